@@ -0,0 +1,67 @@
+"""
+Benchmarks for the graph coloring used for simultaneous total and partial derivatives.
+"""
+import unittest
+
+import numpy as np
+from scipy.sparse import coo_matrix
+
+from openmdao.utils.coloring import _compute_coloring
+
+
+def _banded_sparsity(n, bandwidth, density=.7, seed=11):
+    """Return a random banded n x n sparsity with a full diagonal."""
+    rng = np.random.default_rng(seed)
+    rows = np.repeat(np.arange(n), 2 * bandwidth + 1)
+    cols = rows + np.tile(np.arange(-bandwidth, bandwidth + 1), n)
+    keep = (cols >= 0) & (cols < n) & (rng.random(rows.size) < density)
+    rows = np.concatenate([rows[keep], np.arange(n)])
+    cols = np.concatenate([cols[keep], np.arange(n)])
+    return coo_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=(n, n))
+
+
+def _arrow_sparsity(n, bandwidth, ndense=5):
+    """Return a banded n x n sparsity with some dense rows and columns along the edges."""
+    J = _banded_sparsity(n, bandwidth).tocsr().tolil()
+    J[:ndense, :] = True
+    J[:, -ndense:] = True
+    return J.tocoo()
+
+
+class BenchColoringBanded(unittest.TestCase):
+    """Coloring of a 200K column banded sparsity."""
+
+    def setUp(self):
+        self.J = _banded_sparsity(200000, 5)
+
+    def benchmark_ID_fwd(self):
+        _compute_coloring(self.J, 'fwd', 'ID')
+
+    def benchmark_smallest_last_fwd(self):
+        _compute_coloring(self.J, 'fwd', 'smallest_last')
+
+    def benchmark_DSATUR_fwd(self):
+        _compute_coloring(self.J, 'fwd', 'DSATUR')
+
+    def benchmark_ID_bidir(self):
+        _compute_coloring(self.J, 'auto', 'ID')
+
+
+class BenchColoringArrow(unittest.TestCase):
+    """Bidirectional coloring of a 5K column arrow shaped sparsity."""
+
+    def setUp(self):
+        self.J = _arrow_sparsity(5000, 3)
+
+    def benchmark_ID_bidir(self):
+        _compute_coloring(self.J, 'auto', 'ID')
+
+    def benchmark_smallest_last_bidir(self):
+        _compute_coloring(self.J, 'auto', 'smallest_last')
+
+    def benchmark_DSATUR_bidir(self):
+        _compute_coloring(self.J, 'auto', 'DSATUR')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Benchmarks for table interpolation with the compiled kernels and precomputed coefficients.
+"""
+import unittest
+
+import numpy as np
+
+from openmdao.components.interp_util.interp import InterpND
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.numba import numba
+
+
+def _table(method, npts=100000, seed=11):
+    """Return an interpolant on a 3D table and the points to evaluate."""
+    rng = np.random.default_rng(seed)
+    grid = (np.linspace(0, 1, 20), np.linspace(0, 2, 25), np.linspace(-1, 1, 15))
+    values = rng.random((20, 25, 15))
+    x = np.column_stack([rng.uniform(g[0] - 0.1, g[-1] + 0.1, npts) for g in grid])
+
+    # Put some of the points on the grid points.
+    for j, g in enumerate(grid):
+        x[j * g.size:(j + 1) * g.size, j] = g
+
+    return InterpND(method=method, points=grid, values=values, extrapolate=True), x
+
+
+class _BenchInterp(object):
+    """Interpolation of 100K points on a 3D table."""
+
+    method = None
+
+    def setUp(self):
+        self.interp, self.x = _table(self.method)
+
+        # compile the kernel outside of the timed benchmarks.
+        self.interp.interpolate(self.x[:2])
+
+    def benchmark_python(self):
+        self.interp.table._use_numba = False
+        self.interp.interpolate(self.x, compute_derivative=True)
+
+    @unittest.skipUnless(numba, "numba is required.")
+    def benchmark_numba(self):
+        self.interp.interpolate(self.x, compute_derivative=True)
+
+    @unittest.skipUnless(numba, "numba is required.")
+    def benchmark_parity(self):
+        f, df_dx = self.interp.interpolate(self.x, compute_derivative=True)
+
+        self.interp.table._use_numba = False
+        f_base, df_dx_base = self.interp.interpolate(self.x, compute_derivative=True)
+
+        assert_near_equal(f, f_base, 1e-12)
+        assert_near_equal(df_dx, df_dx_base, 1e-11)
+
+
+class BenchInterpSlinear(_BenchInterp, unittest.TestCase):
+    method = 'slinear'
+
+
+class BenchInterpLagrange2(_BenchInterp, unittest.TestCase):
+    method = 'lagrange2'
+
+
+class BenchInterpLagrange3(_BenchInterp, unittest.TestCase):
+    method = 'lagrange3'
+
+
+class BenchInterpAkima(_BenchInterp, unittest.TestCase):
+    method = 'akima'
+
+
+class BenchInterpPrecomputed(unittest.TestCase):
+    """Interpolation of 100K points on a 3D table with precomputed cell coefficients."""
+
+    def _bench(self, method):
+        interp, x = _table(method)
+        interp.precompute_coeffs()
+        interp.interpolate(x, compute_derivative=True)
+
+    def benchmark_cubic(self):
+        self._bench('cubic')
+
+    def benchmark_lagrange3(self):
+        self._bench('lagrange3')
+
+
+if __name__ == '__main__':
+    unittest.main()
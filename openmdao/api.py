@@ -38,6 +38,7 @@ from openmdao.components.submodel_comp import SubmodelComp
 # Solvers
 from openmdao.solvers.linear.linear_block_gs import LinearBlockGS
 from openmdao.solvers.linear.linear_block_jac import LinearBlockJac
+from openmdao.solvers.linear.linear_block_direct import LinearBlockDirect
 from openmdao.solvers.linear.direct import DirectSolver
 from openmdao.solvers.linear.petsc_ksp import PETScKrylov
 from openmdao.solvers.linear.linear_runonce import LinearRunOnce
@@ -1,6 +1,8 @@
 """Base class used to define the interface for derivative approximation schemes."""
 import time
+import multiprocessing
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from itertools import repeat
 import numpy as np
 
@@ -10,6 +12,7 @@ from openmdao.utils.array_utils import get_input_idx_split, ValueRepeater
 import openmdao.utils.coloring as coloring_mod
 from openmdao.utils.general_utils import _convert_auto_ivc_to_conn_name, LocalRangeIterable
 from openmdao.utils.mpi import check_mpi_env
+from openmdao.utils.om_warnings import issue_warning
 from openmdao.utils.rangemapper import RangeMapper
 
 
@@ -25,6 +28,69 @@ else:
         PETSc = None
 
 
+# (system, scheme) held by each worker process of an approximation process pool
+_pool_worker_state = None
+
+# maximum number of entries in the input and output arrays of a vectorized evaluation
+_MAX_VECTORIZED_ENTRIES = 1 << 22
+
+
+def _init_pool_worker(system, scheme):
+    """
+    Store the forked copies of the system and approximation scheme in a pool worker.
+
+    Parameters
+    ----------
+    system : System
+        The system having its derivs approximated.
+    scheme : ApproximationScheme
+        The approximation scheme.
+    """
+    global _pool_worker_state
+    _pool_worker_state = (system, scheme)
+
+
+def _run_pool_worker_point(starting, idx_info, data, total, idx_start):
+    """
+    Run a single approximation point in a pool worker.
+
+    Parameters
+    ----------
+    starting : tuple of ndarray
+        Starting inputs, outputs and residuals of the system.
+    idx_info : list of (str or None, ndarray of int)
+        List of ('input' or 'output', indices) tuples giving the entries to perturb.
+    data : tuple
+        Approximation data, e.g. (deltas, coeffs, current_coeff) for finite difference.
+    total : bool
+        If True total derivatives are being approximated, else partials.
+    idx_start : range or list
+        Jacobian columns of the wrt variable for this point.
+
+    Returns
+    -------
+    ndarray
+        Results of the approximation point.
+    """
+    system, scheme = _pool_worker_state
+    ins, outs, resids = starting
+
+    system._inputs.set_val(ins)
+    system._outputs.set_val(outs)
+    system._residuals.set_val(resids)
+
+    scheme._starting_ins = ins
+    scheme._starting_outs = outs
+    scheme._starting_resids = resids
+    scheme._results_tmp = outs.copy() if total else resids.copy()
+
+    vecs = {'input': system._inputs, 'output': system._outputs, None: None}
+    idx_info = [(vecs[kind], idxs) for kind, idxs in idx_info]
+
+    return scheme._run_point(system, idx_info, data, scheme._results_tmp.copy(), total,
+                             idx_start)
+
+
 class ApproximationScheme(object):
     """
     Base class used to define the interface for derivative approximation schemes.
@@ -50,8 +116,20 @@ class ApproximationScheme(object):
     _totals_directional_mode : str or None
         If directional total derivatives are being computed, this will contain the top level
         mode ('fwd' or 'rev'), else None.
+    _process_pool : ProcessPoolExecutor or None
+        Pool of worker processes, each holding a forked copy of the system, used to run
+        approximation points concurrently.  The pool only lives for a single approximation, so
+        the workers always see the current state of the system.
+    _process_pool_ok : bool
+        False if the system requested a process pool but one can't be used.
     """
 
+    # if True, this scheme can evaluate points in a pool of local worker processes
+    _supports_process_pool = False
+
+    # if True, this scheme can evaluate points with a vectorized compute of the system
+    _supports_vectorized_points = False
+
     def __init__(self):
         """
         Initialize the ApproximationScheme.
@@ -64,6 +142,8 @@ class ApproximationScheme(object):
         self._jac_scatter = None
         self._totals_directions = {}
         self._totals_directional_mode = None
+        self._process_pool = None
+        self._process_pool_ok = True
 
     def __repr__(self):
         """
@@ -82,6 +162,7 @@ class ApproximationScheme(object):
         """
         self._colored_approx_groups = None
         self._approx_groups = None
+        self._shutdown_process_pool()
 
     def _get_approx_groups(self, system, under_cs=False):
         """
@@ -117,6 +198,217 @@ class ApproximationScheme(object):
 
         return self._approx_groups, self._colored_approx_groups
 
+    def _get_process_pool(self, system):
+        """
+        Return the pool of worker processes to use for approximation points, if any.
+
+        Parameters
+        ----------
+        system : System
+            System where this approximation is occurring.
+
+        Returns
+        -------
+        ProcessPoolExecutor or None
+            The process pool, or None if points should be run in this process.
+        """
+        num_procs = system.options['num_fd_procs']
+        if (num_procs < 2 or not self._supports_process_pool or system.pathname == '' or
+                not self._process_pool_ok):
+            return None
+
+        if system.comm.size > 1 or 'fork' not in multiprocessing.get_all_start_methods():
+            issue_warning("Option 'num_fd_procs' is ignored because a process pool requires the "
+                          "'fork' start method and can't be used under MPI.",
+                          prefix=system.msginfo)
+            self._process_pool_ok = False
+            return None
+
+        # The workers are forked when the first point is submitted, so they get a copy of the
+        # system in its current state, including discrete variables and any other attributes
+        # that compute may read.
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=num_procs,
+                                                     mp_context=multiprocessing.get_context('fork'),
+                                                     initializer=_init_pool_worker,
+                                                     initargs=(system, self))
+
+        return self._process_pool
+
+    def _shutdown_process_pool(self):
+        """
+        Shut down the pool of worker processes, if there is one.
+        """
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
+    def _run_points_in_pool(self, system, pool, points, total):
+        """
+        Run the given approximation points in the process pool.
+
+        Parameters
+        ----------
+        system : System
+            System where this approximation is occurring.
+        pool : ProcessPoolExecutor
+            The process pool.
+        points : list of tuple
+            (idx_info, data, idx_start) for each point to run.
+        total : bool
+            If True total derivatives are being approximated, else partials.
+
+        Returns
+        -------
+        iterator of ndarray
+            Results of each point, in the same order as points.
+        """
+        starting = (system._inputs.asarray(copy=True), system._outputs.asarray(copy=True),
+                    system._residuals.asarray(copy=True))
+
+        kinds = {id(system._inputs): 'input', id(system._outputs): 'output', id(None): None}
+        idx_infos = [[(kinds[id(vec)], idxs) for vec, idxs in idx_info]
+                     for idx_info, _, _ in points]
+
+        return pool.map(_run_pool_worker_point, repeat(starting), idx_infos,
+                        [data for _, data, _ in points], repeat(total),
+                        [idx_start for _, _, idx_start in points])
+
+    def _get_points_runner(self, system, total_or_semi):
+        """
+        Return a function that runs a list of approximation points all at once, if possible.
+
+        Points are run in a process pool if the system's 'num_fd_procs' option is greater than 1,
+        or with a single vectorized compute if the system supports it.
+
+        Parameters
+        ----------
+        system : System
+            System where this approximation is occurring.
+        total_or_semi : bool
+            If True, the system is a Group.
+
+        Returns
+        -------
+        function or None
+            Function that takes a list of (idx_info, data, idx_start) points and returns an
+            iterator over their results, or None if the points must be run one at a time.
+        """
+        pool = self._get_process_pool(system)
+        if pool is not None:
+            return lambda points: self._run_points_in_pool(system, pool, points, total_or_semi)
+
+        if (self._supports_vectorized_points and not total_or_semi and
+                self._progress_out is None and system._vectorized_compute_ok()):
+            return lambda points: self._run_points_vectorized(system, points)
+
+    def _get_vectorized_stencil(self, data):
+        """
+        Return the deltas and coefficients used to evaluate a point in a vectorized compute.
+
+        Parameters
+        ----------
+        data : object
+            Approximation data of the point.
+
+        Returns
+        -------
+        tuple or None
+            (deltas, coeffs, current_coeff), or None if the point must be run by itself.
+        """
+        raise NotImplementedError("_get_vectorized_stencil has not been implemented")
+
+    def _run_points_vectorized(self, system, points):
+        """
+        Run the given approximation points using vectorized computes of the system.
+
+        All perturbed input vectors of the given points are stacked into a 2-D array, which is
+        evaluated in chunks by the system's vectorized_compute.  Points that can't be stacked are
+        run one at a time.
+
+        Parameters
+        ----------
+        system : System
+            System where this approximation is occurring.
+        points : list of tuple
+            (idx_info, data, idx_start) for each point to run.
+
+        Yields
+        ------
+        ndarray
+            Results of each point, in the same order as points.
+        """
+        inputs = system._inputs
+        size = len(inputs) + len(system._outputs)
+        max_rows = max(1, _MAX_VECTORIZED_ENTRIES // max(size, 1))
+
+        chunk = []
+        nrows = 0
+        for idx_info, data, idx_start in points:
+            stencil = self._get_vectorized_stencil(data)
+            if stencil is None or \
+                    any(vec is not None and vec is not inputs for vec, _ in idx_info):
+                yield from self._run_vectorized_chunk(system, chunk)
+                chunk = []
+                nrows = 0
+                yield self._run_point(system, idx_info, data,
+                                      system._residuals.asarray(copy=True), False, idx_start)
+                continue
+
+            chunk.append((idx_info, stencil))
+            nrows += len(stencil[0])
+            if nrows >= max_rows:
+                yield from self._run_vectorized_chunk(system, chunk)
+                chunk = []
+                nrows = 0
+
+        yield from self._run_vectorized_chunk(system, chunk)
+
+    def _run_vectorized_chunk(self, system, chunk):
+        """
+        Run a chunk of approximation points with a single vectorized compute of the system.
+
+        Parameters
+        ----------
+        system : System
+            System where this approximation is occurring.
+        chunk : list of tuple
+            (idx_info, (deltas, coeffs, current_coeff)) for each point to run.
+
+        Yields
+        ------
+        ndarray
+            Results of each point, in the same order as chunk.
+        """
+        if not chunk:
+            return
+
+        start_ins = system._inputs.asarray()
+        in_batch = np.empty((sum(len(stencil[0]) for _, stencil in chunk), start_ins.size),
+                            dtype=start_ins.dtype)
+        in_batch[:] = start_ins
+
+        row = 0
+        for idx_info, (deltas, _, _) in chunk:
+            for delta in deltas:
+                for vec, idxs in idx_info:
+                    if vec is not None and idxs is not None:
+                        in_batch[row, idxs] += delta
+                row += 1
+
+        # residuals of an explicit component are the computed outputs minus the current outputs
+        resids = system._vectorized_compute_wrapper(in_batch)
+        resids -= system._outputs.asarray()
+
+        row = 0
+        for _, (deltas, coeffs, current_coeff) in chunk:
+            nsteps = len(deltas)
+            result = coeffs @ resids[row:row + nsteps]
+            if current_coeff:
+                result += current_coeff * system._residuals.asarray()
+            row += nsteps
+            yield result
+
     def add_approximation(self, abs_key, system, kwargs):
         """
         Use this approximation scheme to approximate the derivative d(of)/d(wrt).
@@ -360,6 +652,24 @@ class ApproximationScheme(object):
         else:
             scratch = np.empty(len(system._outputs))
 
+        run_points = self._get_points_runner(system, total_or_semi)
+        if run_points is not None:
+            points = [(vec_ind_list, data, 0) for data, _, vec_ind_list, _, _
+                      in colored_approx_groups]
+            results = run_points(points)
+
+            for (data, jcols, _, nzrows, _), result in zip(colored_approx_groups, results):
+                result = self._transform_result(result)
+                mult = self._get_multiplier(data)
+                if mult != 1.0:
+                    result *= mult
+
+                for i, col in enumerate(jcols):
+                    scratch[:] = 0.0
+                    scratch[nzrows[i]] = result[nzrows[i]]
+                    yield col, scratch
+            return
+
         # Clean vector for results (copy of the outputs or resids)
         vec = system._outputs if total_or_semi else system._residuals
         results_array = vec.asarray(copy=True)
@@ -486,6 +796,12 @@ class ApproximationScheme(object):
 
         total_or_semi = total or _is_group(system)
 
+        run_points = self._get_points_runner(system, total_or_semi)
+        if run_points is not None:
+            yield from self._uncolored_points_column_iter(run_points, approx_groups,
+                                                          total_or_semi)
+            return
+
         # Clean vector for results (copy of the outputs or resids)
         results_array = system._outputs.asarray(copy=True) if total_or_semi \
             else system._residuals.asarray(copy=True)
@@ -577,6 +893,56 @@ class ApproximationScheme(object):
                     else:
                         yield jinds, res
 
+    def _uncolored_points_column_iter(self, run_points, approx_groups, total_or_semi):
+        """
+        Perform approximations all at once using run_points and yield (column_index, column).
+
+        Parameters
+        ----------
+        run_points : function
+            Function that runs a list of approximation points and returns their results.
+        approx_groups : list of tuples
+            See _uncolored_column_iter.
+        total_or_semi : bool
+            If True, the system is a Group.
+
+        Yields
+        ------
+        int
+            column index
+        ndarray
+            solution array corresponding to the jacobian column at the given column index
+        """
+        points = []
+        cols = []
+        mults = []
+        for wrt, data, jcol_idxs, vec_ind_list, directional, direction in approx_groups:
+            if direction is not None:
+                app_data = self.apply_directional(data, direction)
+            else:
+                app_data = data
+
+            mult = self._get_multiplier(data)
+
+            jidx_iter = iter(range(len(jcol_idxs)))
+            for vec_ind_info, vecidxs in self._vec_ind_iter(vec_ind_list):
+                if vecidxs is None and not total_or_semi:
+                    continue  # skip non-local partial jac column
+
+                jinds = jcol_idxs[next(jidx_iter)]
+                # _vec_ind_iter reuses its entry list, so make a copy
+                points.append(([(vec, idxs) for vec, idxs in vec_ind_info], app_data,
+                               jcol_idxs))
+                cols.append(jinds[0] if directional else jinds)
+                mults.append(mult)
+
+        results = run_points(points)
+        for col, mult, result in zip(cols, mults, results):
+            result = self._transform_result(result)
+            if mult != 1.0:
+                result *= mult
+            yield col, result
+
     def compute_approximations(self, system, jac=None):
         """
         Execute the system to compute the approximate sub-Jacobians.
@@ -605,10 +971,14 @@ class ApproximationScheme(object):
         # This will either generate new approx groups or use cached ones
         approx_groups, colored_approx_groups = self._get_approx_groups(system, under_cs)
 
-        if colored_approx_groups:
-            yield from self._colored_column_iter(system, colored_approx_groups)
+        try:
+            if colored_approx_groups:
+                yield from self._colored_column_iter(system, colored_approx_groups)
 
-        yield from self._uncolored_column_iter(system, approx_groups)
+            yield from self._uncolored_column_iter(system, approx_groups)
+        finally:
+            # the system may change before the next approximation, so don't keep stale workers
+            self._shutdown_process_pool()
 
     def _get_total_result(self, outarr, totarr):
         """
@@ -25,6 +25,8 @@ class ComplexStep(ApproximationScheme):
         When nested complex step is detected, we switch to Finite Difference.
     """
 
+    _supports_vectorized_points = True
+
     DEFAULT_OPTIONS = {
         'step': 1e-40,
         'directional': False,
@@ -222,6 +224,22 @@ class ComplexStep(ApproximationScheme):
 
         return result_array
 
+    def _get_vectorized_stencil(self, data):
+        """
+        Return the deltas and coefficients used to evaluate a point in a vectorized compute.
+
+        Parameters
+        ----------
+        data : complex or ndarray of complex
+            Complex step of the point.
+
+        Returns
+        -------
+        tuple
+            (deltas, coeffs, current_coeff) of the single complex step.
+        """
+        return (data,), np.ones(1), 0.0
+
     def apply_directional(self, data, direction):
         """
         Apply stepsize to direction and embed into approximation data.
@@ -76,6 +76,9 @@ class FiniteDifference(ApproximationScheme):
         An array the same size as the system outputs. Used to store the results temporarily.
     """
 
+    _supports_process_pool = True
+    _supports_vectorized_points = True
+
     DEFAULT_OPTIONS = {
         'step': 1e-6,
         'form': 'forward',
@@ -412,6 +415,25 @@ class FiniteDifference(ApproximationScheme):
 
         return self._results_tmp
 
+    def _get_vectorized_stencil(self, data):
+        """
+        Return the deltas and coefficients used to evaluate a point in a vectorized compute.
+
+        Parameters
+        ----------
+        data : tuple
+            Deltas, coefficients and current coefficient of the point.
+
+        Returns
+        -------
+        tuple or None
+            (deltas, coeffs, current_coeff), or None if the point uses 'rel_element' steps and
+            must be run by itself.
+        """
+        if isinstance(data[2], np.ndarray):
+            return None
+        return data
+
     def apply_directional(self, data, direction):
         """
         Apply stepsize to direction and embed into approximation data.
@@ -1,7 +1,11 @@
 """Define the ExecComp class, a component that evaluates an expression."""
 import re
+import ast
+import sys
 import time
+import traceback
 from itertools import product
+from functools import partial
 from contextlib import contextmanager
 from collections import defaultdict
 
@@ -9,13 +13,28 @@ import numpy as np
 from numpy import ndarray, imag, complex128 as npcomplex
 
 from openmdao.core.system import _DEFAULT_COLORING_META
+from openmdao.approximation_schemes.approximation_scheme import _MAX_VECTORIZED_ENTRIES
 from openmdao.utils.coloring import _ColSparsityJac, _compute_coloring
+from openmdao.utils.coloring_cache import partial_coloring_key
 from openmdao.core.constants import INT_DTYPE
 from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.utils.units import valid_units
 from openmdao.utils import cs_safe
 from openmdao.utils.om_warnings import issue_warning, DerivativesWarning, SetupWarning
 from openmdao.utils.array_utils import get_random_arr
+from openmdao.components.func_comp_common import jac_forward, jac_reverse, _get_tangents
+
+try:
+    import jax
+    from jax import jit
+    import jax.numpy as jnp
+    import jax.scipy.special as jsp
+    jax.config.update("jax_enable_x64", True)  # jax by default uses 32 bit floats
+except Exception:
+    _, err, tb = sys.exc_info()
+    if not isinstance(err, ImportError):
+        traceback.print_tb(tb)
+    jax = None
 
 
 # regex to check for variable names.
@@ -29,7 +48,7 @@ _allowed_meta = {'value', 'val', 'shape', 'units', 'res_units', 'desc',
 
 # Names that are not allowed for input or output variables (keywords for options)
 _disallowed_names = {'has_diag_partials', 'units', 'shape', 'shape_by_conn', 'run_root_only',
-                     'constant', 'do_coloring'}
+                     'constant', 'do_coloring', 'vectorized_approx', 'use_jax'}
 
 
 def check_option(option, value):
@@ -118,6 +137,12 @@ class ExecComp(ExplicitComponent):
     _viewdict : dict or None
         If using internal CS, this maps input, output, and constant names to their corresponding
         views/values.
+    _vectorized_checked : bool
+        If True, a vectorized evaluation has been checked against a normal evaluation.
+    _jax_func : callable or None
+        Jitted jax function that computes the outputs from the inputs, if use_jax is True.
+    _jax_jac_func : tuple or None
+        Direction, coloring and jitted jax function used to compute the partial jacobian.
     """
 
     def __init__(self, exprs=[], **kwargs):
@@ -243,6 +268,9 @@ class ExecComp(ExplicitComponent):
         self._outarray = None
         self._indict = None
         self._viewdict = None
+        self._vectorized_checked = False
+        self._jax_func = None
+        self._jax_jac_func = None
 
     def initialize(self):
         """
@@ -272,6 +300,18 @@ class ExecComp(ExplicitComponent):
                              desc='If True (the default), compute the partial jacobian '
                              'coloring for this component.')
 
+        self.options.declare('vectorized_approx', types=bool, default=False,
+                             desc='If True, partials computed by complex step or declared with '
+                             'method "fd" or "cs" are approximated by evaluating the expressions '
+                             'once for all perturbed points, with the points stacked along an '
+                             'extra trailing dimension of every variable. Only use this if all '
+                             'expressions broadcast over that dimension, e.g., no reductions '
+                             'like sum().')
+
+        self.options.declare('use_jax', types=bool, default=False,
+                             desc='If True, evaluate the expressions with a jit compiled jax '
+                             'function and use jax to compute the partials.')
+
     @classmethod
     def register(cls, name, callable_obj, complex_safe):
         """
@@ -310,6 +350,13 @@ class ExecComp(ExplicitComponent):
         """
         Set up variable name and metadata lists.
         """
+        if self.options['use_jax'] and jax is None:
+            raise RuntimeError(f"{self.msginfo}: jax is not installed. "
+                               "Try 'pip install openmdao[jax]' with Python>=3.8.")
+
+        self._jax_func = None
+        self._jax_jac_func = None
+
         if self._exprs:
             self._setup_expressions()
 
@@ -363,6 +410,16 @@ class ExecComp(ExplicitComponent):
 
         allvars.update(outs)
 
+        if self.options['use_jax']:
+            funcs = set().union(*[fnames for _, _, fnames in exprs_info])
+            no_jax = sorted(f for f in funcs
+                            if f in _expr_dict and callable(_expr_dict[f]) and
+                            _get_jax_equivalent(f) is None)
+            if no_jax:
+                raise RuntimeError(f"{self.msginfo}: Functions {no_jax} have no jax "
+                                   "equivalent, so they can't be used when the 'use_jax' "
+                                   "option is True.")
+
         if self._requires_fd:
             inps = []
             for out, (rhsvars, funcs) in self._requires_fd.items():
@@ -612,6 +669,7 @@ class ExecComp(ExplicitComponent):
         """
         state = self.__dict__.copy()
         del state['_codes']
+        state['_jax_func'] = state['_jax_jac_func'] = None
         return state
 
     def __setstate__(self, state):
@@ -793,6 +851,10 @@ class ExecComp(ExplicitComponent):
         outputs : `Vector`
             `Vector` containing outputs.
         """
+        if self.options['use_jax']:
+            outputs.set_vals(self._get_jax_func()(*inputs.values()))
+            return
+
         if not self._manual_decl_partials:
             if self._relcopy:
                 self._inarray[:] = self._inputs.asarray(copy=False)
@@ -819,6 +881,202 @@ class ExecComp(ExplicitComponent):
                 raise RuntimeError(f"{self.msginfo}: Error occurred evaluating '{self._exprs[i]}':"
                                    f"\n{err}")
 
+    def _vectorized_compute_ok(self):
+        """
+        Return True if this component can evaluate a batch of points in a single call.
+
+        Returns
+        -------
+        bool
+            True if approximation schemes can use a vectorized evaluation of this component.
+        """
+        return self.options['vectorized_approx'] and super()._vectorized_compute_ok()
+
+    def vectorized_compute(self, inputs, outputs):
+        """
+        Execute this component's assignment statements for a batch of input points.
+
+        Parameters
+        ----------
+        inputs : dict of ndarray
+            Input values keyed by variable name, each with shape (npoints,) + variable shape.
+        outputs : dict of ndarray
+            Output values keyed by variable name, each with shape (npoints,) + variable shape.
+        """
+        # put the points along the last axis so that indexing, dot products, etc. in the
+        # expressions still act on the leading (variable) dimensions
+        namespace = self._exec_namespace({name: np.moveaxis(val, 0, -1)
+                                          for name, val in inputs.items()})
+
+        for name, val in outputs.items():
+            npts = val.shape[0]
+            shape = val.shape[1:]
+            result = np.asarray(namespace[name])
+            if result.size == val[0].size:  # result doesn't depend on the inputs
+                val[:] = result.reshape(shape)
+            elif result.size == val.size:
+                val[:] = np.moveaxis(result.reshape(shape + (npts,)), -1, 0)
+            else:
+                raise RuntimeError(f"{self.msginfo}: The vectorized evaluation of output "
+                                   f"'{name}' has shape {result.shape}, which doesn't match its "
+                                   f"shape {shape} and the {npts} points being evaluated. Set "
+                                   "the 'vectorized_approx' option to False.")
+
+        if not self._vectorized_checked:
+            # expressions that don't broadcast over the points, e.g., sum(x), mix the points
+            # together, so compare the first point to a normal evaluation once.
+            namespace = self._exec_namespace({name: val[0] for name, val in inputs.items()})
+            for name, val in outputs.items():
+                if not np.allclose(val[0], np.reshape(namespace[name], val.shape[1:]),
+                                   rtol=1e-10, atol=1e-300):
+                    raise RuntimeError(f"{self.msginfo}: The vectorized evaluation of output "
+                                       f"'{name}' doesn't match its normal evaluation. Set the "
+                                       "'vectorized_approx' option to False.")
+            self._vectorized_checked = True
+
+    def _get_jax_func(self):
+        """
+        Return a jitted jax function that computes the outputs from the inputs.
+
+        The expressions are executed with the jax versions of the functions available to
+        ExecComp expressions.
+
+        Returns
+        -------
+        callable
+            Function that takes the input values, in the order of the input vector, and returns
+            the output values, in the order of the output vector.
+        """
+        if self._jax_func is None:
+            plen = len(self.pathname) + 1 if self.pathname else 0
+            in_names = [n[plen:] for n in self._var_abs2meta['input']]
+            out_info = [(n[plen:], meta['shape'], meta['size'])
+                        for n, meta in self._var_abs2meta['output'].items()]
+            codes = self._codes
+            constants = self._constants
+            jax_expr_dict = _get_jax_expr_dict()
+
+            def compute_outputs(*invals):
+                namespace = dict(zip(in_names, invals))
+                namespace.update(constants)
+                for code in codes:
+                    exec(code, jax_expr_dict, namespace)  # nosec:
+                    # limited to jax versions of _expr_dict
+
+                outvals = []
+                for name, shape, size in out_info:
+                    val = jnp.asarray(namespace[name])
+                    if not jnp.issubdtype(val.dtype, jnp.inexact):
+                        # e.g., the result of isnan.  Its partials are zero.
+                        val = val.astype(float)
+                    if val.size == size:
+                        outvals.append(jnp.reshape(val, shape))
+                    else:
+                        outvals.append(jnp.broadcast_to(val, shape))
+
+                return outvals[0] if len(outvals) == 1 else tuple(outvals)
+
+            self._jax_func = jit(compute_outputs)
+
+        return self._jax_func
+
+    def _compute_jax_partials(self, partials):
+        """
+        Use jax to update the given Jacobian.
+
+        Parameters
+        ----------
+        partials : `Jacobian`
+            Contains sub-jacobians.
+        """
+        coloring = self._coloring_info.coloring
+
+        # the coloring is a column coloring.  Without one, use the cheaper direction.
+        if coloring is None and len(self._outputs) < len(self._inputs):
+            direction = 'rev'
+        else:
+            direction = 'fwd'
+
+        if self._jax_jac_func is None or self._jax_jac_func[:2] != (direction, coloring):
+            func = self._get_jax_func()
+            if direction == 'fwd':
+                tangents = _get_tangents(list(self._inputs.values()), 'fwd', coloring)
+                jac_func = jac_forward(func, None, tangents)
+            else:
+                tangents = _get_tangents(list(self._outputs.values()), 'rev', coloring)
+                jac_func = jac_reverse(func, None, tangents)
+            self._jax_jac_func = (direction, coloring, jit(jac_func))
+
+        parts = self._jax_jac_func[2](*self._inputs.values())
+        if direction == 'fwd':
+            # rows of the (compressed) jacobian grouped by output
+            if self._outputs.nvars() == 1:
+                parts = [parts]
+            parts = [np.asarray(a) for a in parts]
+            jac = np.vstack([a.reshape((a.size // a.shape[-1], a.shape[-1])) for a in parts])
+        else:
+            # columns of the jacobian grouped by input
+            parts = [np.asarray(a) for a in parts]
+            jac = np.hstack([a.reshape((a.shape[0], a.size // a.shape[0])) for a in parts])
+
+        if coloring is not None:
+            jac = coloring.expand_jac(jac, direction)
+
+        self._set_dense_partials(partials, jac)
+
+    def _set_dense_partials(self, partials, jac):
+        """
+        Set the declared partials from a dense jacobian.
+
+        Parameters
+        ----------
+        partials : `Jacobian`
+            Contains sub-jacobians.
+        jac : ndarray
+            Dense partial jacobian with rows ordered like the outputs and columns ordered like
+            the inputs.
+        """
+        plen = len(self.pathname) + 1
+        out_slices = {n[plen:]: slc for n, slc in self._outputs.get_slice_dict().items()}
+        out_names = self._var_rel_names['output']
+        has_diag_partials = self.options['has_diag_partials']
+
+        for name, slc in self._inputs.get_slice_dict().items():
+            name = name[plen:]
+            for u in out_names:
+                if (u, name) in partials:
+                    subjac = jac[out_slices[u], slc]
+                    if has_diag_partials and min(subjac.shape) > 1:
+                        subjac = np.diagonal(subjac)
+                    partials[u, name] = subjac
+
+    def _exec_namespace(self, values):
+        """
+        Execute this component's assignment statements in a new namespace.
+
+        Parameters
+        ----------
+        values : dict
+            Input values keyed by variable name.
+
+        Returns
+        -------
+        dict
+            The namespace, containing the input, constant and output values.
+        """
+        namespace = dict(values)
+        namespace.update(self._constants)
+
+        for i, expr in enumerate(self._codes):
+            try:
+                exec(expr, _expr_dict, namespace)  # nosec:
+                # limited to _expr_dict
+            except Exception as err:
+                raise RuntimeError(f"{self.msginfo}: Error occurred evaluating '{self._exprs[i]}':"
+                                   f"\n{err}")
+
+        return namespace
+
     def _linearize(self, jac=None, sub_do_ln=False):
         """
         Compute jacobian / factorization. The model is assumed to be in a scaled state.
@@ -830,7 +1088,7 @@ class ExecComp(ExplicitComponent):
         sub_do_ln : bool
             Flag indicating if the children should call linearize on their linear solvers.
         """
-        if self._requires_fd:
+        if self._requires_fd and not self.options['use_jax']:
             if 'fd' in self._approx_schemes:
                 fdins = {wrt.rsplit('.', 1)[1] for wrt in self._approx_schemes['fd']._wrt_meta}
             else:
@@ -859,7 +1117,8 @@ class ExecComp(ExplicitComponent):
                          perturb_size=_DEFAULT_COLORING_META['perturb_size'],
                          min_improve_pct=_DEFAULT_COLORING_META['min_improve_pct'],
                          show_summary=_DEFAULT_COLORING_META['show_summary'],
-                         show_sparsity=_DEFAULT_COLORING_META['show_sparsity']):
+                         show_sparsity=_DEFAULT_COLORING_META['show_sparsity'],
+                         color_order='ID'):
         """
         Set options for deriv coloring of a set of wrt vars matching the given pattern(s).
 
@@ -895,10 +1154,13 @@ class ExecComp(ExplicitComponent):
             If True, display summary information after generating coloring.
         show_sparsity : bool
             If True, display sparsity with coloring info after generating coloring.
+        color_order : str
+            Column ordering used by the greedy coloring.  'ID' (incidence degree) is the
+            default.  'smallest_last' and 'DSATUR' sometimes find colorings with fewer colors.
         """
         super().declare_coloring(wrt, method, form, step, per_instance, num_full_jacs,
                                  tol, orders, perturb_size, min_improve_pct,
-                                 show_summary, show_sparsity)
+                                 show_summary, show_sparsity, color_order)
         self._coloring_declared = True
         self._manual_decl_partials = True
 
@@ -950,6 +1212,12 @@ class ExecComp(ExplicitComponent):
         # match everything
         info['wrt_matches'] = None
 
+        coloring, cache_key = self._get_cached_coloring()
+        if coloring is not None:
+            info['wrt_matches'] = None
+            self._setup_colored_slices()
+            return [coloring]
+
         sparsity_start_time = time.perf_counter()
 
         step = self.complex_stepsize * 1j
@@ -985,11 +1253,22 @@ class ExecComp(ExplicitComponent):
         sparsity, sp_info = jac.get_sparsity(self)
         sparsity_time = time.perf_counter() - sparsity_start_time
 
-        coloring = _compute_coloring(sparsity, 'fwd')
+        coloring = _compute_coloring(sparsity, 'fwd', info.color_order)
 
         if not self._finalize_coloring(coloring, info, sp_info, sparsity_time):
             return [None]
 
+        if cache_key is not None:
+            self._problem_meta['coloring_cache'].put(cache_key, coloring)
+
+        self._setup_colored_slices()
+
+        return [coloring]
+
+    def _setup_colored_slices(self):
+        """
+        Compute the index and slice mappings used when computing colored partials.
+        """
         # compute mapping of col index to wrt varname
         self._col_idx2name = idxnames = [None] * len(self._inputs)
         plen = len(self.pathname) + 1
@@ -1002,7 +1281,16 @@ class ExecComp(ExplicitComponent):
         self._out_slices = {n[plen:]: slc for n, slc in self._outputs.get_slice_dict().items()}
         self._in_slices = {n[plen:]: slc for n, slc in self._inputs.get_slice_dict().items()}
 
-        return [coloring]
+    def _get_coloring_cache_key(self):
+        """
+        Return the key of this system's partial coloring in the coloring cache.
+
+        Returns
+        -------
+        str or None
+            The cache key, or None if the coloring can't be cached.
+        """
+        return partial_coloring_key(self, self._exprs)
 
     def _compute_colored_partials(self, partials):
         """
@@ -1049,6 +1337,91 @@ class ExecComp(ExplicitComponent):
             # restore old input value
             inarr[icols] -= step
 
+    def _compute_vectorized_partials(self, partials):
+        """
+        Use complex step with vectorized evaluations of all perturbed points to update partials.
+
+        Parameters
+        ----------
+        partials : `Jacobian`
+            Contains sub-jacobians.
+        """
+        plen = len(self.pathname) + 1
+        out_slices = {n[plen:]: slc for n, slc in self._outputs.get_slice_dict().items()}
+        in_slices = {n[plen:]: slc for n, slc in self._inputs.get_slice_dict().items()}
+        out_names = self._var_rel_names['output']
+        coloring = self._coloring_info.coloring
+
+        # input columns perturbed by each point
+        point_cols = []
+        if coloring is not None:
+            point_cols.extend(coloring.color_iter('fwd'))
+        else:
+            # first point of each input and whether that point perturbs the whole input
+            first_points = {}
+            has_diag_partials = self.options['has_diag_partials']
+            for name, slc in in_slices.items():
+                whole = has_diag_partials or slc.stop - slc.start == 1
+                first_points[name] = (len(point_cols), whole)
+                if whole:
+                    point_cols.append(slc)
+                else:
+                    point_cols.extend(range(slc.start, slc.stop))
+
+        jac_cols = self._eval_perturbed_points(point_cols)
+
+        if coloring is not None:
+            # each nonzero of the jacobian comes from the point of its column's color
+            col_points = np.zeros(len(self._inputs), dtype=INT_DTYPE)
+            for i, icols in enumerate(point_cols):
+                col_points[icols] = i
+            rows, cols = coloring._nzrows, coloring._nzcols
+            jac = np.zeros((jac_cols.shape[1], len(self._inputs)))
+            jac[rows, cols] = jac_cols[col_points[cols], rows]
+            self._set_dense_partials(partials, jac)
+            return
+
+        for name, slc in in_slices.items():
+            start, whole = first_points[name]
+            vals = jac_cols[start] if whole else jac_cols[start:start + slc.stop - slc.start].T
+
+            for u in out_names:
+                if (u, name) in partials:
+                    partials[u, name] = vals[out_slices[u]]
+
+    def _eval_perturbed_points(self, point_cols):
+        """
+        Evaluate the outputs at complex step perturbed inputs with vectorized calls.
+
+        Parameters
+        ----------
+        point_cols : list
+            Input columns (an int, slice or array of int) perturbed by each point.
+
+        Returns
+        -------
+        ndarray
+            Derivatives of the outputs, with one row per point.
+        """
+        step = self.complex_stepsize * 1j
+        inv_stepsize = 1.0 / self.complex_stepsize
+        start_ins = self._inputs.asarray()
+        nout = len(self._outputs)
+        max_rows = max(1, _MAX_VECTORIZED_ENTRIES // (start_ins.size + nout))
+
+        jac_cols = np.empty((len(point_cols), nout))
+        for chunk_start in range(0, len(point_cols), max_rows):
+            chunk = point_cols[chunk_start:chunk_start + max_rows]
+            in_batch = np.empty((len(chunk), start_ins.size), dtype=complex)
+            in_batch[:] = start_ins
+            for row, icols in enumerate(chunk):
+                in_batch[row, icols] += step
+
+            jac_cols[chunk_start:chunk_start + len(chunk)] = \
+                imag(self._vectorized_compute_wrapper(in_batch) * inv_stepsize)
+
+        return jac_cols
+
     def compute_partials(self, inputs, partials):
         """
         Use complex step method to update the given Jacobian.
@@ -1068,6 +1441,14 @@ class ExecComp(ExplicitComponent):
                                "level system is using complex step unless you manually call "
                                "declare_partials and/or declare_coloring on this ExecComp.")
 
+        if self.options['use_jax']:
+            self._compute_jax_partials(partials)
+            return
+
+        if self._vectorized_compute_ok():
+            self._compute_vectorized_partials(partials)
+            return
+
         if self._coloring_info.coloring is not None:
             self._compute_colored_partials(partials)
             return
@@ -1115,6 +1496,301 @@ class ExecComp(ExplicitComponent):
                     ival[idx] -= step
 
 
+class _FusedExecChain(object):
+    """
+    A run of consecutive sibling ExecComps whose expressions are evaluated as one code object.
+
+    Outputs of a member that feed inputs of a later member are passed directly from one
+    expression to the next, so the transfers and the per-component solve overhead between
+    members are skipped.  All member inputs, outputs and residuals are still set in the members'
+    vectors, so the fused ExecComps look the same to the rest of the model.
+
+    Parameters
+    ----------
+    comps : list of ExecComp
+        The ExecComps in execution order.
+    internal : dict
+        Mapping of absolute input name to the absolute name of the output of an earlier member
+        that feeds it directly.
+
+    Attributes
+    ----------
+    comps : list of ExecComp
+        The ExecComps in execution order.
+    xfer_names : list of str
+        Names of the members that have inputs connected to outputs outside of the chain.
+    _code : code
+        The compiled expressions of all members.
+    _inputs : list of tuple
+        (fused name, comp, absolute name) of each input that isn't fed by an earlier member.
+    _outputs : list of tuple
+        (fused name, comp, absolute name) of each output.
+    _internal : list of tuple
+        (comp, absolute input name, index into _outputs) of each input fed by an earlier member.
+    _constants : dict
+        Constant values keyed by fused name.
+    """
+
+    def __init__(self, comps, internal):
+        """
+        Build the fused code object.
+        """
+        self.comps = comps
+        self.xfer_names = []
+        self._inputs = []
+        self._outputs = []
+        self._internal = []
+        self._constants = {}
+
+        fused_outs = {}  # absolute output name -> (fused name, index into _outputs)
+        body = []
+
+        for k, comp in enumerate(comps):
+            plen = len(comp.pathname) + 1
+            rename = {}
+            external = False
+
+            for abs_in in comp._var_abs2meta['input']:
+                rel = abs_in[plen:]
+                if abs_in in internal:
+                    fname, j = fused_outs[internal[abs_in]]
+                    rename[rel] = fname
+                    self._internal.append((comp, abs_in, j))
+                else:
+                    rename[rel] = fname = f'_{k}_{rel}'
+                    self._inputs.append((fname, comp, abs_in))
+                    external = True
+
+            if external:
+                self.xfer_names.append(comp.name)
+
+            out_idxs = {}
+            for abs_out in comp._var_abs2meta['output']:
+                rel = abs_out[plen:]
+                rename[rel] = fname = f'_{k}_{rel}'
+                out_idxs[fname] = len(self._outputs)
+                fused_outs[abs_out] = (fname, len(self._outputs))
+                self._outputs.append((fname, comp, abs_out))
+
+            for name, val in comp._constants.items():
+                rename[name] = fname = f'_{k}_{name}'
+                self._constants[fname] = val
+
+            renamer = _NameReplacer(rename)
+            for expr in comp._exprs:
+                tree = renamer.visit(ast.parse(expr.strip()))
+                body.extend(tree.body)
+
+                # copy each new output value into the output vector right away, the same way
+                # ExecComp.compute does, so later expressions see the value it would have.
+                for fname in sorted(renamer.stored):
+                    body.extend(ast.parse(f"{fname} = _fused_set({out_idxs[fname]}, "
+                                          f"{fname})").body)
+                renamer.stored.clear()
+
+        names = ', '.join(comp.pathname for comp in comps)
+        module = ast.fix_missing_locations(ast.Module(body=body, type_ignores=[]))
+        self._code = compile(module, f'<fused ExecComps {names}>', 'exec')
+
+    def _solve_nonlinear(self, group):
+        """
+        Compute the outputs of all members.
+
+        Parameters
+        ----------
+        group : Group
+            The group containing the members.
+        """
+        views = [comp._outputs._abs_get_val(name, False) for _, comp, name in self._outputs]
+
+        namespace = {fname: comp._inputs._abs_get_val(name, False)
+                     for fname, comp, name in self._inputs}
+        namespace.update(self._constants)
+        namespace['_fused_set'] = partial(_fused_set, views)
+
+        try:
+            exec(self._code, _expr_dict, namespace)  # nosec: limited to _expr_dict
+        except Exception:
+            # run the members one at a time so that the error is reported by the ExecComp
+            # where it occurred.
+            for comp in self.comps:
+                group._transfer('nonlinear', 'fwd', comp.name)
+                comp._solve_nonlinear()
+            raise
+
+        for comp, name, j in self._internal:
+            comp._inputs._abs_set_val(name, views[j])
+
+        for comp in self.comps:
+            comp._residuals.set_val(0.0)
+            comp.iter_count += 1
+            if not comp.under_approx:
+                comp.iter_count_without_approx += 1
+
+
+class _NameReplacer(ast.NodeTransformer):
+    """
+    Replace variable names in an expression and keep track of the names assigned to.
+
+    Parameters
+    ----------
+    rename : dict
+        Mapping of old name to new name.
+
+    Attributes
+    ----------
+    rename : dict
+        Mapping of old name to new name.
+    stored : set
+        New names that have been assigned to.
+    """
+
+    def __init__(self, rename):
+        """
+        Initialize attributes.
+        """
+        self.rename = rename
+        self.stored = set()
+
+    def visit_Name(self, node):
+        """
+        Rename a variable.
+
+        Parameters
+        ----------
+        node : ast.Name
+            The node being visited.
+
+        Returns
+        -------
+        ast.Name
+            The renamed node.
+        """
+        if node.id in self.rename:
+            node.id = self.rename[node.id]
+            if isinstance(node.ctx, ast.Store):
+                self.stored.add(node.id)
+        return node
+
+
+def _fused_set(views, idx, val):
+    """
+    Set an output value of a fused ExecComp chain in its output vector.
+
+    Parameters
+    ----------
+    views : list of ndarray
+        Output vector views of all outputs in the chain.
+    idx : int
+        Index of the output.
+    val : float or ndarray
+        The value of the output.
+
+    Returns
+    -------
+    ndarray
+        The view of the output, which is passed on to the expressions that use it.
+    """
+    view = views[idx]
+    try:
+        view[:] = val
+    except ValueError:
+        # see if value fits if size 1 dimensions are removed
+        sqz = np.squeeze(val)
+        if np.squeeze(view).shape == sqz.shape:
+            view[:] = sqz
+        else:
+            raise
+    return view
+
+
+def _can_fuse(system):
+    """
+    Return True if the given system can be evaluated as part of a fused ExecComp chain.
+
+    Parameters
+    ----------
+    system : System
+        The system.
+
+    Returns
+    -------
+    bool
+        True if the system is a plain ExecComp with no recorders, discrete or distributed
+        variables, or scaling.
+    """
+    return (type(system) is ExecComp and bool(system._exprs) and
+            not system.options['use_jax'] and not system.options['distributed'] and
+            not system._rec_mgr._recorders and
+            not system._var_discrete['input'] and not system._var_discrete['output'] and
+            not (system._has_output_scaling or system._has_resid_scaling or
+                 system._has_input_scaling))
+
+
+def _find_fused_exec_chains(group):
+    """
+    Find the runs of consecutive ExecComps in a group that can be evaluated together.
+
+    A connection from one member to a later member is passed directly if it has no src_indices
+    and the same shape and units on both ends.  Any other such connection ends the run, since
+    the input must be transferred after the earlier member has run.  Connections to earlier
+    members, e.g., in a cycle, are transferred before the run starts, just as they would be
+    when each member is run separately.
+
+    Parameters
+    ----------
+    group : Group
+        The group.
+
+    Returns
+    -------
+    dict
+        _FusedExecChain objects keyed by the name of their first member.
+    """
+    conns = group._conn_global_abs_in2out
+    meta_in = group._var_abs2meta['input']
+    meta_out = group._var_abs2meta['output']
+    chains = {}
+    run = []
+    internal = {}
+    run_outputs = set()
+
+    for subsys in group._subsystems_myproc + [None]:
+        if subsys is not None and _can_fuse(subsys):
+            feeds = {}
+            direct = True
+            for abs_in in subsys._var_abs2meta['input']:
+                src = conns.get(abs_in)
+                if src in run_outputs:
+                    imeta = meta_in[abs_in]
+                    ometa = meta_out[src]
+                    if imeta['src_indices'] is not None or imeta['shape'] != ometa['shape'] or \
+                            imeta['units'] != ometa['units']:
+                        direct = False
+                        break
+                    feeds[abs_in] = src
+
+            if direct:
+                run.append(subsys)
+                internal.update(feeds)
+                run_outputs.update(subsys._var_abs2meta['output'])
+                continue
+
+        if len(run) > 1:
+            chains[run[0].name] = _FusedExecChain(run, internal)
+
+        if subsys is not None and _can_fuse(subsys):
+            # start a new run with the system that couldn't be added to the last one
+            run = [subsys]
+            run_outputs = set(subsys._var_abs2meta['output'])
+        else:
+            run = []
+            run_outputs = set()
+        internal = {}
+
+    return chains
+
+
 class _ViewDict(object):
     def __init__(self, dct):
         self.dct = dct
@@ -1261,6 +1937,45 @@ _expr_dict['abs'] = cs_safe.abs
 _expr_dict['arctan2'] = cs_safe.arctan2
 
 
+def _get_jax_equivalent(name):
+    """
+    Return the jax equivalent of a function available to ExecComp expressions.
+
+    Parameters
+    ----------
+    name : str
+        Name of the function in ExecComp expressions.
+
+    Returns
+    -------
+    callable or None
+        The jax function, or None if there isn't one.
+    """
+    fname = getattr(_expr_dict[name], '__name__', name)
+    return getattr(jnp, fname, None) or getattr(jsp, fname, None)
+
+
+def _get_jax_expr_dict():
+    """
+    Return a copy of _expr_dict where functions are replaced by their jax equivalents.
+
+    Functions without a jax equivalent are left out.
+
+    Returns
+    -------
+    dict
+        Namespace used to evaluate expressions with jax.
+    """
+    dct = {}
+    for name, val in _expr_dict.items():
+        if callable(val):
+            val = _get_jax_equivalent(name)
+            if val is None:
+                continue
+        dct[name] = val
+    return dct
+
+
 class _NumpyMsg(object):
     """
     A class that will raise an error if an attempt is made to access any attribute/function.
@@ -5,15 +5,20 @@ import traceback
 import numpy as np
 
 from openmdao.core.explicitcomponent import ExplicitComponent
+from openmdao.core.component import Component
+from openmdao.core.indepvarcomp import IndepVarComp
 from openmdao.core.constants import INT_DTYPE
+from openmdao.approximation_schemes.approximation_scheme import ApproximationScheme
+from openmdao.solvers.nonlinear.nonlinear_runonce import NonlinearRunOnce
 import openmdao.func_api as omf
 from openmdao.components.func_comp_common import _check_var_name, _copy_with_ignore, _add_options, \
-    jac_forward, jac_reverse, _get_tangents
+    _get_tangents, _cached_jit, _jac_kernel, _jax_direction
 from openmdao.utils.array_utils import shape_to_len
+from openmdao.utils.units import unit_conversion
+from openmdao.utils.coloring_cache import partial_coloring_key, _source_hash
 
 try:
     import jax
-    from jax import jit
     import jax.numpy as jnp
     jax.config.update("jax_enable_x64", True)  # jax by default uses 32 bit floats
 except Exception:
@@ -57,6 +62,9 @@ class ExplicitFuncComp(ExplicitComponent):
         Tuple of parts of the tangent matrix cached for jax derivative computation.
     _tangent_direction : str
         Direction of the last tangent computation.
+    _jax_batched_partials : object or None
+        Partials computed by jax for this component as part of a batch of components sharing
+        the same function, to be used in the next call to _linearize.
     """
 
     def __init__(self, compute, compute_partials=None, **kwargs):
@@ -81,13 +89,17 @@ class ExplicitFuncComp(ExplicitComponent):
 
         self._tangents = None
         self._tangent_direction = None
+        self._jax_batched_partials = None
 
         self._compute_partials = compute_partials
         if self.options['use_jax'] and self.options['use_jit']:
-            static_argnums = [i for i, m in enumerate(self._compute._inputs.values())
-                              if 'is_option' in m]
+            static_argnums = tuple([i for i, m in enumerate(self._compute._inputs.values())
+                                    if 'is_option' in m])
             try:
-                self._compute_jax = jit(self._compute_jax, static_argnums=static_argnums)
+                # the jitted function is shared with all other components wrapping the same
+                # function, so it's only compiled once per distinct set of input shapes
+                self._compute_jax = _cached_jit((self._compute._f, 'compute', static_argnums),
+                                                self._compute_jax, static_argnums)
             except Exception as err:
                 raise RuntimeError(f"{self.msginfo}: failed jit compile of compute function: {err}")
 
@@ -143,7 +155,7 @@ class ExplicitFuncComp(ExplicitComponent):
             Flag indicating if the children should call linearize on their linear solvers.
         """
         if self.options['use_jax']:
-            if self._mode != self._tangent_direction:
+            if self._coloring_info.coloring is not None and self._mode != self._tangent_direction:
                 # force recomputation of coloring and tangents
                 self._first_call_to_linearize = True
                 self._tangents = None
@@ -165,19 +177,30 @@ class ExplicitFuncComp(ExplicitComponent):
         argidxs = argnums
         if len(argnums) == len(inames):
             argnums = None  # speedup if there are no static args
+        else:
+            argnums = tuple(argnums)
         osize = len(self._outputs)
         isize = len(self._inputs)
         invals = list(self._func_values(self._inputs))
         coloring = self._coloring_info.coloring
-        func = self._compute_jax
+        direction = _jax_direction(self, osize, isize, coloring)
 
-        if self._mode == 'rev':  # use reverse mode to compute derivs
-            outvals = tuple(self._outputs.values())
-            tangents = self._get_tangents(outvals, 'rev', coloring)
+        if direction == 'rev':  # use reverse mode to compute derivs
+            tangents = self._get_tangents(tuple(self._outputs.values()), 'rev', coloring)
+        else:
+            tangents = self._get_tangents(invals, 'fwd', coloring, argnums)
+
+        if self._jax_batched_partials is None:
+            partials = self._get_jax_jac_func(direction, argnums)(tangents, *invals)
+        else:
+            partials = self._jax_batched_partials
+            self._jax_batched_partials = None
+
+        if direction == 'rev':
             if coloring is None:
                 j = np.empty((osize, isize), dtype=float)
                 cstart = cend = 0
-                for i, a in zip(argidxs, jac_reverse(func, argnums, tangents)(*invals)):
+                for i, a in zip(argidxs, partials):
                     if isinstance(invals[i], np.ndarray):
                         cend += invals[i].size
                     else:  # must be a scalar
@@ -190,14 +213,13 @@ class ExplicitFuncComp(ExplicitComponent):
                     cstart = cend
             else:
                 j = [np.asarray(a).reshape((a.shape[0], shape_to_len(a.shape[1:])))
-                     for a in jac_reverse(func, argnums, tangents)(*invals)]
+                     for a in partials]
                 j = coloring.expand_jac(np.hstack(j), 'rev')
         else:
-            tangents = self._get_tangents(invals, 'fwd', coloring, argnums)
             if coloring is None:
                 j = np.empty((osize, isize), dtype=float)
                 start = end = 0
-                for a in jac_forward(func, argnums, tangents)(*invals):
+                for a in partials:
                     a = np.asarray(a)
                     if a.ndim < 2:
                         a = a.reshape((1, a.size))
@@ -211,11 +233,75 @@ class ExplicitFuncComp(ExplicitComponent):
                     start = end
             else:
                 j = [np.asarray(a).reshape((shape_to_len(a.shape[:-1]), a.shape[-1]))
-                     for a in jac_forward(func, argnums, tangents)(*invals)]
+                     for a in partials]
                 j = coloring.expand_jac(np.vstack(j), 'fwd')
 
         self._jacobian.set_dense_jac(self, j)
 
+    def _get_jax_jac_func(self, direction, argnums):
+        """
+        Return the function of (tangents, *args) that computes the partials using jax.
+
+        If jit is active, the jitted function is shared by all components wrapping the same
+        python function.
+
+        Parameters
+        ----------
+        direction : str
+            Derivative direction, 'fwd' or 'rev'.
+        argnums : tuple of int or None
+            Indices of dynamic (differentiable) function args.
+
+        Returns
+        -------
+        function
+            The partials function.
+        """
+        kernel = _jac_kernel(self._compute_jax, direction, argnums)
+        if self.options['use_jit']:
+            static_argnums = tuple([i + 1 for i, m in enumerate(self._compute._inputs.values())
+                                    if 'is_option' in m])
+            return _cached_jit((self._compute._f, direction, argnums), kernel, static_argnums)
+        return kernel
+
+    def _jax_batch_key(self):
+        """
+        Return the key used to batch the jax partials computation with other components.
+
+        Returns
+        -------
+        tuple or None
+            (function, direction, input shapes), or None if this component can't be batched.
+        """
+        if not (self.options['use_jax'] and self.options['use_jit']) or \
+                self._first_call_to_linearize or self._coloring_info.coloring is not None or \
+                any('is_option' in m for m in self._compute._inputs.values()):
+            return None
+
+        return (self._compute._f, _jax_direction(self, len(self._outputs), len(self._inputs), None),
+                tuple([v.shape for v in self._inputs.values()]))
+
+    def _jax_batch_data(self, direction):
+        """
+        Return the data needed to compute the partials of this component in a batch.
+
+        Parameters
+        ----------
+        direction : str
+            Derivative direction, 'fwd' or 'rev'.
+
+        Returns
+        -------
+        tuple
+            The function to differentiate, the tangents and the function args.
+        """
+        invals = list(self._inputs.values())
+        if direction == 'rev':
+            tangents = self._get_tangents(tuple(self._outputs.values()), 'rev')
+        else:
+            tangents = self._get_tangents(invals, 'fwd')
+        return self._compute_jax, tangents, invals
+
     def _get_tangents(self, vals, direction, coloring=None, argnums=None):
         """
         Return a tuple of tangents values for use with vmap.
@@ -332,3 +418,371 @@ class ExplicitFuncComp(ExplicitComponent):
         ret = super()._compute_coloring(recurse, **overrides)
         self._tangents = None  # reset to compute new colored tangents later
         return ret
+
+    def _get_coloring_cache_key(self):
+        """
+        Return the key of this system's partial coloring in the coloring cache.
+
+        Returns
+        -------
+        str or None
+            The cache key, or None if the coloring can't be cached.
+        """
+        return partial_coloring_key(self, _source_hash(self._compute._f))
+
+
+def _jax_compile_problem(group):
+    """
+    Return the reason why the given group can't be compiled with jax, or None if it can.
+
+    Parameters
+    ----------
+    group : Group
+        The group.
+
+    Returns
+    -------
+    str or None
+        Description of the problem.
+    """
+    if jax is None:
+        return "jax is not installed"
+
+    if group.comm.size > 1:
+        return "the group is running on more than one process"
+
+    for s in group.system_iter(include_self=True, recurse=True):
+        if not isinstance(s, Component):
+            if not isinstance(s.nonlinear_solver, NonlinearRunOnce):
+                return f"'{s.pathname}' has a {type(s.nonlinear_solver).__name__} nonlinear solver"
+        elif not isinstance(s, IndepVarComp):
+            if not (isinstance(s, ExplicitFuncComp) and s.options['use_jax']):
+                return f"'{s.pathname}' is not an ExplicitFuncComp using jax"
+            if s.options['distributed'] or s._rec_mgr._recorders or \
+                    s._var_discrete['input'] or s._var_discrete['output']:
+                return f"'{s.pathname}' is distributed, has recorders or has discrete variables"
+
+    return None
+
+
+def _offsets(names, abs2meta):
+    """
+    Return the (start, end) of each named variable in an array containing all of them.
+
+    Parameters
+    ----------
+    names : list of str
+        Absolute variable names in array order.
+    abs2meta : dict
+        Variable metadata keyed by absolute name.
+
+    Returns
+    -------
+    dict
+        (start, end) keyed by absolute name.
+    """
+    offsets = {}
+    end = 0
+    for name in names:
+        start = end
+        end += abs2meta[name]['size']
+        offsets[name] = (start, end)
+    return offsets
+
+
+def _vec_indices(names, slices):
+    """
+    Return the indices of the named variables in a vector's array.
+
+    Parameters
+    ----------
+    names : list of str
+        Absolute variable names.
+    slices : dict
+        Slice of each variable in the array keyed by absolute name.
+
+    Returns
+    -------
+    ndarray
+        The concatenated indices.
+    """
+    idxs = [np.arange(slices[n].start, slices[n].stop, dtype=INT_DTYPE) for n in names]
+    return np.concatenate(idxs) if idxs else np.zeros(0, dtype=INT_DTYPE)
+
+
+class _JaxGroupFunc(object):
+    """
+    The feed-forward subtree of a Group traced into a single jitted jax function.
+
+    The function takes the flattened values of the inputs connected to sources outside of the
+    group and of the IndepVarComp outputs.  It evaluates the ExplicitFuncComps in execution
+    order, doing the connections inside of the group as gathers, and returns the flattened
+    values of all ExplicitFuncComp outputs and of all inputs connected inside of the group.
+
+    Parameters
+    ----------
+    group : Group
+        The group.
+
+    Attributes
+    ----------
+    comps : list of ExplicitFuncComp
+        The ExplicitFuncComps in execution order.
+    ext_offsets : dict
+        (start, end) of each input connected outside of the group in the flat external input
+        array, keyed by absolute name.
+    out_offsets : dict
+        (start, end) of each ExplicitFuncComp output in the flat output array, keyed by
+        absolute name.
+    _ext_idx : ndarray
+        Indices in the group's input array of the inputs connected outside of the group.
+    _ivc_idx : ndarray
+        Indices in the group's output array of the IndepVarComp outputs.
+    _out_idx : ndarray
+        Indices in the group's output array of the ExplicitFuncComp outputs.
+    _int_idx : ndarray
+        Indices in the group's input array of the inputs connected inside of the group.
+    _func : function
+        The jitted function of (external inputs, IndepVarComp outputs) that returns
+        (outputs, internal inputs).
+    _jac_func : function
+        The jitted function of (external inputs, IndepVarComp outputs) that returns the jacobian
+        of the outputs with respect to the external inputs.
+    """
+
+    def __init__(self, group):
+        """
+        Initialize attributes.
+        """
+        prefix = group.pathname + '.' if group.pathname else ''
+        conns = group._problem_meta['model_ref']()._conn_global_abs_in2out
+        abs2meta_in = group._var_abs2meta['input']
+        abs2meta_out = group._var_abs2meta['output']
+
+        comps = list(group.system_iter(recurse=True, typ=Component))
+        self.comps = [c for c in comps if not isinstance(c, IndepVarComp)]
+        ivc_names = [n for c in comps if isinstance(c, IndepVarComp)
+                     for n in c._var_abs2meta['output']]
+        ext_names = [n for c in self.comps for n in c._var_abs2meta['input']
+                     if not conns[n].startswith(prefix)]
+        out_names = [n for c in self.comps for n in c._var_abs2meta['output']]
+
+        self.ext_offsets = ext_offsets = _offsets(ext_names, abs2meta_in)
+        self.out_offsets = _offsets(out_names, abs2meta_out)
+        ivc_offsets = _offsets(ivc_names, abs2meta_out)
+
+        int_names = []
+        steps = []
+        computed = set()
+        for comp in self.comps:
+            specs = []
+            inputs = iter(comp._var_abs2meta['input'])
+            for argname, meta in comp._compute._inputs.items():
+                if 'is_option' in meta:
+                    specs.append(('option', comp.options[argname]))
+                    continue
+
+                name = next(inputs)
+                meta_in = abs2meta_in[name]
+                if name in ext_offsets:
+                    specs.append(('ext', ext_offsets[name] + (meta_in['shape'],)))
+                    continue
+
+                src = conns[name]
+                if src in ivc_offsets:
+                    kind = 'ivc'
+                elif src in computed:
+                    kind = 'out'
+                else:
+                    raise RuntimeError(f"{group.msginfo}: Option 'jax_compile' requires a "
+                                       f"feed-forward data flow, but input '{name}' is connected "
+                                       f"to output '{src}', which is computed after it.")
+
+                idx = meta_in['src_indices']
+                if idx is not None:
+                    idx = idx.shaped_array().ravel()
+
+                factor = offset = None
+                src_units = abs2meta_out[src]['units']
+                if src_units is not None and meta_in['units'] is not None and \
+                        src_units != meta_in['units']:
+                    factor, offset = unit_conversion(src_units, meta_in['units'])
+
+                specs.append((kind, (src, idx, factor, offset, meta_in['shape'])))
+                int_names.append(name)
+
+            outs = list(comp._var_abs2meta['output'])
+            computed.update(outs)
+            steps.append((comp._compute_jax, specs, outs))
+
+        def func(x_ext, x_ivc):
+            vals = {}
+            int_vals = []
+            for f, specs, outs in steps:
+                args = []
+                for kind, data in specs:
+                    if kind == 'option':
+                        args.append(data)
+                    elif kind == 'ext':
+                        start, end, shape = data
+                        args.append(x_ext[start:end].reshape(shape))
+                    else:
+                        src, idx, factor, offset, shape = data
+                        if kind == 'ivc':
+                            start, end = ivc_offsets[src]
+                            val = x_ivc[start:end]
+                        else:
+                            val = vals[src]
+                        if idx is not None:
+                            val = val[idx]
+                        if factor is not None:
+                            val = (val + offset) * factor
+                        int_vals.append(val)
+                        args.append(val.reshape(shape))
+
+                results = f(*args)
+                if len(outs) == 1:
+                    results = (results,)
+                for name, result in zip(outs, results):
+                    vals[name] = jnp.ravel(result)
+
+            outvals = jnp.concatenate([vals[n] for n in out_names]) if out_names \
+                else jnp.zeros(0)
+            return outvals, jnp.concatenate(int_vals) if int_vals else jnp.zeros(0)
+
+        def outputs_func(x_ext, x_ivc):
+            return func(x_ext, x_ivc)[0]
+
+        if self.out_offsets and ext_offsets:
+            nout = list(self.out_offsets.values())[-1][1]
+            next_ = list(ext_offsets.values())[-1][1]
+            jacfunc = jax.jacrev if nout < next_ else jax.jacfwd
+        else:
+            jacfunc = jax.jacfwd
+
+        self._func = jax.jit(func)
+        self._jac_func = jax.jit(jacfunc(outputs_func))
+
+        in_slices = group._inputs.get_slice_dict()
+        out_slices = group._outputs.get_slice_dict()
+        self._ext_idx = _vec_indices(ext_names, in_slices)
+        self._ivc_idx = _vec_indices(ivc_names, out_slices)
+        self._out_idx = _vec_indices(out_names, out_slices)
+        self._int_idx = _vec_indices(int_names, in_slices)
+
+    def _solve_nonlinear(self, group):
+        """
+        Compute the outputs of all ExplicitFuncComps in the group.
+
+        Parameters
+        ----------
+        group : Group
+            The group.
+        """
+        with group._unscaled_context(outputs=[group._outputs], residuals=[group._residuals]):
+            inarr = group._inputs.asarray()
+            outarr = group._outputs.asarray()
+            outvals, intvals = self._func(inarr[self._ext_idx], outarr[self._ivc_idx])
+            outarr[self._out_idx] = np.asarray(outvals)
+            inarr[self._int_idx] = np.asarray(intvals)
+
+        group._residuals.set_val(0.0)
+
+        for comp in self.comps:
+            comp.iter_count += 1
+            if not comp.under_approx:
+                comp.iter_count_without_approx += 1
+
+    def _compute_jacobian(self, group):
+        """
+        Compute the jacobian of the outputs with respect to the inputs connected outside.
+
+        The outputs of the group are assumed to be in an unscaled state.
+
+        Parameters
+        ----------
+        group : Group
+            The group.
+
+        Returns
+        -------
+        ndarray
+            The dense jacobian.
+        """
+        return np.asarray(self._jac_func(group._inputs.asarray()[self._ext_idx],
+                                         group._outputs.asarray()[self._ivc_idx]))
+
+
+class _JaxGroupJacobian(ApproximationScheme):
+    """
+    Compute the jacobian of a group using its 'jax_compile' function.
+
+    The group behaves like an ExplicitComponent, so this sets the derivatives of its outputs
+    with respect to the inputs connected outside of the group.
+
+    Attributes
+    ----------
+    _keys : list of tuple
+        The (of, wrt) absolute name pairs of the sub-jacobians.
+    """
+
+    def __init__(self):
+        """
+        Initialize attributes.
+        """
+        super().__init__()
+        self._keys = []
+
+    def _reset(self):
+        """
+        Get rid of any existing sub-jacobian keys.
+        """
+        super()._reset()
+        self._keys = []
+
+    def add_approximation(self, abs_key, system, kwargs):
+        """
+        Use jax to compute the derivative d(of)/d(wrt).
+
+        Parameters
+        ----------
+        abs_key : tuple(str,str)
+            Absolute name pairing of (of, wrt) for the derivative.
+        system : System
+            Containing System.
+        kwargs : dict
+            Additional keyword arguments.  Not used.
+        """
+        self._wrt_meta[abs_key[1]] = kwargs
+        self._keys.append(abs_key)
+
+    def compute_approximations(self, system, jac=None):
+        """
+        Compute the sub-jacobians of the group.
+
+        Parameters
+        ----------
+        system : System
+            The group.
+        jac : None or dict-like
+            If None, update system with the computed sub-jacobians. Otherwise, store them in the
+            given dict-like object.
+        """
+        func = system._get_jax_group_func()
+        if not (self._keys and func.ext_offsets and func.out_offsets):
+            return
+
+        if jac is None:
+            jac = system._jacobian
+
+        J = func._compute_jacobian(system)
+
+        for key in self._keys:
+            of, wrt = key
+            if of in func.out_offsets and wrt in func.ext_offsets:
+                subjac = jac._subjacs_info[key]
+                sub = J[slice(*func.out_offsets[of]), slice(*func.ext_offsets[wrt])]
+                if subjac['rows'] is None:
+                    subjac['val'][:] = sub
+                else:
+                    subjac['val'][:] = sub[subjac['rows'], subjac['cols']]
@@ -6,11 +6,12 @@ import sys
 import traceback
 import re
 from functools import partial
+from collections import defaultdict, OrderedDict
 
 import numpy as np
 try:
     import jax
-    from jax import vmap
+    from jax import vmap, jit
     import jax.numpy as jnp
     # linear_util moved to jax.extend in jax 0.4.17, previous location is deprecated
     try:
@@ -31,6 +32,16 @@ from openmdao.vectors.vector import Vector
 from openmdao.core.constants import INT_DTYPE
 
 
+# Jitted functions shared by all function components in this process, keyed by the wrapped
+# python function and the transformation applied to it.  jax caches the compiled code of a jitted
+# function based on the shapes and dtypes of its dynamic args and the values of its static args,
+# so components that wrap the same function only trigger one compilation for each distinct set
+# of input shapes and option values.  The least recently used entries are dropped once there are
+# more than _JIT_CACHE_SIZE of them.  Components keep a reference to their own jitted functions,
+# so dropping an entry only means that components created later compile the function again.
+_jit_cache = OrderedDict()
+_JIT_CACHE_SIZE = 128
+
 # regex to check for variable names.
 namecheck_rgx = re.compile('[_a-zA-Z][_a-zA-Z0-9]*')
 
@@ -112,6 +123,9 @@ def jac_forward(fun, argnums, tangents):
         variable, the values returned are grouped by input variable.
     """
     f = linear_util.wrap_init(fun)
+    if not isinstance(tangents, tuple):
+        # the tangents must have the same structure as the tuple of dynamic args
+        tangents = (tangents,)
     if argnums is None:
         def jacfunf(*args):
             return vmap(partial(_jvp, f, args), out_axes=(None, -1))(tangents)[1]
@@ -150,15 +164,42 @@ def jac_reverse(fun, argnums, tangents):
     f = linear_util.wrap_init(fun)
     if argnums is None:
         def jacfunr(*args):
-            return vmap(_vjp(f, *args)[1])(tangents)
+            out, vjpfun = _vjp(f, *args)
+            return vmap(vjpfun)(_match_cotangents(tangents, out))
     else:
         def jacfunr(*args):
             f_partial, dyn_args = argnums_partial(f, argnums, args)
-            return vmap(_vjp(f_partial, *dyn_args)[1])(tangents)
+            out, vjpfun = _vjp(f_partial, *dyn_args)
+            return vmap(vjpfun)(_match_cotangents(tangents, out))
 
     return jacfunr
 
 
+def _match_cotangents(tangents, out):
+    """
+    Reshape the rows of the tangent matrix to match the values returned by the function.
+
+    The tangents have the shapes of the declared outputs, but a function may return values of a
+    different shape with the same size, e.g. a 0-d value for an output of shape (1,).
+
+    Parameters
+    ----------
+    tangents : tuple of ndarray or ndarray
+        The tangents, with shapes (ntangents,) + output shape.
+    out : tuple of ndarray or ndarray
+        Values returned by the function.
+
+    Returns
+    -------
+    tuple of ndarray or ndarray
+        The tangents, with the same structure and shapes as out, plus the leading dimension.
+    """
+    out_leaves, out_tree = jax.tree_util.tree_flatten(out)
+    return out_tree.unflatten([jnp.reshape(t, t.shape[:1] + jnp.shape(o))
+                               for t, o in zip(jax.tree_util.tree_leaves(tangents),
+                                               out_leaves)])
+
+
 def jacvec_prod(fun, argnums, invals, tangent):
     """
     Similar to the jvp function but gives back a flat column.
@@ -245,3 +286,144 @@ def _get_tangents(vals, direction, coloring=None, argnums=None, trans=None):
         tangents = tangents[0]
 
     return tangents
+
+
+def _cached_jit(key, func, static_argnums=()):
+    """
+    Return the jitted version of a function, shared by all components using the same key.
+
+    Parameters
+    ----------
+    key : tuple
+        Key identifying the function and the transformations applied to it.  The first entry
+        should be the wrapped python function.
+    func : function
+        The function to be jitted.  It's only used if there is no jitted function for this key.
+    static_argnums : tuple of int
+        Indices of the static args of the function.
+
+    Returns
+    -------
+    function
+        The jitted function.
+    """
+    try:
+        jitted = _jit_cache[key]
+    except KeyError:
+        jitted = _jit_cache[key] = jit(func, static_argnums=static_argnums)
+        while len(_jit_cache) > _JIT_CACHE_SIZE:
+            _jit_cache.popitem(last=False)
+    else:
+        _jit_cache.move_to_end(key)
+
+    return jitted
+
+
+def clear_jit_cache():
+    """
+    Remove all of the jitted functions shared by function components.
+
+    This releases the python functions held by the cache.  Existing components keep using their
+    jitted functions.
+    """
+    _jit_cache.clear()
+
+
+def _jac_kernel(func, direction, argnums):
+    """
+    Return a function of (tangents, *args) that computes the partials of func.
+
+    Unlike the functions returned by jac_forward and jac_reverse, the tangents are an argument
+    rather than being bound, so the same kernel can be used by any number of components.
+
+    Parameters
+    ----------
+    func : function
+        The function to be differentiated.
+    direction : str
+        Derivative direction, 'fwd' or 'rev'.
+    argnums : tuple of int or None
+        Specifies which positional args are dynamic.  None means all positional args are dynamic.
+
+    Returns
+    -------
+    function
+        The partials function.
+    """
+    jacfunc = jac_forward if direction == 'fwd' else jac_reverse
+
+    def kernel(tangents, *args):
+        return jacfunc(func, argnums, tangents)(*args)
+
+    return kernel
+
+
+def _jax_direction(comp, nrows, ncols, coloring):
+    """
+    Return the direction that requires the fewest jax passes to compute a component's partials.
+
+    Parameters
+    ----------
+    comp : ExplicitFuncComp or ImplicitFuncComp
+        The component.
+    nrows : int
+        Number of rows in the partial jacobian.
+    ncols : int
+        Number of columns in the partial jacobian.
+    coloring : Coloring or None
+        The partial coloring.  The compressed tangents of a coloring are computed for the
+        derivative direction of the problem.
+
+    Returns
+    -------
+    str
+        'fwd' or 'rev'.
+    """
+    if coloring is not None:
+        return comp._mode
+    return 'rev' if nrows < ncols else 'fwd'
+
+
+def _jax_linearize_batched(systems):
+    """
+    Compute the partials of sibling function components that share a function using jax.vmap.
+
+    Components whose partials are computed with jit and jax, that wrap the same function with no
+    option args and have the same input shapes and no partial coloring, are batched together.
+    The partials of each batch are computed in a single call of the vmapped, jitted partials
+    kernel, and are then picked up by each component in its _linearize method.
+
+    Parameters
+    ----------
+    systems : list of System
+        The subsystems about to be linearized.
+    """
+    if jax is None:
+        return
+
+    batches = defaultdict(list)
+    for system in systems:
+        get_key = getattr(system, '_jax_batch_key', None)
+        if get_key is not None:
+            key = get_key()
+            if key is not None:
+                batches[key].append(system)
+
+    for key, comps in batches.items():
+        if len(comps) < 2:
+            continue
+
+        # key is (function, direction, input shapes)
+        direction = key[1]
+        data = [comp._jax_batch_data(direction) for comp in comps]
+        func, tangents, _ = data[0]
+        kernel = _jac_kernel(func, direction, None)
+
+        def batched(tangents, *args):
+            return vmap(partial(kernel, tangents))(*args)
+
+        stacked = [np.stack(vals) for vals in zip(*[args for _, _, args in data])]
+        raw = _cached_jit(key + ('vmap',), batched)(tangents, *stacked)
+
+        for i, comp in enumerate(comps):
+            comp._jax_batched_partials = jax.tree_util.tree_map(lambda a: a[i], raw)
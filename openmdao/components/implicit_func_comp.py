@@ -8,12 +8,13 @@ from openmdao.core.implicitcomponent import ImplicitComponent
 from openmdao.core.constants import INT_DTYPE
 import openmdao.func_api as omf
 from openmdao.components.func_comp_common import _check_var_name, _copy_with_ignore, _add_options, \
-    jac_forward, jac_reverse, _get_tangents
+    _get_tangents, _cached_jit, _jac_kernel, _jax_direction
 from openmdao.utils.array_utils import shape_to_len
+from openmdao.utils.coloring_cache import partial_coloring_key, _source_hash
 
 try:
     import jax
-    from jax import jit, jacfwd, jacrev
+    from jax import jacfwd, jacrev
     jax.config.update("jax_enable_x64", True)  # jax by default uses 32 bit floats
 except Exception:
     _, err, tb = sys.exc_info()
@@ -65,6 +66,9 @@ class ImplicitFuncComp(ImplicitComponent):
         Direction of the last tangent computation.
     _jac2func_inds : ndarray
         Translation array from jacobian indices to function array indices.
+    _jax_batched_partials : object or None
+        Partials computed by jax for this component as part of a batch of components sharing
+        the same function, to be used in the next call to _linearize.
     """
 
     def __init__(self, apply_nonlinear, solve_nonlinear=None, linearize=None, solve_linear=None,
@@ -81,6 +85,7 @@ class ImplicitFuncComp(ImplicitComponent):
         self._tangents = None
         self._tangent_direction = None
         self._jac2func_inds = None
+        self._jax_batched_partials = None
 
         if solve_nonlinear:
             self.solve_nonlinear = self._user_solve_nonlinear
@@ -104,12 +109,17 @@ class ImplicitFuncComp(ImplicitComponent):
             self._apply_nonlinear_func_jax = omf.jax_decorate(self._apply_nonlinear_func._f)
 
         if self.options['use_jax'] and self.options['use_jit']:
-            static_argnums = [i for i, m in enumerate(self._apply_nonlinear_func._inputs.values())
-                              if 'is_option' in m]
+            static_argnums = tuple([i for i, m in
+                                    enumerate(self._apply_nonlinear_func._inputs.values())
+                                    if 'is_option' in m])
             try:
+                # the jitted function is shared with all other components wrapping the same
+                # function, so it's only compiled once per distinct set of input shapes
                 with omf.jax_context(self._apply_nonlinear_func._f.__globals__):
-                    self._apply_nonlinear_func_jax = jit(self._apply_nonlinear_func_jax,
-                                                         static_argnums=static_argnums)
+                    self._apply_nonlinear_func_jax = \
+                        _cached_jit((self._apply_nonlinear_func._f, 'apply_nonlinear',
+                                     static_argnums), self._apply_nonlinear_func_jax,
+                                    static_argnums)
             except Exception as err:
                 raise RuntimeError(f"{self.msginfo}: failed jit compile of solve_nonlinear "
                                    f"function: {err}")
@@ -217,7 +227,7 @@ class ImplicitFuncComp(ImplicitComponent):
             Flag indicating if the children should call linearize on their linear solvers.
         """
         if self.options['use_jax']:
-            if self._mode != self._tangent_direction:
+            if self._coloring_info.coloring is not None and self._mode != self._tangent_direction:
                 # force recomputation of coloring and tangents
                 self._first_call_to_linearize = True
                 self._tangents = None
@@ -237,25 +247,40 @@ class ImplicitFuncComp(ImplicitComponent):
         func = self._apply_nonlinear_func
         # argnums specifies which position args are to be differentiated
         inames = list(func.get_input_names())
-        argnums = aa = [i for i, m in enumerate(func._inputs.values()) if 'is_option' not in m]
+        argnums = [i for i, m in enumerate(func._inputs.values()) if 'is_option' not in m]
         if len(argnums) == len(inames):
             argnums = None  # speedup if there are no static args
+        else:
+            argnums = tuple(argnums)
         osize = len(self._outputs)
         isize = len(self._inputs) + osize
         invals = list(self._ordered_func_invals(self._inputs, self._outputs))
         coloring = self._coloring_info['coloring']
+        direction = _jax_direction(self, osize, isize, coloring)
+
+        if direction == 'rev':  # use reverse mode to compute derivs
+            tangents = self._get_tangents(tuple(self._outputs.values()), 'rev', coloring)
+        elif coloring is not None:
+            tangents = self._get_tangents(invals, 'fwd', coloring, argnums,
+                                          trans=self._get_jac2func_inds(self._inputs,
+                                                                        self._outputs))
+        else:
+            tangents = self._get_tangents(invals, 'fwd', coloring, argnums)
+
+        if self._jax_batched_partials is None:
+            partials = self._get_jax_jac_func(direction, argnums)(tangents, *invals)
+        else:
+            partials = self._jax_batched_partials
+            self._jax_batched_partials = None
 
-        if self._mode == 'rev':  # use reverse mode to compute derivs
-            outvals = tuple(self._outputs.values())
-            tangents = self._get_tangents(outvals, 'rev', coloring)
+        if direction == 'rev':
             if coloring is not None:
                 j = [np.asarray(a).reshape((a.shape[0], shape_to_len(a.shape[1:])))
-                     for a in jac_reverse(self._apply_nonlinear_func_jax, argnums,
-                                          tangents)(*invals)]
+                     for a in partials]
                 j = coloring.expand_jac(np.hstack(self._reorder_col_chunks(j)), 'rev')
             else:
                 j = []
-                for a in jac_reverse(self._apply_nonlinear_func_jax, argnums, tangents)(*invals):
+                for a in partials:
                     a = np.asarray(a)
                     if a.ndim < 2:
                         a = a.reshape((a.size, 1))
@@ -265,17 +290,12 @@ class ImplicitFuncComp(ImplicitComponent):
                 j = np.hstack(self._reorder_col_chunks(j)).reshape((osize, isize))
         else:
             if coloring is not None:
-                tangents = self._get_tangents(invals, 'fwd', coloring, argnums,
-                                              trans=self._get_jac2func_inds(self._inputs,
-                                                                            self._outputs))
                 j = [np.asarray(a).reshape((shape_to_len(a.shape[:-1]), a.shape[-1]))
-                     for a in jac_forward(self._apply_nonlinear_func_jax, argnums,
-                                          tangents)(*invals)]
+                     for a in partials]
                 j = coloring.expand_jac(np.vstack(j), 'fwd')
             else:
-                tangents = self._get_tangents(invals, 'fwd', coloring, argnums)
                 j = []
-                for a in jac_forward(self._apply_nonlinear_func_jax, argnums, tangents)(*invals):
+                for a in partials:
                     a = np.asarray(a)
                     if a.ndim < 2:
                         a = a.reshape((1, a.size))
@@ -286,6 +306,75 @@ class ImplicitFuncComp(ImplicitComponent):
 
         self._jacobian.set_dense_jac(self, j)
 
+    def _get_jax_jac_func(self, direction, argnums):
+        """
+        Return the function of (tangents, *args) that computes the partials using jax.
+
+        If jit is active, the jitted function is shared by all components wrapping the same
+        python function.
+
+        Parameters
+        ----------
+        direction : str
+            Derivative direction, 'fwd' or 'rev'.
+        argnums : tuple of int or None
+            Indices of dynamic (differentiable) function args.
+
+        Returns
+        -------
+        function
+            The partials function.
+        """
+        func = self._apply_nonlinear_func
+        kernel = _jac_kernel(self._apply_nonlinear_func_jax, direction, argnums)
+        if self.options['use_jit']:
+            static_argnums = tuple([i + 1 for i, m in enumerate(func._inputs.values())
+                                    if 'is_option' in m])
+            return _cached_jit((func._f, direction, argnums), kernel, static_argnums)
+        return kernel
+
+    def _jax_batch_key(self):
+        """
+        Return the key used to batch the jax partials computation with other components.
+
+        Returns
+        -------
+        tuple or None
+            (function, direction, function arg shapes), or None if this component can't be
+            batched.
+        """
+        func = self._apply_nonlinear_func
+        if not (self.options['use_jax'] and self.options['use_jit']) or \
+                self._first_call_to_linearize or self._coloring_info.coloring is not None or \
+                any('is_option' in m for m in func._inputs.values()):
+            return None
+
+        osize = len(self._outputs)
+        return (func._f, _jax_direction(self, osize, len(self._inputs) + osize, None),
+                tuple([np.shape(v) for v in self._ordered_func_invals(self._inputs,
+                                                                      self._outputs)]))
+
+    def _jax_batch_data(self, direction):
+        """
+        Return the data needed to compute the partials of this component in a batch.
+
+        Parameters
+        ----------
+        direction : str
+            Derivative direction, 'fwd' or 'rev'.
+
+        Returns
+        -------
+        tuple
+            The function to differentiate, the tangents and the function args.
+        """
+        invals = list(self._ordered_func_invals(self._inputs, self._outputs))
+        if direction == 'rev':
+            tangents = self._get_tangents(tuple(self._outputs.values()), 'rev')
+        else:
+            tangents = self._get_tangents(invals, 'fwd')
+        return self._apply_nonlinear_func_jax, tangents, invals
+
     def _user_linearize(self, inputs, outputs, jacobian):
         """
         Calculate the partials of the residual for each balance.
@@ -497,3 +586,14 @@ class ImplicitFuncComp(ImplicitComponent):
         ret = super()._compute_coloring(recurse, **overrides)
         self._tangents = None  # reset to compute new colored tangents later
         return ret
+
+    def _get_coloring_cache_key(self):
+        """
+        Return the key of this system's partial coloring in the coloring cache.
+
+        Returns
+        -------
+        str or None
+            The cache key, or None if the coloring can't be cached.
+        """
+        return partial_coloring_key(self, _source_hash(self._apply_nonlinear_func._f))
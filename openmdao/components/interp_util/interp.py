@@ -49,6 +49,7 @@ TABLE_METHODS = ['slinear', 'lagrange2', 'lagrange3', 'cubic', 'akima',
                  '1D-akima',
                  '3D-lagrange2', '2D-lagrange2', '1D-lagrange2',
                  '3D-lagrange3', '2D-lagrange3', '1D-lagrange3']
+PRECOMPUTE_METHODS = ['cubic', 'lagrange3', 'akima']
 SPLINE_METHODS = ['slinear', 'lagrange2', 'lagrange3', 'cubic', 'akima', 'bsplines',
                   'scipy_cubic', 'scipy_slinear', 'scipy_quintic']
 
@@ -265,6 +266,37 @@ class InterpND(object):
         else:
             return xnew
 
+    def precompute_coeffs(self):
+        """
+        Compute the polynomial coefficients of every table cell ahead of time.
+
+        Afterwards, interpolation is a vectorized lookup of the cell containing each point
+        followed by a dot product with the cell's coefficients, instead of recomputing the
+        coefficients from the neighboring table values every time. Every cell stores 4**n_dims
+        coefficients, which can take much more memory than the table itself. Methods 'cubic' and
+        'lagrange3' are supported, as is 'akima' for 1D tables.
+
+        Returns
+        -------
+        dict
+            The number of cells, the number of coefficients per cell, and the memory used by the
+            coefficients and by the table values, in bytes.
+        """
+        table = self.table
+        if self.x_interp is not None or table._name not in PRECOMPUTE_METHODS:
+            methods = ', '.join([f"'{m}'" for m in PRECOMPUTE_METHODS])
+            raise ValueError(f"Method '{table._name}' does not support precomputed "
+                             f"coefficients. Valid methods are {methods}.")
+
+        coeffs = table.precompute_coeffs()
+
+        return {
+            'cells': coeffs.shape[0],
+            'coeffs_per_cell': coeffs.shape[1],
+            'nbytes': coeffs.nbytes,
+            'table_nbytes': np.asarray(self.values).nbytes,
+        }
+
     def evaluate_spline(self, values, compute_derivative=False):
         """
         Interpolate at all fixed output coordinates given the new table values.
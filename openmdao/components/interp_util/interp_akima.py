@@ -731,6 +731,118 @@ class InterpAkima(InterpAlgorithm):
         # Evaluate dependent value and exit
         return a + dx * (b + dx * (c + dx * d)), deriv_dx, deriv_dv, None
 
+    def _compute_cell_coeffs(self, grids):
+        """
+        Compute the polynomial coefficients of all table cells.
+
+        The akima spline depends nonlinearly on the table values, so it isn't a tensor product
+        polynomial in more than one dimension, and only 1D tables are supported.  Two more cells
+        hold the linear extrapolations below and above the table.
+
+        Parameters
+        ----------
+        grids : list of ndarray
+            Grid of each table dimension.
+
+        Returns
+        -------
+        ndarray
+            The coefficients, with shape (n_cells, 4).
+        """
+        if len(grids) > 1:
+            raise ValueError("Method 'akima' only supports precomputed coefficients for 1D "
+                             "tables.")
+
+        grid = grids[0]
+        values = np.asarray(self.values, dtype=float)
+        eps = self.options['eps']
+        delta_x = self.options['delta_x']
+        n = len(grid)
+        idx = np.arange(n - 1)
+
+        # Slope of interval i is at slopes[i + 2], with zeros for the missing intervals on
+        # either side.
+        slopes = np.zeros(n + 3)
+        slopes[2:n + 1] = np.diff(values) / np.diff(grid)
+
+        m1 = slopes[idx]
+        m2 = slopes[idx + 1]
+        m3 = slopes[idx + 2]
+        m4 = slopes[idx + 3]
+        m5 = slopes[idx + 4]
+
+        # Same precedence as interpolate when more than one condition applies.
+        first = idx == 0
+        second = idx == 1
+        third_last = (idx == n - 3) & ~first & ~second
+        second_last = (idx == n - 2) & ~first & ~second & ~third_last
+
+        m2 = np.where(first, 2.0 * m3 - m4, m2)
+        m1 = np.where(first, 2.0 * m2 - m3, m1)
+        m1 = np.where(second, 2.0 * m2 - m3, m1)
+        m5 = np.where(third_last, 2.0 * m4 - m3, m5)
+        m4 = np.where(second_last, 2.0 * m3 - m2, m4)
+        m5 = np.where(second_last, 2.0 * m4 - m3, m5)
+
+        if delta_x > 0:
+            w2 = abs_smooth_complex(m4 - m3, delta_x)
+            w31 = abs_smooth_complex(m2 - m1, delta_x)
+            w32 = abs_smooth_complex(m5 - m4, delta_x)
+            w4 = abs_smooth_complex(m3 - m2, delta_x)
+        else:
+            w2 = abs_complex(m4 - m3)
+            w31 = abs_complex(m2 - m1)
+            w32 = abs_complex(m5 - m4)
+            w4 = abs_complex(m3 - m2)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            b = np.where(w2 + w31 > eps, (m2 * w2 + m3 * w31) / (w2 + w31), 0.5 * (m2 + m3))
+            bp1 = np.where(w32 + w4 > eps, (m3 * w32 + m4 * w4) / (w32 + w4), 0.5 * (m3 + m4))
+
+        h = 1.0 / np.diff(grid)
+
+        coeffs = np.zeros((n + 1, 4))
+        coeffs[:n - 1, 0] = values[:-1]
+        coeffs[:n - 1, 1] = b
+        coeffs[:n - 1, 2] = (3.0 * m3 - 2.0 * b - bp1) * h
+        coeffs[:n - 1, 3] = (b + bp1 - 2.0 * m3) * h * h
+
+        coeffs[n - 1, :2] = values[0], b[0]
+        coeffs[n, :2] = values[-1], bp1[-1]
+
+        return coeffs
+
+    def _cell_lookup(self, grid, x):
+        """
+        Return the cell that contains each point and the position of the point in the cell.
+
+        Parameters
+        ----------
+        grid : ndarray
+            Grid locations in this dimension.
+        x : ndarray
+            Locations of the points in this dimension.
+
+        Returns
+        -------
+        ndarray of int
+            Cell index of each point.
+        ndarray
+            Distance of each point from the origin of its cell.
+        """
+        n = len(grid)
+        cell, t = super()._cell_lookup(grid, x)
+
+        below = x.real < grid[0]
+        cell[below] = n - 1
+        t[below] = x[below] - grid[0]
+
+        above = x.real > grid[-1]
+        cell[above] = n
+        t[above] = x[above] - grid[-1]
+
+        return cell, t
+
 
 def abs_smooth_1d(x, x_deriv=None, delta_x=0):
     """
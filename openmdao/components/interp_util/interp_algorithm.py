@@ -3,10 +3,34 @@ Base class for interpolation methods.  New methods should inherit from this clas
 """
 import numpy as np
 
+from openmdao.components.interp_util.interp_numba import NUMBA_METHODS, interp_kernel, \
+    interp_kernel_data
 from openmdao.components.interp_util.outofbounds_error import OutOfBoundsError
+from openmdao.utils.numba import numba
 from openmdao.utils.options_dictionary import OptionsDictionary
 
 
+def _outer_rows(arrays):
+    """
+    Return the row-wise outer product of a list of 2D arrays, flattened.
+
+    Parameters
+    ----------
+    arrays : list of ndarray
+        Arrays with the same number of rows.
+
+    Returns
+    -------
+    ndarray
+        Array whose row i is the flattened outer product of the rows i of all arrays.
+    """
+    result = arrays[0]
+    nrows = result.shape[0]
+    for arr in arrays[1:]:
+        result = (result[:, :, np.newaxis] * arr[:, np.newaxis, :]).reshape((nrows, -1))
+    return result
+
+
 class InterpAlgorithm(object):
     """
     Base class for interpolation over data in an n-dimensional table.
@@ -40,12 +64,22 @@ class InterpAlgorithm(object):
         When set to True, compute gradients with respect to the grid values.
     _compute_d_dx : bool
         When set to True, compute gradients with respect to the interpolated point location.
+    _cell_coeffs : ndarray or None
+        Polynomial coefficients of every table cell, with shape (n_cells, 4**n_dims), when they
+        have been precomputed.
+    _cell_grids : list of ndarray
+        Grid of each table dimension, used to look up the cells.
     _full_slice : tuple of <Slice>
         Used to cache the full slice if training derivatives are computed.
+    _kernel_data : tuple or None
+        Cache of the table data packed for the compiled kernel.
     _name : str
         Algorithm name for error messages.
     _supports_d_dvalues : bool
         If True, this algorithm can compute the derivatives with respect to table values.
+    _use_numba : bool
+        If True, evaluate all points with a compiled kernel when the method has one. Defaults
+        to True when numba is installed.
     _vectorized :bool
         If True, this method is vectorized and can simultaneously solve multiple interpolations.
     """
@@ -74,6 +108,10 @@ class InterpAlgorithm(object):
         self._compute_d_dx = True
         self._full_slice = None
         self._supports_d_dvalues = True
+        self._use_numba = numba is not None
+        self._kernel_data = None
+        self._cell_coeffs = None
+        self._cell_grids = None
 
     def initialize(self):
         """
@@ -111,7 +149,201 @@ class InterpAlgorithm(object):
         bool
             Returns True if this table can be run vectorized.
         """
-        return self._vectorized
+        if self._vectorized or (self._cell_coeffs is not None and not self._compute_d_dvalues):
+            return True
+
+        # The compiled kernels are real valued and don't compute derivatives with respect to
+        # the table values.
+        return (self._use_numba and self._name in NUMBA_METHODS and
+                not self._compute_d_dvalues and x.dtype == np.float64 and
+                not np.iscomplexobj(self.values) and x.shape[-1] == np.ndim(self.values))
+
+    def evaluate_vectorized(self, x):
+        """
+        Interpolate at all points with the precomputed coefficients or the compiled kernel.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates to sample the gridded data at, with shape (n_points, n_dims).
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to x.
+        None
+            Derivatives with respect to values are not computed.
+        None
+            Derivatives with respect to grid are not computed.
+        """
+        if self._cell_coeffs is not None:
+            result, d_dx = self._evaluate_cells(x)
+            return result, d_dx, None, None
+
+        if self._kernel_data is None:
+            grid = []
+            table = self
+            while table is not None:
+                grid.append(table.grid)
+                table = table.subtable
+            self._kernel_data = interp_kernel_data(grid, self.values)
+
+        opts = {name: self.options[name] for name in ('eps', 'delta_x') if name in self.options}
+        result, d_dx = interp_kernel(self._name, self._kernel_data, x, **opts)
+
+        return result, d_dx, None, None
+
+    def precompute_coeffs(self):
+        """
+        Compute and store the polynomial coefficients of all table cells.
+
+        Within a cell, the interpolant is a polynomial of degree 3 in each dimension, so every
+        cell is described by 4**n_dims coefficients.  Afterwards, each point is interpolated by
+        looking up its cell and taking the dot product of the coefficients with the powers of
+        its position in the cell.
+
+        Returns
+        -------
+        ndarray
+            The coefficients, with shape (n_cells, 4**n_dims).
+        """
+        grids = []
+        table = self
+        while table is not None:
+            grids.append(table.grid)
+            table = table.subtable
+
+        self._cell_grids = grids
+        self._cell_coeffs = self._compute_cell_coeffs(grids)
+
+        return self._cell_coeffs
+
+    def _compute_cell_coeffs(self, grids):
+        """
+        Compute the polynomial coefficients of all table cells.
+
+        The coefficients of a method that is linear in the table values are the tensor product
+        of the cell polynomials of the basis functions in each dimension.
+
+        Parameters
+        ----------
+        grids : list of ndarray
+            Grid of each table dimension.
+
+        Returns
+        -------
+        ndarray
+            The coefficients, with shape (n_cells, 4**n_dims).
+        """
+        coeffs = np.asarray(self.values)
+        ncells = []
+
+        # Contracting the first remaining table axis each time leaves the result ordered as
+        # (cell_0, power_0, cell_1, power_1, ...).
+        for grid in grids:
+            basis = self._cell_basis(grid)
+            coeffs = np.tensordot(coeffs, basis, axes=([0], [2]))
+            ncells.append(basis.shape[0])
+
+        ndim = len(grids)
+        coeffs = coeffs.transpose(list(range(0, 2 * ndim, 2)) + list(range(1, 2 * ndim, 2)))
+
+        return np.ascontiguousarray(coeffs).reshape((np.prod(ncells), 4 ** ndim))
+
+    def _cell_basis(self, grid):
+        """
+        Return the cell polynomials of the basis functions in one dimension.
+
+        Methods that support precomputed coefficients must override this, or
+        _compute_cell_coeffs if they aren't linear in the table values.
+
+        Parameters
+        ----------
+        grid : ndarray
+            Grid locations in this dimension.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (n_cells, 4, n_grid) containing the coefficients of the powers of
+            the distance from the cell origin for the basis function of each grid point.
+        """
+        raise NotImplementedError(f"Method '{self._name}' does not support precomputed "
+                                  "coefficients.")
+
+    def _cell_lookup(self, grid, x):
+        """
+        Return the cell that contains each point and the position of the point in the cell.
+
+        Points below or above the table are placed in the first or last cell, and a point that
+        lies exactly on a grid point is placed in the cell behind it.
+
+        Parameters
+        ----------
+        grid : ndarray
+            Grid locations in this dimension.
+        x : ndarray
+            Locations of the points in this dimension.
+
+        Returns
+        -------
+        ndarray of int
+            Cell index of each point.
+        ndarray
+            Distance of each point from the origin of its cell.
+        """
+        cell = np.clip(np.searchsorted(grid, x.real, side='left') - 1, 0, len(grid) - 2)
+        return cell, x - grid[cell]
+
+    def _evaluate_cells(self, x):
+        """
+        Interpolate at all points with the precomputed cell coefficients.
+
+        Parameters
+        ----------
+        x : ndarray
+            The coordinates to sample the gridded data at, with shape (n_points, n_dims).
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        ndarray
+            Derivative of interpolated values with respect to x.
+        """
+        npts, ndim = x.shape
+        dtype = np.result_type(x.dtype, float)
+        cell = np.zeros(npts, dtype=int)
+        powers = []
+        dpowers = []
+
+        for j, grid in enumerate(self._cell_grids):
+            cell_j, t = self._cell_lookup(grid, x[:, j])
+            cell = cell * (len(grid) - 1) + cell_j
+
+            tpow = np.ones((npts, 4), dtype=dtype)
+            tpow[:, 1] = t
+            tpow[:, 2] = t * t
+            tpow[:, 3] = tpow[:, 2] * t
+            powers.append(tpow)
+
+            dtpow = np.zeros((npts, 4), dtype=dtype)
+            dtpow[:, 1] = 1.0
+            dtpow[:, 2] = 2.0 * t
+            dtpow[:, 3] = 3.0 * tpow[:, 2]
+            dpowers.append(dtpow)
+
+        coeffs = self._cell_coeffs[cell]
+
+        result = np.einsum('ij,ij->i', coeffs, _outer_rows(powers))
+        d_dx = np.empty((npts, ndim), dtype=result.dtype)
+        for j in range(ndim):
+            d_dx[:, j] = np.einsum('ij,ij->i', coeffs,
+                                   _outer_rows(powers[:j] + [dpowers[j]] + powers[j + 1:]))
+
+        return result, d_dx
 
     def bracket(self, x):
         """
@@ -177,7 +409,7 @@ class InterpAlgorithm(object):
         # Bisection
         while high - last_index > 1:
             low = (high + last_index) // 2
-            if x < grid[low]:
+            if x <= grid[low]:
                 high = low
             else:
                 last_index = low
@@ -446,7 +678,7 @@ class InterpAlgorithmFixed(object):
         # Bisection
         while high - last_index > 1:
             low = (high + last_index) // 2
-            if x < grid[low]:
+            if x <= grid[low]:
                 high = low
             else:
                 last_index = low
@@ -791,7 +1023,7 @@ class InterpAlgorithmSemi(object):
         # Bisection
         while high - last_index > 1:
             low = (high + last_index) // 2
-            if x < grid[low]:
+            if x <= grid[low]:
                 high = low
             else:
                 last_index = low
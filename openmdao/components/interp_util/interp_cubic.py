@@ -95,6 +95,39 @@ class InterpCubic(InterpAlgorithm):
 
         return sec_deriv
 
+    def _cell_basis(self, grid):
+        """
+        Return the cell polynomials of the basis functions in one dimension.
+
+        Parameters
+        ----------
+        grid : ndarray
+            Grid locations in this dimension.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (n_cells, 4, n_grid) containing the coefficients of the powers of
+            the distance from the cell origin for the basis function of each grid point.
+        """
+        n = len(grid)
+        eye = np.eye(n)
+
+        # Second derivatives at each grid point for a unit value at each grid point.
+        sec_deriv = self.compute_coeffs(grid, eye, grid)
+
+        step = np.diff(grid)[:, np.newaxis]
+        sec_lo = sec_deriv[:, :-1].T
+        sec_hi = sec_deriv[:, 1:].T
+
+        basis = np.empty((n - 1, 4, n))
+        basis[:, 0, :] = eye[:-1]
+        basis[:, 1, :] = (eye[1:] - eye[:-1]) / step - step * (2.0 * sec_lo + sec_hi) / 6.0
+        basis[:, 2, :] = 0.5 * sec_lo
+        basis[:, 3, :] = (sec_hi - sec_lo) / (6.0 * step)
+
+        return basis
+
     def interpolate(self, x, idx, slice_idx):
         """
         Compute the interpolated value over this grid dimension.
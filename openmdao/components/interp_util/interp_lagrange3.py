@@ -147,6 +147,36 @@ class InterpLagrange3(InterpAlgorithm):
         return xx4 * (xx3 * (q1 * xx2 - q2 * xx1) + q3 * xx1 * xx2) - q4 * xx1 * xx2 * xx3, \
             derivs, None, None
 
+    def _cell_basis(self, grid):
+        """
+        Return the cell polynomials of the basis functions in one dimension.
+
+        Parameters
+        ----------
+        grid : ndarray
+            Grid locations in this dimension.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (n_cells, 4, n_grid) containing the coefficients of the powers of
+            the distance from the cell origin for the basis function of each grid point.
+        """
+        n = len(grid)
+        basis = np.zeros((n - 1, 4, n))
+
+        for cell in range(n - 1):
+            # Same shift as interpolate, so there are 2 points on each side where possible.
+            idx = min(max(cell, 1), n - 3)
+            pts = grid[idx - 1:idx + 3]
+
+            for k in range(4):
+                others = np.delete(pts, k)
+                poly = np.poly(others - grid[cell])[::-1]
+                basis[cell, :, idx - 1 + k] = poly / np.prod(pts[k] - others)
+
+        return basis
+
 
 class InterpLagrange3Semi(InterpAlgorithmSemi):
     """
@@ -0,0 +1,563 @@
+"""
+Compiled kernels for the 'slinear', 'lagrange2', 'lagrange3' and 'akima' table methods.
+
+The recursive table algorithms interpolate one point at a time, creating several small arrays in
+each table dimension.  The kernels here evaluate all points in a single compiled loop.  For each
+point, the block of table values that the stencils touch is gathered and then reduced one
+dimension at a time, starting with the last one, which is the same order of operations used by
+the recursive algorithms.  The derivatives with respect to the later dimensions are carried
+through each reduction with the chain rule.
+
+The kernels are compiled with numba when it is installed. Otherwise, they are plain python
+functions that give the same results, but are far too slow to be used for anything but testing.
+"""
+import numpy as np
+
+from openmdao.utils.numba import numba
+
+
+NUMBA_METHODS = {
+    'slinear': 0,
+    'lagrange2': 1,
+    'lagrange3': 2,
+    'akima': 3,
+}
+
+# Maximum number of points in the stencil of each method.
+_MAX_WIDTH = (2, 3, 4, 6)
+
+
+def _stencil(method, grid, x):
+    """
+    Return the interval and the range of grid points used to interpolate at x.
+
+    The interval is the one found by InterpAlgorithm.bracket, so a point that lies exactly on an
+    interior grid point is placed in the interval behind it.
+
+    Parameters
+    ----------
+    method : int
+        Interpolation method code from NUMBA_METHODS.
+    grid : ndarray
+        Grid locations in this dimension.
+    x : float
+        Location of the point in this dimension.
+
+    Returns
+    -------
+    int
+        Interval index, adjusted for the method.
+    int
+        Extrapolation flag for akima, -1 below the table, 1 above it and 0 otherwise.
+    int
+        Index of the first grid point in the stencil.
+    int
+        Number of grid points in the stencil.
+    """
+    n = grid.size
+
+    if x <= grid[0]:
+        idx = 0
+    elif x > grid[n - 1]:
+        idx = n - 1
+    else:
+        low = 0
+        high = n - 1
+        while high - low > 1:
+            mid = (high + low) // 2
+            if x <= grid[mid]:
+                high = mid
+            else:
+                low = mid
+        idx = low
+
+    extrap = 0
+
+    if method == 0:
+        if idx == n - 1:
+            idx = n - 2
+        return idx, extrap, idx, 2
+
+    elif method == 1:
+        if idx > n - 3:
+            idx = n - 3
+        return idx, extrap, idx, 3
+
+    elif method == 2:
+        if idx > n - 3:
+            idx = n - 3
+        elif idx == 0:
+            idx = 1
+        return idx, extrap, idx - 1, 4
+
+    if idx == n - 1:
+        idx = n - 2
+        extrap = 1
+    elif idx == 0 and x < grid[0]:
+        extrap = -1
+
+    if idx >= 2:
+        low = idx - 2
+    elif idx == 1:
+        low = idx - 1
+    else:
+        low = idx
+
+    if idx < n - 3:
+        high = idx + 4
+    elif idx == n - 3:
+        high = idx + 3
+    else:
+        high = idx + 2
+
+    return idx, extrap, low, high - low
+
+
+def _abs_smooth(x, delta_x):
+    """
+    Return the (optionally smoothed) absolute value of x and its derivative.
+
+    Parameters
+    ----------
+    x : float
+        Input value.
+    delta_x : float
+        Half width of the rounded section, or 0 for no smoothing.
+
+    Returns
+    -------
+    float
+        Absolute value of x.
+    float
+        Derivative of the absolute value with respect to x.
+    """
+    if delta_x > 0.0:
+        if x <= -delta_x:
+            return -x, -1.0
+        elif x >= delta_x:
+            return x, 1.0
+        return 0.5 * (x * x / delta_x + delta_x), x / delta_x
+
+    if x < 0.0:
+        return -x, -1.0
+    return x, 1.0
+
+
+def _akima_1d(grid, x, idx, extrap, start, v, wts, work, eps, delta_x):
+    """
+    Interpolate a line of values with an akima spline.
+
+    Parameters
+    ----------
+    grid : ndarray
+        Grid locations in this dimension.
+    x : float
+        Location of the point in this dimension.
+    idx : int
+        Interval index.
+    extrap : int
+        Extrapolation flag.
+    start : int
+        Index of the grid point of v[0].
+    v : ndarray
+        Values at the stencil points.
+    wts : ndarray
+        Receives the derivatives of the interpolated value with respect to v.
+    work : ndarray
+        Scratch array of shape (8, 6).  Rows 0-4 hold the derivatives of the five interval
+        slopes and rows 5 and 6 those of the slopes at the interval end points with respect to
+        the values at grid points idx - 2 through idx + 3.  Row 7 holds the slopes.
+    eps : float
+        Value that triggers the division-by-zero safeguard.
+    delta_x : float
+        Half width of the rounded section of the absolute value function.
+
+    Returns
+    -------
+    float
+        Interpolated value.
+    float
+        Derivative of the interpolated value with respect to x.
+    """
+    n = grid.size
+    work[:, :] = 0.0
+    m = work[7]
+
+    # Slopes of the intervals from (idx - 2, idx - 1) through (idx + 2, idx + 3).
+    for k in range(5):
+        i0 = idx - 2 + k
+        if i0 >= 0 and i0 + 1 < n:
+            h = 1.0 / (grid[i0 + 1] - grid[i0])
+            m[k] = (v[i0 + 1 - start] - v[i0 - start]) * h
+            work[k, k + 1] = h
+            work[k, k] = -h
+
+    if idx == 0:
+        m[1] = 2.0 * m[2] - m[3]
+        m[0] = 2.0 * m[1] - m[2]
+        for j in range(6):
+            work[1, j] = 2.0 * work[2, j] - work[3, j]
+            work[0, j] = 2.0 * work[1, j] - work[2, j]
+    elif idx == 1:
+        m[0] = 2.0 * m[1] - m[2]
+        for j in range(6):
+            work[0, j] = 2.0 * work[1, j] - work[2, j]
+    elif idx == n - 3:
+        m[4] = 2.0 * m[3] - m[2]
+        for j in range(6):
+            work[4, j] = 2.0 * work[3, j] - work[2, j]
+    elif idx == n - 2:
+        m[3] = 2.0 * m[2] - m[1]
+        m[4] = 2.0 * m[3] - m[2]
+        for j in range(6):
+            work[3, j] = 2.0 * work[2, j] - work[1, j]
+            work[4, j] = 2.0 * work[3, j] - work[2, j]
+
+    m1, m2, m3, m4, m5 = m[0], m[1], m[2], m[3], m[4]
+
+    # Slope at the start of the interval.
+    w2, s2 = _abs_smooth(m4 - m3, delta_x)
+    w31, s31 = _abs_smooth(m2 - m1, delta_x)
+    den = w2 + w31
+    if den > eps:
+        b = (m2 * w2 + m3 * w31) / den
+        for j in range(6):
+            dw2 = s2 * (work[3, j] - work[2, j])
+            dw31 = s31 * (work[1, j] - work[0, j])
+            work[5, j] = (work[1, j] * w2 + m2 * dw2 + work[2, j] * w31 + m3 * dw31 -
+                          b * (dw2 + dw31)) / den
+    else:
+        b = 0.5 * (m2 + m3)
+        for j in range(6):
+            work[5, j] = 0.5 * (work[1, j] + work[2, j])
+
+    # Slope at the end of the interval.
+    w32, s32 = _abs_smooth(m5 - m4, delta_x)
+    w4, s4 = _abs_smooth(m3 - m2, delta_x)
+    den = w32 + w4
+    if den > eps:
+        bp1 = (m3 * w32 + m4 * w4) / den
+        for j in range(6):
+            dw32 = s32 * (work[4, j] - work[3, j])
+            dw4 = s4 * (work[2, j] - work[1, j])
+            work[6, j] = (work[2, j] * w32 + m3 * dw32 + work[3, j] * w4 + m4 * dw4 -
+                          bp1 * (dw32 + dw4)) / den
+    else:
+        bp1 = 0.5 * (m3 + m4)
+        for j in range(6):
+            work[6, j] = 0.5 * (work[2, j] + work[3, j])
+
+    c = 0.0
+    d = 0.0
+    h = 0.0
+    if extrap == 0:
+        h = 1.0 / (grid[idx + 1] - grid[idx])
+        ja = 2
+        c = (3.0 * m3 - 2.0 * b - bp1) * h
+        d = (b + bp1 - 2.0 * m3) * h * h
+        dx = x - grid[idx]
+    elif extrap == 1:
+        ja = 3
+        b = bp1
+        dx = x - grid[idx + 1]
+    else:
+        ja = 2
+        dx = x - grid[0]
+
+    for j in range(6):
+        k = j + idx - 2 - start
+        if k < 0 or k >= v.size:
+            continue
+
+        if extrap == 1:
+            db = work[6, j]
+        else:
+            db = work[5, j]
+
+        wt = dx * db
+        if extrap == 0:
+            dm3 = work[2, j]
+            dbp1 = work[6, j]
+            dc = (3.0 * dm3 - 2.0 * db - dbp1) * h
+            dd = (db + dbp1 - 2.0 * dm3) * h * h
+            wt += dx * dx * (dc + dx * dd)
+        if j == ja:
+            wt += 1.0
+
+        wts[k] = wt
+
+    return v[ja + idx - 2 - start] + dx * (b + dx * (c + dx * d)), \
+        b + dx * (2.0 * c + 3.0 * d * dx)
+
+
+def _line_1d(method, grid, x, idx, extrap, start, v, wts, work, eps, delta_x):
+    """
+    Interpolate a line of values in one dimension.
+
+    Parameters
+    ----------
+    method : int
+        Interpolation method code from NUMBA_METHODS.
+    grid : ndarray
+        Grid locations in this dimension.
+    x : float
+        Location of the point in this dimension.
+    idx : int
+        Interval index.
+    extrap : int
+        Extrapolation flag.
+    start : int
+        Index of the grid point of v[0].
+    v : ndarray
+        Values at the stencil points.
+    wts : ndarray
+        Receives the derivatives of the interpolated value with respect to v.
+    work : ndarray
+        Scratch array of shape (8, 6).
+    eps : float
+        Value that triggers the division-by-zero safeguard in akima.
+    delta_x : float
+        Half width of the rounded section of the absolute value function in akima.
+
+    Returns
+    -------
+    float
+        Interpolated value.
+    float
+        Derivative of the interpolated value with respect to x.
+    """
+    if method == 3:
+        return _akima_1d(grid, x, idx, extrap, start, v, wts, work, eps, delta_x)
+
+    # The polynomial methods are linear in the values, so the weights are the basis functions.
+    dwts = work[0]
+
+    if method == 0:
+        h = 1.0 / (grid[idx + 1] - grid[idx])
+        t = (x - grid[idx]) * h
+        wts[0] = 1.0 - t
+        wts[1] = t
+        dwts[0] = -h
+        dwts[1] = h
+
+    elif method == 1:
+        xx1 = x - grid[idx]
+        xx2 = x - grid[idx + 1]
+        xx3 = x - grid[idx + 2]
+
+        c12 = grid[idx] - grid[idx + 1]
+        c13 = grid[idx] - grid[idx + 2]
+        c23 = grid[idx + 1] - grid[idx + 2]
+
+        q1 = 1.0 / (c12 * c13)
+        q2 = -1.0 / (c12 * c23)
+        q3 = 1.0 / (c13 * c23)
+
+        wts[0] = q1 * xx2 * xx3
+        wts[1] = q2 * xx1 * xx3
+        wts[2] = q3 * xx1 * xx2
+        dwts[0] = q1 * (xx2 + xx3)
+        dwts[1] = q2 * (xx1 + xx3)
+        dwts[2] = q3 * (xx1 + xx2)
+
+    else:
+        p1 = grid[idx - 1]
+        p2 = grid[idx]
+        p3 = grid[idx + 1]
+        p4 = grid[idx + 2]
+
+        xx1 = x - p1
+        xx2 = x - p2
+        xx3 = x - p3
+        xx4 = x - p4
+
+        c12 = 1.0 / (p1 - p2)
+        c13 = 1.0 / (p1 - p3)
+        c14 = 1.0 / (p1 - p4)
+        c23 = 1.0 / (p2 - p3)
+        c24 = 1.0 / (p2 - p4)
+        c34 = 1.0 / (p3 - p4)
+
+        q1 = c12 * c13 * c14
+        q2 = -c12 * c23 * c24
+        q3 = c13 * c23 * c34
+        q4 = -c14 * c24 * c34
+
+        wts[0] = q1 * xx2 * xx3 * xx4
+        wts[1] = q2 * xx1 * xx3 * xx4
+        wts[2] = q3 * xx1 * xx2 * xx4
+        wts[3] = q4 * xx1 * xx2 * xx3
+        dwts[0] = q1 * (x * (3.0 * x - 2.0 * (p4 + p3 + p2)) + p4 * (p2 + p3) + p2 * p3)
+        dwts[1] = q2 * (x * (3.0 * x - 2.0 * (p4 + p3 + p1)) + p4 * (p1 + p3) + p1 * p3)
+        dwts[2] = q3 * (x * (3.0 * x - 2.0 * (p4 + p2 + p1)) + p4 * (p2 + p1) + p2 * p1)
+        dwts[3] = q4 * (x * (3.0 * x - 2.0 * (p3 + p2 + p1)) + p1 * (p2 + p3) + p2 * p3)
+
+    val = 0.0
+    dval = 0.0
+    for k in range(v.size):
+        val += wts[k] * v[k]
+        dval += dwts[k] * v[k]
+
+    return val, dval
+
+
+def _interp_kernel(method, grids, offsets, values, shape, x, eps, delta_x):
+    """
+    Interpolate at all points.
+
+    Parameters
+    ----------
+    method : int
+        Interpolation method code from NUMBA_METHODS.
+    grids : ndarray
+        Grid locations of all dimensions, concatenated.
+    offsets : ndarray of int
+        Start of the grid of each dimension in grids, plus the total length.
+    values : ndarray
+        Flattened table values.
+    shape : ndarray of int
+        Shape of the table.
+    x : ndarray
+        Points to interpolate, with shape (npts, ndim).
+    eps : float
+        Value that triggers the division-by-zero safeguard in akima.
+    delta_x : float
+        Half width of the rounded section of the absolute value function in akima.
+
+    Returns
+    -------
+    ndarray
+        Interpolated values.
+    ndarray
+        Derivatives of the interpolated values with respect to x.
+    """
+    npts, ndim = x.shape
+    result = np.empty(npts)
+    d_dx = np.empty((npts, ndim))
+
+    maxw = _MAX_WIDTH[method]
+    nblock = maxw ** ndim
+    block = np.empty(nblock)
+    dblock = np.empty((nblock, ndim))
+
+    strides = np.empty(ndim, dtype=np.int64)
+    stride = 1
+    for d in range(ndim - 1, -1, -1):
+        strides[d] = stride
+        stride *= shape[d]
+
+    idxs = np.empty(ndim, dtype=np.int64)
+    extraps = np.empty(ndim, dtype=np.int64)
+    starts = np.empty(ndim, dtype=np.int64)
+    widths = np.empty(ndim, dtype=np.int64)
+    wts = np.empty(maxw)
+    work = np.empty((8, 6))
+
+    for ipt in range(npts):
+        size = 1
+        for d in range(ndim):
+            idx, extrap, start, width = _stencil(method, grids[offsets[d]:offsets[d + 1]],
+                                                 x[ipt, d])
+            idxs[d] = idx
+            extraps[d] = extrap
+            starts[d] = start
+            widths[d] = width
+            size *= width
+
+        # Gather the table values used by the stencils.
+        for i in range(size):
+            rem = i
+            flat = 0
+            for d in range(ndim - 1, -1, -1):
+                flat += (starts[d] + rem % widths[d]) * strides[d]
+                rem //= widths[d]
+            block[i] = values[flat]
+            for d in range(ndim):
+                dblock[i, d] = 0.0
+
+        # Reduce one dimension at a time. Each line of values collapses into its first entry,
+        # which has already been read by the time it is overwritten.
+        for d in range(ndim - 1, -1, -1):
+            w = widths[d]
+            size //= w
+            grid = grids[offsets[d]:offsets[d + 1]]
+            for i in range(size):
+                line = i * w
+                val, dval = _line_1d(method, grid, x[ipt, d], idxs[d], extraps[d], starts[d],
+                                     block[line:line + w], wts, work, eps, delta_x)
+
+                for j in range(d + 1, ndim):
+                    total = 0.0
+                    for k in range(w):
+                        total += wts[k] * dblock[line + k, j]
+                    dblock[i, j] = total
+
+                dblock[i, d] = dval
+                block[i] = val
+
+        result[ipt] = block[0]
+        for d in range(ndim):
+            d_dx[ipt, d] = dblock[0, d]
+
+    return result, d_dx
+
+
+if numba is not None:
+    _stencil = numba.jit(nopython=True, nogil=True)(_stencil)
+    _abs_smooth = numba.jit(nopython=True, nogil=True)(_abs_smooth)
+    _akima_1d = numba.jit(nopython=True, nogil=True)(_akima_1d)
+    _line_1d = numba.jit(nopython=True, nogil=True)(_line_1d)
+    _interp_kernel = numba.jit(nopython=True, nogil=True)(_interp_kernel)
+
+
+def interp_kernel_data(grid, values):
+    """
+    Pack a table into the arrays used by the kernels.
+
+    Parameters
+    ----------
+    grid : tuple of ndarray
+        Grid locations of each dimension.
+    values : ndarray
+        Table values.
+
+    Returns
+    -------
+    tuple
+        The concatenated grids, their offsets, the flattened values and the table shape.
+    """
+    offsets = np.zeros(len(grid) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(g) for g in grid])
+
+    return (np.concatenate(grid).astype(float), offsets,
+            np.ascontiguousarray(values, dtype=float).ravel(),
+            np.array(values.shape, dtype=np.int64))
+
+
+def interp_kernel(name, data, x, eps=1e-30, delta_x=0.0):
+    """
+    Interpolate at all points and compute the derivatives with respect to the points.
+
+    Parameters
+    ----------
+    name : str
+        Name of the interpolation method, one of the keys of NUMBA_METHODS.
+    data : tuple
+        Table data returned by interp_kernel_data.
+    x : ndarray
+        Points to interpolate, with shape (npts, ndim).
+    eps : float
+        Value that triggers the division-by-zero safeguard in akima.
+    delta_x : float
+        Half width of the rounded section of the absolute value function in akima.
+
+    Returns
+    -------
+    ndarray
+        Interpolated values.
+    ndarray
+        Derivatives of the interpolated values with respect to x.
+    """
+    grids, offsets, values, shape = data
+    return _interp_kernel(NUMBA_METHODS[name], grids, offsets, values, shape,
+                          np.ascontiguousarray(x, dtype=float), float(eps), float(delta_x))
@@ -1285,5 +1285,171 @@ class TestInterpNDFixedPython(unittest.TestCase):
             assert_near_equal(df_dx[0], df_dx_base[j, :], 2e-10)
 
 
+class TestInterpNDKernels(unittest.TestCase):
+    """Compare the compiled kernels to the recursive table algorithms."""
+
+    def _compare(self, method, ndim, n, **kwargs):
+        rng = np.random.default_rng(ndim * 10 + n)
+        grid = [np.cumsum(rng.uniform(0.2, 1.0, n)) for i in range(ndim)]
+        values = rng.random([n] * ndim)
+
+        # Include points outside of the table and on the grid points in every dimension.
+        x = np.column_stack([rng.uniform(g[0] - 0.5, g[-1] + 0.5, 50) for g in grid])
+        for j, g in enumerate(grid):
+            x[j * n:(j + 1) * n, j] = g
+
+        interp = InterpND(method=method, points=grid, values=values, extrapolate=True,
+                          **kwargs)
+        interp.table._use_numba = False
+        self.assertFalse(interp.table.vectorized(x))
+        f_base, df_dx_base = interp.interpolate(x, compute_derivative=True)
+
+        # Without numba, this runs the same kernels as plain python.
+        interp.table._use_numba = True
+        self.assertTrue(interp.table.vectorized(x))
+        f, df_dx = interp.interpolate(x, compute_derivative=True)
+
+        assert_near_equal(f, f_base, 1e-12)
+        assert_near_equal(df_dx, df_dx_base, 1e-11)
+
+    def test_kernels(self):
+        for method in ('slinear', 'lagrange2', 'lagrange3', 'akima'):
+            for ndim in (1, 2, 3):
+                for n in (4, 5, 8):
+                    with self.subTest(method=method, ndim=ndim, n=n):
+                        self._compare(method, ndim, n)
+
+    def test_grid_points(self):
+        grid = np.arange(10.0)
+        interp = InterpND(method='slinear', points=(grid, ), values=grid ** 2)
+        interp.table._use_numba = False
+
+        # A point on a grid point is always in the interval behind it, no matter which interval
+        # the previous point was in.
+        for prev in (0.5, 2.5, 5.5, 8.5):
+            x = np.array([[prev], [1.0], [2.0], [3.0], [5.0], [6.0], [8.0]])
+            _, df_dx = interp.interpolate(x, compute_derivative=True)
+            assert_near_equal(df_dx[1:, 0], 2.0 * x[1:, 0] - 1.0, 1e-15)
+
+    def test_akima_smoothing(self):
+        for ndim in (1, 2):
+            with self.subTest(ndim=ndim):
+                self._compare('akima', ndim, 7, delta_x=0.1)
+
+    def test_fallback(self):
+        p1 = np.linspace(0, 1, 6)
+        p2 = np.linspace(0, 2, 7)
+        values = np.outer(p1, p2)
+        x = np.array([[0.3, 0.7], [0.5, 1.5]])
+
+        interp = InterpND(method='akima', points=(p1, p2), values=values)
+        interp.table._use_numba = True
+
+        # complex step and training data gradients use the table algorithms.
+        self.assertFalse(interp.table.vectorized(x + 1j * 1e-30))
+        interp.table._compute_d_dvalues = True
+        self.assertFalse(interp.table.vectorized(x))
+
+        # so do methods without a kernel.
+        interp = InterpND(method='cubic', points=(p1, p2), values=values)
+        interp.table._use_numba = True
+        self.assertFalse(interp.table.vectorized(x))
+
+
+class TestInterpNDPrecomputed(unittest.TestCase):
+    """Compare interpolation with precomputed cell coefficients to the table algorithms."""
+
+    def _compare(self, method, ndim, n, **kwargs):
+        rng = np.random.default_rng(ndim * 10 + n)
+        grid = [np.cumsum(rng.uniform(0.2, 1.0, n)) for i in range(ndim)]
+        values = rng.random([n] * ndim)
+
+        # Include points outside of the table and on the grid points in every dimension.
+        x = np.column_stack([rng.uniform(g[0] - 0.5, g[-1] + 0.5, 50) for g in grid])
+        for j, g in enumerate(grid):
+            x[j * n:(j + 1) * n, j] = g
+
+        interp = InterpND(method=method, points=grid, values=values, extrapolate=True,
+                          **kwargs)
+        interp.table._use_numba = False
+        f_base, df_dx_base = interp.interpolate(x, compute_derivative=True)
+
+        stats = interp.precompute_coeffs()
+        self.assertEqual(stats['coeffs_per_cell'], 4 ** ndim)
+        self.assertTrue(interp.table.vectorized(x))
+        f, df_dx = interp.interpolate(x, compute_derivative=True)
+
+        assert_near_equal(f, f_base, 1e-12)
+        assert_near_equal(df_dx, df_dx_base, 1e-11)
+
+        return interp, x
+
+    def test_tensor_product_methods(self):
+        for method in ('cubic', 'lagrange3'):
+            for ndim in (1, 2, 3):
+                for n in (4, 5, 8):
+                    with self.subTest(method=method, ndim=ndim, n=n):
+                        interp, x = self._compare(method, ndim, n)
+                        self.assertEqual(interp.table._cell_coeffs.shape[0], (n - 1) ** ndim)
+
+    def test_akima(self):
+        for n in (4, 5, 6, 9):
+            for delta_x in (0.0, 0.1):
+                with self.subTest(n=n, delta_x=delta_x):
+                    interp, x = self._compare('akima', 1, n, delta_x=delta_x)
+
+                    # Two more cells hold the extrapolations.
+                    self.assertEqual(interp.table._cell_coeffs.shape[0], n + 1)
+
+    def test_grid_points(self):
+        grid = np.arange(10.0)
+        x = np.array([[0.5], [2.5], [5.5], [8.5]])
+        x = np.column_stack((x, np.full((4, 6), grid[2:8]))).reshape((-1, 1))
+
+        interp = InterpND(method='lagrange3', points=(grid, ), values=np.sin(grid))
+        interp.table._use_numba = False
+        _, df_dx_base = interp.interpolate(x, compute_derivative=True)
+
+        # Points on the grid points are in the same cell as in the table algorithm, no matter
+        # which cell the previous point was in.
+        interp.precompute_coeffs()
+        _, df_dx = interp.interpolate(x, compute_derivative=True)
+
+        assert_near_equal(df_dx, df_dx_base, 1e-12)
+
+    def test_complex_step(self):
+        grid = (np.linspace(0, 1, 6), np.linspace(0, 2, 7))
+        values = np.random.default_rng(0).random((6, 7))
+        x = np.array([[0.3, 0.7], [0.55, 1.5]])
+
+        interp = InterpND(method='cubic', points=grid, values=values)
+        interp.precompute_coeffs()
+        _, df_dx = interp.interpolate(x, compute_derivative=True)
+
+        for j in range(2):
+            xc = x.astype(complex)
+            xc[:, j] += 1j * 1e-30
+            assert_near_equal(interp.interpolate(xc).imag * 1e30, df_dx[:, j], 1e-12)
+
+    def test_errors(self):
+        grid = (np.linspace(0, 1, 6), np.linspace(0, 2, 7))
+        values = np.zeros((6, 7))
+
+        interp = InterpND(method='akima', points=grid, values=values)
+        with self.assertRaises(ValueError) as cm:
+            interp.precompute_coeffs()
+
+        self.assertEqual(str(cm.exception),
+                         "Method 'akima' only supports precomputed coefficients for 1D tables.")
+
+        interp = InterpND(method='lagrange2', points=grid, values=values)
+        with self.assertRaises(ValueError) as cm:
+            interp.precompute_coeffs()
+
+        self.assertEqual(str(cm.exception),
+                         "Method 'lagrange2' does not support precomputed coefficients. Valid "
+                         "methods are 'cubic', 'lagrange3', 'akima'.")
+
+
 if __name__ == '__main__':
     unittest.main()
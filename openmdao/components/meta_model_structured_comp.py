@@ -1,11 +1,14 @@
 """Define the MetaModelStructured class."""
 
-import numpy as np
+import sys
 import inspect
 
+import numpy as np
+
 from openmdao.components.interp_util.outofbounds_error import OutOfBoundsError
 from openmdao.components.interp_util.interp import InterpND, TABLE_METHODS
 from openmdao.core.analysis_error import AnalysisError
+from openmdao.core.constants import _DEFAULT_OUT_STREAM
 from openmdao.core.explicitcomponent import ExplicitComponent
 
 
@@ -31,6 +34,9 @@ class MetaModelStructuredComp(ExplicitComponent):
 
     Attributes
     ----------
+    coeff_stats : dict
+        Size of the precomputed coefficients of each output, when option 'precompute_coeffs' is
+        True.
     grad_shape : tuple
         Cached shape of the gradient of the outputs wrt the training inputs.
     interps : dict
@@ -53,6 +59,7 @@ class MetaModelStructuredComp(ExplicitComponent):
         self.inputs = []
         self.training_outputs = {}
         self.interps = {}
+        self.coeff_stats = {}
         self.grad_shape = ()
 
         self._no_check_partials = True
@@ -71,6 +78,12 @@ class MetaModelStructuredComp(ExplicitComponent):
                              desc='Number of points to evaluate at once.')
         self.options.declare('method', values=TABLE_METHODS, default='scipy_cubic',
                              desc='Spline interpolation method to use for all outputs.')
+        self.options.declare('precompute_coeffs', types=bool, default=False,
+                             desc="If True, compute the polynomial coefficients of every table "
+                             "cell during setup, so that interpolation is a cell lookup and a dot "
+                             "product. Each cell stores 4**n_dims coefficients, which can take "
+                             "much more memory than the table. Supported for methods 'cubic', "
+                             "'lagrange3' and, with 1D tables, 'akima'.")
 
     def add_input(self, name, val=1.0, training_data=None, **kwargs):
         """
@@ -144,11 +157,22 @@ class MetaModelStructuredComp(ExplicitComponent):
         Instantiate surrogates for the output variables that use the default surrogate.
         """
         interp_method = self.options['method']
+        precompute = self.options['precompute_coeffs']
 
+        if precompute and self.options['training_data_gradients']:
+            raise ValueError(f"{self.msginfo}: Option 'precompute_coeffs' can't be used with "
+                             "'training_data_gradients' because the training data may change.")
+
+        self.coeff_stats = {}
         for name, train_data in self.training_outputs.items():
-            self.interps[name] = InterpND(method=interp_method,
-                                          points=self.inputs, values=train_data,
-                                          extrapolate=self.options['extrapolate'])
+            self.interps[name] = interp = InterpND(method=interp_method,
+                                                   points=self.inputs, values=train_data,
+                                                   extrapolate=self.options['extrapolate'])
+            if precompute:
+                try:
+                    self.coeff_stats[name] = interp.precompute_coeffs()
+                except ValueError as err:
+                    raise ValueError(f"{self.msginfo}: {err}")
 
         if self.options['training_data_gradients']:
             self.grad_shape = tuple([self.options['vec_size']] + [i.size for i in self.inputs])
@@ -185,6 +209,33 @@ class MetaModelStructuredComp(ExplicitComponent):
         elif self.options['method'] == 'slinear':
             self.set_check_partial_options('*', form='backward')
 
+    def report_coeffs(self, out_stream=_DEFAULT_OUT_STREAM):
+        """
+        Print the size of the precomputed coefficients of each output.
+
+        The coefficients make interpolation faster at the cost of the memory reported here.
+
+        Parameters
+        ----------
+        out_stream : file-like object
+            Where to send human readable output. Default is sys.stdout.
+            Set to None to suppress.
+        """
+        if out_stream is None:
+            return
+        if out_stream is _DEFAULT_OUT_STREAM:
+            out_stream = sys.stdout
+
+        print(f"{self.msginfo}: precomputed coefficients", file=out_stream)
+        if not self.coeff_stats:
+            print("   None", file=out_stream)
+            return
+
+        for name, stats in self.coeff_stats.items():
+            print(f"   {name}: {stats['cells']} cells x {stats['coeffs_per_cell']} coefficients, "
+                  f"{stats['nbytes'] / 2**20:.3f} MB ({stats['nbytes'] / stats['table_nbytes']:.1f}"
+                  " x the table size)", file=out_stream)
+
     def compute(self, inputs, outputs):
         """
         Perform the interpolation at run time.
@@ -48,6 +48,8 @@ class MetaModelUnStructuredComp(ExplicitComponent):
         Training data for inputs.
     _training_output : dict
         Training data for outputs.
+    _num_updates : int
+        Number of incremental updates since the surrogates were last trained from scratch.
     """
 
     def __init__(self, **kwargs):
@@ -64,6 +66,7 @@ class MetaModelUnStructuredComp(ExplicitComponent):
         self.train = True
         self._training_input = np.empty(0)
         self._training_output = {}
+        self._num_updates = 0
 
         self._input_size = 0
 
@@ -107,6 +110,14 @@ class MetaModelUnStructuredComp(ExplicitComponent):
         self.options.declare('vec_size', types=int, default=1, lower=1,
                              desc='Number of points that will be simultaneously predicted by '
                                   'the surrogate.')
+        self.options.declare('incremental_training', types=bool, default=False,
+                             desc='If True and the only change in the training data is new '
+                                  'points appended to the end, surrogates that support it are '
+                                  'updated with the new points instead of being trained from '
+                                  'scratch.')
+        self.options.declare('full_retrain_interval', types=int, default=10, lower=1,
+                             desc='When incremental_training is True, the surrogates are '
+                                  'trained from scratch after this many incremental updates.')
 
     def add_input(self, name, val=1.0, training_data=None, **kwargs):
         """
@@ -231,6 +242,7 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
         # training will occur on first execution after setup
         self.train = True
+        self._num_updates = 0
 
         super()._setup_var_data()
 
@@ -368,12 +380,11 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
             elif overrides_method('vectorized_predict', surrogate, SurrogateModel):
                 # Vectorized; surrogate provides vectorized computation.
-                # TODO: This code is untested because no surrogates provide this option.
-                predicted = surrogate.vectorized_predict(flat_inputs.flat)
+                predicted = surrogate.vectorized_predict(flat_inputs)
                 if isinstance(predicted, tuple):  # rmse option
                     self._metadata(name)['rmse'] = predicted[1]
                     predicted = predicted[0]
-                outputs[name] = np.reshape(predicted, shape)
+                outputs[name] = np.reshape(predicted, outputs[name].shape)
 
             else:
                 # Vectorized; must call surrogate multiple times.
@@ -433,12 +444,10 @@ class MetaModelUnStructuredComp(ExplicitComponent):
         vec_size = self.options['vec_size']
         arr = np.zeros((vec_size, self._input_size), dtype=vec.asarray().dtype)
 
-        vecvals = [(vec[n], sz) for n, sz in self._surrogate_input_names]
-        for row in range(vec_size):
-            idx = 0
-            for val, sz in vecvals:
-                arr[row][idx:idx + sz] = val[row].flat
-                idx += sz
+        idx = 0
+        for name, sz in self._surrogate_input_names:
+            arr[:, idx:idx + sz] = vec[name].reshape((vec_size, sz))
+            idx += sz
 
         return arr
 
@@ -515,7 +524,15 @@ class MetaModelUnStructuredComp(ExplicitComponent):
 
         for out_name, out_shape in self._surrogate_output_names:
             surrogate = self._metadata(out_name).get('surrogate')
-            if vec_size > 1:
+            if vec_size > 1 and overrides_method('vectorized_linearize', surrogate,
+                                                 SurrogateModel):
+                # jacobians of all points at once, shape (vec_size, out_size, input_size)
+                derivs = surrogate.vectorized_linearize(flat_inputs)
+                idx = 0
+                for in_name, sz in self._surrogate_input_names:
+                    partials[out_name, in_name] = derivs[:, :, idx:idx + sz].ravel()
+                    idx += sz
+            elif vec_size > 1:
                 out_size = shape_to_len(out_shape)
                 for j in range(vec_size):
                     flat_input = flat_inputs[j]
@@ -560,6 +577,7 @@ class MetaModelUnStructuredComp(ExplicitComponent):
             raise RuntimeError(f"{self.msginfo}: The following training data sets must be "
                                f"provided as options: {missing_training_data}")
 
+        old_inputs = self._training_input
         inputs = np.zeros((num_sample, self._input_size))
         self._training_input = inputs
 
@@ -576,10 +594,20 @@ class MetaModelUnStructuredComp(ExplicitComponent):
                     inputs[row_idx, idx:idx + sz] = v.flat
                 idx += sz
 
+        # Points can only be added incrementally if the existing training points are unchanged.
+        incremental = False
+        if self.options['incremental_training'] and np.ndim(old_inputs) == 2:
+            n_old = old_inputs.shape[0]
+            incremental = (0 < n_old < num_sample and
+                           self._num_updates < self.options['full_retrain_interval'] and
+                           old_inputs.shape[1] == self._input_size and
+                           np.array_equal(inputs[:n_old], old_inputs))
+
         # Assemble output data and train each output.
         for name, shape in self._surrogate_output_names:
             output_size = shape_to_len(shape)
 
+            old_outputs = self._training_output[name]
             outputs = np.zeros((num_sample, output_size))
             self._training_output[name] = outputs
 
@@ -595,10 +623,15 @@ class MetaModelUnStructuredComp(ExplicitComponent):
             surrogate = self._metadata(name).get('surrogate')
             if surrogate is None:
                 raise RuntimeError(f"{self.msginfo}: No surrogate specified for output '{name}'")
+            elif (incremental and surrogate.trained and
+                  overrides_method('update', surrogate, SurrogateModel) and
+                  np.array_equal(outputs[:n_old], old_outputs)):
+                surrogate.update(inputs[n_old:], outputs[n_old:])
             else:
                 surrogate.train(self._training_input,
                                 self._training_output[name])
 
+        self._num_updates = self._num_updates + 1 if incremental else 0
         self.train = False
 
     def _metadata(self, name):
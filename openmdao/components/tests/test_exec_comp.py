@@ -18,7 +18,7 @@ except ImportError:
     from openmdao.utils.assert_utils import SkipParameterized as parameterized
 
 import openmdao.api as om
-from openmdao.components.exec_comp import _expr_dict, _temporary_expr_dict
+from openmdao.components.exec_comp import _expr_dict, _temporary_expr_dict, jax
 from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials, assert_warning
 from openmdao.utils.general_utils import env_truthy
 from openmdao.utils.testing_utils import force_check_partials
@@ -1979,5 +1979,221 @@ class TestExecCompParameterized(unittest.TestCase):
                                                    verbose=True, err_msg=f"{test_data['args']=}")
 
 
+class TestExecCompJax(unittest.TestCase):
+
+    def _build(self, use_jax, mode='fwd', **kwargs):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', om.ExecComp(['y = sin(x) * z + arctan2(x, z)',
+                                                      'w = sum(x ** 2) * exp(z)',
+                                                      'v = 3.0 * x[1:] ** 2'],
+                                                     x=np.arange(1., 6.), y=np.ones(5),
+                                                     v=np.ones(4), use_jax=use_jax, **kwargs),
+                                 promotes=['*'])
+        prob.setup(mode=mode)
+        prob.set_val('z', 1.5)
+        prob.run_model()
+        return prob
+
+    @unittest.skipIf(jax is None, "jax is not installed")
+    def test_values_and_partials(self):
+        for mode in ('fwd', 'rev'):
+            for kwargs in ({}, {'do_coloring': False}):
+                with self.subTest(mode=mode, **kwargs):
+                    expected = self._build(False, mode, **kwargs)
+                    prob = self._build(True, mode, **kwargs)
+
+                    for name in ('y', 'w', 'v'):
+                        assert_near_equal(prob.get_val(name), expected.get_val(name), 1e-14)
+
+                    of = ['y', 'w', 'v']
+                    wrt = ['x', 'z']
+                    J = prob.compute_totals(of, wrt)
+                    for key, val in expected.compute_totals(of, wrt).items():
+                        assert_near_equal(J[key], val, 1e-12)
+
+                    # partials are computed at the new point
+                    prob.set_val('x', np.arange(2., 7.))
+                    expected.set_val('x', np.arange(2., 7.))
+                    prob.run_model()
+                    expected.run_model()
+                    J = prob.compute_totals(of, wrt)
+                    for key, val in expected.compute_totals(of, wrt).items():
+                        assert_near_equal(J[key], val, 1e-12)
+
+    @unittest.skipIf(jax is None, "jax is not installed")
+    def test_diag_partials(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', om.ExecComp('y = 2.0 * x ** 2 + z', x=np.arange(1., 4.),
+                                                     y=np.ones(3), has_diag_partials=True,
+                                                     use_jax=True),
+                                 promotes=['*'])
+        prob.setup()
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y'), 2.0 * np.arange(1., 4.) ** 2 + 1.0, 1e-14)
+        J = prob.compute_totals(['y'], ['x', 'z'])
+        assert_near_equal(J['y', 'x'], np.diag(4.0 * np.arange(1., 4.)), 1e-14)
+        assert_near_equal(J['y', 'z'], np.ones((3, 1)), 1e-14)
+
+    @unittest.skipIf(jax is None, "jax is not installed")
+    def test_boolean_funcs(self):
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                prob = om.Problem()
+                prob.model.add_subsystem('comp', om.ExecComp(['y = isnan(x) + isinf(x)',
+                                                              'z = 2.0 * x'],
+                                                             x=np.arange(1., 4.), y=np.ones(3),
+                                                             z=np.ones(3), use_jax=True),
+                                         promotes=['*'])
+                prob.setup(mode=mode)
+                prob.set_val('x', np.array([1., np.inf, 3.]))
+                prob.run_model()
+
+                assert_near_equal(prob.get_val('y'), np.array([0., 1., 0.]), 1e-14)
+                J = prob.compute_totals(['y', 'z'], ['x'])
+                assert_near_equal(J['y', 'x'], np.zeros((3, 3)), 1e-14)
+                assert_near_equal(J['z', 'x'], 2.0 * np.eye(3), 1e-14)
+
+    @unittest.skipIf(jax is None, "jax is not installed")
+    def test_func_without_jax_equivalent(self):
+        with _temporary_expr_dict():
+            om.ExecComp.register('myfunc', lambda x: x * x, complex_safe=True)
+
+            prob = om.Problem()
+            prob.model.add_subsystem('comp', om.ExecComp('y = myfunc(x) + sin(x)', use_jax=True))
+
+            with self.assertRaises(RuntimeError) as cm:
+                prob.setup()
+
+        self.assertEqual(str(cm.exception),
+                         "'comp' <class ExecComp>: Functions ['myfunc'] have no jax equivalent, "
+                         "so they can't be used when the 'use_jax' option is True.")
+
+    @unittest.skipUnless(jax is None, "only runs when jax is not installed")
+    def test_no_jax(self):
+        with self.assertRaises(RuntimeError) as cm:
+            self._build(True)
+
+        self.assertEqual(str(cm.exception),
+                         "'comp' <class ExecComp>: jax is not installed. "
+                         "Try 'pip install openmdao[jax]' with Python>=3.8.")
+
+
+class TestFusedExecComps(unittest.TestCase):
+
+    def _build(self, fuse, cycle=False):
+        prob = om.Problem(reports=False)
+        model = prob.model
+        sub = model.add_subsystem('sub', om.Group(), promotes=['*'])
+        sub.options['fuse_exec_comps'] = fuse
+
+        sub.add_subsystem('c1', om.ExecComp(['y = 2.0*x + c', 'z = x**2'], c={'val': 3.0,
+                                                                            'constant': True},
+                                            x=np.ones(3), y=np.ones(3), z=np.ones(3)))
+        sub.add_subsystem('c2', om.ExecComp('y = sin(x)*sum(z) + w', x=np.ones(3), z=np.ones(3),
+                                            y=np.ones(3), w=2.0))
+        # src_indices on a connection between members breaks the chain
+        sub.add_subsystem('c3', om.ExecComp('y = 3.0*x', x=np.ones(2), y=np.ones(2)))
+        sub.add_subsystem('c4', om.ExecComp('y = x[0]*x[1] + a', x=np.ones(2), a=np.ones(2),
+                                            y=np.ones(2)))
+        sub.add_subsystem('c5', om.ExecComp('y = -x', x=np.ones(2), y=np.ones(2)))
+        sub.add_subsystem('p', om.ExecComp('y = 2.0*x', x=np.ones(2), y=np.ones(2),
+                                           shape_by_conn=False))
+
+        sub.connect('c1.y', 'c2.x')
+        sub.connect('c1.z', 'c2.z')
+        sub.connect('c2.y', 'c3.x', src_indices=[0, 2])
+        sub.connect('c3.y', 'c4.x')
+        sub.connect('c4.y', 'c5.x')
+        sub.connect('c5.y', 'p.x')
+
+        if cycle:
+            sub.connect('p.y', 'c4.a')
+            sub.nonlinear_solver = om.NonlinearBlockGS(maxiter=100, atol=1e-12, rtol=1e-12)
+
+        model.add_design_var('c1.x')
+        model.add_design_var('c2.w')
+        model.add_objective('p.y', index=0)
+        model.add_constraint('c2.y', upper=10.)
+
+        prob.setup(force_alloc_complex=True)
+        prob.set_val('c1.x', [.1, .2, .3])
+        prob.set_solver_print(level=0)
+        return prob
+
+    def test_values_and_totals(self):
+        for cycle in (False, True):
+            with self.subTest(cycle=cycle):
+                probs = [self._build(fuse, cycle) for fuse in (False, True)]
+                for prob in probs:
+                    prob.run_model()
+
+                chains = probs[1].model.sub._get_fused_exec_chains()
+                self.assertEqual([[c.name for c in chain.comps] for chain in chains.values()],
+                                 [['c1', 'c2'], ['c3', 'c4', 'c5', 'p']])
+                self.assertEqual(probs[0].model.sub._get_fused_exec_chains(), {})
+
+                # all inputs and outputs, including those passed within a chain, are the same
+                for name in ('c2.x', 'c2.z', 'c2.y', 'c3.x', 'c4.x', 'c4.a', 'c5.x', 'p.x',
+                             'p.y'):
+                    assert_near_equal(probs[1].get_val(name), probs[0].get_val(name), 1e-15)
+
+                self.assertEqual(probs[1].model.sub.c4.iter_count,
+                                 probs[0].model.sub.c4.iter_count)
+
+                J0 = probs[0].compute_totals(return_format='array')
+                J1 = probs[1].compute_totals(return_format='array')
+                assert_near_equal(J1, J0, 1e-15)
+
+    def test_approx_totals(self):
+        for method in ('fd', 'cs'):
+            with self.subTest(method=method):
+                Js = []
+                for fuse in (False, True):
+                    prob = self._build(fuse)
+                    prob.model.approx_totals(method=method)
+                    prob.setup(force_alloc_complex=True)
+                    prob.set_val('c1.x', [.1, .2, .3])
+                    prob.run_model()
+                    Js.append(prob.compute_totals(return_format='array'))
+
+                assert_near_equal(Js[1], Js[0], 1e-12)
+
+    def test_not_fused(self):
+        prob = om.Problem(reports=False)
+        model = prob.model
+        model.options['fuse_exec_comps'] = True
+        model.add_subsystem('c1', om.ExecComp('y = 2.0*x', y={'ref': 10.0}))
+        model.add_subsystem('c2', om.ExecComp('y = 2.0*x', x={'units': 'm'}, y={'units': 'm'}))
+        model.add_subsystem('c3', om.ExecComp('y = 2.0*x', x={'units': 'm'}, y={'units': 'm'}))
+        model.add_subsystem('c4', om.ExecComp('y = 2.0*x', x={'units': 'cm'}))
+        model.connect('c2.y', 'c3.x')
+        model.connect('c3.y', 'c4.x')
+        prob.setup()
+        prob.set_val('c2.x', 3.0)
+        prob.run_model()
+
+        # c1 is scaled and c4 has a unit conversion on its input
+        self.assertEqual([[c.name for c in chain.comps]
+                          for chain in model._get_fused_exec_chains().values()], [['c2', 'c3']])
+        assert_near_equal(prob.get_val('c4.y'), 2400.0, 1e-15)
+
+    def test_error(self):
+        prob = om.Problem(reports=False)
+        model = prob.model
+        model.options['fuse_exec_comps'] = True
+        model.add_subsystem('c1', om.ExecComp('y = 2.0*x'))
+        model.add_subsystem('c2', om.ExecComp('y = x[3]'))
+        model.connect('c1.y', 'c2.x')
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.run_model()
+
+        self.assertEqual(str(cm.exception),
+                         "'c2' <class ExecComp>: Error occurred evaluating 'y = x[3]':\n"
+                         "index 3 is out of bounds for axis 0 with size 1")
+
+
 if __name__ == "__main__":
     unittest.main()
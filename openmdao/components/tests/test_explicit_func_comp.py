@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 import math
 
 import numpy as np
@@ -6,7 +7,9 @@ from numpy.testing import assert_almost_equal
 from io import StringIO
 
 import openmdao.api as om
-from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials, assert_check_totals
+from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials, assert_check_totals, \
+    assert_warning
+from openmdao.utils.om_warnings import UnusedOptionWarning
 from openmdao.utils.cs_safe import abs, arctan2
 import openmdao.func_api as omf
 from openmdao.utils.coloring import compute_total_coloring
@@ -1083,6 +1086,39 @@ class TestJax(unittest.TestCase):
         self.check_derivs('rev', (), use_jit=True)
 
 
+@unittest.skipIf(jax is None, "jax is not installed")
+class TestJaxScalarReturn(unittest.TestCase):
+    def check_derivs(self, mode, use_jit):
+        # the function returns a 0-d value for an output of shape (1,)
+        def func(y, b):
+            x = jnp.sum(y ** 2) + b
+            return x
+
+        f = (omf.wrap(func).add_input('y', shape=3).add_input('b', shape=1)
+             .add_output('x', shape=1).declare_partials(of='*', wrt='*', method='jax'))
+        p = om.Problem()
+        p.model.add_subsystem('comp', om.ExplicitFuncComp(f, use_jax=True, use_jit=use_jit))
+        p.setup(mode=mode)
+        p.set_val('comp.y', np.array([1., 2., 3.]))
+        p.run_model()
+        J = p.compute_totals(of=['comp.x'], wrt=['comp.y', 'comp.b'])
+
+        assert_near_equal(J['comp.x', 'comp.y'], [[2., 4., 6.]])
+        assert_near_equal(J['comp.x', 'comp.b'], [[1.]])
+
+    def test_fwd(self):
+        self.check_derivs('fwd', use_jit=False)
+
+    def test_fwd_jit(self):
+        self.check_derivs('fwd', use_jit=True)
+
+    def test_rev(self):
+        self.check_derivs('rev', use_jit=False)
+
+    def test_rev_jit(self):
+        self.check_derivs('rev', use_jit=True)
+
+
 @unittest.skipIf(jax is None, "jax is not installed")
 class TestJaxMixedShapes1output(unittest.TestCase):
     def check_derivs(self, mode, m, n, o):
@@ -1410,5 +1446,250 @@ class TestJax2retvalsColoring(unittest.TestCase):
     def test_rev_jit(self):
         self.check_derivs('rev', (), use_jit=True)
 
+@unittest.skipIf(jax is None, "jax is not installed")
+class TestJaxSharedFunction(unittest.TestCase):
+
+    def _build(self, func, n, mode):
+        f = omf.wrap(func).defaults(shape=3).declare_partials(of='*', wrt='*', method='jax')
+        p = om.Problem()
+        for i in range(n):
+            p.model.add_subsystem(f'comp{i}', om.ExplicitFuncComp(f, use_jax=True, use_jit=True))
+        p.setup(mode=mode)
+        for i in range(n):
+            p.set_val(f'comp{i}.a', np.arange(3.) + i)
+            p.set_val(f'comp{i}.b', np.arange(3.) - i)
+        p.run_model()
+        return p
+
+    def test_shared_jit_and_batch(self):
+        from openmdao.components.func_comp_common import _jit_cache
+
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                def func(a, b):
+                    x = a * b ** 2
+                    y = np.sin(a) + b
+                    return x, y
+
+                p = self._build(func, 20, mode)
+
+                # all instances share one jitted compute function
+                self.assertEqual(len([k for k in _jit_cache if k[0] is func]), 1)
+
+                # and one jitted partials kernel
+                J = p.compute_totals(of=['comp7.x', 'comp7.y'], wrt=['comp7.a', 'comp7.b'])
+                self.assertEqual(len([k for k in _jit_cache if k[0] is func]), 2)
+
+                # the first linearize is done separately for each instance, and the next ones
+                # in a single vmapped call
+                for i in range(2):
+                    p.model.run_linearize()
+
+                self.assertEqual(len([k for k in _jit_cache if k[0] is func]), 3)
+
+                a = np.arange(3.) + 7
+                b = np.arange(3.) - 7
+                assert_near_equal(J['comp7.x', 'comp7.a'], np.diag(b ** 2))
+                assert_near_equal(J['comp7.x', 'comp7.b'], np.diag(2 * a * b))
+                assert_near_equal(J['comp7.y', 'comp7.a'], np.diag(np.cos(a)))
+                assert_near_equal(J['comp7.y', 'comp7.b'], np.eye(3))
+
+                jac = p.model.comp7._jacobian
+                assert_near_equal(jac['x', 'a'], np.diag(b ** 2))
+                assert_near_equal(jac['y', 'a'], np.diag(np.cos(a)))
+
+    def test_jit_cache_size(self):
+        from openmdao.components import func_comp_common as fcc
+
+        funcs = [lambda a, i=i: a * i for i in range(4)]
+        with mock.patch.object(fcc, '_JIT_CACHE_SIZE', 2):
+            fcc.clear_jit_cache()
+            jitted = [fcc._cached_jit((f, 'compute'), f) for f in funcs[:2]]
+
+            # a cached function is returned and becomes the most recently used one
+            self.assertIs(fcc._cached_jit((funcs[0], 'compute'), funcs[0]), jitted[0])
+
+            fcc._cached_jit((funcs[2], 'compute'), funcs[2])
+            self.assertEqual([k[0] for k in fcc._jit_cache], [funcs[0], funcs[2]])
+
+            fcc.clear_jit_cache()
+            self.assertEqual(len(fcc._jit_cache), 0)
+
+    def test_direction(self):
+        def func(a, b, c):
+            x = np.sum(a * b * c)
+            return x
+
+        f = omf.wrap(func).defaults(shape=4).declare_partials(of='*', wrt='*', method='jax')
+        p = om.Problem()
+        comp = p.model.add_subsystem('comp', om.ExplicitFuncComp(f, use_jax=True))
+        p.setup(mode='fwd')
+        p.run_model()
+        p.compute_totals(of=['comp.x'], wrt=['comp.a'])
+
+        # one output and 12 inputs, so reverse mode is cheaper regardless of the problem mode
+        self.assertEqual(comp._tangent_direction, 'rev')
+
+    def test_single_input_fwd(self):
+        def func(x):
+            y = 0.5 * x + np.sin(x)
+            return y
+
+        f = omf.wrap(func).defaults(shape=3).declare_partials(of='*', wrt='*', method='jax')
+        p = om.Problem()
+        comp = p.model.add_subsystem('comp', om.ExplicitFuncComp(f, use_jax=True))
+        p.setup(mode='rev')
+        p.set_val('comp.x', np.arange(3.))
+        p.run_model()
+        J = p.compute_totals(of=['comp.y'], wrt=['comp.x'])
+
+        # the jacobian is square, so forward mode is used
+        self.assertEqual(comp._tangent_direction, 'fwd')
+        assert_near_equal(J['comp.y', 'comp.x'], np.diag(0.5 + np.cos(np.arange(3.))))
+
+
+def _compiled_group_model(jax_compile, mode, top=False):
+    def func1(x, y, scale=2.0):
+        a = scale * x * y
+        b = np.sin(x) + y ** 2
+        return a, b
+
+    def func2(a, b):
+        c = a ** 2 * np.sum(b)
+        return c
+
+    f1 = (omf.wrap(func1)
+          .add_input('x', units='m', shape=5)
+          .add_input('y', shape=5)
+          .declare_option('scale', default=2.0)
+          .add_output('a', units='m', shape=5, ref=3.)
+          .add_output('b', shape=5)
+          .declare_partials(of='*', wrt='*', method='jax'))
+    f2 = (omf.wrap(func2)
+          .add_input('a', units='cm', shape=3)
+          .add_input('b', shape=2)
+          .add_output('c', shape=3, ref0=1., ref=5.)
+          .declare_partials(of='*', wrt='*', method='jax'))
+
+    p = om.Problem()
+    group = p.model if top else p.model.add_subsystem('sub', om.Group(), promotes=['*'])
+    group.options['jax_compile'] = jax_compile
+
+    group.add_subsystem('ivc', om.IndepVarComp('y', np.arange(5) * -.2 + 2))
+    inner = group.add_subsystem('inner', om.Group())
+    inner.add_subsystem('c1', om.ExplicitFuncComp(f1, use_jax=True))
+    group.add_subsystem('c2', om.ExplicitFuncComp(f2, use_jax=True))
+    group.connect('ivc.y', 'inner.c1.y')
+    group.connect('inner.c1.a', 'c2.a', src_indices=[4, 0, 2])
+    group.connect('inner.c1.b', 'c2.b', src_indices=[1, 3])
+
+    if top:
+        p.model.add_objective('c2.c', index=0, alias='obj')
+    else:
+        p.model.add_subsystem('post', om.ExecComp('z = sum(c)', c=np.ones(3)))
+        p.model.connect('c2.c', 'post.c')
+        p.model.add_objective('post.z')
+
+    p.model.add_design_var('inner.c1.x')
+    p.model.add_constraint('c2.c', upper=0., indices=[1, 2])
+
+    p.setup(mode=mode, force_alloc_complex=True)
+    p.set_val('inner.c1.x', np.arange(5) * .3 + 1)
+    p.run_model()
+    return p
+
+
+@unittest.skipIf(jax is None, "jax is not installed")
+class TestJaxCompiledGroup(unittest.TestCase):
+
+    def test_values_and_totals(self):
+        for top in (False, True):
+            for mode in ('fwd', 'rev'):
+                with self.subTest(top=top, mode=mode):
+                    p = _compiled_group_model(False, mode, top)
+                    c = p.get_val('c2.c')
+                    J = p.compute_totals()
+
+                    p = _compiled_group_model(True, mode, top)
+                    group = p.model if top else p.model.sub
+                    self.assertIsNotNone(group._get_jax_group_func())
+                    # a compiled subgroup computes its own derivatives with jax
+                    self.assertEqual(group._owns_approx_jac, not top)
+
+                    assert_near_equal(p.get_val('c2.c'), c, 1e-14)
+                    assert_near_equal(p.get_val('c2.a'), p.get_val('inner.c1.a')[[4, 0, 2]] * 100.,
+                                      1e-14)
+                    Jc = p.compute_totals()
+                    for key, val in J.items():
+                        assert_near_equal(Jc[key], val, 1e-12)
+
+                    assert_check_totals(p.check_totals(method='cs', out_stream=None))
+
+    def test_cycle_err(self):
+        def func(x):
+            y = 2. * x
+            return y
+
+        f = omf.wrap(func).declare_partials(of='*', wrt='*', method='jax')
+        p = om.Problem()
+        p.model.options['jax_compile'] = True
+        p.model.add_subsystem('c1', om.ExplicitFuncComp(f, use_jax=True))
+        p.model.add_subsystem('c2', om.ExplicitFuncComp(f, use_jax=True))
+        p.model.connect('c2.y', 'c1.x')
+        p.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            p.run_model()
+
+        self.assertEqual(str(cm.exception),
+                         "<model> <class Group>: Option 'jax_compile' requires a feed-forward data "
+                         "flow, but input 'c1.x' is connected to output 'c2.y', which is computed "
+                         "after it.")
+
+    def test_not_compiled(self):
+        def func(x):
+            y = 2. * x
+            return y
+
+        f = omf.wrap(func).declare_partials(of='*', wrt='*', method='jax')
+        p = om.Problem()
+        sub = p.model.add_subsystem('sub', om.Group())
+        sub.options['jax_compile'] = True
+        sub.add_subsystem('c1', om.ExplicitFuncComp(f, use_jax=True))
+        sub.add_subsystem('c2', om.ExecComp('y = 3. * x'))
+        sub.connect('c1.y', 'c2.x')
+
+        with assert_warning(UnusedOptionWarning,
+                            "'sub' <class Group>: Option 'jax_compile' is ignored because "
+                            "'sub.c2' is not an ExplicitFuncComp using jax."):
+            p.setup()
+
+        p.set_val('sub.c1.x', 2.)
+        p.run_model()
+
+        self.assertIsNone(sub._get_jax_group_func())
+        self.assertFalse(sub._owns_approx_jac)
+        assert_near_equal(p.get_val('sub.c2.y'), 12.)
+
+
+@unittest.skipIf(jax is not None, "jax is installed")
+class TestJaxCompiledGroupNoJax(unittest.TestCase):
+
+    def test_no_jax(self):
+        p = om.Problem()
+        sub = p.model.add_subsystem('sub', om.Group())
+        sub.options['jax_compile'] = True
+        sub.add_subsystem('c1', om.ExecComp('y = 2. * x'))
+
+        with assert_warning(UnusedOptionWarning,
+                            "'sub' <class Group>: Option 'jax_compile' is ignored because jax is "
+                            "not installed."):
+            p.setup()
+
+        p.set_val('sub.c1.x', 2.)
+        p.run_model()
+        assert_near_equal(p.get_val('sub.c1.y'), 4.)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -543,5 +543,32 @@ class TestJax(unittest.TestCase):
     def test_partials_implicit_2in2out_fwd_cs_nojit(self):
         self._partials_implicit_2in2out(mode='fwd', method='cs', use_jit=False)
 
+    def test_shared_function_batch(self):
+        def apply_nl(a, x):
+            return x ** 2 - a
+
+        f = (omf.wrap(apply_nl)
+             .add_input('a', shape=4)
+             .add_output('x', resid='R_x', shape=4, val=1.0)
+             .declare_partials(of='*', wrt='*', method='jax')
+            )
+
+        prob = om.Problem()
+        model = prob.model
+        for i in range(5):
+            model.add_subsystem(f'comp{i}', om.ImplicitFuncComp(f, use_jit=True))
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, iprint=0, maxiter=30)
+        model.linear_solver = om.DirectSolver()
+
+        prob.setup()
+        for i in range(5):
+            prob.set_val(f'comp{i}.a', np.arange(1., 5.) + i)
+        prob.run_model()
+
+        # after the first iteration, the partials of all instances are computed together
+        for i in range(5):
+            assert_near_equal(prob.get_val(f'comp{i}.x'), np.sqrt(np.arange(1., 5.) + i), 1e-10)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@ Unit tests for the structured metamodel component.
 """
 import unittest
 import inspect
+from io import StringIO
 
 import numpy as np
 from numpy.testing import assert_almost_equal
@@ -1293,6 +1294,110 @@ class TestMetaModelStructuredPython(unittest.TestCase):
         # Derivatives have large magniudes, so tols are high.
         assert_check_totals(totals, atol=1e3, rtol=1e-4)
 
+    def test_precompute_coeffs(self):
+        mapdata = SampleMap()
+        params = mapdata.param_data
+        outs = mapdata.output_data
+
+        def build(method, precompute):
+            prob = om.Problem()
+
+            comp = om.MetaModelStructuredComp(method=method, extrapolate=True, vec_size=3,
+                                              precompute_coeffs=precompute)
+
+            for param in params:
+                comp.add_input(param['name'], np.full(3, param['default']), param['values'],
+                               units=param['units'])
+
+            for out in outs:
+                comp.add_output(out['name'], np.full(3, out['default']), out['values'])
+
+            prob.model.add_subsystem('comp', comp, promotes=["*"])
+
+            prob.setup(force_alloc_complex=True)
+            prob.set_val('x', np.array([1.0, 10.0, 90.0]))
+            prob.set_val('y', np.array([0.75, 0.81, 1.2]))
+            prob.set_val('z', np.array([-1.7, 1.1, 2.1]))
+            prob.run_model()
+
+            return prob
+
+        for method in ('cubic', 'lagrange3'):
+            with self.subTest(method=method):
+                prob = build(method, True)
+                base = build(method, False)
+
+                assert_near_equal(prob.get_val('f'), base.get_val('f'), 1e-12)
+                assert_near_equal(prob.get_val('g'), base.get_val('g'), 1e-12)
+
+                partials = force_check_partials(prob, method='cs', out_stream=None)
+                # Derivs are large, so ignore atol.
+                assert_check_partials(partials, atol=1e10, rtol=1e-10)
+
+                stats = prob.model.comp.coeff_stats['f']
+                self.assertEqual(stats['cells'], 9 * 4 * 11)
+                self.assertEqual(stats['coeffs_per_cell'], 64)
+
+    def test_precompute_coeffs_1D_akima(self):
+        comp = om.MetaModelStructuredComp(extrapolate=True, method='akima', vec_size=2,
+                                          precompute_coeffs=True)
+        comp.add_input('x', 0.0, np.array([.1, .2, .3, .4, .5, .6, .7]))
+        comp.add_output('f', 0.0, np.array([.3, .7, .5, .6, .3, .4, .2]))
+
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', comp, promotes=["*"])
+        prob.setup()
+        prob.set_val('x', np.array([0.45, 0.75]))
+        prob.run_model()
+
+        totals = prob.compute_totals(of='f', wrt='x')
+        assert_near_equal(totals['f', 'x'][0, 0], -4.14285714, tolerance=1e-7)
+        assert_near_equal(totals['f', 'x'][1, 1], -3.5, tolerance=1e-7)
+
+        stream = StringIO()
+        comp.report_coeffs(out_stream=stream)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(lines[0], "'comp' <class MetaModelStructuredComp>: precomputed "
+                                   "coefficients")
+        self.assertEqual(lines[1], "   f: 8 cells x 4 coefficients, 0.000 MB "
+                                   "(4.6 x the table size)")
+
+    def test_precompute_coeffs_errors(self):
+        mapdata = SampleMap()
+
+        def build(method, **kwargs):
+            comp = om.MetaModelStructuredComp(method=method, precompute_coeffs=True, **kwargs)
+            for param in mapdata.param_data:
+                comp.add_input(param['name'], param['default'], param['values'])
+            comp.add_output('f', 0.0, mapdata.output_data[0]['values'])
+
+            prob = om.Problem()
+            prob.model.add_subsystem('comp', comp)
+            return prob
+
+        with self.assertRaises(ValueError) as cm:
+            build('akima').setup()
+
+        self.assertEqual(str(cm.exception),
+                         "'comp' <class MetaModelStructuredComp>: Method 'akima' only supports "
+                         "precomputed coefficients for 1D tables.")
+
+        with self.assertRaises(ValueError) as cm:
+            build('slinear').setup()
+
+        self.assertEqual(str(cm.exception),
+                         "'comp' <class MetaModelStructuredComp>: Method 'slinear' does not "
+                         "support precomputed coefficients. Valid methods are 'cubic', "
+                         "'lagrange3', 'akima'.")
+
+        with self.assertRaises(ValueError) as cm:
+            build('cubic', training_data_gradients=True).setup()
+
+        self.assertEqual(str(cm.exception),
+                         "'comp' <class MetaModelStructuredComp>: Option 'precompute_coeffs' "
+                         "can't be used with 'training_data_gradients' because the training "
+                         "data may change.")
+
 
 @use_tempdirs
 @unittest.skipIf(not scipy_gte_019, "only run if scipy>=0.19.")
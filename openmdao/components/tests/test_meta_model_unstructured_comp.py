@@ -1244,5 +1244,61 @@ class MetaModelUnstructuredSurrogatesFeatureTestCase(unittest.TestCase):
         assert_near_equal(prob.get_val('sin_mm.f_x'), .5*np.sin(prob.get_val('sin_mm.x')), 5e-3)
 
 
+    def test_incremental_training(self):
+        kriging = om.KrigingSurrogate(training_method='cholesky')
+        surface = om.ResponseSurface()
+
+        mm = om.MetaModelUnStructuredComp(incremental_training=True, full_retrain_interval=2)
+        mm.add_input('x', 2.1)
+        mm.add_output('f_x', 0., surrogate=kriging)
+        mm.add_output('g_x', 0., surrogate=surface)
+
+        prob = om.Problem()
+        prob.model.add_subsystem('mm', mm)
+        prob.setup()
+
+        x = np.linspace(0, 10, 40)
+        rng = np.random.default_rng(0)
+        rng.shuffle(x)
+
+        def train(n):
+            mm.options['train_x'] = x[:n]
+            mm.options['train_f_x'] = .5 * np.sin(x[:n])
+            mm.options['train_g_x'] = 2. * x[:n] ** 2 - x[:n]
+            mm.train = True
+            prob.run_model()
+
+        train(20)
+        thetas = kriging.thetas.copy()
+
+        # appended points update the surrogates with the kriging hyperparameters fixed
+        train(25)
+        self.assertEqual(mm._num_updates, 1)
+        self.assertEqual(kriging.n_samples, 25)
+        self.assertEqual(surface.m, 25)
+        assert_near_equal(kriging.thetas, thetas, 1e-15)
+
+        train(30)
+        self.assertEqual(mm._num_updates, 2)
+        self.assertEqual(kriging.n_samples, 30)
+
+        prob.set_val('mm.x', 2.1)
+        prob.run_model()
+        assert_near_equal(prob.get_val('mm.f_x'), .5 * np.sin(2.1), 1e-4)
+        assert_near_equal(prob.get_val('mm.g_x'), 2. * 2.1 ** 2 - 2.1, 1e-10)
+
+        # after full_retrain_interval updates, the surrogates are trained from scratch
+        train(35)
+        self.assertEqual(mm._num_updates, 0)
+        self.assertEqual(kriging.n_samples, 35)
+
+        # changing existing training points also forces a full training
+        train(40)
+        self.assertEqual(mm._num_updates, 1)
+        x[0] += 1e-3
+        train(40)
+        self.assertEqual(mm._num_updates, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
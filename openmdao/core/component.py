@@ -1207,7 +1207,8 @@ class Component(System):
                          perturb_size=_DEFAULT_COLORING_META['perturb_size'],
                          min_improve_pct=_DEFAULT_COLORING_META['min_improve_pct'],
                          show_summary=_DEFAULT_COLORING_META['show_summary'],
-                         show_sparsity=_DEFAULT_COLORING_META['show_sparsity']):
+                         show_sparsity=_DEFAULT_COLORING_META['show_sparsity'],
+                         color_order='ID'):
         """
         Set options for deriv coloring of a set of wrt vars matching the given pattern(s).
 
@@ -1243,11 +1244,14 @@ class Component(System):
             If True, display summary information after generating coloring.
         show_sparsity : bool
             If True, display sparsity with coloring info after generating coloring.
+        color_order : str
+            Column ordering used by the greedy coloring.  'ID' (incidence degree) is the
+            default.  'smallest_last' and 'DSATUR' sometimes find colorings with fewer colors.
         """
         super().declare_coloring(wrt, method, form, step, per_instance,
                                  num_full_jacs,
                                  tol, orders, perturb_size, min_improve_pct,
-                                 show_summary, show_sparsity)
+                                 show_summary, show_sparsity, color_order)
 
         # create approx partials for all matches
         meta = self.declare_partials('*', wrt, method=method, step=step, form=form)
@@ -1808,6 +1812,17 @@ class Component(System):
         self.comm.gather(nzresids, root=0)
         return nzresids
 
+    def _vectorized_compute_ok(self):
+        """
+        Return True if this component can evaluate a batch of points in a single call.
+
+        Returns
+        -------
+        bool
+            True if approximation schemes can use a vectorized evaluation of this component.
+        """
+        return False
+
     def _has_fast_rel_lookup(self):
         """
         Return True if this System should have fast relative variable name lookup in vectors.
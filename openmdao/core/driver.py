@@ -25,6 +25,25 @@ from openmdao.utils.indexer import indexer
 from openmdao.utils.om_warnings import issue_warning, DerivativesWarning, DriverWarning
 
 
+def _check_cache_linear_solutions(name, value):
+    """
+    Check the value of the 'cache_linear_solutions' option.
+
+    Parameters
+    ----------
+    name : str
+        The name of the option.
+    value : bool or int
+        The value of the option.
+
+    Raises
+    ------
+    ValueError
+    """
+    if not isinstance(value, bool) and value < 1:
+        raise ValueError(f"Option '{name}' must be a bool or an int > 0, but got {value}.")
+
+
 class Driver(object):
     """
     Top-level container for the systems and drivers.
@@ -124,6 +143,15 @@ class Driver(object):
                                   'variable to one of the valid options.',
                              default=default_desvar_behavior)
 
+        self.options.declare('cache_linear_solutions', types=(bool, int), default=False,
+                             check_valid=_check_cache_linear_solutions,
+                             desc='If True, cache the converged linear solution of every seed or '
+                                  'color of the total jacobian and use it as the initial guess '
+                                  'for the same linear solve at the next computation of total '
+                                  'derivatives. If an int, caching is enabled and the value is the '
+                                  'maximum number of cached solutions, with the least recently '
+                                  'used solution evicted first.')
+
         # Case recording options
         self.recording_options = OptionsDictionary(parent_name=type(self).__name__)
 
@@ -266,6 +294,17 @@ class Driver(object):
         """
         self._problem = weakref.ref(problem)
 
+    def _check_recorders(self, problem):
+        """
+        Check the recorders attached anywhere in the problem before any of them are started.
+
+        Parameters
+        ----------
+        problem : <Problem>
+            Pointer to the containing problem.
+        """
+        pass
+
     def _setup_driver(self, problem):
         """
         Prepare the driver for execution.
@@ -736,6 +775,17 @@ class Driver(object):
         """
         return 0
 
+    def _get_run_stats(self):
+        """
+        Return driver specific statistics of the last run to be saved in opt_result.
+
+        Returns
+        -------
+        dict
+            The statistics keyed by name.
+        """
+        return {}
+
     def get_design_var_values(self, get_remote=True, driver_scaling=True):
         """
         Return the design variable values.
@@ -1143,7 +1193,8 @@ class Driver(object):
                          min_improve_pct=coloring_mod._DEF_COMP_SPARSITY_ARGS['min_improve_pct'],
                          show_summary=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_summary'],
                          show_sparsity=coloring_mod._DEF_COMP_SPARSITY_ARGS['show_sparsity'],
-                         use_scaling=coloring_mod._DEF_COMP_SPARSITY_ARGS['use_scaling']):
+                         use_scaling=coloring_mod._DEF_COMP_SPARSITY_ARGS['use_scaling'],
+                         sparsity_method='numeric', color_order='ID'):
         """
         Set options for total deriv coloring.
 
@@ -1166,7 +1217,19 @@ class Driver(object):
             If True, display sparsity with coloring info after generating coloring.
         use_scaling : bool
             If True, use driver scaling when generating the sparsity.
-        """
+        sparsity_method : str
+            If 'numeric', compute sparsity from num_full_jacs total jacobians with randomized
+            partials.  If 'structural', propagate the declared partial sparsity through the
+            model and verify the result with a single random directional derivative.
+        color_order : str
+            Column ordering used by the greedy coloring.  'ID' (incidence degree) is the
+            default.  'smallest_last' and 'DSATUR' sometimes find colorings with fewer colors.
+        """
+        if sparsity_method not in ('numeric', 'structural'):
+            raise ValueError(f"{self.msginfo}: sparsity_method must be 'numeric' or "
+                             f"'structural', but got '{sparsity_method}'.")
+        coloring_mod._check_coloring_order(color_order, self.msginfo)
+
         self._coloring_info.coloring = None
         self._coloring_info.num_full_jacs = num_full_jacs
         self._coloring_info.tol = tol
@@ -1180,6 +1243,8 @@ class Driver(object):
         self._coloring_info.show_summary = show_summary
         self._coloring_info.show_sparsity = show_sparsity
         self._coloring_info.use_scaling = use_scaling
+        self._coloring_info.sparsity_method = sparsity_method
+        self._coloring_info.color_order = color_order
 
     def use_fixed_coloring(self, coloring=coloring_mod._STD_COLORING_FNAME):
         """
@@ -1472,6 +1537,7 @@ class SaveOptResult(object):
             'deriv_calls': driver.get_driver_derivative_calls(),
             'exit_status': driver.get_exit_status()
         }
+        driver.opt_result.update(driver._get_run_stats())
 
 
 class RecordingDebugging(Recording):
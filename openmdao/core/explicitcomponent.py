@@ -23,6 +23,8 @@ class ExplicitComponent(Component):
     ----------
     _has_compute_partials : bool
         If True, the instance overrides compute_partials.
+    _has_vectorized_compute : bool
+        If True, the instance overrides vectorized_compute.
     """
 
     def __init__(self, **kwargs):
@@ -32,6 +34,8 @@ class ExplicitComponent(Component):
         super().__init__(**kwargs)
 
         self._has_compute_partials = overrides_method('compute_partials', self, ExplicitComponent)
+        self._has_vectorized_compute = overrides_method('vectorized_compute', self,
+                                                        ExplicitComponent)
         self.options.undeclare('assembled_jac_type')
 
     @property
@@ -266,6 +270,50 @@ class ExplicitComponent(Component):
                 else:
                     self.compute(self._inputs, self._outputs)
 
+    def _vectorized_compute_ok(self):
+        """
+        Return True if this component can evaluate a batch of points in a single call.
+
+        Returns
+        -------
+        bool
+            True if approximation schemes can use a vectorized evaluation of this component.
+        """
+        return (self._has_vectorized_compute and self.comm.size == 1 and
+                not (self._discrete_inputs or self._discrete_outputs))
+
+    def _vectorized_compute_wrapper(self, in_batch):
+        """
+        Call vectorized_compute for a batch of input points. The model is assumed to be unscaled.
+
+        Parameters
+        ----------
+        in_batch : ndarray
+            2-D array where each row is a full input vector.
+
+        Returns
+        -------
+        ndarray
+            2-D array where each row is the output vector computed from the same row of in_batch.
+        """
+        npts = in_batch.shape[0]
+        out_batch = np.empty((npts, len(self._outputs)), dtype=in_batch.dtype)
+        out_batch[:] = self._outputs.asarray()
+
+        plen = len(self.pathname) + 1 if self.pathname else 0
+        batches = []
+        for io, batch in (('input', in_batch), ('output', out_batch)):
+            abs2meta = self._var_abs2meta[io]
+            vec = self._inputs if io == 'input' else self._outputs
+            batches.append(_BatchDict((name[plen:],
+                                       batch[:, slc].reshape((npts,) + abs2meta[name]['shape']))
+                                      for name, slc in vec.get_slice_dict().items()))
+
+        with self._call_user_function('vectorized_compute'):
+            self.vectorized_compute(*batches)
+
+        return out_batch
+
     def _apply_nonlinear(self):
         """
         Compute residuals. The model is assumed to be in a scaled state.
@@ -509,6 +557,27 @@ class ExplicitComponent(Component):
         """
         pass
 
+    def vectorized_compute(self, inputs, outputs):
+        """
+        Compute outputs for a batch of input points. The model is assumed to be unscaled.
+
+        Overriding this method is optional.  If it is overridden, finite difference and
+        complex step approximations of this component's partials evaluate all of their perturbed
+        points with a single call to this method instead of calling compute once per point.
+        It must give the same results as compute for every point in the batch and, if complex
+        step is used, it must be complex safe.
+
+        Parameters
+        ----------
+        inputs : dict of ndarray
+            Unscaled, dimensional input values keyed by variable name.  Each value has shape
+            (npoints,) + the shape of the variable.
+        outputs : dict of ndarray
+            Unscaled, dimensional output values keyed by variable name, to be set in place.  Each
+            value has shape (npoints,) + the shape of the variable.
+        """
+        pass
+
     def compute_partials(self, inputs, partials, discrete_inputs=None):
         """
         Compute sub-jacobian parts. The model is assumed to be in an unscaled state.
@@ -558,3 +627,24 @@ class ExplicitComponent(Component):
             True if this is an explicit component.
         """
         return True
+
+
+class _BatchDict(dict):
+    """
+    Dict of views into a 2-D batch array, keyed by variable name.
+
+    Setting an entry sets the values of the view in place.
+    """
+
+    def __setitem__(self, name, val):
+        """
+        Set the values of the named view.
+
+        Parameters
+        ----------
+        name : str
+            Name of the variable.
+        val : ndarray or float
+            Values for every point in the batch.
+        """
+        self[name][...] = val
@@ -199,6 +199,12 @@ class Group(System):
         within this group, keyed by active response.  These determine if contributions
         from all ranks will be added together to get the correct input values when derivatives
         in the larger model are being solved using reverse mode.
+    _fused_exec_chains : dict or None
+        Chains of consecutive ExecComp subsystems that are evaluated together, keyed by the name
+        of their first member.  Only used if the 'fuse_exec_comps' option is True.
+    _jax_group_func : _JaxGroupFunc, bool or None
+        The jitted function that computes the outputs of this group if the 'jax_compile' option
+        is True, None if it hasn't been created yet, or False if this group can't be compiled.
     """
 
     def __init__(self, **kwargs):
@@ -228,6 +234,8 @@ class Group(System):
         self._post_components = None
         self._iterated_components = None
         self._fd_rev_xfer_correction_dist = {}
+        self._fused_exec_chains = None
+        self._jax_group_func = None
 
         # TODO: we cannot set the solvers with property setters at the moment
         # because our lint check thinks that we are defining new attributes
@@ -241,6 +249,16 @@ class Group(System):
                              desc='If True the order of subsystems is determined automatically '
                              'based on the dependency graph.  It will not break or reorder '
                              'cycles.')
+        self.options.declare('fuse_exec_comps', types=bool, default=False,
+                             desc='If True, runs of consecutive ExecComp subsystems are evaluated '
+                             'as a single block of compiled expressions during nonlinear '
+                             'solves. The ExecComps and their variables remain in the model.')
+        self.options.declare('jax_compile', types=bool, default=False,
+                             desc='If True, the feed-forward subtree of this group is traced into '
+                             'a single jitted jax function that computes all of its outputs. '
+                             'Every component in the subtree must be an ExplicitFuncComp using '
+                             'jax or an IndepVarComp. Unless this group is the model, its '
+                             'derivatives are also computed from that function using jax.')
 
     def setup(self):
         """
@@ -552,6 +570,7 @@ class Group(System):
         super()._setup_procs(pathname, comm, prob_meta)
 
         nproc = comm.size
+        self._fused_exec_chains = None
 
         if self._num_par_fd > 1:
             info = self._coloring_info
@@ -1613,6 +1632,7 @@ class Group(System):
             self._group_inputs[n] = lst.copy()  # must copy the list manually
 
         self._has_distrib_vars = False
+        self._setup_jax_compile()
         self._has_fd_group = self._owns_approx_jac
         abs_in2prom_info = self._problem_meta['abs_in2prom_info']
 
@@ -3437,8 +3457,12 @@ class Group(System):
         name = self.pathname if self.pathname else 'root'
 
         with Recording(name + '._solve_nonlinear', self.iter_count, self):
-            with self._relevance.active(self._nonlinear_solver.use_relevance()):
-                self._nonlinear_solver._solve_with_cache_check()
+            jax_func = self._get_jax_group_func()
+            if jax_func is not None and not self._outputs._under_complex_step:
+                jax_func._solve_nonlinear(self)
+            else:
+                with self._relevance.active(self._nonlinear_solver.use_relevance()):
+                    self._nonlinear_solver._solve_with_cache_check()
 
         # Iteration counter is incremented in the Recording context manager at exit.
 
@@ -3682,6 +3706,10 @@ class Group(System):
             with relevance.active(self._linear_solver.use_relevance()):
                 subs = list(relevance.filter(self._subsystems_myproc))
 
+                # function components that share a function compute their jax partials together
+                from openmdao.components.func_comp_common import _jax_linearize_batched
+                _jax_linearize_batched(subs)
+
                 # Only linearize subsystems if we aren't approximating the derivs at this level.
                 for subsys in subs:
                     do_ln = sub_do_ln and (subsys._linear_solver is not None and
@@ -4715,6 +4743,76 @@ class Group(System):
         else:
             yield from self._subsystems_allprocs
 
+    def _get_fused_exec_chains(self):
+        """
+        Return the chains of ExecComp subsystems that are evaluated together.
+
+        The chains are found the first time they are needed after setup.
+
+        Returns
+        -------
+        dict
+            Fused ExecComp chains keyed by the name of their first member.
+        """
+        if self._fused_exec_chains is None:
+            if self.options['fuse_exec_comps'] and self.comm.size == 1:
+                from openmdao.components.exec_comp import _find_fused_exec_chains
+                self._fused_exec_chains = _find_fused_exec_chains(self)
+            else:
+                self._fused_exec_chains = {}
+
+        return self._fused_exec_chains
+
+    def _setup_jax_compile(self):
+        """
+        Check if this group can be compiled with jax and if so, use jax for its derivatives.
+
+        If the group can't be compiled, a warning is issued and it runs normally.
+        """
+        from openmdao.components.explicit_func_comp import _jax_compile_problem, \
+            _JaxGroupJacobian
+
+        self._jax_group_func = None
+
+        if 'jax' in self._approx_schemes:
+            # undo the approximation added during a previous setup
+            self._has_approx = self._owns_approx_jac = False
+            self._approx_schemes = {}
+
+        if not self.options['jax_compile']:
+            return
+
+        problem = _jax_compile_problem(self)
+        if problem is not None:
+            issue_warning(f"Option 'jax_compile' is ignored because {problem}.",
+                          prefix=self.msginfo, category=UnusedOptionWarning)
+            self._jax_group_func = False
+        elif self.pathname and not self._has_approx:
+            # the group behaves like an ExplicitComponent whose jacobian comes from jax
+            self._has_approx = self._owns_approx_jac = True
+            self._approx_schemes = {'jax': _JaxGroupJacobian()}
+            self._owns_approx_jac_meta = {}
+
+    def _get_jax_group_func(self):
+        """
+        Return the jitted function that computes the outputs of this group.
+
+        The function is created the first time it's needed after setup.
+
+        Returns
+        -------
+        _JaxGroupFunc or None
+            The function, or None if the 'jax_compile' option isn't active.
+        """
+        if self._jax_group_func is None:
+            if self.options['jax_compile']:
+                from openmdao.components.explicit_func_comp import _JaxGroupFunc
+                self._jax_group_func = _JaxGroupFunc(self)
+            else:
+                self._jax_group_func = False
+
+        return self._jax_group_func or None
+
     def _all_subsystem_iter(self):
         """
         Iterate over all subsystems, local and nonlocal.
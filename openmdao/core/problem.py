@@ -54,6 +54,7 @@ from openmdao.utils.general_utils import pad_name, LocalRangeIterable, \
 from openmdao.utils.om_warnings import issue_warning, DerivativesWarning, warn_deprecation, \
     OMInvalidCheckDerivativesOptionsWarning
 import openmdao.utils.coloring as coloring_mod
+from openmdao.utils.coloring_cache import ColoringCache
 from openmdao.visualization.tables.table_builder import generate_table
 
 try:
@@ -291,6 +292,17 @@ class Problem(object):
         self.options.declare('coloring_dir', types=str,
                              default=os.path.join(os.getcwd(), 'coloring_files'),
                              desc='Directory containing coloring files (if any) for this Problem.')
+        self.options.declare('coloring_cache', types=bool, default=False,
+                             desc="If True, dynamically computed total and partial colorings are "
+                             "stored in a cache directory, keyed by a hash of the model "
+                             "structure, and reused by later runs of the same model. The cache "
+                             "is not used when running under MPI with more than one process.")
+        self.options.declare('coloring_cache_dir', types=str, allow_none=True, default=None,
+                             desc="Directory of the coloring cache. If None, the 'cache' "
+                             "subdirectory of 'coloring_dir' is used.")
+        self.options.declare('coloring_cache_size', types=int, default=100, lower=1,
+                             desc="Maximum number of colorings kept in the coloring cache. The "
+                             "least recently used colorings are removed first.")
         self.options.declare('group_by_pre_opt_post', types=bool,
                              default=False,
                              desc="If True, group subsystems of the top level model into "
@@ -957,6 +969,7 @@ class Problem(object):
             'pathname': None,  # the pathname of this Problem in the current tree of Problems
             'comm': comm,
             'coloring_dir': self.options['coloring_dir'],  # directory for coloring files
+            'coloring_cache': self._get_coloring_cache(comm),  # ColoringCache or None
             'recording_iter': _RecIteration(comm.rank),  # manager of recorder iterations
             'local_vector_class': local_vector_class,
             'distributed_vector_class': distributed_vector_class,
@@ -1054,6 +1067,9 @@ class Problem(object):
 
         self._metadata['mode'] = mode
 
+        # the model and solver recorders are started during the model's final setup
+        driver._check_recorders(self)
+
         if self._metadata['setup_status'] < _SetupStatus.POST_FINAL_SETUP:
             self.model._final_setup()
 
@@ -2468,6 +2484,46 @@ class Problem(object):
 
         self.model._set_complex_step_mode(active)
 
+    def _get_coloring_cache(self, comm):
+        """
+        Return a new coloring cache based on the current options, or None if it's inactive.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm>
+            The global communicator.
+
+        Returns
+        -------
+        ColoringCache or None
+            The coloring cache.
+        """
+        if not self.options['coloring_cache'] or comm.size > 1:
+            return None
+
+        cache_dir = self.options['coloring_cache_dir']
+        if cache_dir is None:
+            cache_dir = os.path.join(self.options['coloring_dir'], 'cache')
+
+        return ColoringCache(cache_dir, self.options['coloring_cache_size'])
+
+    def get_coloring_cache(self):
+        """
+        Return the coloring cache used by this Problem.
+
+        The cache keeps count of its hits, misses and evictions, which can be displayed by
+        calling its report method.
+
+        Returns
+        -------
+        ColoringCache or None
+            The coloring cache, or None if the 'coloring_cache' option is False, setup hasn't
+            been called or the Problem is running under MPI.
+        """
+        if self._metadata is None:
+            return None
+        return self._metadata['coloring_cache']
+
     def get_reports_dir(self, force=False):
         """
         Get the path to the directory where the report files should go.
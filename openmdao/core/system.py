@@ -32,6 +32,7 @@ from openmdao.utils.name_maps import name2abs_name, name2abs_names
 from openmdao.utils.coloring import _compute_coloring, Coloring, \
     _STD_COLORING_FNAME, _DEF_COMP_SPARSITY_ARGS, _ColSparsityJac
 import openmdao.utils.coloring as coloring_mod
+from openmdao.utils.coloring_cache import partial_coloring_key
 from openmdao.utils.indexer import indexer
 from openmdao.utils.om_warnings import issue_warning, \
     DerivativesWarning, PromotionWarning, UnusedOptionWarning, UnitsWarning, warn_deprecation
@@ -411,6 +412,13 @@ class System(object):
         self.options.declare('assembled_jac_type', values=['csc', 'dense'], default='csc',
                              desc='Linear solver(s) in this group or implicit component, '
                                   'if using an assembled jacobian, will use this type.')
+        self.options.declare('num_fd_procs', types=int, default=1, lower=1,
+                             desc='Number of local worker processes used to evaluate finite '
+                                  'difference points when approximating the partials of this '
+                                  'system. The workers are forked from the current process for '
+                                  'each approximation, so the system must be safe to run '
+                                  'concurrently in separate processes. Only used when not '
+                                  'running under MPI.')
 
         # Case recording options
         self.recording_options = OptionsDictionary(parent_name=type(self).__name__)
@@ -1329,12 +1337,13 @@ class System(object):
         """
         if method == 'exact':
             return None
+        if method in self._approx_schemes:
+            return self._approx_schemes[method]
         if method not in _supported_methods:
             msg = '{}: Method "{}" is not supported, method must be one of {}'
             raise ValueError(msg.format(self.msginfo, method,
                                         [m for m in _supported_methods if m != 'exact']))
-        if method not in self._approx_schemes:
-            self._approx_schemes[method] = _supported_methods[method]()
+        self._approx_schemes[method] = _supported_methods[method]()
         return self._approx_schemes[method]
 
     def get_source(self, name):
@@ -1465,7 +1474,8 @@ class System(object):
                          perturb_size=_DEFAULT_COLORING_META['perturb_size'],
                          min_improve_pct=_DEFAULT_COLORING_META['min_improve_pct'],
                          show_summary=_DEFAULT_COLORING_META['show_summary'],
-                         show_sparsity=_DEFAULT_COLORING_META['show_sparsity']):
+                         show_sparsity=_DEFAULT_COLORING_META['show_sparsity'],
+                         color_order='ID'):
         """
         Set options for deriv coloring of a set of wrt vars matching the given pattern(s).
 
@@ -1501,10 +1511,14 @@ class System(object):
             If True, display summary information after generating coloring.
         show_sparsity : bool
             If True, plot sparsity with coloring info after generating coloring.
+        color_order : str
+            Column ordering used by the greedy coloring.  'ID' (incidence degree) is the
+            default.  'smallest_last' and 'DSATUR' sometimes find colorings with fewer colors.
         """
         if method not in ('fd', 'cs', 'jax'):
             raise RuntimeError(
                 "{}: method must be one of ['fd', 'cs', 'jax'].".format(self.msginfo))
+        coloring_mod._check_coloring_order(color_order, self.msginfo)
 
         self._has_approx = True
 
@@ -1537,6 +1551,7 @@ class System(object):
         options.min_improve_pct = min_improve_pct
         options.show_summary = show_summary
         options.show_sparsity = show_sparsity
+        options.color_order = color_order
         if form is not None:
             options.form = form
         if step is not None:
@@ -1587,6 +1602,54 @@ class System(object):
 
         return True
 
+    def _get_coloring_cache_key(self):
+        """
+        Return the key of this system's partial coloring in the coloring cache.
+
+        Returns
+        -------
+        str or None
+            The cache key, or None if the coloring can't be cached.
+        """
+        return partial_coloring_key(self)
+
+    def _get_cached_coloring(self):
+        """
+        Return this system's partial coloring from the coloring cache if there is a valid one.
+
+        If a coloring is found it is set up as though it had just been computed.
+
+        Returns
+        -------
+        Coloring or None
+            The cached coloring, or None if the cache is inactive or has no valid coloring.
+        str or None
+            The cache key, or None if the cache is inactive or the coloring can't be cached.
+        """
+        cache = self._problem_meta['coloring_cache']
+        if cache is None:
+            return None, None
+
+        key = self._get_coloring_cache_key()
+        if key is None:
+            return None, None
+
+        coloring = cache.get(key, lambda c: c._check_config_partial(self))
+        if coloring is not None:
+            print(f"{self.msginfo}: loading coloring from cache file {cache._entry_path(key)}")
+            info = self._coloring_info
+            info.update(coloring._meta)
+            info._update_wrt_matches(self)
+            info.coloring = coloring
+            info.display()
+
+            self._save_coloring(coloring)
+
+            if not info.per_instance:
+                coloring_mod._CLASS_COLORINGS[self.get_coloring_fname()] = coloring
+
+        return coloring, key
+
     def _compute_coloring(self, recurse=False, **overrides):
         """
         Compute a coloring of the partial jacobian.
@@ -1685,6 +1748,12 @@ class System(object):
                     approx_scheme._reset()
             return [coloring]
 
+        coloring, cache_key = self._get_cached_coloring()
+        if coloring is not None:
+            if not use_jax:
+                approx_scheme._reset()
+            return [coloring]
+
         save_first_call = self._first_call_to_linearize
         self._first_call_to_linearize = False
         sparsity_start_time = time.perf_counter()
@@ -1764,7 +1833,7 @@ class System(object):
 
         sparsity_time = time.perf_counter() - sparsity_start_time
 
-        coloring = _compute_coloring(sparsity, direction)
+        coloring = _compute_coloring(sparsity, direction, info.color_order)
 
         # restore original inputs/outputs
         self._inputs.set_val(starting_inputs)
@@ -1774,6 +1843,9 @@ class System(object):
         if not self._finalize_coloring(coloring, info, sp_info, sparsity_time):
             return [None]
 
+        if cache_key is not None:
+            self._problem_meta['coloring_cache'].put(cache_key, coloring)
+
         self._first_call_to_linearize = save_first_call
 
         if not use_jax:
@@ -2931,6 +3003,17 @@ class System(object):
         """
         return ()
 
+    def _get_fused_exec_chains(self):
+        """
+        Do nothing.
+
+        Returns
+        -------
+        dict
+            An empty dict.
+        """
+        return {}
+
     def _create_indexer(self, indices, typename, vname, flat_src=False):
         """
         Return an Indexer instance and it's size if possible.
@@ -4767,6 +4850,10 @@ class System(object):
         # shut down all recorders
         self._rec_mgr.shutdown()
 
+        # shut down any worker processes used to approximate derivatives
+        for scheme in self._approx_schemes.values():
+            scheme._shutdown_process_pool()
+
         # do any required cleanup on solvers
         if self._nonlinear_solver:
             self._nonlinear_solver.cleanup()
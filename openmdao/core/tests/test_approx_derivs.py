@@ -1,6 +1,8 @@
 """ Testing for group finite differencing."""
+import multiprocessing
 import time
 import unittest
+from unittest import mock
 
 from packaging.version import Version
 
@@ -10,6 +12,7 @@ from scipy import __version__ as scipy_version
 ScipyVersion = Version(scipy_version)
 
 import openmdao.api as om
+from openmdao.approximation_schemes.approximation_scheme import ApproximationScheme
 from openmdao.test_suite.components.impl_comp_array import TestImplCompArray, TestImplCompArrayDense
 from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, \
@@ -20,7 +23,7 @@ from openmdao.test_suite.components.unit_conv import SrcComp, TgtCompC, TgtCompF
 from openmdao.test_suite.groups.parallel_groups import FanInSubbedIDVC
 from openmdao.test_suite.parametric_suite import parametric_suite
 from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials, \
-    assert_check_totals, assert_warnings
+    assert_check_totals, assert_warning, assert_warnings
 from openmdao.utils.general_utils import set_pyoptsparse_opt
 from openmdao.utils.mpi import MPI
 from openmdao.utils.testing_utils import use_tempdirs
@@ -2495,6 +2498,294 @@ class TestFDRelative(unittest.TestCase):
         self.assertTrue(np.abs(totals['comp.y', 'comp.x_element']['J_fd'][2, 2]) < 1e-9)
 
 
+class _FDPoolComp(om.ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('coloring', types=bool, default=False)
+        self.options.declare('fd_kwargs', types=dict, default={})
+        self.options.declare('method', default='fd')
+
+    def setup(self):
+        self.add_input('x', np.arange(1., 7.))
+        self.add_input('z', 2.0)
+        self.add_output('y', np.ones(6))
+        self.add_output('w', 1.0)
+
+        method = self.options['method']
+        self.declare_partials('*', '*', method=method, **self.options['fd_kwargs'])
+        if self.options['coloring']:
+            self.declare_coloring(wrt='*', method=method, show_summary=False)
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = inputs['x'] ** 2 * inputs['z']
+        outputs['w'] = np.sum(inputs['x']) * inputs['z'] ** 3
+
+
+class _FDPoolDiscreteComp(om.ExplicitComponent):
+
+    def setup(self):
+        self.add_input('x', np.arange(1., 5.))
+        self.add_discrete_input('n', 1)
+        self.add_output('y', np.ones(4))
+
+        self.declare_partials('y', 'x', method='fd')
+
+    def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
+        outputs['y'] = discrete_inputs['n'] * inputs['x'] ** 2
+
+
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                     "a process pool for FD requires the 'fork' start method")
+@unittest.skipIf(MPI, "a process pool for FD is not used under MPI")
+class TestFDProcessPool(unittest.TestCase):
+
+    def _compute_partials(self, num_fd_procs, approx_group=False, **kwargs):
+        prob = om.Problem()
+        model = prob.model
+        if approx_group:
+            sub = model.add_subsystem('sub', om.Group(num_fd_procs=num_fd_procs),
+                                      promotes=['*'])
+            sub.add_subsystem('comp', _FDPoolComp(**kwargs), promotes=['*'])
+            sub.add_subsystem('sq', om.ExecComp('v = y ** 2', y=np.ones(6), v=np.ones(6)),
+                              promotes=['*'])
+            sub.approx_totals(method='fd')
+        else:
+            model.add_subsystem('comp', _FDPoolComp(num_fd_procs=num_fd_procs, **kwargs),
+                                promotes=['*'])
+
+        prob.setup()
+        prob.run_model()
+
+        with mock.patch.object(ApproximationScheme, '_run_points_in_pool', autospec=True,
+                               side_effect=ApproximationScheme._run_points_in_pool) as run_in_pool:
+            # run twice to make sure new workers are used at a new point
+            J = prob.compute_totals(of=['y', 'w'], wrt=['x', 'z'])
+            prob.set_val('x', np.arange(2., 8.))
+            prob.run_model()
+            J = prob.compute_totals(of=['y', 'w'], wrt=['x', 'z'])
+
+        self.assertEqual(run_in_pool.called, num_fd_procs > 1)
+
+        # the workers are shut down after each approximation
+        system = model.sub if approx_group else model.comp
+        self.assertIsNone(system._approx_schemes['fd']._process_pool)
+
+        return J
+
+    def _check(self, **kwargs):
+        expected = self._compute_partials(1, **kwargs)
+        J = self._compute_partials(3, **kwargs)
+
+        for key, val in expected.items():
+            assert_near_equal(J[key], val, 1e-12)
+
+        x = np.arange(2., 8.)
+        assert_near_equal(J['y', 'x'], np.diag(4. * x), 1e-5)
+        assert_near_equal(J['w', 'z'], [[12. * np.sum(x)]], 1e-5)
+
+    def test_uncolored(self):
+        self._check()
+
+    def test_colored(self):
+        self._check(coloring=True)
+
+    def test_central_rel_element(self):
+        self._check(fd_kwargs={'form': 'central', 'step_calc': 'rel_element'})
+
+    def test_approx_group(self):
+        self._check(approx_group=True)
+
+    def _discrete_partials(self, num_fd_procs):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', _FDPoolDiscreteComp(num_fd_procs=num_fd_procs),
+                                 promotes=['*'])
+        prob.setup()
+        prob.run_model()
+        prob.compute_totals(of=['y'], wrt=['x'])
+
+        # the workers must see values that changed since the last approximation
+        prob.set_val('n', 10)
+        prob.run_model()
+        return prob.compute_totals(of=['y'], wrt=['x'])
+
+    def test_discrete(self):
+        expected = self._discrete_partials(1)
+        J = self._discrete_partials(2)
+
+        assert_near_equal(J['y', 'x'], expected['y', 'x'], 1e-12)
+        assert_near_equal(J['y', 'x'], np.diag([20., 40., 60., 80.]), 1e-5)
+
+    def test_no_fork(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', _FDPoolComp(num_fd_procs=3), promotes=['*'])
+        prob.setup()
+        prob.run_model()
+
+        msg = ("'comp' <class _FDPoolComp>: Option 'num_fd_procs' is ignored because a process "
+               "pool requires the 'fork' start method and can't be used under MPI.")
+
+        with mock.patch.object(multiprocessing, 'get_all_start_methods', return_value=['spawn']):
+            with assert_warning(UserWarning, msg):
+                J = prob.compute_totals(of=['y'], wrt=['x'])
+
+        # the user's option is left alone
+        self.assertEqual(comp.options['num_fd_procs'], 3)
+        assert_near_equal(J['y', 'x'], np.diag(4. * np.arange(1., 7.)), 1e-5)
+
+
+class _FDVectorizedComp(_FDPoolComp):
+
+    def initialize(self):
+        super().initialize()
+        self.ncomputes = 0
+
+    def compute(self, inputs, outputs):
+        self.ncomputes += 1
+        super().compute(inputs, outputs)
+
+
+class _FDVectorizedComp2(_FDVectorizedComp):
+
+    def vectorized_compute(self, inputs, outputs):
+        self.ncomputes += 1
+        x = inputs['x']
+        z = inputs['z']
+        outputs['y'] = x ** 2 * z
+        outputs['w'] = np.sum(x, axis=1, keepdims=True) * z ** 3
+
+
+class TestFDVectorized(unittest.TestCase):
+
+    def _compute_partials(self, comp):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', comp, promotes=['*'])
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+
+        # the first call computes the coloring, if any
+        prob.compute_totals(of=['y', 'w'], wrt=['x', 'z'])
+
+        comp.ncomputes = 0
+        J = prob.compute_totals(of=['y', 'w'], wrt=['x', 'z'])
+        return J, comp.ncomputes
+
+    def _check(self, tol=1e-5, **kwargs):
+        expected, nexpected = self._compute_partials(_FDVectorizedComp(**kwargs))
+        J, n = self._compute_partials(_FDVectorizedComp2(**kwargs))
+
+        for key, val in expected.items():
+            assert_near_equal(J[key], val, 1e-12)
+
+        x = np.arange(1., 7.)
+        assert_near_equal(J['y', 'x'], np.diag(4. * x), tol)
+        assert_near_equal(J['w', 'z'], [[12. * np.sum(x)]], tol)
+
+        return n, nexpected
+
+    def test_uncolored(self):
+        self.assertEqual(self._check(), (1, 7))
+
+    def test_colored(self):
+        self.assertEqual(self._check(coloring=True), (1, 7))
+
+    def test_central(self):
+        self.assertEqual(self._check(fd_kwargs={'form': 'central'}), (1, 14))
+
+    def test_rel_element_fallback(self):
+        # steps that depend on the perturbed element are evaluated one point at a time
+        self.assertEqual(self._check(fd_kwargs={'step_calc': 'rel_element'}), (7, 7))
+
+    def test_cs_uncolored(self):
+        self.assertEqual(self._check(tol=1e-15, method='cs'), (1, 7))
+
+    def test_cs_colored(self):
+        self.assertEqual(self._check(tol=1e-15, method='cs', coloring=True), (1, 7))
+
+    def test_cs_check_partials(self):
+        # the directional complex step of check_partials is also vectorized
+        ncomputes = []
+        for comp_class in (_FDVectorizedComp, _FDVectorizedComp2):
+            prob = om.Problem()
+            comp = prob.model.add_subsystem('comp', comp_class())
+            comp.set_check_partial_options(wrt='*', method='cs', directional=True)
+            prob.setup(force_alloc_complex=True)
+            prob.run_model()
+
+            comp.ncomputes = 0
+            data = prob.check_partials(out_stream=None)
+            assert_check_partials(data, atol=1e-3, rtol=1e-5)
+            ncomputes.append(comp.ncomputes)
+
+        self.assertLess(ncomputes[1], ncomputes[0])
+
+    def test_exec_comp(self):
+        for vectorized in (False, True):
+            prob = om.Problem()
+            comp = prob.model.add_subsystem('comp', om.ExecComp(['y = x ** 2 * z',
+                                                                 'w = x[0] * x[5] * z ** 3'],
+                                                                x=np.arange(1., 7.),
+                                                                y=np.ones(6),
+                                                                vectorized_approx=vectorized))
+            comp.declare_partials('*', '*', method='fd')
+            prob.setup()
+            prob.run_model()
+            J = prob.compute_totals(of=['comp.y', 'comp.w'], wrt=['comp.x', 'comp.z'])
+            if vectorized:
+                for key, val in expected.items():
+                    assert_near_equal(J[key], val, 1e-12)
+            else:
+                expected = J
+
+        x = np.arange(1., 7.)
+        assert_near_equal(J['comp.y', 'comp.x'], np.diag(2. * x), 1e-5)
+        assert_near_equal(J['comp.w', 'comp.x'], [[6., 0., 0., 0., 0., 1.]], 1e-5)
+
+    def test_exec_comp_cs(self):
+        x = np.arange(1., 7.)
+        for kwargs in ({}, {'has_diag_partials': True}, {'coloring': True}):
+            for vectorized in (False, True):
+                prob = om.Problem()
+                coloring = kwargs.pop('coloring', False)
+                comp = prob.model.add_subsystem('comp', om.ExecComp(['y = x ** 2 * z',
+                                                                     'w = x * z ** 3'],
+                                                                    x=x, z=2.0,
+                                                                    y=np.ones(6),
+                                                                    w=np.ones(6),
+                                                                    vectorized_approx=vectorized,
+                                                                    **kwargs))
+                if coloring:
+                    comp.declare_coloring(wrt='*', method='cs', show_summary=False)
+                    kwargs['coloring'] = True
+                prob.setup()
+                prob.run_model()
+                J = prob.compute_totals(of=['comp.y', 'comp.w'], wrt=['comp.x', 'comp.z'])
+                if vectorized:
+                    for key, val in expected.items():
+                        assert_near_equal(J[key], val, 1e-15)
+                else:
+                    expected = J
+
+            assert_near_equal(J['comp.y', 'comp.x'], np.diag(4. * x), 1e-15)
+            assert_near_equal(J['comp.w', 'comp.z'], 12. * x[:, np.newaxis], 1e-15)
+
+    def test_exec_comp_bad_expr(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', om.ExecComp('y = sum(x) * x', x=np.ones(3),
+                                                            y=np.ones(3),
+                                                            vectorized_approx=True))
+        comp.declare_partials('*', '*', method='fd')
+        prob.setup()
+        prob.run_model()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_totals(of=['comp.y'], wrt=['comp.x'])
+
+        self.assertEqual(str(cm.exception),
+                         "'comp' <class ExecComp>: The vectorized evaluation of output 'y' "
+                         "doesn't match its normal evaluation. Set the 'vectorized_approx' "
+                         "option to False.")
+
+
 class ParallelFDParametricTestCase(unittest.TestCase):
 
     @parametric_suite(
@@ -23,6 +23,7 @@ from openmdao.utils.mpi import MPI, multi_proc_exception_check
 from openmdao.utils.testing_utils import use_tempdirs, set_env_vars
 from openmdao.test_suite.tot_jac_builder import TotJacBuilder
 from openmdao.utils.general_utils import run_driver
+from openmdao.utils.assert_utils import assert_warning
 
 import openmdao.test_suite
 
@@ -167,9 +168,19 @@ def run_opt(driver_class, mode, assemble_type=None, color_info=None, derivs=True
     if 'min_improve_pct' in options:
         del options['min_improve_pct']
 
+    sparsity_method = options.get('sparsity_method', 'numeric')
+    if 'sparsity_method' in options:
+        del options['sparsity_method']
+
+    coloring_order = options.get('coloring_order', 'ID')
+    if 'coloring_order' in options:
+        del options['coloring_order']
+
     if 'dynamic_total_coloring' in options:
         if options['dynamic_total_coloring']:
-            p.driver.declare_coloring(tol=1e-15, min_improve_pct=min_improve_pct)
+            p.driver.declare_coloring(tol=1e-15, min_improve_pct=min_improve_pct,
+                                      sparsity_method=sparsity_method,
+                                      color_order=coloring_order)
         del options['dynamic_total_coloring']
 
     p.driver.options.update(options)
@@ -1127,6 +1138,104 @@ class SimulColoringRevScipyTestCase(unittest.TestCase):
                          "Derivative support has been turned off but compute_totals was called.")
 
 
+class BadSolveLinearComp(om.ImplicitComponent):
+    """
+    Computes y = x and z = 1, but its solve_linear doesn't agree with its declared partials.
+    """
+
+    def setup(self):
+        self.add_input('x', np.ones(SIZE))
+        self.add_output('y', np.ones(SIZE))
+        self.add_output('z', np.ones(SIZE))
+
+        ar = np.arange(SIZE)
+        self.declare_partials('y', 'y', rows=ar, cols=ar, val=1.0)
+        self.declare_partials('y', 'x', rows=ar, cols=ar, val=-1.0)
+        self.declare_partials('z', 'z', rows=ar, cols=ar, val=1.0)
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['y'] = outputs['y'] - inputs['x']
+        residuals['z'] = outputs['z'] - 1.0
+
+    def solve_nonlinear(self, inputs, outputs):
+        outputs['y'] = inputs['x']
+        outputs['z'] = 1.0
+
+    def solve_linear(self, d_outputs, d_residuals, mode):
+        if mode == 'fwd':
+            d_outputs['y'] = d_residuals['y']
+            d_outputs['z'] = d_residuals['z'] + d_residuals['y']
+        else:
+            d_residuals['y'] = d_outputs['y'] + d_outputs['z']
+            d_residuals['z'] = d_outputs['z']
+
+
+@use_tempdirs
+class StructuralSparsityTestCase(unittest.TestCase):
+
+    def setUp(self):
+        om.clear_reports()
+
+    def test_structural_matches_numeric(self):
+        for mode in ('fwd', 'rev', 'auto'):
+            for partial_coloring in (False, True):
+                with self.subTest(mode=mode, partial_coloring=partial_coloring):
+                    p = run_opt(om.ScipyOptimizeDriver, mode, optimizer='SLSQP', disp=False,
+                                partial_coloring=partial_coloring)
+                    numeric = compute_total_coloring(p, mode=mode)
+                    structural = compute_total_coloring(p, mode=mode,
+                                                        sparsity_method='structural')
+
+                    self.assertEqual(structural._meta['sparsity_method'], 'structural')
+                    np.testing.assert_array_equal(structural.get_dense_sparsity(),
+                                                  numeric.get_dense_sparsity())
+                    self.assertEqual(structural.total_solves(), numeric.total_solves())
+
+    def test_dynamic_total_coloring_structural(self):
+        p_color = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                          dynamic_total_coloring=True, sparsity_method='structural')
+
+        assert_almost_equal(p_color['circle.area'], np.pi, decimal=7)
+        self.assertEqual(p_color.driver._coloring_info.coloring._meta['sparsity_method'],
+                         'structural')
+
+        p_color.model._solve_count = 0
+        p_color.driver._compute_totals()
+        self.assertEqual(p_color.model._solve_count, 5)
+
+    def test_structural_fallback(self):
+        p = om.Problem()
+        p.model.add_subsystem('comp', BadSolveLinearComp())
+        p.model.add_subsystem('obj', om.ExecComp('z = sum(y)', y=np.ones(SIZE)))
+        p.model.connect('comp.y', 'obj.y')
+        p.model.add_design_var('comp.x')
+        p.model.add_constraint('comp.y', lower=0.)
+        p.model.add_constraint('comp.z', lower=0.)
+        p.model.add_objective('obj.z')
+        p.setup(mode='fwd')
+        p.run_model()
+
+        msg = ("<model> <class Group>: Structural total sparsity does not contain all nonzeros "
+               "found in a random check of the total jacobian, so numeric total sparsity will be "
+               "used instead.  Check that the declared partials of all components are correct.")
+
+        with assert_warning(om.DerivativesWarning, msg):
+            coloring = compute_total_coloring(p, sparsity_method='structural')
+
+        self.assertNotIn('sparsity_method', coloring._meta)
+        # rows are ordered obj.z, comp.y, comp.z
+        np.testing.assert_array_equal(coloring.get_dense_sparsity()[SIZE + 1:],
+                                      np.eye(SIZE, dtype=int))
+
+    def test_bad_sparsity_method(self):
+        p = om.Problem()
+        with self.assertRaises(ValueError) as cm:
+            p.driver.declare_coloring(sparsity_method='foo')
+
+        self.assertEqual(str(cm.exception), "Driver: sparsity_method must be 'numeric' or "
+                                            "'structural', but got 'foo'.")
+
+
 def _test_func_name(func, num, param):
     args = []
     for p in param.args:
@@ -1195,6 +1304,102 @@ class BidirectionalTestCase(unittest.TestCase):
         self.assertEqual(tot_colors, expected_colors)
 
 
+def _check_coloring(J, coloring):
+    """Check that the coloring recovers every nonzero of J and that colors don't overlap."""
+    rng = np.random.default_rng(7)
+    vals = rng.random(J.shape) * J
+    recovered = np.zeros(J.shape)
+    for direction, mat in (('fwd', vals), ('rev', vals.T)):
+        info = getattr(coloring, '_' + direction)
+        if info is None:
+            continue
+        col_groups, col2rows = info
+        for group in col_groups:
+            rows = [r for c in group for r in col2rows[c]]
+            if len(rows) != len(set(rows)):
+                raise AssertionError(f"Columns {group} in a {direction} color share rows.")
+            seed = np.zeros(mat.shape[1])
+            seed[group] = 1.
+            product = mat @ seed
+            for c in group:
+                if direction == 'fwd':
+                    recovered[col2rows[c], c] = product[col2rows[c]]
+                else:
+                    recovered[c, col2rows[c]] = product[col2rows[c]]
+    np.testing.assert_array_equal(recovered, vals)
+
+
+class ColoringOrderTestCase(unittest.TestCase):
+
+    def test_orders_valid(self):
+        rng = np.random.default_rng(11)
+        for i in range(20):
+            nrows, ncols = rng.integers(1, 40, 2)
+            J = rng.random((nrows, ncols)) < rng.uniform(.02, .5)
+            for order in ('ID', 'smallest_last', 'DSATUR'):
+                for mode in ('fwd', 'rev', 'auto'):
+                    with self.subTest(i=i, order=order, mode=mode):
+                        _check_coloring(J, _compute_coloring(J, mode, order))
+
+    def test_orders_banded(self):
+        # a tridiagonal matrix needs exactly 3 colors in either direction
+        n = 200
+        J = np.eye(n, dtype=bool) | np.eye(n, k=1, dtype=bool) | np.eye(n, k=-1, dtype=bool)
+        for order in ('ID', 'smallest_last', 'DSATUR'):
+            for mode in ('fwd', 'rev', 'auto'):
+                with self.subTest(order=order, mode=mode):
+                    coloring = _compute_coloring(J, mode, order)
+                    _check_coloring(J, coloring)
+                    self.assertEqual(coloring.total_solves(), 3)
+
+    def test_orders_arrowhead(self):
+        for order in ('ID', 'smallest_last', 'DSATUR'):
+            for n in [5, 50, 55]:
+                with self.subTest(order=order, n=n):
+                    builder = TotJacBuilder(n, n)
+                    builder.add_row(n-1)
+                    builder.add_col(n-1)
+                    builder.add_block_diag([(1,1)] * (n-1), 0, 0)
+                    coloring = _compute_coloring(builder.J, 'auto', order)
+                    _check_coloring(builder.J, coloring)
+                    self.assertEqual(coloring.total_solves(), 3)
+
+    def test_zero_cols(self):
+        J = np.zeros((6, 5), dtype=bool)
+        J[[0, 2, 4], [1, 1, 3]] = True
+        for order in ('ID', 'smallest_last', 'DSATUR'):
+            with self.subTest(order=order):
+                coloring = _compute_coloring(J, 'fwd', order)
+                _check_coloring(J, coloring)
+                self.assertEqual(coloring.total_solves(), 1)
+
+    def test_dynamic_total_coloring_order(self):
+        for order in ('smallest_last', 'DSATUR'):
+            with self.subTest(order=order):
+                p_color = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                                  dynamic_total_coloring=True, coloring_order=order)
+
+                assert_almost_equal(p_color['circle.area'], np.pi, decimal=7)
+
+                p_color.model._solve_count = 0
+                p_color.driver._compute_totals()
+                self.assertEqual(p_color.model._solve_count, 5)
+
+    def test_bad_order(self):
+        p = om.Problem()
+        with self.assertRaises(ValueError) as cm:
+            p.driver.declare_coloring(color_order='foo')
+
+        self.assertEqual(str(cm.exception), "Driver: color_order must be one of ['ID', "
+                                            "'smallest_last', 'DSATUR'], but got 'foo'.")
+
+        with self.assertRaises(ValueError) as cm:
+            _compute_coloring(np.eye(3, dtype=bool), 'fwd', 'foo')
+
+        self.assertEqual(str(cm.exception), "color_order must be one of ['ID', 'smallest_last', "
+                                            "'DSATUR'], but got 'foo'.")
+
+
 def _get_random_mat(rows, cols, generator=None):
     gen = generator if generator is not None else np.random.default_rng()
 
@@ -873,6 +873,78 @@ class TestDriver(unittest.TestCase):
         with assert_warnings(expected_warnings):
             prob.final_setup()
 
+    def _setup_cache_lin_sol_model(self, mode, cache_opt):
+        prob = om.Problem()
+        prob.model = model = SellarDerivatives()
+        model.nonlinear_solver = om.NonlinearBlockGS()
+        model.linear_solver = om.ScipyKrylov()
+
+        model.add_design_var('x')
+        model.add_design_var('z')
+        model.add_objective('obj')
+        model.add_constraint('con1', lower=0)
+        model.add_constraint('con2', lower=0)
+
+        prob.driver.options['cache_linear_solutions'] = cache_opt
+        prob.setup(mode=mode)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        return prob
+
+    def test_cache_linear_solutions(self):
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                prob = self._setup_cache_lin_sol_model(mode, True)
+                ln_solver = prob.model.linear_solver
+
+                J1 = prob.driver._compute_totals()
+                icount1 = ln_solver._iter_count
+                J2 = prob.driver._compute_totals()
+                icount2 = ln_solver._iter_count
+
+                for key in J1:
+                    assert_near_equal(J2[key], J1[key], 1e-9)
+
+                # Should take less iterations when starting from previous solution.
+                self.assertLess(icount2, icount1)
+
+                stats = prob.driver._total_jac.lin_sol_cache.get_stats()
+                # x and z (size 2) in fwd, obj, con1 and con2 in rev.
+                nsolves = 3
+                self.assertEqual(stats['misses'], nsolves)
+                self.assertEqual(stats['hits'], nsolves)
+                self.assertEqual(stats['size'], nsolves)
+                self.assertEqual(stats['evictions'], 0)
+                self.assertEqual(set(stats['key_hits'].values()), {1})
+
+    def test_cache_linear_solutions_bounded(self):
+        prob = self._setup_cache_lin_sol_model('rev', 2)
+
+        J1 = prob.driver._compute_totals()
+        J2 = prob.driver._compute_totals()
+
+        for key in J1:
+            assert_near_equal(J2[key], J1[key], 1e-9)
+
+        # with room for only 2 of the 3 solutions, each solve evicts the solution that the
+        # next one needs.
+        stats = prob.driver._total_jac.lin_sol_cache.get_stats()
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['hits'], 0)
+        self.assertEqual(stats['misses'], 6)
+        self.assertEqual(stats['evictions'], 4)
+
+    def test_cache_linear_solutions_option_err(self):
+        prob = om.Problem()
+
+        with self.assertRaises(ValueError) as cm:
+            prob.driver.options['cache_linear_solutions'] = 0
+
+        self.assertEqual(str(cm.exception),
+                         "Option 'cache_linear_solutions' must be a bool or an int > 0, but got 0.")
+
+
 @use_tempdirs
 class TestCheckRelevance(unittest.TestCase):
     def setup_problem(self, driver=None):
@@ -5,9 +5,8 @@ import sys
 import time
 import pprint
 from contextlib import contextmanager
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from itertools import repeat
-from copy import deepcopy
 
 import numpy as np
 
@@ -54,8 +53,8 @@ class _TotalJacInfo(object):
         If return_format is 'array', Jfinal is J.  Otherwise it's either a nested dict (if
         return_format is 'dict') or a flat dict (return_format 'flat_dict') with views into
         the array jacobian.
-    lin_sol_cache : dict
-        Dict of indices keyed to solution vectors.
+    lin_sol_cache : _LinearSolutionCache
+        Cache of linear solutions keyed by seed index or color.
     mode : str
         If 'fwd' compute deriv in forward mode, else if 'rev', reverse (adjoint) mode.
     model : <System>
@@ -87,6 +86,9 @@ class _TotalJacInfo(object):
         If True, perform a single directional derivative.
     relevance : dict
         Dict of relevance dictionaries for each var of interest.
+    _cache_all_lin_sols : bool
+        If True, cache the linear solution of every seed or color, regardless of the
+        'cache_linear_solution' setting of the individual design variables and responses.
     """
 
     def __init__(self, problem, of, wrt, return_format, approx=False,
@@ -132,7 +134,15 @@ class _TotalJacInfo(object):
         self._orig_mode = problem._orig_mode
         self.has_scaling = driver and driver._has_scaling and driver_scaling
         self.return_format = return_format
-        self.lin_sol_cache = {}
+
+        cache_opt = driver.options['cache_linear_solutions'] if driver else False
+        if isinstance(cache_opt, bool):
+            self._cache_all_lin_sols = cache_opt
+            self.lin_sol_cache = _LinearSolutionCache()
+        else:
+            self._cache_all_lin_sols = True
+            self.lin_sol_cache = _LinearSolutionCache(cache_opt)
+
         self.debug_print = debug_print
         self.par_deriv_printnames = {}
         self.get_remote = get_remote
@@ -585,7 +595,7 @@ class _TotalJacInfo(object):
                 end += meta['size']
 
             parallel_deriv_color = meta['parallel_deriv_color']
-            cache_lin_sol = meta['cache_linear_solution']
+            cache_lin_sol = meta['cache_linear_solution'] or self._cache_all_lin_sols
 
             if simul_coloring and parallel_deriv_color:
                 raise RuntimeError("Using both simul_coloring and parallel_deriv_color with "
@@ -1463,6 +1473,11 @@ class _TotalJacInfo(object):
                 if debug_print:
                     # Debug outputs scaled derivatives.
                     self._print_derivatives()
+                    if self.lin_sol_cache:
+                        stats = self.lin_sol_cache.get_stats()
+                        print(f"Linear solution cache: {stats['hits']} hits, {stats['misses']} "
+                              f"misses, {stats['evictions']} evictions, {stats['size']} entries\n",
+                              flush=True)
         finally:
             self.model._recording_iter.pop()
 
@@ -1669,12 +1684,9 @@ class _TotalJacInfo(object):
         mode : str
             Direction of derivative solution.
         """
-        lin_sol_cache = self.lin_sol_cache
-        if key in lin_sol_cache:
-            doutputs = self.output_vec[mode]
-            doutputs.set_val(lin_sol_cache[key])
-        else:
-            lin_sol_cache[key] = deepcopy(self.output_vec[mode].asarray())
+        sol = self.lin_sol_cache.get(key)
+        if sol is not None:
+            self.output_vec[mode].set_val(sol)
 
     def _save_linear_solution(self, key, mode):
         """
@@ -1687,7 +1699,7 @@ class _TotalJacInfo(object):
         mode : str
             Direction of derivative solution.
         """
-        self.lin_sol_cache[key][:] = self.output_vec[mode].asarray()
+        self.lin_sol_cache.set(key, self.output_vec[mode].asarray())
 
     def _do_driver_scaling(self, J):
         """
@@ -1894,3 +1906,139 @@ def _fix_pdc_lengths(idx_iter_dict):
                 # just convert all (start, end) tuples to ranges
                 for i, (start, end) in enumerate(range_list):
                     range_list[i] = range(start, end)
+
+
+class _LinearSolutionCache(object):
+    """
+    Least recently used cache of linear solutions keyed by seed index or color.
+
+    Parameters
+    ----------
+    max_entries : int or None
+        Maximum number of cached solutions.  If None, the cache is unbounded.
+
+    Attributes
+    ----------
+    max_entries : int or None
+        Maximum number of cached solutions.  If None, the cache is unbounded.
+    hits : defaultdict
+        Number of cache hits keyed by seed index or color.
+    misses : defaultdict
+        Number of cache misses keyed by seed index or color.
+    evictions : int
+        Number of solutions that were evicted from the cache.
+    _cache : OrderedDict
+        Cached solution arrays, in order from least to most recently used.
+    """
+
+    def __init__(self, max_entries=None):
+        """
+        Initialize attributes.
+        """
+        self.max_entries = max_entries
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+        self.evictions = 0
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        """
+        Return the number of cached solutions.
+
+        Returns
+        -------
+        int
+            Number of cached solutions.
+        """
+        return len(self._cache)
+
+    def __contains__(self, key):
+        """
+        Return True if a solution is cached for the given key.
+
+        Parameters
+        ----------
+        key : hashable object
+            Key to lookup linear solution.
+
+        Returns
+        -------
+        bool
+            True if a solution is cached for the given key.
+        """
+        return key in self._cache
+
+    def get(self, key):
+        """
+        Return the cached solution for the given key, or None, and update the statistics.
+
+        Parameters
+        ----------
+        key : hashable object
+            Key to lookup linear solution.
+
+        Returns
+        -------
+        ndarray or None
+            The cached solution or None if there isn't one.
+        """
+        try:
+            sol = self._cache[key]
+        except KeyError:
+            self.misses[key] += 1
+            return None
+
+        self._cache.move_to_end(key)
+        self.hits[key] += 1
+        return sol
+
+    def set(self, key, sol):
+        """
+        Store a copy of the given solution, evicting the least recently used one if necessary.
+
+        Parameters
+        ----------
+        key : hashable object
+            Key to lookup linear solution.
+        sol : ndarray
+            The solution array.
+        """
+        cache = self._cache
+        if key in cache and cache[key].shape == sol.shape and cache[key].dtype == sol.dtype:
+            cache[key][:] = sol
+            cache.move_to_end(key)
+            return
+
+        cache[key] = sol.copy()
+        cache.move_to_end(key)
+
+        if self.max_entries is not None:
+            while len(cache) > self.max_entries:
+                cache.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Remove all cached solutions and reset the statistics.
+        """
+        self._cache.clear()
+        self.hits.clear()
+        self.misses.clear()
+        self.evictions = 0
+
+    def get_stats(self):
+        """
+        Return a dict of cache statistics.
+
+        Returns
+        -------
+        dict
+            Total hits, misses and evictions, number of cached solutions and per key hit counts.
+        """
+        return {
+            'hits': sum(self.hits.values()),
+            'misses': sum(self.misses.values()),
+            'evictions': self.evictions,
+            'size': len(self._cache),
+            'key_hits': dict(self.hits),
+        }
@@ -25,8 +25,12 @@ except ModuleNotFoundError:
 
 from openmdao.core.constants import INF_BOUND
 from openmdao.core.driver import Driver, RecordingDebugging
-from openmdao.utils.concurrent import concurrent_eval
+from openmdao.drivers.fitness_cache import _create_fitness_cache, _save_fitness_cache
+from openmdao.recorders.recording_manager import _clear_all_recorders
+from openmdao.utils.concurrent import concurrent_eval, concurrent_eval_lb, concurrent_eval_pool, \
+    concurrent_eval_async, fork_pool
 from openmdao.utils.mpi import MPI
+from openmdao.utils.om_warnings import issue_warning
 from openmdao.core.analysis_error import AnalysisError
 
 
@@ -56,6 +60,8 @@ class DifferentialEvolutionDriver(Driver):
         Main genetic algorithm lies here.
     _nfit : int
          Number of successful function evaluations.
+    _fitness_cache : FitnessCache or None
+        Cache of the fitness of evaluated designs during the last run.
     _randomstate : int
         Seed-number which controls the random draws.
     """
@@ -90,6 +96,7 @@ class DifferentialEvolutionDriver(Driver):
         self._desvar_idx = {}
         self._ga = None
         self._nfit = 0
+        self._fitness_cache = None
 
         # random state can be set for predictability during testing
         if 'DifferentialEvolutionDriver_seed' in os.environ:
@@ -129,6 +136,36 @@ class DifferentialEvolutionDriver(Driver):
                              'if not given.')
         self.options.declare('multi_obj_exponent', default=1., lower=0.,
                              desc='Multi-objective weighting exponent.')
+        self.options.declare('fitness_cache', types=bool, default=False,
+                             desc='If True, cache the fitness of evaluated designs so that '
+                             'designs that appear again in later generations are not run again.')
+        self.options.declare('fitness_cache_size', types=int, default=10000, lower=1,
+                             desc='Maximum number of designs kept in the fitness cache.')
+        self.options.declare('fitness_cache_tol', default=0., lower=0.,
+                             desc='If greater than zero, designs are rounded to multiples of this '
+                             'value before being looked up in the fitness cache.')
+        self.options.declare('fitness_cache_file', types=str, default=None, allow_none=True,
+                             desc='If given, the fitness cache is loaded from this file before '
+                             'the run, if it exists, and saved to it afterwards, so that restarts '
+                             'can reuse it. It must be removed if the model changes.')
+        self.options.declare('load_balance', types=bool, default=False,
+                             desc="If True and 'run_parallel' is True, rank 0 hands out the points "
+                             'of each generation one at a time to the other ranks as they finish, '
+                             'instead of splitting them evenly between all ranks. Use this when '
+                             "evaluation times vary. Requires 'procs_per_model' to be 1.")
+        self.options.declare('num_procs', types=int, default=1, lower=1,
+                             desc='Number of worker processes used to evaluate the points of each '
+                             'generation when not running under MPI. The workers are forked from '
+                             "this process, so this requires the 'fork' start method. Cases run "
+                             'by the workers are not recorded.')
+        self.options.declare('asynchronous', types=bool, default=False,
+                             desc='If True, use a steady-state variant of the algorithm that '
+                             'generates a new trial point from the current population as soon as '
+                             'any evaluation finishes, instead of waiting for the whole '
+                             'generation. The same number of points is evaluated as in max_gen '
+                             "generations. Use with 'run_parallel' or 'num_procs'; parallel runs "
+                             'are not repeatable because they depend on the order in which '
+                             "evaluations finish. Requires 'procs_per_model' to be 1.")
 
     def _setup_driver(self, problem):
         """
@@ -166,6 +203,12 @@ class DifferentialEvolutionDriver(Driver):
                        f"equals={equals}, lower={lower}, upper={upper}.")
                 raise ValueError(msg)
 
+        if self.options['procs_per_model'] > 1:
+            for opt in ('load_balance', 'asynchronous'):
+                if self.options[opt]:
+                    raise RuntimeError(f"{self.msginfo}: Option '{opt}' requires "
+                                       "'procs_per_model' to be 1.")
+
         model_mpi = None
         comm = problem.comm
         if self._concurrent_pop_size > 0:
@@ -275,6 +318,45 @@ class DifferentialEvolutionDriver(Driver):
         """
         return 0
 
+    def _get_run_stats(self):
+        """
+        Return driver specific statistics of the last run to be saved in opt_result.
+
+        Returns
+        -------
+        dict
+            The statistics keyed by name.
+        """
+        if self._fitness_cache is None:
+            return {}
+        return self._fitness_cache.stats()
+
+    def _get_process_pool(self):
+        """
+        Return a pool of worker processes that evaluate the population, if the driver uses one.
+
+        Returns
+        -------
+        ProcessPoolExecutor or None
+            The process pool, or None if the population is evaluated in this process or by MPI.
+        """
+        num_procs = self.options['num_procs']
+        if num_procs < 2:
+            return None
+
+        problem = self._problem()
+        if problem.comm.size > 1:
+            issue_warning("Option 'num_procs' is ignored when running under MPI.",
+                          prefix=self.msginfo)
+            return None
+
+        pool = fork_pool(self.objective_callback, num_procs, initializer=_clear_all_recorders,
+                         initargs=(problem,))
+        if pool is None:
+            issue_warning("Option 'num_procs' is ignored because a process pool requires the "
+                          "'fork' start method.", prefix=self.msginfo)
+        return pool
+
     def run(self):
         """
         Execute the genetic algorithm.
@@ -320,9 +402,22 @@ class DifferentialEvolutionDriver(Driver):
         if pop_size == 0:
             pop_size = 20 * count
 
-        desvar_new, obj, self._nfit = ga.execute_ga(x0, lower_bound, upper_bound,
-                                                    pop_size, max_gen,
-                                                    self._randomstate, F, Pc)
+        ga.cache = self._fitness_cache = _create_fitness_cache(self, count)
+        ga.load_balance = self.options['load_balance']
+        ga.asynchronous = self.options['asynchronous']
+        ga.pool = self._get_process_pool()
+        ga.pool_size = self.options['num_procs']
+
+        try:
+            desvar_new, obj, self._nfit = ga.execute_ga(x0, lower_bound, upper_bound,
+                                                        pop_size, max_gen,
+                                                        self._randomstate, F, Pc)
+        finally:
+            if ga.pool is not None:
+                ga.pool.shutdown()
+                ga.pool = None
+
+        _save_fitness_cache(self)
 
         # Pull optimal parameters back into framework and re-run, so that
         # framework is left in the right final state
@@ -517,10 +612,19 @@ class DifferentialEvolution(object):
 
     Attributes
     ----------
+    asynchronous : bool
+        If True, run the steady-state variant of the algorithm, which generates a new trial point
+        as soon as any evaluation finishes.
+    cache : FitnessCache or None
+        If not None, the fitness of designs found in this cache is reused instead of being
+        evaluated again.
     comm : MPI communicator or None
         The MPI communicator that will be used objective evaluation for each generation.
     lchrom : int
         Chromosome length.
+    load_balance : bool
+        If True, cases are handed out one at a time to the ranks of comm as they finish, instead
+        of being split evenly between them.
     model_mpi : None or tuple
         If the model in objfun is also parallel, then this will contain a tuple with the the
         total number of population points to evaluate concurrently, and the color of the point
@@ -529,6 +633,11 @@ class DifferentialEvolution(object):
         Population size.
     objfun : function
         Objective function callback.
+    pool : ProcessPoolExecutor or None
+        If not None, the pool of worker processes, created with fork_pool, that evaluates
+        the population instead of comm.
+    pool_size : int
+        Number of worker processes in pool.
     """
 
     def __init__(self, objfun, comm=None, model_mpi=None):
@@ -547,6 +656,11 @@ class DifferentialEvolution(object):
         self.lchrom = 0
         self.npop = 0
         self.model_mpi = model_mpi
+        self.cache = None
+        self.load_balance = False
+        self.asynchronous = False
+        self.pool = None
+        self.pool_size = 1
 
     def execute_ga(self, x0, vlb, vub, pop_size, max_gen, random_state, F=0.5, Pc=0.5):
         """
@@ -614,43 +728,49 @@ class DifferentialEvolution(object):
         population = np.vstack((population, x0))
         fitness = np.ones(self.npop) * np.inf  # initialize fitness to infinitely bad
 
+        if self.asynchronous:
+            return self._execute_async(population, vlb, vub, max_gen, F, Pc, rng)
+
         # Main Loop
         nfit = 0
         for generation in range(max_gen + 1):
             # Evaluate fitness of points in this generation
-            if comm is not None:  # Parallel
+            if comm is not None:
                 # Since GA is random, ranks generate different new populations, so just take one
                 # and use it on all.
                 population = comm.bcast(population, root=0)
 
-                cases = [((item, ii), None) for ii, item in enumerate(population)]
+            if self.cache is None:
+                found, todo, repeats = [], range(self.npop), {}
+            else:
+                found, todo, repeats = self.cache.lookup(population, range(self.npop))
 
-                # Pad the cases with some dummy cases to make the cases divisible amongst the procs.
-                # TODO: Add a load balancing option to this driver.
-                extra = len(cases) % comm.size
-                if extra > 0:
-                    for j in range(comm.size - extra):
-                        cases.append(cases[-1])
+            fitness[:] = np.inf
+            for ii, val, success in found:
+                if success or comm is None:
+                    fitness[ii] = val
 
-                results = concurrent_eval(self.objfun, cases, comm,
-                                          allgather=True, model_mpi=self.model_mpi)
+            if comm is not None or self.pool is not None:  # Parallel
+                cases = [((population[ii], ii), None) for ii in todo]
 
-                fitness[:] = np.inf
-                for result in results:
+                for result in self._evaluate_cases(cases):
                     returns, traceback = result
 
                     if returns:
                         val, success, ii = returns
-                        if success:
-                            fitness[ii] = val
+                        # like a serial run, a pool keeps the values of failed points.
+                        keep = success or comm is None
+                        self._store_fitness(population, fitness, ii, val, success, keep, repeats)
+                        if keep:
                             nfit += 1
                     else:
                         # Print the traceback if it fails
                         print('A case failed:')
                         print(traceback)
             else:  # Serial
-                for ii in range(self.npop):
-                    fitness[ii], success, _ = self.objfun(population[ii], 0)
+                for ii in todo:
+                    val, success, _ = self.objfun(population[ii], 0)
+                    self._store_fitness(population, fitness, ii, val, success, True, repeats)
                     nfit += 1
 
             # Find best performing point in this generation.
@@ -681,26 +801,221 @@ class DifferentialEvolution(object):
             fitness = np.ones(self.npop) * np.inf
 
             for ii in range(self.npop):
-                # randomly select 3 different population members other than the current choice
-                a, b, c = ii, ii, ii
-                while a == ii:
-                    a = rng.integers(0, self.npop)
-                while b == ii or b == a:
-                    b = rng.integers(0, self.npop)
-                while c == ii or c == a or c == b:
-                    c = rng.integers(0, self.npop)
-
-                # randomly select chromosome index for forced crossover
-                r = rng.integers(0, self.lchrom)
-
-                # crossover and mutation
-                population[ii] = parentPop[ii]  # start the same as parent
-                # clip mutant so that it cannot be outside the bounds
-                mutant = np.clip(parentPop[a] + F * (parentPop[b] - parentPop[c]), vlb, vub)
-                # sometimes replace parent's feature with mutant's
-                rr = rng.random(self.lchrom)
-                idx = np.where(rr < Pc)
-                population[ii][idx] = mutant[idx]
-                population[ii][r] = mutant[r]  # always replace at least one with mutant's
+                population[ii] = self._trial(parentPop, ii, vlb, vub, F, Pc, rng)
 
         return xopt, fopt, nfit
+
+    def _trial(self, parentPop, ii, vlb, vub, F, Pc, rng):
+        """
+        Generate a trial point for a member of the population by mutation and crossover.
+
+        Parameters
+        ----------
+        parentPop : ndarray
+            Design vectors of the current population.
+        ii : int
+            Index of the population member.
+        vlb : ndarray
+            Lower bounds array.
+        vub : ndarray
+            Upper bounds array.
+        F : float
+            Differential rate.
+        Pc : float
+            Crossover rate.
+        rng : Generator
+            Random number generator.
+
+        Returns
+        -------
+        ndarray
+            The trial point.
+        """
+        # randomly select 3 different population members other than the current choice
+        a, b, c = ii, ii, ii
+        while a == ii:
+            a = rng.integers(0, self.npop)
+        while b == ii or b == a:
+            b = rng.integers(0, self.npop)
+        while c == ii or c == a or c == b:
+            c = rng.integers(0, self.npop)
+
+        # randomly select chromosome index for forced crossover
+        r = rng.integers(0, self.lchrom)
+
+        # crossover and mutation
+        trial = parentPop[ii].copy()  # start the same as parent
+        # clip mutant so that it cannot be outside the bounds
+        mutant = np.clip(parentPop[a] + F * (parentPop[b] - parentPop[c]), vlb, vub)
+        # sometimes replace parent's feature with mutant's
+        rr = rng.random(self.lchrom)
+        idx = np.where(rr < Pc)
+        trial[idx] = mutant[idx]
+        trial[r] = mutant[r]  # always replace at least one with mutant's
+
+        return trial
+
+    def _execute_async(self, population, vlb, vub, max_gen, F, Pc, rng):
+        """
+        Run the steady-state variant of the algorithm.
+
+        The initial population is evaluated first, then trial points are generated for the
+        members of the population in turn, each from the population as it is when a worker
+        becomes free.  An evaluated point replaces the member it was generated for if it is
+        better.  The run stops after (max_gen + 1) * npop points, like the generational algorithm.
+
+        Parameters
+        ----------
+        population : ndarray
+            Design vectors of the initial population.
+        vlb : ndarray
+            Lower bounds array.
+        vub : ndarray
+            Upper bounds array.
+        max_gen : int
+            Number of generations to run the GA.
+        F : float
+            Differential rate.
+        Pc : float
+            Crossover rate.
+        rng : Generator
+            Random number generator.
+
+        Returns
+        -------
+        ndarray
+            Best design point.
+        float
+            Objective value at best design point.
+        int
+            Number of successful function evaluations.
+        """
+        comm = self.comm
+        npop = self.npop
+        budget = (max_gen + 1) * npop
+
+        parentPop = population.copy()
+        parentFitness = np.full(npop, np.inf)
+        xopt = copy.deepcopy(vlb)
+        fopt = np.inf
+        nfit = 0
+        nsent = 0
+
+        def update(ii, x, val, success):
+            nonlocal xopt, fopt
+
+            # failed points never replace a member of the population.
+            if success and val < parentFitness[ii]:
+                parentPop[ii] = x
+                parentFitness[ii] = val
+
+                if val < fopt:
+                    xopt = x.copy()
+                    fopt = val
+
+        def next_case():
+            nonlocal nsent
+
+            while nsent < budget:
+                ii = nsent % npop
+                if nsent < npop:
+                    x = population[ii]
+                else:
+                    x = self._trial(parentPop, ii, vlb, vub, F, Pc, rng)
+                nsent += 1
+
+                if self.cache is not None:
+                    cached = self.cache.get(x)
+                    if cached is not None:
+                        update(ii, x, *cached)
+                        continue
+
+                return ((x, ii), None)
+
+        def case_done(case, returns, traceback):
+            nonlocal nfit
+
+            (x, ii), _ = case
+            if returns is None:
+                # Print the traceback if it fails
+                print('A case failed:')
+                print(traceback)
+                return
+
+            val, success, _ = returns
+            if self.cache is not None:
+                self.cache.put(x, val, success)
+            if success:
+                nfit += 1
+
+            update(ii, x, val, success)
+
+        concurrent_eval_async(self.objfun, next_case, case_done, comm=comm, pool=self.pool,
+                              num_workers=self.pool_size)
+
+        if comm is not None:
+            # only rank 0 runs the algorithm, the other ranks just evaluate points.
+            xopt, fopt, nfit = comm.bcast((xopt, fopt, nfit), root=0)
+
+        return xopt, fopt, nfit
+
+    def _evaluate_cases(self, cases):
+        """
+        Evaluate cases with the process pool, or concurrently on the procs of comm.
+
+        Parameters
+        ----------
+        cases : list
+            Arguments of objfun for each case, as (args, kwargs) tuples.
+
+        Returns
+        -------
+        list
+            (return value, traceback) of each case.
+        """
+        comm = self.comm
+
+        if self.pool is not None:
+            return concurrent_eval_pool(cases, self.pool)
+
+        if self.load_balance and comm.size > 1:
+            # Rank 0 hands out the cases as the other ranks finish them, so no padding is needed.
+            return concurrent_eval_lb(self.objfun, cases, comm, broadcast=True)
+
+        # Pad the cases with some dummy cases to make the cases divisible amongst the procs.
+        extra = len(cases) % comm.size
+        if extra > 0:
+            for j in range(comm.size - extra):
+                cases.append(cases[-1])
+
+        return concurrent_eval(self.objfun, cases, comm, allgather=True,
+                               model_mpi=self.model_mpi)
+
+    def _store_fitness(self, population, fitness, ii, val, success, keep, repeats):
+        """
+        Save the fitness of an evaluated point and of any repeats of it in the population.
+
+        Parameters
+        ----------
+        population : ndarray
+            Design vectors of the population.
+        fitness : ndarray
+            Fitness of each point in the population.
+        ii : int
+            Index of the evaluated point.
+        val : float
+            Fitness of the evaluated point.
+        success : bool
+            True if the point was evaluated successfully.
+        keep : bool
+            If True, the fitness is kept in the population.
+        repeats : dict
+            Indices of the repeated occurrences of each evaluated point.
+        """
+        if self.cache is not None:
+            self.cache.put(population[ii], val, success)
+
+        if keep:
+            fitness[ii] = val
+            for jj in repeats.get(ii, ()):
+                fitness[jj] = val
@@ -2,16 +2,22 @@
 Design-of-Experiments Driver.
 """
 
+import os
 import traceback
 import inspect
+from itertools import chain
 
 import numpy as np
 
 from openmdao.core.driver import Driver, RecordingDebugging
 from openmdao.core.analysis_error import AnalysisError
 from openmdao.drivers.doe_generators import DOEGenerator, ListGenerator
+from openmdao.recorders.case_reader import CaseReader
+from openmdao.recorders.recording_manager import _clear_all_recorders
 
+from openmdao.utils.concurrent import concurrent_eval_async, fork_pool
 from openmdao.utils.mpi import MPI
+from openmdao.utils.om_warnings import issue_warning
 
 
 class DOEDriver(Driver):
@@ -37,6 +43,10 @@ class DOEDriver(Driver):
         List of design variables, used to compute derivatives.
     _quantities : list
         Contains the objectives plus nonlinear constraints, used to compute derivatives.
+    _recorded_cases : set or None
+        Keys of the design variable values of the cases found in the 'resume_from' files.
+    _num_skipped : int
+        Number of cases skipped in the last run because they were already recorded.
     """
 
     def __init__(self, generator=None, **kwargs):
@@ -77,6 +87,8 @@ class DOEDriver(Driver):
         self._indep_list = []
         self._quantities = []
         self._total_jac_format = 'dict'
+        self._recorded_cases = None
+        self._num_skipped = 0
 
     def _declare_options(self):
         """
@@ -88,6 +100,38 @@ class DOEDriver(Driver):
                              desc='Set to True to execute cases in parallel.')
         self.options.declare('procs_per_model', types=int, default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('load_balance', types=bool, default=False,
+                             desc='If True and run_parallel is True, rank 0 hands out the cases '
+                             'to the other ranks as they finish their previous case instead of '
+                             'assigning the cases to the ranks in a fixed order. Rank 0 does not '
+                             'run any cases. Requires procs_per_model to be 1.')
+        self.options.declare('num_procs', types=int, default=1, lower=1,
+                             desc='Number of processes that run the cases in parallel when not '
+                             'running under MPI. The worker processes are forked from this '
+                             'process, which records the cases as they finish.')
+        self.options.declare('resume_from', types=(str, list), default=None, allow_none=True,
+                             desc='Name of a case recorder file, or list of names of case '
+                             'recorder files, from a previous run of this DOE. Generated cases '
+                             'that were recorded as successful in these files are skipped.')
+
+    def _setup_driver(self, problem):
+        """
+        Prepare the driver for execution.
+
+        This is the final thing to run during setup.
+
+        Parameters
+        ----------
+        problem : <Problem>
+            Pointer to the containing problem.
+        """
+        super()._setup_driver(problem)
+
+        if self.options['load_balance'] and self.options['procs_per_model'] > 1:
+            raise RuntimeError(f"{self.msginfo}: Option 'load_balance' requires "
+                               "'procs_per_model' to be 1.")
+
+        self._recorded_cases = self._get_recorded_cases()
 
     def _setup_comm(self, comm):
         """
@@ -181,28 +225,208 @@ class DOEDriver(Driver):
         for name, _ in con_meta.items():
             self._quantities.append(name)
 
-        if MPI and self.options['run_parallel']:
-            case_gen = self._parallel_generator
+        self._num_skipped = 0
+
+        model = self._problem().model
+        generator = self.options['generator']
+
+        pool = self._get_process_pool()
+        if pool is not None:
+            try:
+                concurrent_eval_async(None, self._case_feeder(generator(self._designvars, model)),
+                                      self._record_pool_case, pool=pool,
+                                      num_workers=self.options['num_procs'])
+            finally:
+                pool.shutdown()
+
+        elif MPI and self.options['run_parallel'] and self.options['load_balance']:
+            concurrent_eval_async(self._run_indexed_case,
+                                  self._case_feeder(generator(self._designvars, model)),
+                                  self._lb_case_done, comm=self._problem_comm)
+
         else:
-            case_gen = self.options['generator']
+            if MPI and self.options['run_parallel']:
+                case_gen = self._parallel_generator
+            else:
+                case_gen = generator
 
-        for case in case_gen(self._designvars, self._problem().model):
-            self._run_case(case)
-            self.iter_count += 1
+            for case in case_gen(self._designvars, model):
+                if self._is_recorded(case):
+                    self._num_skipped += 1
+                else:
+                    self._run_case(case)
+                self.iter_count += 1
 
         return False
 
-    def _run_case(self, case):
+    def _get_process_pool(self):
         """
-        Run case, save exception info and mark the metadata if the case fails.
+        Return a pool of worker processes that run the cases, if the driver uses one.
+
+        Returns
+        -------
+        ProcessPoolExecutor or None
+            The process pool, or None if the cases are run in this process or by MPI.
+        """
+        num_procs = self.options['num_procs']
+        if num_procs < 2:
+            return None
+
+        problem = self._problem()
+        if problem.comm.size > 1:
+            issue_warning("Option 'num_procs' is ignored when running under MPI.",
+                          prefix=self.msginfo)
+            return None
+
+        pool = fork_pool(self._run_pool_case, num_procs, initializer=_clear_all_recorders,
+                         initargs=(problem,))
+        if pool is None:
+            issue_warning("Option 'num_procs' is ignored because a process pool requires the "
+                          "'fork' start method.", prefix=self.msginfo)
+        return pool
+
+    def _case_feeder(self, cases):
+        """
+        Return a function that hands out the generated cases one at a time.
+
+        Cases are only pulled from the generator when a worker is ready for them, so the cases
+        don't all have to be held in memory.  Cases that were already recorded are skipped.
+
+        Parameters
+        ----------
+        cases : iter of list
+            The generated cases.
+
+        Returns
+        -------
+        function
+            Function that returns the next case and its index as an (args, kwargs) tuple, or
+            None if there are no more cases.
+        """
+        cases = iter(cases)
+
+        def next_case():
+            for case in cases:
+                idx = self.iter_count
+                self.iter_count += 1
+                if self._is_recorded(case):
+                    self._num_skipped += 1
+                else:
+                    return (case, idx), None
+
+        return next_case
+
+    def _get_resume_files(self):
+        """
+        Return the list of files given in the 'resume_from' option.
+
+        Returns
+        -------
+        list of str
+            The files to resume from.
+        """
+        filenames = self.options['resume_from']
+        if not filenames:
+            return []
+        if isinstance(filenames, str):
+            return [filenames]
+        return filenames
+
+    def _check_recorders(self, problem):
+        """
+        Check the recorders attached anywhere in the problem before any of them are started.
+
+        A recorder that writes to one of the 'resume_from' files would overwrite it before the
+        recorded cases are read.
+
+        Parameters
+        ----------
+        problem : <Problem>
+            Pointer to the containing problem.
+        """
+        filenames = self._get_resume_files()
+        if not filenames:
+            return
+
+        # gather the recorders attached to the driver, the problem, and every system and solver
+        recorders = list(chain(self._rec_mgr, problem._rec_mgr))
+        solvers = []
+        for system in problem.model.system_iter(include_self=True, recurse=True):
+            recorders.extend(system._rec_mgr)
+            solvers.extend((system._nonlinear_solver, system._linear_solver))
+        while solvers:
+            solver = solvers.pop()
+            if solver is not None:
+                recorders.extend(solver._rec_mgr)
+                # solvers may own other solvers, e.g. a Newton linesearch or a preconditioner
+                solvers.extend(getattr(solver, name, None)
+                               for name in ('linear_solver', 'linesearch', 'precon'))
+
+        resume_paths = {os.path.abspath(filename) for filename in filenames}
+        for recorder in recorders:
+            filepath = getattr(recorder, '_filepath', None)
+            if filepath is not None and os.path.abspath(filepath) in resume_paths:
+                raise RuntimeError(f"{self.msginfo}: Can't resume from '{filepath}' because "
+                                   "it would be overwritten by a case recorder. Record the "
+                                   "resumed run to a different file.")
+
+    def _get_recorded_cases(self):
+        """
+        Return the keys of the successful cases recorded in the 'resume_from' files.
+
+        Returns
+        -------
+        set or None
+            The keys of the recorded cases, or None if the driver isn't resuming a previous run.
+        """
+        filenames = self._get_resume_files()
+        if not filenames:
+            return None
+
+        recorded = set()
+        for filename in filenames:
+            cr = CaseReader(filename)
+            for case in cr.get_cases('driver', recurse=False):
+                if case.success:
+                    dvs = case.get_design_vars(scaled=False)
+                    recorded.add(_case_key([(name, dvs[name]) for name in self._designvars]))
+
+        return recorded
+
+    def _is_recorded(self, case):
+        """
+        Return True if a case was already recorded in one of the 'resume_from' files.
+
+        The design variables are set to the values of the case, so the values are compared in
+        model units.
 
         Parameters
         ----------
         case : list
             list of name, value tuples for the design variables.
+
+        Returns
+        -------
+        bool
+            True if the case doesn't have to be run again.
         """
-        metadata = {}
+        if not self._recorded_cases:
+            return False
+
+        self._set_case(case)
+        values = self.get_design_var_values(driver_scaling=False)
+        return _case_key([(name, values[name]) for name in self._designvars]) in \
+            self._recorded_cases
 
+    def _set_case(self, case):
+        """
+        Set the design variables to the values of a case.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+        """
         for dv_name, dv_val in case:
             try:
                 msg = None
@@ -216,20 +440,149 @@ class DOEDriver(Driver):
                 if msg:
                     raise ValueError(msg)
 
-        with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
-            try:
-                self._problem().model.run_solve_nonlinear()
-                metadata['success'] = 1
-                metadata['msg'] = ''
-            except AnalysisError:
-                metadata['success'] = 0
-                metadata['msg'] = traceback.format_exc()
-            except Exception:
-                metadata['success'] = 0
-                metadata['msg'] = traceback.format_exc()
-                print(metadata['msg'])
+    def _solve_case(self):
+        """
+        Run the model, save exception info and mark the metadata if the case fails.
 
+        Returns
+        -------
+        dict
+            Metadata of the case, with its success flag and error message.
+        """
+        metadata = {}
+
+        try:
+            self._problem().model.run_solve_nonlinear()
+            metadata['success'] = 1
+            metadata['msg'] = ''
+        except AnalysisError:
+            metadata['success'] = 0
+            metadata['msg'] = traceback.format_exc()
+        except Exception:
+            metadata['success'] = 0
+            metadata['msg'] = traceback.format_exc()
+            print(metadata['msg'])
+
+        return metadata
+
+    def _run_case(self, case):
+        """
+        Run case, save exception info and mark the metadata if the case fails.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+        """
+        self._set_case(case)
+
+        with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
             # save reference to metadata for use in record_iteration
+            self._metadata = self._solve_case()
+
+        if self.recording_options['record_derivatives']:
+            self._compute_totals(of=self._quantities,
+                                 wrt=self._indep_list,
+                                 return_format=self._total_jac_format,
+                                 driver_scaling=False)
+
+    def _run_indexed_case(self, case, idx):
+        """
+        Run and record a case handed out by the load balancing master.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+        idx : int
+            Index of the case in the generated cases, used as its iteration count.
+
+        Returns
+        -------
+        int
+            The success flag of the case.
+        """
+        self.iter_count = idx
+        self._run_case(case)
+        return self._metadata['success']
+
+    def _lb_case_done(self, case, success, err):
+        """
+        Check a case that was run by a load balancing worker.
+
+        Parameters
+        ----------
+        case : tuple
+            The (args, kwargs) of the case.
+        success : int or None
+            The success flag of the case, or None if the worker raised an exception.
+        err : str or None
+            The traceback of the exception raised by the worker.
+        """
+        if err is not None:
+            raise RuntimeError(f"{self.msginfo}: Case {case[0][1]} failed on a worker:\n{err}")
+
+    def _run_pool_case(self, case, idx):
+        """
+        Run a case in a worker process and return the values needed to record it.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+        idx : int
+            Index of the case in the generated cases.
+
+        Returns
+        -------
+        tuple
+            The metadata of the case and the values of the nonlinear vectors and discrete
+            variables of the model.
+        """
+        self._set_case(case)
+        metadata = self._solve_case()
+
+        model = self._problem().model
+        inputs, outputs, residuals = model.get_nonlinear_vectors()
+
+        return (metadata, inputs.asarray(copy=True), outputs.asarray(copy=True),
+                residuals.asarray(copy=True),
+                dict(model._discrete_inputs.items()) if model._discrete_inputs else {},
+                dict(model._discrete_outputs.items()) if model._discrete_outputs else {})
+
+    def _record_pool_case(self, case, retval, err):
+        """
+        Record a case that was run by a worker process.
+
+        The model is set to the state of the worker at the end of the case, so the recorders
+        see the same values as if the case had been run in this process.
+
+        Parameters
+        ----------
+        case : tuple
+            The (args, kwargs) of the case.
+        retval : tuple or None
+            Return value of _run_pool_case, or None if the worker raised an exception.
+        err : str or None
+            The traceback of the exception raised by the worker.
+        """
+        if err is not None:
+            raise RuntimeError(f"{self.msginfo}: Case {case[0][1]} failed in a worker "
+                               f"process:\n{err}")
+
+        metadata, inputs, outputs, residuals, discrete_inputs, discrete_outputs = retval
+
+        model = self._problem().model
+        model_inputs, model_outputs, model_residuals = model.get_nonlinear_vectors()
+        model_inputs.set_val(inputs)
+        model_outputs.set_val(outputs)
+        model_residuals.set_val(residuals)
+        for name, val in discrete_inputs.items():
+            model._discrete_inputs[name] = val
+        for name, val in discrete_outputs.items():
+            model._discrete_outputs[name] = val
+
+        with RecordingDebugging(self._get_name(), case[0][1], self):
             self._metadata = metadata
 
         if self.recording_options['record_derivatives']:
@@ -238,6 +591,19 @@ class DOEDriver(Driver):
                                  return_format=self._total_jac_format,
                                  driver_scaling=False)
 
+    def _get_run_stats(self):
+        """
+        Return driver specific statistics of the last run to be saved in opt_result.
+
+        Returns
+        -------
+        dict
+            Number of cases skipped because they were already recorded, if the run was resumed.
+        """
+        if self._recorded_cases is None:
+            return {}
+        return {'skipped_cases': self._num_skipped}
+
     def _parallel_generator(self, design_vars, model=None):
         """
         Generate case for this processor when running under MPI.
@@ -259,9 +625,7 @@ class DOEDriver(Driver):
         color = self._color
 
         generator = self.options['generator']
-        for i, case in enumerate(generator(design_vars, model)):
-            if i % size == color:
-                yield case
+        yield from generator.generate_slice(design_vars, model, start=color, step=size)
 
     def _setup_recording(self):
         """
@@ -304,3 +668,28 @@ class DOEDriver(Driver):
         """
         self._metadata['name'] = case_name
         return self._metadata
+
+
+def _case_key(values):
+    """
+    Return a hashable key for the design variable values of a case.
+
+    Parameters
+    ----------
+    values : list
+        list of name, value tuples for the design variables.
+
+    Returns
+    -------
+    tuple
+        The key of the case.
+    """
+    key = []
+    for name, val in values:
+        arr = np.asarray(val)
+        if arr.dtype.kind in 'biuf':
+            key.append((name, np.ascontiguousarray(arr.ravel(), dtype=float).tobytes()))
+        else:
+            key.append((name, repr(val)))
+
+    return tuple(key)
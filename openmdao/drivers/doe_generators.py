@@ -5,6 +5,7 @@ import csv
 import os.path
 import re
 from collections import OrderedDict
+from itertools import islice
 
 import numpy as np
 
@@ -16,6 +17,7 @@ except ImportError:
 from openmdao.utils.name_maps import prom_name2abs_name
 
 _LEVELS = 2  # default number of levels for pyDOE generators
+_CHUNK_SIZE = 1024  # number of cases of a full factorial design generated at a time
 
 
 class DOEGenerator(object):
@@ -42,6 +44,35 @@ class DOEGenerator(object):
         """
         return []
 
+    def generate_slice(self, design_vars, model=None, start=0, stop=None, step=1):
+        """
+        Generate the cases of a slice of the design.
+
+        This generates the same cases as cases[start:stop:step] would if all the cases were
+        in a list, so the cases can be split among workers, e.g. with start set to the index of
+        the worker and step set to the number of workers.  Generators that can compute a case
+        from its index skip the other cases without generating them.
+
+        Parameters
+        ----------
+        design_vars : OrderedDict
+            Dictionary of design variables for which to generate values.
+        model : Group
+            The model containing the design variables (used by some subclasses).
+        start : int
+            Index of the first case.
+        stop : int or None
+            Index where the cases stop, or None to generate all of the remaining cases.
+        step : int
+            Difference between the indices of consecutive cases.
+
+        Yields
+        ------
+        list
+            list of name, value tuples for the design variables.
+        """
+        yield from islice(self(design_vars, model), start, stop, step)
+
 
 class ListGenerator(DOEGenerator):
     """
@@ -353,6 +384,30 @@ class _pyDOE_Generator(DOEGenerator):
         model : Group
             The model containing the design variables (not used).
 
+        Yields
+        ------
+        list
+            list of name, value tuples for the design variables.
+        """
+        yield from self.generate_slice(design_vars, model)
+
+    def generate_slice(self, design_vars, model=None, start=0, stop=None, step=1):
+        """
+        Generate the cases of a slice of the design.
+
+        Parameters
+        ----------
+        design_vars : OrderedDict
+            Dictionary of design variables for which to generate values.
+        model : Group
+            The model containing the design variables (not used).
+        start : int
+            Index of the first case.
+        stop : int or None
+            Index where the cases stop, or None to generate all of the remaining cases.
+        step : int
+            Difference between the indices of consecutive cases.
+
         Yields
         ------
         list
@@ -361,7 +416,6 @@ class _pyDOE_Generator(DOEGenerator):
         self._sizes = OrderedDict([(name, _get_size(meta))
                                    for name, meta in design_vars.items()])
         size = sum(self._sizes.values())
-        doe = self._generate_design(size).astype('int')
 
         # Maximum number of levels, or the default if the maximum is smaller than the default.
         # This is to ensure that the array will be big enough even if some keys are missing
@@ -378,9 +432,9 @@ class _pyDOE_Generator(DOEGenerator):
 
         row = 0
         for name, meta in design_vars.items():
-            size = _get_size(meta)
+            size_i = _get_size(meta)
 
-            for k in range(size):
+            for k in range(size_i):
                 lower = meta['lower']
                 if isinstance(lower, np.ndarray):
                     lower = lower[k]
@@ -394,19 +448,36 @@ class _pyDOE_Generator(DOEGenerator):
 
                 row += 1
 
+        rows = np.arange(size)
+        offsets = np.cumsum([0] + list(self._sizes.values()))
+
         # yield values for doe generated indices
-        for idxs in doe:
-            retval = []
-            row = 0
-            for name, meta in design_vars.items():
-                size_i = _get_size(meta)
-                val = np.empty(size_i)
-                for k in range(size_i):
-                    idx = idxs[row + k]
-                    val[k] = values[row + k][idx]
-                retval.append((name, val))
-                row += size_i
-            yield retval
+        for idxs in self._generate_indices(size, start, stop, step):
+            vals = values[rows, idxs]
+            yield [(name, vals[offsets[i]:offsets[i + 1]])
+                   for i, name in enumerate(self._sizes)]
+
+    def _generate_indices(self, size, start, stop, step):
+        """
+        Generate the rows of a slice of the design matrix.
+
+        Parameters
+        ----------
+        size : int
+            The number of factors for the design.
+        start : int
+            Index of the first row.
+        stop : int or None
+            Index where the rows stop, or None for all of the remaining rows.
+        step : int
+            Difference between the indices of consecutive rows.
+
+        Returns
+        -------
+        iter of ndarray
+            The level index of each factor, for each row of the slice.
+        """
+        return self._generate_design(size).astype('int')[start:stop:step]
 
     def _generate_design(self, size):
         """
@@ -454,6 +525,30 @@ class FullFactorialGenerator(_pyDOE_Generator):
         """
         return pyDOE3.fullfact(self._get_all_levels())
 
+    def _generate_indices(self, size, start, stop, step):
+        """
+        Generate the rows of a slice of the full factorial design matrix.
+
+        The rows are computed from their index, so the design matrix is never built.
+
+        Parameters
+        ----------
+        size : int
+            The number of factors for the design.
+        start : int
+            Index of the first row.
+        stop : int or None
+            Index where the rows stop, or None for all of the remaining rows.
+        step : int
+            Difference between the indices of consecutive rows.
+
+        Returns
+        -------
+        iter of ndarray
+            The level index of each factor, for each row of the slice.
+        """
+        return _full_factorial_indices(self._get_all_levels(), start, stop, step)
+
 
 class GeneralizedSubsetGenerator(_pyDOE_Generator):
     """
@@ -702,6 +797,45 @@ class LatinHypercubeGenerator(DOEGenerator):
             yield retval
 
 
+def _full_factorial_indices(levels, start=0, stop=None, step=1):
+    """
+    Generate the rows of a slice of a full factorial design matrix.
+
+    The rows are in the same order as those of pyDOE3.fullfact, i.e. the level indices count
+    in a mixed radix number system whose first digit changes fastest.  Rows are computed
+    from their index a chunk at a time, so memory use doesn't depend on the size of the design.
+
+    Parameters
+    ----------
+    levels : list of int
+        The number of levels of each factor.
+    start : int
+        Index of the first row.
+    stop : int or None
+        Index where the rows stop, or None for all of the remaining rows.
+    step : int
+        Difference between the indices of consecutive rows.
+
+    Yields
+    ------
+    ndarray
+        The level index of each factor for a row of the design.
+    """
+    levels = np.asarray(levels, dtype=np.int64)
+    strides = np.cumprod(np.concatenate(([1], levels[:-1]))).astype(np.int64)
+
+    num_rows = 1
+    for n in levels:
+        num_rows *= int(n)
+
+    cases = range(num_rows)[start:stop:step]
+
+    for i in range(0, len(cases), _CHUNK_SIZE):
+        chunk = cases[i:i + _CHUNK_SIZE]
+        idx = np.arange(chunk.start, chunk.stop, chunk.step, dtype=np.int64)
+        yield from (idx[:, np.newaxis] // strides) % levels
+
+
 def _get_size(dct):
     # Returns global size of the variable if it is distributed, size otherwise.
     return dct['global_size'] if dct['distributed'] else dct['size']
@@ -0,0 +1,277 @@
+"""
+A bounded cache of fitness values for the genetic algorithm drivers.
+
+Populations of a genetic algorithm often contain designs that have already been evaluated,
+especially with elitism and discrete design variables.  The cache is keyed on the decoded design
+vector, optionally rounded to a tolerance, so those designs don't need to be run again.
+"""
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from openmdao.utils.om_warnings import issue_warning
+
+
+class FitnessCache(object):
+    """
+    A least recently used (LRU) cache of fitness values keyed on the design vector.
+
+    Parameters
+    ----------
+    max_entries : int
+        Maximum number of designs kept in the cache.
+    tol : float
+        If greater than zero, design vectors are rounded to multiples of tol to form the key,
+        so designs that differ by less than tol share a fitness value.  Otherwise, the key is
+        the exact design vector.
+
+    Attributes
+    ----------
+    max_entries : int
+        Maximum number of designs kept in the cache.
+    tol : float
+        Tolerance used to quantize the design vectors, or 0 for exact keys.
+    hits : int
+        Number of designs found in the cache.
+    misses : int
+        Number of designs that were not found in the cache.
+    evictions : int
+        Number of entries removed to stay within max_entries.
+    _entries : OrderedDict
+        (design, fitness, success) keyed on the quantized design, least recently used first.
+    """
+
+    def __init__(self, max_entries=10000, tol=0.):
+        """
+        Initialize attributes.
+        """
+        self.max_entries = max_entries
+        self.tol = tol
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        """
+        Return the number of designs in the cache.
+
+        Returns
+        -------
+        int
+            Number of cached designs.
+        """
+        return len(self._entries)
+
+    def _key(self, x):
+        """
+        Return the cache key of a design vector.
+
+        Parameters
+        ----------
+        x : ndarray
+            Design vector.
+
+        Returns
+        -------
+        bytes
+            The cache key.
+        """
+        if self.tol > 0.:
+            return np.round(np.asarray(x, dtype=float) / self.tol).astype(np.int64).tobytes()
+        return np.ascontiguousarray(x, dtype=float).tobytes()
+
+    def get(self, x):
+        """
+        Return the cached fitness of a design, or None if it isn't in the cache.
+
+        Parameters
+        ----------
+        x : ndarray
+            Design vector.
+
+        Returns
+        -------
+        tuple or None
+            The fitness and success flag of the design.
+        """
+        key = self._key(x)
+        try:
+            _, fitness, success = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return fitness, success
+
+    def put(self, x, fitness, success):
+        """
+        Store the fitness of a design, evicting the least recently used designs if necessary.
+
+        Parameters
+        ----------
+        x : ndarray
+            Design vector.
+        fitness : float or ndarray
+            Fitness of the design.
+        success : bool
+            True if the design was evaluated successfully.
+        """
+        key = self._key(x)
+        self._entries[key] = (np.array(x, dtype=float), np.copy(fitness), bool(success))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def lookup(self, points, indices):
+        """
+        Split the points of a population into cached designs and designs that must be evaluated.
+
+        Parameters
+        ----------
+        points : ndarray
+            Design vectors of the population, one per row.
+        indices : list of int
+            Indices of the points to consider.
+
+        Returns
+        -------
+        list of tuple
+            (index, fitness, success) of each point found in the cache.
+        list of int
+            Indices of the first occurrence of each design that isn't in the cache.
+        dict
+            Indices of the repeated occurrences of each design that must be evaluated, keyed
+            by the index of its first occurrence.
+        """
+        found = []
+        todo = []
+        repeats = {}
+        first = {}
+
+        for ii in indices:
+            key = self._key(points[ii])
+            if key in first:
+                repeats[first[key]].append(ii)
+                self.hits += 1
+                continue
+
+            cached = self.get(points[ii])
+            if cached is None:
+                first[key] = ii
+                repeats[ii] = []
+                todo.append(ii)
+            else:
+                found.append((ii,) + cached)
+
+        return found, todo, repeats
+
+    def save(self, filename):
+        """
+        Write the cached designs to a file.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file.
+        """
+        entries = list(self._entries.values())
+        if entries:
+            x = np.array([e[0] for e in entries])
+            fitness = np.array([np.atleast_1d(e[1]) for e in entries])
+            success = np.array([e[2] for e in entries])
+        else:
+            x = fitness = success = np.zeros(0)
+
+        with open(filename, 'wb') as f:
+            np.savez(f, x=x, fitness=fitness, success=success)
+
+    def load(self, filename, size):
+        """
+        Add the designs saved in a file to the cache.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file.
+        size : int
+            Length of the design vector.  Files of a different design space are ignored.
+        """
+        if not os.path.isfile(filename):
+            return
+
+        with np.load(filename, allow_pickle=False) as data:
+            x, fitness, success = data['x'], data['fitness'], data['success']
+
+        if x.size == 0:
+            return
+
+        if x.shape[1] != size:
+            issue_warning(f"Ignoring the fitness cache file '{filename}' because its designs "
+                          f"have {x.shape[1]} variables instead of {size}.")
+            return
+
+        for xi, fi, si in zip(x, fitness, success):
+            self.put(xi, fi if fi.size > 1 else fi[0], si)
+
+    def stats(self):
+        """
+        Return the number of cache hits, misses and evictions.
+
+        Returns
+        -------
+        dict
+            The cache statistics.
+        """
+        return {
+            'cache_hits': self.hits,
+            'cache_misses': self.misses,
+            'cache_evictions': self.evictions,
+        }
+
+
+def _create_fitness_cache(driver, size):
+    """
+    Return a new fitness cache for a driver run, or None if the driver doesn't use one.
+
+    Parameters
+    ----------
+    driver : Driver
+        The driver, with fitness cache options.
+    size : int
+        Length of the design vector.
+
+    Returns
+    -------
+    FitnessCache or None
+        The fitness cache, including the designs saved in the fitness cache file.
+    """
+    if not driver.options['fitness_cache']:
+        return None
+
+    cache = FitnessCache(driver.options['fitness_cache_size'], driver.options['fitness_cache_tol'])
+
+    filename = driver.options['fitness_cache_file']
+    if filename:
+        cache.load(filename, size)
+
+    return cache
+
+
+def _save_fitness_cache(driver):
+    """
+    Save the fitness cache of a driver to its fitness cache file, if it has one.
+
+    Parameters
+    ----------
+    driver : Driver
+        The driver, with fitness cache options.
+    """
+    filename = driver.options['fitness_cache_file']
+    if driver._fitness_cache is not None and filename and driver._problem().comm.rank == 0:
+        driver._fitness_cache.save(filename)
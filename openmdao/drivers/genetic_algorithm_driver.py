@@ -32,8 +32,13 @@ except ModuleNotFoundError:
 
 from openmdao.core.constants import INF_BOUND
 from openmdao.core.driver import Driver, RecordingDebugging
-from openmdao.utils.concurrent import concurrent_eval
+from openmdao.drivers.fitness_cache import _create_fitness_cache, _save_fitness_cache
+from openmdao.drivers.pareto import update_front
+from openmdao.recorders.recording_manager import _clear_all_recorders
+from openmdao.utils.concurrent import concurrent_eval, concurrent_eval_lb, concurrent_eval_pool, \
+    fork_pool
 from openmdao.utils.mpi import MPI
+from openmdao.utils.om_warnings import issue_warning
 from openmdao.core.analysis_error import AnalysisError
 
 
@@ -63,6 +68,8 @@ class SimpleGADriver(Driver):
          Random state (or seed-number) which controls the seed and random draws.
     _nfit : int
          Number of successful function evaluations.
+    _fitness_cache : FitnessCache or None
+        Cache of the fitness of evaluated designs during the last run.
     """
 
     def __init__(self, **kwargs):
@@ -106,6 +113,7 @@ class SimpleGADriver(Driver):
         self._concurrent_color = 0
 
         self._nfit = 0  # Number of successful function evaluations
+        self._fitness_cache = None
 
     def _declare_options(self):
         """
@@ -154,6 +162,32 @@ class SimpleGADriver(Driver):
                              'given objectives and update it each generation. The multi-objective '
                              'weight and exponents are ignored because the algorithm uses all '
                              'objective values instead of a composite.')
+        self.options.declare('pareto_archive_size', types=int, default=0, lower=0,
+                             desc="Maximum number of non-dominated points kept when "
+                             "'compute_pareto' is True. When there are more, the most crowded "
+                             'points are dropped. Set to 0 to keep all non-dominated points.')
+        self.options.declare('fitness_cache', types=bool, default=False,
+                             desc='If True, cache the fitness of evaluated designs so that '
+                             'designs that appear again in later generations are not run again.')
+        self.options.declare('fitness_cache_size', types=int, default=10000, lower=1,
+                             desc='Maximum number of designs kept in the fitness cache.')
+        self.options.declare('fitness_cache_tol', default=0., lower=0.,
+                             desc='If greater than zero, designs are rounded to multiples of this '
+                             'value before being looked up in the fitness cache.')
+        self.options.declare('fitness_cache_file', types=str, default=None, allow_none=True,
+                             desc='If given, the fitness cache is loaded from this file before '
+                             'the run, if it exists, and saved to it afterwards, so that restarts '
+                             'can reuse it. It must be removed if the model changes.')
+        self.options.declare('load_balance', types=bool, default=False,
+                             desc="If True and 'run_parallel' is True, rank 0 hands out the points "
+                             'of each generation one at a time to the other ranks as they finish, '
+                             'instead of splitting them evenly between all ranks. Use this when '
+                             "evaluation times vary. Requires 'procs_per_model' to be 1.")
+        self.options.declare('num_procs', types=int, default=1, lower=1,
+                             desc='Number of worker processes used to evaluate the points of each '
+                             'generation when not running under MPI. The workers are forked from '
+                             "this process, so this requires the 'fork' start method. Cases run "
+                             'by the workers are not recorded.')
 
     def _setup_driver(self, problem):
         """
@@ -191,6 +225,10 @@ class SimpleGADriver(Driver):
                        f"equals={equals}, lower={lower}, upper={upper}.")
                 raise ValueError(msg)
 
+        if self.options['load_balance'] and self.options['procs_per_model'] > 1:
+            raise RuntimeError(f"{self.msginfo}: Option 'load_balance' requires "
+                               "'procs_per_model' to be 1.")
+
         model_mpi = None
         comm = problem.comm
         if self._concurrent_pop_size > 0:
@@ -300,6 +338,45 @@ class SimpleGADriver(Driver):
         """
         return 0
 
+    def _get_run_stats(self):
+        """
+        Return driver specific statistics of the last run to be saved in opt_result.
+
+        Returns
+        -------
+        dict
+            The statistics keyed by name.
+        """
+        if self._fitness_cache is None:
+            return {}
+        return self._fitness_cache.stats()
+
+    def _get_process_pool(self):
+        """
+        Return a pool of worker processes that evaluate the population, if the driver uses one.
+
+        Returns
+        -------
+        ProcessPoolExecutor or None
+            The process pool, or None if the population is evaluated in this process or by MPI.
+        """
+        num_procs = self.options['num_procs']
+        if num_procs < 2:
+            return None
+
+        problem = self._problem()
+        if problem.comm.size > 1:
+            issue_warning("Option 'num_procs' is ignored when running under MPI.",
+                          prefix=self.msginfo)
+            return None
+
+        pool = fork_pool(self.objective_callback, num_procs, initializer=_clear_all_recorders,
+                         initargs=(problem,))
+        if pool is None:
+            issue_warning("Option 'num_procs' is ignored because a process pool requires the "
+                          "'fork' start method.", prefix=self.msginfo)
+        return pool
+
     def run(self):
         """
         Execute the genetic algorithm.
@@ -328,6 +405,7 @@ class SimpleGADriver(Driver):
 
         if compute_pareto:
             self._ga.nobj = len(self._objs)
+            self._ga.archive_size = self.options['pareto_archive_size']
 
         # Size design variables.
         desvars = self._designvars
@@ -394,9 +472,20 @@ class SimpleGADriver(Driver):
         if pop_size == 0:
             pop_size = 4 * np.sum(bits)
 
-        desvar_new, obj, self._nfit = ga.execute_ga(x0, lower_bound, upper_bound, outer_bound,
-                                                    bits, pop_size, max_gen,
-                                                    self._randomstate, Pm, Pc)
+        ga.cache = self._fitness_cache = _create_fitness_cache(self, count)
+        ga.load_balance = self.options['load_balance']
+        ga.pool = self._get_process_pool()
+
+        try:
+            desvar_new, obj, self._nfit = ga.execute_ga(x0, lower_bound, upper_bound, outer_bound,
+                                                        bits, pop_size, max_gen,
+                                                        self._randomstate, Pm, Pc)
+        finally:
+            if ga.pool is not None:
+                ga.pool.shutdown()
+                ga.pool = None
+
+        _save_fitness_cache(self)
 
         if compute_pareto:
             # Just save the non-dominated points.
@@ -605,6 +694,12 @@ class GeneticAlgorithm(object):
 
     Attributes
     ----------
+    archive_size : int
+        If greater than zero, the maximum number of non dominated designs kept when there are
+        multiple objectives. The most crowded designs are dropped first.
+    cache : FitnessCache or None
+        If not None, the fitness of designs found in this cache is reused instead of being
+        evaluated again.
     comm : MPI communicator or None
         The MPI communicator that will be used objective evaluation for each generation.
     elite : bool
@@ -616,6 +711,9 @@ class GeneticAlgorithm(object):
         so when used Pc should be increased and Pm reduced.
     lchrom : int
         Chromosome length.
+    load_balance : bool
+        If True, cases are handed out one at a time to the ranks of comm as they finish, instead
+        of being split evenly between them.
     model_mpi : None or tuple
         If the model in objfun is also parallel, then this will contain a tuple with the the
         total number of population points to evaluate concurrently, and the color of the point
@@ -626,6 +724,9 @@ class GeneticAlgorithm(object):
         Population size.
     objfun : function
         Objective function callback.
+    pool : ProcessPoolExecutor or None
+        If not None, the pool of worker processes, created with fork_pool, that evaluates
+        the population instead of comm.
     """
 
     def __init__(self, objfun, comm=None, model_mpi=None):
@@ -648,6 +749,10 @@ class GeneticAlgorithm(object):
         self.gray_code = False
         self.cross_bits = False
         self.model_mpi = model_mpi
+        self.cache = None
+        self.load_balance = False
+        self.pool = None
+        self.archive_size = 0
 
     def execute_ga(self, x0, vlb, vub, vob, bits, pop_size, max_gen, random_state, Pm=None, Pc=0.5):
         """
@@ -727,33 +832,34 @@ class GeneticAlgorithm(object):
 
             # Evaluate fitness of points in this generation.
             if comm is not None:
-                # Parallel
-
                 # Since GA is random, ranks generate different new populations, so just take one
                 # and use it on all.
                 x_pop = comm.bcast(x_pop, root=0)
 
-                cases = [((item, ii), None) for ii, item in enumerate(x_pop)
-                         if np.all(item - vob <= 0)]
+            # Points above the bounds of integer variables that are over-allocated are skipped.
+            valid = [ii for ii, item in enumerate(x_pop) if np.all(item - vob <= 0)]
+
+            if self.cache is None:
+                found, todo, repeats = [], valid, {}
+            else:
+                found, todo, repeats = self.cache.lookup(x_pop, valid)
 
-                # Pad the cases with some dummy cases to make the cases divisible amongst the procs.
-                # TODO: Add a load balancing option to this driver.
-                extra = len(cases) % comm.size
-                if extra > 0:
-                    for j in range(comm.size - extra):
-                        cases.append(cases[-1])
+            fitness[:] = np.inf
+            for ii, val, success in found:
+                if success:
+                    fitness[ii, :] = val
 
-                results = concurrent_eval(self.objfun, cases, comm, allgather=True,
-                                          model_mpi=self.model_mpi)
+            if comm is not None or self.pool is not None:
+                # Parallel
+                cases = [((x_pop[ii], ii), None) for ii in todo]
 
-                fitness[:] = np.inf
-                for result in results:
+                for result in self._evaluate_cases(cases):
                     returns, traceback = result
 
                     if returns:
                         val, success, ii = returns
+                        self._store_fitness(x_pop, fitness, ii, val, success, repeats)
                         if success:
-                            fitness[ii, :] = val
                             nfit += 1
 
                     else:
@@ -763,19 +869,11 @@ class GeneticAlgorithm(object):
 
             else:
                 # Serial
-                for ii in range(self.npop):
-                    x = x_pop[ii]
-
-                    if np.any(x - vob > 0):
-                        # Exceeded bounds for integer variables that are over-allocated.
-                        success = False
-                    else:
-                        fitness[ii, :], success, _ = self.objfun(x, 0)
-
+                for ii in todo:
+                    val, success, _ = self.objfun(x_pop[ii], 0)
+                    self._store_fitness(x_pop, fitness, ii, val, success, repeats)
                     if success:
                         nfit += 1
-                    else:
-                        fitness[ii, :] = np.inf
 
             # Find Pareto front.
             if nobj > 1:
@@ -813,10 +911,72 @@ class GeneticAlgorithm(object):
 
         return xopt, fopt, nfit
 
+    def _evaluate_cases(self, cases):
+        """
+        Evaluate cases with the process pool, or concurrently on the procs of comm.
+
+        Parameters
+        ----------
+        cases : list
+            Arguments of objfun for each case, as (args, kwargs) tuples.
+
+        Returns
+        -------
+        list
+            (return value, traceback) of each case.
+        """
+        comm = self.comm
+
+        if self.pool is not None:
+            return concurrent_eval_pool(cases, self.pool)
+
+        if self.load_balance and comm.size > 1:
+            # Rank 0 hands out the cases as the other ranks finish them, so no padding is needed.
+            return concurrent_eval_lb(self.objfun, cases, comm, broadcast=True)
+
+        # Pad the cases with some dummy cases to make the cases divisible amongst the procs.
+        extra = len(cases) % comm.size
+        if extra > 0:
+            for j in range(comm.size - extra):
+                cases.append(cases[-1])
+
+        return concurrent_eval(self.objfun, cases, comm, allgather=True,
+                               model_mpi=self.model_mpi)
+
+    def _store_fitness(self, x_pop, fitness, ii, val, success, repeats):
+        """
+        Save the fitness of an evaluated point and of any repeats of it in the population.
+
+        Parameters
+        ----------
+        x_pop : ndarray
+            Design vectors of the population.
+        fitness : ndarray
+            Fitness of each point in the population.
+        ii : int
+            Index of the evaluated point.
+        val : float or ndarray
+            Fitness of the evaluated point.
+        success : bool
+            True if the point was evaluated successfully.
+        repeats : dict
+            Indices of the repeated occurrences of each evaluated point.
+        """
+        if self.cache is not None:
+            self.cache.put(x_pop[ii], val, success)
+
+        if success:
+            fitness[ii, :] = val
+            for jj in repeats.get(ii, ()):
+                fitness[jj, :] = val
+
     def eval_pareto(self, x, obj, x_nd, obj_nd):
         """
         Produce a set of non dominated designs.
 
+        The new designs are merged into the non dominated set of the previous generations, which
+        is kept to at most archive_size designs if that is greater than zero.
+
         Parameters
         ----------
         x : ndarray
@@ -835,26 +995,11 @@ class GeneticAlgorithm(object):
         ndarray
             Objective at nondominated design points.
         """
-        if len(x_nd) > 1:
-            ypop = np.concatenate((np.array(obj_nd), obj), axis=0)
-            xpop = np.concatenate((x_nd, x), axis=0)
-        else:
-            ypop = obj
-            xpop = x
-
-        n_pts = ypop.shape[0]
-        i = 0
-        pot_idx = np.arange(n_pts)
-        while i < len(ypop):
-            nd_point_mask = np.any(ypop < ypop[i, :], axis=1)
-            nd_point_mask[i] = True
-
-            # Remove dominated points
-            pot_idx = pot_idx[nd_point_mask]
-            ypop = ypop[nd_point_mask]
-            i = np.sum(nd_point_mask[:i]) + 1
-
-        return xpop[pot_idx, :], ypop
+        if len(x_nd) == 0:
+            x_nd = np.empty((0, x.shape[1]))
+            obj_nd = np.empty((0, obj.shape[1]))
+
+        return update_front(x_nd, obj_nd, x, obj, self.archive_size)
 
     def tournament(self, old_gen, fitness):
         """
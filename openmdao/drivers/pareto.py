@@ -0,0 +1,199 @@
+"""
+Vectorized maintenance of a front of non-dominated points for multi-objective drivers.
+
+All objectives are minimized.  A point dominates another if it is no worse in every objective
+and better in at least one.
+"""
+import numpy as np
+
+
+# maximum number of entries in the comparison arrays of one block of points
+_MAX_BLOCK_ENTRIES = 1 << 22
+
+
+def dominated_mask(obj, others):
+    """
+    Return a mask that is True for each point dominated by any of the other points.
+
+    Parameters
+    ----------
+    obj : ndarray
+        Objective values of the points to check, one point per row.
+    others : ndarray
+        Objective values of the points they are compared against, one point per row.
+
+    Returns
+    -------
+    ndarray of bool
+        True for each row of obj that is dominated by a row of others.
+    """
+    mask = np.zeros(len(obj), dtype=bool)
+    if len(obj) == 0 or len(others) == 0:
+        return mask
+
+    # compare a block of the other points to all points at a time to bound the memory.
+    block = max(1, _MAX_BLOCK_ENTRIES // obj.size)
+    for start in range(0, len(others), block):
+        other = others[start:start + block, np.newaxis, :]
+        mask |= np.any(np.all(other <= obj, axis=2) & np.any(other < obj, axis=2), axis=0)
+
+    return mask
+
+
+def _duplicate_mask(obj, others=None):
+    """
+    Return a mask that is True for each point that is a duplicate of an earlier or other point.
+
+    Parameters
+    ----------
+    obj : ndarray
+        Objective values of the points to check, one point per row.
+    others : ndarray or None
+        If given, points of obj equal to one of these are also duplicates.
+
+    Returns
+    -------
+    ndarray of bool
+        True for each row of obj that isn't the first occurrence of its values.
+    """
+    mask = np.ones(len(obj), dtype=bool)
+    if len(obj) > 0:
+        _, first = np.unique(obj, axis=0, return_index=True)
+        mask[first] = False
+
+    if others is not None and len(others) > 0 and len(obj) > 0:
+        known = {row.tobytes() for row in np.ascontiguousarray(others)}
+        mask |= [row.tobytes() in known for row in np.ascontiguousarray(obj)]
+
+    return mask
+
+
+def nondominated_mask(obj):
+    """
+    Return a mask that is True for each point that isn't dominated by another point.
+
+    Of a set of points with identical objective values, only the first one is kept.
+
+    Parameters
+    ----------
+    obj : ndarray
+        Objective values, one point per row.
+
+    Returns
+    -------
+    ndarray of bool
+        True for each non-dominated row of obj.
+    """
+    return ~(dominated_mask(obj, obj) | _duplicate_mask(obj))
+
+
+def crowding_distance(obj):
+    """
+    Return the crowding distance of each point of a front.
+
+    The crowding distance is the sum over the objectives of the distance between the two
+    neighbors of a point, scaled by the range of the objective.  The points at the ends of the
+    front have an infinite distance.
+
+    Parameters
+    ----------
+    obj : ndarray
+        Objective values, one point per row.
+
+    Returns
+    -------
+    ndarray
+        Crowding distance of each point.
+    """
+    npts = obj.shape[0]
+    if npts < 3:
+        return np.full(npts, np.inf)
+
+    order = np.argsort(obj, axis=0, kind='stable')
+    sorted_obj = np.take_along_axis(obj, order, axis=0)
+
+    span = sorted_obj[-1] - sorted_obj[0]
+    span[span == 0.] = 1.
+
+    with np.errstate(invalid='ignore'):
+        gaps = np.nan_to_num((sorted_obj[2:] - sorted_obj[:-2]) / span)
+
+    dist = np.zeros(npts)
+    np.add.at(dist, order[1:-1].ravel(), gaps.ravel())
+    dist[order[0]] = np.inf
+    dist[order[-1]] = np.inf
+
+    return dist
+
+
+def truncate_front(x, obj, max_size):
+    """
+    Remove the most crowded points from a front until it has at most max_size points.
+
+    Points are removed one at a time, and the crowding distances are updated after each removal,
+    so the points that are kept stay spread along the front.
+
+    Parameters
+    ----------
+    x : ndarray
+        Design points of the front, one point per row.
+    obj : ndarray
+        Objective values of the front, one point per row.
+    max_size : int
+        Maximum number of points to keep.
+
+    Returns
+    -------
+    ndarray
+        Design points that were kept.
+    ndarray
+        Objective values of the points that were kept.
+    """
+    keep = np.arange(len(obj))
+    while len(keep) > max_size:
+        keep = np.delete(keep, np.argmin(crowding_distance(obj[keep])))
+
+    return x[keep], obj[keep]
+
+
+def update_front(x_nd, obj_nd, x, obj, max_size=0):
+    """
+    Merge new points into a front of non-dominated points.
+
+    The new points are only compared with each other and with the points of the front, so the
+    points of the front are never compared with each other again.  The points of the front that
+    are kept come first, followed by the new non-dominated points, both in their original order.
+    A new point equal to a point of the front is dropped.
+
+    Parameters
+    ----------
+    x_nd : ndarray
+        Design points of the front, one point per row.
+    obj_nd : ndarray
+        Objective values of the front, one point per row.
+    x : ndarray
+        New design points, one point per row.
+    obj : ndarray
+        Objective values of the new points, one point per row.
+    max_size : int
+        If greater than zero, the most crowded points are removed from the merged front until
+        it has at most this many points.
+
+    Returns
+    -------
+    ndarray
+        Design points of the merged front.
+    ndarray
+        Objective values of the merged front.
+    """
+    new = ~(dominated_mask(obj, obj) | dominated_mask(obj, obj_nd) |
+            _duplicate_mask(obj, obj_nd))
+    old = ~dominated_mask(obj_nd, obj[new])
+
+    x_nd = np.concatenate((x_nd[old], x[new]), axis=0)
+    obj_nd = np.concatenate((obj_nd[old], obj[new]), axis=0)
+
+    if 0 < max_size < len(obj_nd):
+        x_nd, obj_nd = truncate_front(x_nd, obj_nd, max_size)
+
+    return x_nd, obj_nd
@@ -3,6 +3,7 @@ OpenMDAO Wrapper for the scipy.optimize.minimize family of local optimizers.
 """
 
 import sys
+from collections import OrderedDict
 from packaging.version import Version
 
 import numpy as np
@@ -39,6 +40,9 @@ if Version(scipy_version) >= Version("1.4"):
     _constraint_grad_optimizers.add('differential_evolution')
 
 _eq_constraint_optimizers = {'SLSQP', 'trust-constr'}
+
+# Optimizers that take all equality and all inequality constraints as two vector functions
+_vector_constraint_optimizers = {'SLSQP'}
 _global_optimizers = {'differential_evolution', 'basinhopping'}
 if Version(scipy_version) >= Version("1.2"):  # Only available in newer versions
     _global_optimizers |= {'shgo', 'dual_annealing'}
@@ -60,6 +64,9 @@ if Version(scipy_version) >= Version("1.4"):
     _supports_new_style.add('differential_evolution')
 _use_new_style = True  # Recommended to set to True
 
+# Number of design points whose model evaluations are kept by the driver
+_EVAL_CACHE_SIZE = 8
+
 CITATIONS = """
 @article{Hwang_maud_2018
  author = {Hwang, John T. and Martins, Joaquim R.R.A.},
@@ -107,13 +114,18 @@ class ScipyOptimizeDriver(Driver):
         Dictionary of solver-specific options. See the scipy.optimize.minimize documentation.
     _check_jac : bool
         Used internally to control when to perform singular checks on computed total derivs.
-    _con_cache : dict
-        Cached result of constraint evaluations because scipy asks for them in a separate function.
+    _eval_cache : OrderedDict
+        Objective value, constraint values and total derivatives keyed on the design point,
+        least recently used first.  scipy asks for them in separate functions, in any order.
+    _model_key : bytes or None
+        Key of the design point at which the model was last run.
+    _cache_hits : int
+        Number of callbacks at design points where the model had already been run.
     _con_idx : dict
         Used for constraint bookkeeping in the presence of 2-sided constraints.
-    _grad_cache : {}
-        Cached result of nonlinear constraint derivatives because scipy asks for them in a separate
-        function.
+    _con_groups : dict
+        Name, indices, signs and bounds of the constraints that make up the vector valued
+        'eq' and 'ineq' constraint functions.
     _exc_info : 3 item tuple
         Storage for exception and traceback information.
     _obj_and_nlcons : list
@@ -152,9 +164,11 @@ class ScipyOptimizeDriver(Driver):
         self.opt_settings = {}
 
         self.result = None
-        self._grad_cache = None
-        self._con_cache = None
+        self._eval_cache = OrderedDict()
+        self._model_key = None
+        self._cache_hits = 0
         self._con_idx = {}
+        self._con_groups = {}
         self._obj_and_nlcons = None
         self._dvlist = None
         self._lincongrad_cache = None
@@ -284,6 +298,9 @@ class ScipyOptimizeDriver(Driver):
         self.iter_count = 0
         self._total_jac = None
         self._desvar_array_cache = None
+        self._eval_cache = OrderedDict()
+        self._model_key = None
+        self._cache_hits = 0
 
         self._check_for_missing_objective()
         self._check_for_invalid_desvar_values()
@@ -294,7 +311,6 @@ class ScipyOptimizeDriver(Driver):
                 model.run_solve_nonlinear()
             self.iter_count += 1
 
-        self._con_cache = self.get_constraint_values()
         desvar_vals = self.get_design_var_values()
         self._dvlist = list(self._designvars)
 
@@ -363,6 +379,7 @@ class ScipyOptimizeDriver(Driver):
         lin_i = 0  # counter for linear constraint jacobian
         lincons = []  # list of linear constraints
         self._obj_and_nlcons = list(self._objs)
+        self._con_groups = {'eq': [], 'ineq': []}
 
         if opt in _constraint_optimizers:
             # get list of linear constraints and precalculate gradients for them (if any)
@@ -415,25 +432,28 @@ class ScipyOptimizeDriver(Driver):
 
                     if linear:
                         # LinearConstraint
-                        con = LinearConstraint(A=lincongrad[self._con_idx[name]],
-                                               lb=lower, ub=upper, keep_feasible=True)
+                        idx = self._con_idx[name]
+                        con = LinearConstraint(A=lincongrad[idx:idx + size],
+                                               lb=lb, ub=ub, keep_feasible=True)
                     else:
                         # NonlinearConstraint
-                        # Loop over every index separately,
-                        # because scipy calls each constraint by index.
-                        for j in range(size):
-                            # TODO add option for Hessian
-                            # Double-sided constraints are accepted by the algorithm
-                            args = [name, False, j]
-                            con = NonlinearConstraint(
-                                fun=signature_extender(
-                                    WeakMethodWrapper(self, '_con_val_func'), args),
-                                lb=lb, ub=ub,
-                                jac=signature_extender(
-                                    WeakMethodWrapper(self, '_congradfunc'), args)
-                            )
+                        # TODO add option for Hessian
+                        # Double-sided constraints are accepted by the algorithm
+                        args = [name]
+                        con = NonlinearConstraint(
+                            fun=signature_extender(
+                                WeakMethodWrapper(self, '_con_val_func'), args),
+                            lb=lb, ub=ub,
+                            jac=signature_extender(
+                                WeakMethodWrapper(self, '_con_val_gradfunc'), args)
+                        )
 
                     constraints.append(con)
+
+                elif opt in _vector_constraint_optimizers:
+                    # All constraints of a type are combined into one vector function.
+                    self._add_to_con_groups(name, size, lower, upper, equals)
+
                 else:
                     # Type of constraints is list of dict
 
@@ -469,6 +489,15 @@ class ScipyOptimizeDriver(Driver):
                             dcon_dict['args'] = [name, True, j]
                             constraints.append(dcon_dict)
 
+            for con_type, group in self._con_groups.items():
+                if group:
+                    con_dict = {'type': con_type,
+                                'fun': WeakMethodWrapper(self, '_vec_confunc'),
+                                'args': [con_type]}
+                    if opt in _constraint_grad_optimizers:
+                        con_dict['jac'] = WeakMethodWrapper(self, '_vec_congradfunc')
+                    constraints.append(con_dict)
+
         # Provide gradients for optimizers that support it
         if opt in _gradient_optimizers:
             jac = self._gradfunc
@@ -585,6 +614,16 @@ class ScipyOptimizeDriver(Driver):
         if self._exc_info is not None:
             self._reraise()
 
+        # The last point evaluated by the optimizer may have been taken from the cache, or may not
+        # be the optimum, so make sure the model is left at the optimum.
+        x_opt = getattr(result, 'x', None)
+        if x_opt is not None and np.size(x_opt) == np.size(x_init):
+            x_opt = np.array(x_opt, dtype=float).ravel()
+            if MPI:
+                model.comm.Bcast(x_opt, root=0)
+            if self._model_key != x_opt.tobytes():
+                self._run_point(x_opt, x_opt.tobytes())
+
         self.result = result
 
         if hasattr(result, 'success'):
@@ -608,6 +647,69 @@ class ScipyOptimizeDriver(Driver):
 
         return self.fail
 
+    def _get_run_stats(self):
+        """
+        Return driver specific statistics of the last run to be saved in opt_result.
+
+        Returns
+        -------
+        dict
+            Number of callbacks at design points where the model had already been run.
+        """
+        return {'cache_hits': self._cache_hits}
+
+    def _add_to_con_groups(self, name, size, lower, upper, equals):
+        """
+        Add the rows of a constraint to the vector valued 'eq' or 'ineq' constraint function.
+
+        The rows are in the same order as the constraints scipy would get if each index of each
+        constraint was given as a separate constraint.
+
+        Parameters
+        ----------
+        name : str
+            Name of the constraint.
+        size : int
+            Size of the constraint.
+        lower : float or ndarray
+            Lower bound of the constraint.
+        upper : float or ndarray
+            Upper bound of the constraint.
+        equals : float, ndarray or None
+            Value of an equality constraint.
+        """
+        if equals is not None:
+            self._con_groups['eq'].append((name, np.arange(size), np.ones(size),
+                                           np.broadcast_to(equals, size).astype(float)))
+            return
+
+        lower = np.broadcast_to(lower, size)
+        upper = np.broadcast_to(upper, size)
+
+        # Note, scipy defines constraints to be satisfied when positive,
+        # which is the opposite of OpenMDAO.
+        rows = []
+        signs = []
+        bounds = []
+        for j in range(size):
+            if lower[j] <= -INF_BOUND:
+                rows.append(j)
+                signs.append(-1.)
+                bounds.append(upper[j])
+            else:
+                rows.append(j)
+                signs.append(1.)
+                bounds.append(lower[j])
+
+                # add extra row if double-sided
+                if upper[j] < INF_BOUND:
+                    rows.append(j)
+                    signs.append(-1.)
+                    bounds.append(upper[j])
+
+        self._con_groups['ineq'].append((name, np.array(rows, dtype=int), np.array(signs),
+                                         np.array(bounds, dtype=float)))
+
     def _update_design_vars(self, x_new):
         """
         Update the design variables in the model.
@@ -623,48 +725,147 @@ class ScipyOptimizeDriver(Driver):
             self.set_design_var(name, x_new[i:i + size])
             i += size
 
-    def _objfunc(self, x_new):
+    def _cache_point(self, key):
         """
-        Evaluate and return the objective function.
+        Add the objective and constraint values of the current model run to the cache.
+
+        Parameters
+        ----------
+        key : bytes
+            Key of the design point at which the model was run.
+
+        Returns
+        -------
+        dict
+            The cache entry of the design point.
+        """
+        for obj in self.get_objective_values().values():
+            f_new = obj
+            break
+
+        entry = self._eval_cache[key] = {'obj': f_new, 'cons': self.get_constraint_values(),
+                                         'grad': None}
+
+        while len(self._eval_cache) > _EVAL_CACHE_SIZE:
+            self._eval_cache.popitem(last=False)
 
-        Model is executed here.
+        return entry
+
+    def _run_point(self, x_new, key):
+        """
+        Run the model at a design point and cache the objective and constraint values.
 
         Parameters
         ----------
         x_new : ndarray
             Array containing input values at new design point.
+        key : bytes
+            Key of the design point.
 
         Returns
         -------
-        float
-            Value of the objective function evaluated at the new design point.
+        dict
+            The cache entry of the design point.
         """
         model = self._problem().model
 
-        try:
+        if self._desvar_array_cache is None:
+            self._desvar_array_cache = np.empty(x_new.shape, dtype=x_new.dtype)
 
-            # Pass in new inputs
-            if MPI:
-                model.comm.Bcast(x_new, root=0)
+        self._desvar_array_cache[:] = x_new
+
+        self._update_design_vars(x_new)
+
+        # if the run fails, the model is at an unknown design point.
+        self._model_key = None
+
+        with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
+            self.iter_count += 1
+            with model._relevance.nonlinear_active('iter'):
+                model.run_solve_nonlinear()
+
+        self._model_key = key
+
+        return self._cache_point(key)
+
+    def _get_point(self, x_new):
+        """
+        Return the cached values at a design point, running the model if they aren't cached.
+
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing input values at new design point.
+
+        Returns
+        -------
+        ndarray
+            The design point, identical on all procs.
+        bytes
+            Key of the design point.
+        dict
+            The cache entry of the design point.
+        """
+        x_new = np.array(x_new, dtype=float)
+
+        # Pass in new inputs
+        if MPI:
+            self._problem().model.comm.Bcast(x_new, root=0)
+
+        key = x_new.tobytes()
+        entry = self._eval_cache.get(key)
+        if entry is None:
+            entry = self._run_point(x_new, key)
+        else:
+            self._eval_cache.move_to_end(key)
+            self._cache_hits += 1
+
+        return x_new, key, entry
+
+    def _get_grad(self, x_new):
+        """
+        Return the total derivatives at a design point, computing them if they aren't cached.
+
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing input values at new design point.
+
+        Returns
+        -------
+        ndarray
+            Total derivatives of the objective and nonlinear constraints.
+        """
+        x_new, key, entry = self._get_point(x_new)
+
+        if entry['grad'] is None:
+            if self._model_key != key:
+                # the model has been run at other points since, so linearize it at this one.
+                entry = self._run_point(x_new, key)
 
-            if self._desvar_array_cache is None:
-                self._desvar_array_cache = np.empty(x_new.shape, dtype=x_new.dtype)
+            entry['grad'] = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
+                                                 return_format=self._total_jac_format)
 
-            self._desvar_array_cache[:] = x_new
+        return entry['grad']
 
-            self._update_design_vars(x_new)
+    def _objfunc(self, x_new):
+        """
+        Evaluate and return the objective function.
 
-            with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
-                self.iter_count += 1
-                with model._relevance.nonlinear_active('iter'):
-                    model.run_solve_nonlinear()
+        Model is executed here, unless it has already been run at this design point.
 
-            # Get the objective function evaluations
-            for obj in self.get_objective_values().values():
-                f_new = obj
-                break
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing input values at new design point.
 
-            self._con_cache = self.get_constraint_values()
+        Returns
+        -------
+        float
+            Value of the objective function evaluated at the new design point.
+        """
+        try:
+            f_new = self._get_point(x_new)[2]['obj']
 
         except Exception as msg:
             if self._exc_info is None:  # only record the first one
@@ -678,7 +879,7 @@ class ScipyOptimizeDriver(Driver):
 
         return f_new
 
-    def _con_val_func(self, x_new, name, dbl, idx):
+    def _con_val_func(self, x_new, name):
         """
         Return the value of the constraint function requested in args.
 
@@ -691,28 +892,107 @@ class ScipyOptimizeDriver(Driver):
             Array containing input values at new design point.
         name : str
             Name of the constraint to be evaluated.
-        dbl : bool
-            True if double sided constraint.
-        idx : float
-            Contains index into the constraint array.
 
         Returns
         -------
-        float
+        ndarray
             Value of the constraint function.
         """
-        if self.options['optimizer'] == 'differential_evolution':
-            # the DE opt will not have called this, so we do it here to update DV/resp values
-            self._objfunc(x_new)
+        if self._exc_info is not None:
+            self._reraise()
+
+        return self._get_point(x_new)[2]['cons'][name]
+
+    def _con_val_gradfunc(self, x_new, name):
+        """
+        Return the gradient of the constraint function requested in args.
+
+        Used for optimizers, which take the bounds of the constraints (e.g. trust-constr)
+
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing input values at new design point.
+        name : str
+            Name of the constraint to be evaluated.
+
+        Returns
+        -------
+        ndarray
+            Gradient of the constraint function wrt all inputs.
+        """
+        if self._exc_info is not None:
+            self._reraise()
+
+        meta = self._cons[name]
+        size = meta['global_size'] if meta['distributed'] else meta['size']
+        idx = self._con_idx[name]
+
+        return self._get_grad(x_new)[idx:idx + size]
+
+    def _vec_confunc(self, x_new, con_type):
+        """
+        Return the values of all the equality or inequality constraints.
+
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing input values at new design point.
+        con_type : str
+            'eq' or 'ineq'.
+
+        Returns
+        -------
+        ndarray
+            Values of the constraint functions.
+        """
+        if self._exc_info is not None:
+            self._reraise()
+
+        cons = self._get_point(x_new)[2]['cons']
+
+        return np.concatenate([signs * (cons[name][rows] - bounds)
+                               for name, rows, signs, bounds in self._con_groups[con_type]])
+
+    def _vec_congradfunc(self, x_new, con_type):
+        """
+        Return the gradients of all the equality or inequality constraints.
+
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing input values at new design point.
+        con_type : str
+            'eq' or 'ineq'.
+
+        Returns
+        -------
+        ndarray
+            Gradients of the constraint functions wrt all inputs, one row per constraint.
+        """
+        if self._exc_info is not None:
+            self._reraise()
+
+        grad = None
+        jac = []
+        for name, rows, signs, bounds in self._con_groups[con_type]:
+            if self._cons[name]['linear']:
+                con_grad = self._lincongrad_cache
+            else:
+                if grad is None:
+                    grad = self._get_grad(x_new)
+                con_grad = grad
 
-        return self._con_cache[name][idx]
+            jac.append(signs[:, np.newaxis] * con_grad[self._con_idx[name] + rows])
+
+        return np.vstack(jac)
 
     def _confunc(self, x_new, name, dbl, idx):
         """
         Return the value of the constraint function requested in args.
 
-        Note that this function is called for each constraint, so the model is only run when the
-        objective is evaluated.
+        Note that this function is called for each constraint, so the model is only run if it
+        hasn't been run at this design point.
 
         Parameters
         ----------
@@ -733,7 +1013,7 @@ class ScipyOptimizeDriver(Driver):
         if self._exc_info is not None:
             self._reraise()
 
-        cons = self._con_cache
+        cons = self._get_point(x_new)[2]['cons']
         meta = self._cons[name]
 
         # Equality constraints
@@ -778,9 +1058,7 @@ class ScipyOptimizeDriver(Driver):
         model = prob.model
 
         try:
-            grad = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
-                                        return_format=self._total_jac_format)
-            self._grad_cache = grad
+            grad = self._get_grad(x_new)
 
             # First time through, check for zero row/col.
             if self._check_jac and self._total_jac is not None:
@@ -806,10 +1084,10 @@ class ScipyOptimizeDriver(Driver):
 
     def _congradfunc(self, x_new, name, dbl, idx):
         """
-        Return the cached gradient of the constraint function.
+        Return the gradient of the constraint function.
 
-        Note, scipy calls the constraints one at a time, so the gradient is cached when the
-        objective gradient is called.
+        Note, scipy calls the constraints one at a time, so the gradients of all constraints are
+        computed once per design point and cached.
 
         Parameters
         ----------
@@ -835,13 +1113,7 @@ class ScipyOptimizeDriver(Driver):
         if meta['linear']:
             grad = self._lincongrad_cache
         else:
-            if self._grad_cache is not None:
-                grad = self._grad_cache
-            else:
-                # _gradfunc has not been called, meaning gradients are not
-                # used for the objective but are needed for the constraints
-                grad = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
-                                            return_format=self._total_jac_format)
+            grad = self._get_grad(x_new)
         grad_idx = self._con_idx[name] + idx
 
         # print("Constraint Gradient returned")
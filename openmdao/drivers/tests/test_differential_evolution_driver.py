@@ -466,6 +466,147 @@ class TestDriverOptionsDifferentialEvolution(unittest.TestCase):
         self.assertEqual(prob.driver.options['Pc'], 0.0123)
 
 
+@use_tempdirs
+@unittest.skipUnless(pyDOE3, "requires 'pyDOE3', install openmdao[doe]")
+class TestFitnessCacheDifferentialEvolution(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['DifferentialEvolutionDriver_seed'] = '11'
+
+    def tearDown(self):
+        del os.environ['DifferentialEvolutionDriver_seed']
+
+    def _run(self, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.DifferentialEvolutionDriver(max_gen=50, **options)
+
+        prob.setup()
+        prob.run_driver()
+
+        return prob
+
+    def test_cache_same_result(self):
+        base = self._run()
+        prob = self._run(fitness_cache=True)
+
+        assert_near_equal(prob['comp.f'], base['comp.f'], 1e-12)
+        assert_near_equal(prob['xI'], base['xI'], 1e-12)
+        self.assertEqual(prob.driver.opt_result['cache_hits'] +
+                         prob.driver.opt_result['cache_misses'],
+                         base.driver.opt_result['obj_calls'])
+
+    def test_cache_tol(self):
+        base = self._run()
+        prob = self._run(fitness_cache=True, fitness_cache_tol=1e-3)
+
+        # near-converged populations map onto a few quantized designs.
+        self.assertGreater(prob.driver.opt_result['cache_hits'], 0)
+        self.assertLess(prob.driver.opt_result['obj_calls'], base.driver.opt_result['obj_calls'])
+        assert_near_equal(prob['comp.f'], 0.397887, 1e-3)
+
+    def test_cache_file(self):
+        first = self._run(fitness_cache=True, fitness_cache_file='de_cache.npz')
+        second = self._run(fitness_cache=True, fitness_cache_file='de_cache.npz')
+
+        # the same seed reproduces the same populations, which are all in the file.
+        assert_near_equal(second['comp.f'], first['comp.f'], 1e-12)
+        self.assertEqual(second.driver.opt_result['cache_misses'], 0)
+
+
+@use_tempdirs
+@unittest.skipUnless(pyDOE3, "requires 'pyDOE3', install openmdao[doe]")
+class TestConcurrentDifferentialEvolution(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['DifferentialEvolutionDriver_seed'] = '11'
+
+    def tearDown(self):
+        del os.environ['DifferentialEvolutionDriver_seed']
+
+    def _run(self, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        options.setdefault('max_gen', 20)
+        prob.driver = om.DifferentialEvolutionDriver(**options)
+        prob.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        return prob
+
+    def test_num_procs(self):
+        base = self._run()
+        prob = self._run(num_procs=2)
+
+        assert_near_equal(prob['comp.f'], base['comp.f'], 1e-12)
+        assert_near_equal(prob['xI'], base['xI'], 1e-12)
+        self.assertEqual(prob.driver.opt_result['obj_calls'], base.driver.opt_result['obj_calls'])
+
+        # only the final case is recorded, because the workers don't record.
+        cases = om.CaseReader('cases.sql').list_cases('driver', out_stream=None)
+        self.assertEqual(len(cases), 1)
+
+    def test_asynchronous(self):
+        prob = self._run(asynchronous=True, max_gen=50)
+
+        # the same number of points is evaluated as by the generational algorithm.
+        self.assertEqual(prob.driver.opt_result['obj_calls'], 20 * 2 * 51)
+        assert_near_equal(prob['comp.f'], 0.397887, 1e-3)
+
+        # a serial run is repeatable.
+        again = self._run(asynchronous=True, max_gen=50)
+        assert_near_equal(again['comp.f'], prob['comp.f'], 1e-12)
+
+    def test_asynchronous_num_procs(self):
+        prob = self._run(asynchronous=True, num_procs=2, max_gen=50)
+
+        # the result depends on the order in which the workers finish.
+        self.assertEqual(prob.driver.opt_result['obj_calls'], 20 * 2 * 51)
+        assert_near_equal(prob['comp.f'], 0.397887, 1e-2)
+
+    def test_asynchronous_fitness_cache(self):
+        prob = self._run(asynchronous=True, fitness_cache=True, fitness_cache_tol=1e-3)
+
+        stats = prob.driver.opt_result
+        self.assertEqual(stats['cache_hits'] + stats['cache_misses'], 20 * 2 * 21)
+        self.assertEqual(stats['obj_calls'], stats['cache_misses'])
+
+    @parameterized.expand(['load_balance', 'asynchronous'])
+    def test_procs_per_model(self, option):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+        prob.model.add_design_var('xI', lower=-5.0, upper=10.0)
+        prob.model.add_design_var('xC', lower=0.0, upper=15.0)
+        prob.model.add_objective('comp.f')
+
+        prob.driver = om.DifferentialEvolutionDriver(procs_per_model=2)
+        prob.driver.options[option] = True
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception), f"DifferentialEvolutionDriver: Option '{option}' "
+                         "requires 'procs_per_model' to be 1.")
+
+
 @unittest.skipUnless(pyDOE3, "requires 'pyDOE3', install openmdao[doe]")
 class TestMultiObjectiveDifferentialEvolution(unittest.TestCase):
 
@@ -912,6 +1053,52 @@ class MPITestDifferentialEvolution(unittest.TestCase):
         prob.setup()
         prob.run_driver()
 
+    def test_load_balance(self):
+        def run(load_balance):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+            model.add_design_var('xI', lower=-5.0, upper=10.0)
+            model.add_design_var('xC', lower=0.0, upper=15.0)
+            model.add_objective('comp.f')
+
+            prob.driver = om.DifferentialEvolutionDriver(max_gen=20, pop_size=15,
+                                                         run_parallel=True,
+                                                         load_balance=load_balance)
+
+            prob.setup()
+            prob.run_driver()
+
+            return prob
+
+        base = run(False)
+        prob = run(True)
+
+        # the same points are evaluated, without the padding cases.
+        assert_near_equal(prob['comp.f'], base['comp.f'], 1e-12)
+        self.assertEqual(prob.driver.opt_result['obj_calls'], 16 * 21)
+
+    def test_asynchronous(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.DifferentialEvolutionDriver(max_gen=50, run_parallel=True,
+                                                     asynchronous=True)
+
+        prob.setup()
+        prob.run_driver()
+
+        self.assertEqual(prob.driver.opt_result['obj_calls'], 40 * 51)
+        assert_near_equal(prob['comp.f'], 0.397887, 1e-2)
+
 
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 @unittest.skipUnless(pyDOE3, "requires 'pyDOE3', install openmdao[doe]")
@@ -8,6 +8,7 @@ import os
 import os.path
 import glob
 import csv
+from itertools import islice
 
 import numpy as np
 
@@ -560,6 +561,70 @@ class TestDOEDriver(unittest.TestCase):
             for name in ('x', 'y', 'f_xy'):
                 self.assertEqual(outputs[name], expected_case[name])
 
+    @unittest.skipUnless(pyDOE3, "requires 'pyDOE3', pip install openmdao[doe]")
+    def test_full_factorial_slice(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', ParaboloidArray(), promotes=['*'])
+        model.add_design_var('xy', lower=np.array([-10., -50.]), upper=np.array([10., 50.]))
+        model.add_objective('f_xy')
+
+        prob.setup()
+        prob.final_setup()
+        design_vars = prob.driver._designvars
+
+        # more cases than are generated at a time.
+        generator = om.FullFactorialGenerator(levels={'xy': 37})
+        cases = [case[0][1] for case in generator(design_vars)]
+
+        self.assertEqual(len(cases), 37 * 37)
+
+        x = np.linspace(-10., 10., 37)
+        y = np.linspace(-50., 50., 37)
+        expected = [np.array([x[i], y[j]]) for i, j in pyDOE3.fullfact([37, 37]).astype(int)]
+        assert_near_equal(cases, expected, 1e-15)
+
+        for start, stop, step in [(0, None, 3), (5, 1200, 7), (1368, None, 1), (-10, None, -2)]:
+            sliced = [case[0][1] for case in generator.generate_slice(design_vars, start=start,
+                                                                      stop=stop, step=step)]
+            assert_near_equal(sliced, expected[start:stop:step], 1e-15)
+
+    @unittest.skipUnless(pyDOE3, "requires 'pyDOE3', pip install openmdao[doe]")
+    def test_full_factorial_large(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', om.ExecComp('y = sum(x)', x=np.zeros(8)), promotes=['*'])
+        model.add_design_var('x', lower=0., upper=19.)
+        model.add_objective('y')
+
+        prob.setup()
+        prob.final_setup()
+        design_vars = prob.driver._designvars
+
+        # 20**8 cases are far too many to build the design matrix, but any slice can be used.
+        generator = om.FullFactorialGenerator(levels=20)
+
+        cases = list(islice(generator(design_vars), 3))
+        assert_near_equal([case[0][1] for case in cases],
+                          [np.zeros(8), np.array([1.] + [0.] * 7), np.array([2.] + [0.] * 7)])
+
+        last = list(generator.generate_slice(design_vars, start=20**8 - 1))
+        self.assertEqual(len(last), 1)
+        assert_near_equal(last[0][0][1], 19. * np.ones(8))
+
+        case = next(generator.generate_slice(design_vars, start=123456789))
+        digits = [(123456789 // 20**i) % 20 for i in range(8)]
+        assert_near_equal(case[0][1], np.array(digits, dtype=float))
+
+    def test_list_slice(self):
+        generator = om.ListGenerator(self.fullfact3)
+        design_vars = {'x': {}, 'y': {}}
+
+        self.assertEqual(list(generator.generate_slice(design_vars, start=1, step=4)),
+                         [self.fullfact3[1], self.fullfact3[5]])
+
     @unittest.skipUnless(pyDOE3, "requires 'pyDOE3', pip install openmdao[doe]")
     def test_full_factorial_factoring(self):
 
@@ -1640,6 +1705,152 @@ class TestDOEDriverListVars(unittest.TestCase):
         self.assertIn('f_xy  59   0', output)
 
 
+class ParaboloidFailing(om.ExplicitComponent):
+
+    def setup(self):
+        self.add_input('x', val=0.0)
+        self.add_input('y', val=0.0)
+
+        self.add_output('f_xy', val=0.0)
+        self.add_discrete_output('n', val=0)
+
+    def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
+        x = inputs['x']
+        y = inputs['y']
+
+        if x > 0.9 and y > 0.9:
+            raise om.AnalysisError('corner case')
+
+        outputs['f_xy'] = (x - 3.0)**2 + x * y + (y + 4.0)**2 - 3.0
+        discrete_outputs['n'] = int(10 * x)
+
+
+@use_tempdirs
+class TestDOEDriverConcurrent(unittest.TestCase):
+
+    def _run(self, filename, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', ParaboloidFailing(), promotes=['*'])
+
+        model.add_design_var('x', lower=0.0, upper=1.0, ref=2.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3), **options)
+        prob.driver.recording_options['includes'] = ['*']
+        prob.driver.add_recorder(om.SqliteRecorder(filename))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader(filename)
+        cases = {}
+        for case in cr.get_cases('driver', recurse=False):
+            if case.success:
+                cases[case.name] = (case.get_val('x')[0], case.get_val('y')[0],
+                                    case.get_val('f_xy')[0], case.get_val('n'), case.success)
+            else:
+                # the outputs of a failed case are left over from the previous case.
+                cases[case.name] = (case.get_val('x')[0], case.get_val('y')[0], case.success)
+
+        return prob, cases
+
+    def test_num_procs(self):
+        _, expected = self._run('serial.sql')
+        _, cases = self._run('pool.sql', num_procs=3)
+
+        # cases may be recorded in a different order, but keep the name of their index.
+        self.assertEqual(cases, expected)
+        self.assertEqual(len(cases), 9)
+        self.assertEqual(sum(case[-1] for case in cases.values()), 8)
+
+    def test_resume(self):
+        _, first = self._run('first.sql')
+
+        prob, cases = self._run('second.sql', resume_from='first.sql')
+
+        # only the failed case is run again, with its original case name.
+        self.assertEqual(list(cases), ['rank0:DOEDriver_FullFactorial|8'])
+        self.assertEqual(cases['rank0:DOEDriver_FullFactorial|8'],
+                         first['rank0:DOEDriver_FullFactorial|8'])
+        self.assertEqual(prob.driver.opt_result['skipped_cases'], 8)
+
+        prob, cases = self._run('third.sql', resume_from=['first.sql'], num_procs=2)
+
+        self.assertEqual(list(cases), ['rank0:DOEDriver_FullFactorial|8'])
+        self.assertEqual(prob.driver.opt_result['skipped_cases'], 8)
+
+    def test_resume_same_file(self):
+        _, first = self._run('cases.sql')
+
+        with self.assertRaises(RuntimeError) as cm:
+            self._run('cases.sql', resume_from='cases.sql')
+
+        self.assertEqual(str(cm.exception),
+                         "DOEDriver: Can't resume from 'cases.sql' because it would be "
+                         "overwritten by a case recorder. Record the resumed run to a different "
+                         "file.")
+
+        # the recorded cases are still there to resume from.
+        prob, cases = self._run('second.sql', resume_from='cases.sql')
+
+        self.assertEqual(list(cases), ['rank0:DOEDriver_FullFactorial|8'])
+        self.assertEqual(prob.driver.opt_result['skipped_cases'], 8)
+
+    def test_resume_same_file_model_recorders(self):
+        self._run('cases.sql')
+
+        def add_to_system(prob):
+            prob.model.comp.add_recorder(om.SqliteRecorder('cases.sql'))
+
+        def add_to_solver(prob):
+            prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+            prob.model.nonlinear_solver.linesearch = om.ArmijoGoldsteinLS()
+            prob.model.nonlinear_solver.linesearch.add_recorder(om.SqliteRecorder('cases.sql'))
+
+        for add_recorder in (add_to_system, add_to_solver):
+            with self.subTest(add_recorder.__name__):
+                prob = om.Problem()
+                prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+                prob.model.add_design_var('x', lower=0.0, upper=1.0)
+                prob.model.add_objective('f_xy')
+                prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3),
+                                           resume_from='cases.sql')
+                prob.driver.add_recorder(om.SqliteRecorder('second.sql'))
+                add_recorder(prob)
+                prob.setup()
+
+                with self.assertRaises(RuntimeError) as cm:
+                    prob.final_setup()
+
+                self.assertEqual(str(cm.exception),
+                                 "DOEDriver: Can't resume from 'cases.sql' because it would be "
+                                 "overwritten by a case recorder. Record the resumed run to a "
+                                 "different file.")
+
+        # the recorded cases are still there to resume from.
+        self.assertEqual(len(om.CaseReader('cases.sql').list_cases('driver', out_stream=None)), 9)
+
+    def test_load_balance_procs_per_model(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        prob.model.add_design_var('x', lower=0.0, upper=1.0)
+        prob.model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3), load_balance=True,
+                                   procs_per_model=2)
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.setup()
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "DOEDriver: Option 'load_balance' requires 'procs_per_model' to be 1.")
+
+
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 @use_tempdirs
 class TestParallelDOE4Proc(unittest.TestCase):
@@ -2190,6 +2401,33 @@ class TestParallelDOE2proc(unittest.TestCase):
 
         self.assertFalse(found_metadata, "No error from SqliteCaseReader for missing metadata file.")
 
+    def test_load_balance(self):
+        from mpi4py import MPI
+
+        prob = om.Problem()
+
+        prob.model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        prob.model.add_design_var('x', lower=0.0, upper=1.0)
+        prob.model.add_design_var('y', lower=0.0, upper=1.0)
+        prob.model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(self.fullfact3, run_parallel=True, load_balance=True)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        # rank 0 hands out the cases, so rank 1 runs all of them.
+        rank = MPI.COMM_WORLD.rank
+        cr = om.CaseReader("cases.sql_%d" % rank, metadata_filename='cases.sql_meta')
+        cases = cr.list_cases('driver', out_stream=None)
+
+        if rank == 0:
+            self.assertEqual(len(cases), 0)
+        else:
+            self.assertEqual(cases, ['rank1:DOEDriver_List|%d' % i for i in range(9)])
+
 
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 @unittest.skipUnless(pyDOE3, "requires 'pyDOE3', pip install openmdao[doe]")
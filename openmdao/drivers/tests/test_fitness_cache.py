@@ -0,0 +1,117 @@
+""" Unit tests for the fitness cache of the genetic algorithm drivers."""
+
+import unittest
+
+import numpy as np
+
+from openmdao.drivers.fitness_cache import FitnessCache
+from openmdao.utils.assert_utils import assert_near_equal, assert_warning
+from openmdao.utils.om_warnings import OpenMDAOWarning
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+@use_tempdirs
+class TestFitnessCache(unittest.TestCase):
+
+    def test_get_put(self):
+        cache = FitnessCache()
+
+        self.assertIsNone(cache.get(np.array([1., 2.])))
+        cache.put(np.array([1., 2.]), 3., True)
+
+        self.assertEqual(cache.get(np.array([1., 2.])), (3., True))
+        self.assertIsNone(cache.get(np.array([1., 2. + 1e-12])))
+
+        self.assertEqual(cache.stats(), {'cache_hits': 1, 'cache_misses': 2,
+                                         'cache_evictions': 0})
+
+    def test_lru(self):
+        cache = FitnessCache(max_entries=2)
+
+        cache.put(np.array([1.]), 1., True)
+        cache.put(np.array([2.]), 2., True)
+
+        # using the first design makes the second one the least recently used.
+        cache.get(np.array([1.]))
+        cache.put(np.array([3.]), 3., True)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertIsNone(cache.get(np.array([2.])))
+        self.assertEqual(cache.get(np.array([1.])), (1., True))
+
+    def test_tol(self):
+        cache = FitnessCache(tol=1e-3)
+
+        cache.put(np.array([1., 2.]), 3., True)
+
+        self.assertEqual(cache.get(np.array([1.0002, 1.9999])), (3., True))
+        self.assertIsNone(cache.get(np.array([1.002, 2.])))
+
+    def test_lookup(self):
+        cache = FitnessCache()
+        cache.put(np.array([0., 0.]), 5., True)
+        cache.put(np.array([1., 0.]), np.inf, False)
+
+        points = np.array([[0., 0.], [2., 2.], [1., 0.], [2., 2.], [3., 3.], [2., 2.]])
+        found, todo, repeats = cache.lookup(points, range(5))
+
+        self.assertEqual(found, [(0, 5., True), (2, np.inf, False)])
+        self.assertEqual(todo, [1, 4])
+        self.assertEqual(repeats, {1: [3], 4: []})
+
+        # the repeated design counts as a hit.
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(cache.misses, 2)
+
+    def test_save_load(self):
+        cache = FitnessCache()
+        cache.put(np.array([1., 2.]), np.array([3., 4.]), True)
+        cache.put(np.array([5., 6.]), np.array([np.inf, np.inf]), False)
+        cache.save('cache.npz')
+
+        new_cache = FitnessCache()
+        new_cache.load('cache.npz', 2)
+
+        self.assertEqual(len(new_cache), 2)
+
+        fitness, success = new_cache.get(np.array([1., 2.]))
+        assert_near_equal(fitness, np.array([3., 4.]))
+        self.assertTrue(success)
+
+        fitness, success = new_cache.get(np.array([5., 6.]))
+        self.assertFalse(success)
+
+    def test_save_load_scalar(self):
+        cache = FitnessCache()
+        cache.put(np.array([1., 2.]), 3., True)
+        cache.save('cache.npz')
+
+        new_cache = FitnessCache()
+        new_cache.load('cache.npz', 2)
+
+        self.assertEqual(new_cache.get(np.array([1., 2.])), (3., True))
+
+    def test_load_missing(self):
+        cache = FitnessCache()
+        cache.load('missing.npz', 2)
+
+        self.assertEqual(len(cache), 0)
+
+    def test_load_wrong_size(self):
+        cache = FitnessCache()
+        cache.put(np.array([1., 2.]), 3., True)
+        cache.save('cache.npz')
+
+        new_cache = FitnessCache()
+        msg = "Ignoring the fitness cache file 'cache.npz' because its designs have 2 " \
+              "variables instead of 3."
+
+        with assert_warning(OpenMDAOWarning, msg):
+            new_cache.load('cache.npz', 3)
+
+        self.assertEqual(len(new_cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -607,6 +607,136 @@ class TestDriverOptionsSimpleGA(unittest.TestCase):
         self.assertEqual(driver.options['Pc'], 0.0123)
 
 
+
+@use_tempdirs
+@unittest.skipUnless(pyDOE3, "requires 'pyDOE3', install openmdao[doe]")
+class TestFitnessCacheSimpleGA(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['SimpleGADriver_seed'] = '11'
+
+    def tearDown(self):
+        del os.environ['SimpleGADriver_seed']
+
+    def _run(self, **options):
+        # selection and crossover draw from the global random state.
+        np.random.seed(1)
+
+        prob = om.Problem()
+        model = prob.model
+
+        indep = om.IndepVarComp()
+        indep.add_output('xC', val=7.5)
+        indep.add_discrete_output('xI', val=0)
+
+        model.add_subsystem('p', indep)
+        model.add_subsystem('comp', BraninDiscrete())
+
+        model.connect('p.xI', 'comp.x0')
+        model.connect('p.xC', 'comp.x1')
+
+        model.add_design_var('p.xI', lower=-5, upper=10)
+        model.add_design_var('p.xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(max_gen=40, pop_size=25, **options)
+        prob.driver.options['bits'] = {'p.xC': 8}
+
+        prob.setup()
+        prob.run_driver()
+
+        return prob
+
+    def test_cache_same_result(self):
+        base = self._run()
+        prob = self._run(fitness_cache=True)
+
+        assert_near_equal(prob['comp.f'], base['comp.f'], 1e-12)
+        self.assertEqual(prob['p.xI'], base['p.xI'])
+
+        # elitism and the discrete design space repeat many designs.
+        self.assertGreater(prob.driver.opt_result['cache_hits'], 0)
+        self.assertLess(prob.driver.opt_result['obj_calls'], base.driver.opt_result['obj_calls'])
+        self.assertNotIn('cache_hits', base.driver.opt_result)
+
+    def test_cache_size(self):
+        prob = self._run(fitness_cache=True, fitness_cache_size=10)
+
+        self.assertEqual(len(prob.driver._fitness_cache), 10)
+        self.assertGreater(prob.driver.opt_result['cache_evictions'], 0)
+
+    def test_cache_file(self):
+        first = self._run(fitness_cache=True, fitness_cache_file='ga_cache.npz')
+        self.assertTrue(os.path.isfile('ga_cache.npz'))
+
+        second = self._run(fitness_cache=True, fitness_cache_file='ga_cache.npz')
+
+        assert_near_equal(second['comp.f'], first['comp.f'], 1e-12)
+        self.assertLess(second.driver.opt_result['obj_calls'],
+                        first.driver.opt_result['obj_calls'])
+
+
+@use_tempdirs
+@unittest.skipUnless(pyDOE3, "requires 'pyDOE3', install openmdao[doe]")
+class TestConcurrentSimpleGA(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['SimpleGADriver_seed'] = '11'
+
+    def tearDown(self):
+        del os.environ['SimpleGADriver_seed']
+
+    def _run(self, **options):
+        np.random.seed(1)
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(max_gen=20, pop_size=25, **options)
+        prob.driver.options['bits'] = {'xC': 8}
+        prob.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        return prob
+
+    def test_num_procs(self):
+        base = self._run()
+        prob = self._run(num_procs=2)
+
+        assert_near_equal(prob['comp.f'], base['comp.f'], 1e-12)
+        self.assertEqual(prob['xI'], base['xI'])
+        self.assertEqual(prob.driver.opt_result['obj_calls'], base.driver.opt_result['obj_calls'])
+
+        # only the final case is recorded, because the workers don't record.
+        cases = om.CaseReader('cases.sql').list_cases('driver', out_stream=None)
+        self.assertEqual(len(cases), 1)
+
+    def test_load_balance_procs_per_model(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+        prob.model.add_design_var('xI', lower=-5.0, upper=10.0)
+        prob.model.add_design_var('xC', lower=0.0, upper=15.0)
+        prob.model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(load_balance=True, procs_per_model=2)
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception), "SimpleGADriver: Option 'load_balance' requires "
+                         "'procs_per_model' to be 1.")
+
+
 class Box(om.ExplicitComponent):
 
     def setup(self):
@@ -761,6 +891,40 @@ class TestMultiObjectiveSimpleGA(unittest.TestCase):
         self.assertTrue(np.all(sorted_obj[:-1, 0] <= sorted_obj[1:, 0]))
         self.assertTrue(np.all(sorted_obj[:-1, 1] >= sorted_obj[1:, 1]))
 
+    def test_pareto_archive_size(self):
+        np.random.seed(11)
+
+        prob = om.Problem()
+
+        indeps = prob.model.add_subsystem('indeps', om.IndepVarComp(), promotes=['*'])
+        indeps.add_output('length', 1.5)
+        indeps.add_output('width', 1.5)
+        indeps.add_output('height', 1.5)
+
+        prob.model.add_subsystem('box', Box(), promotes=['*'])
+
+        prob.driver = om.SimpleGADriver(max_gen=20, compute_pareto=True, pareto_archive_size=8)
+        prob.driver.options['bits'] = {'length': 8, 'width': 8, 'height': 8}
+        prob.driver._randomstate = 11
+
+        prob.model.add_design_var('length', lower=0.1, upper=2.)
+        prob.model.add_design_var('width', lower=0.1, upper=2.)
+        prob.model.add_design_var('height', lower=0.1, upper=2.)
+        prob.model.add_objective('front_area', scaler=-1)  # maximize
+        prob.model.add_objective('top_area', scaler=-1)  # maximize
+        prob.model.add_constraint('volume', upper=1.)
+
+        prob.setup()
+        prob.run_driver()
+
+        nd_obj = prob.driver.obj_nd
+        self.assertEqual(len(nd_obj), 8)
+        self.assertEqual(len(prob.driver.desvar_nd), 8)
+
+        sorted_obj = nd_obj[nd_obj[:, 0].argsort()]
+        self.assertTrue(np.all(sorted_obj[:-1, 0] <= sorted_obj[1:, 0]))
+        self.assertTrue(np.all(sorted_obj[:-1, 1] >= sorted_obj[1:, 1]))
+
 
 @unittest.skipUnless(pyDOE3, "requires 'pyDOE3', install openmdao[doe]")
 class TestConstrainedSimpleGA(unittest.TestCase):
@@ -1097,6 +1261,36 @@ class MPITestSimpleGA(unittest.TestCase):
         assert_near_equal(prob['comp.f'], 0.49399549, 1e-4)
         self.assertTrue(int(prob['p2.xI']) in [3, -3])
 
+    def test_load_balance(self):
+        def run(load_balance):
+            np.random.seed(1)
+
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+            model.add_design_var('xI', lower=-5.0, upper=10.0)
+            model.add_design_var('xC', lower=0.0, upper=15.0)
+            model.add_objective('comp.f')
+
+            prob.driver = om.SimpleGADriver(max_gen=20, pop_size=25, run_parallel=True,
+                                            load_balance=load_balance)
+            prob.driver.options['bits'] = {'xC': 8}
+            prob.driver._randomstate = 1
+
+            prob.setup()
+            prob.run_driver()
+
+            return prob
+
+        base = run(False)
+        prob = run(True)
+
+        # the same points are evaluated, without the padding cases.
+        assert_near_equal(prob['comp.f'], base['comp.f'], 1e-12)
+        self.assertLess(prob.driver.opt_result['obj_calls'], base.driver.opt_result['obj_calls'])
+
     def test_two_branin_parallel_model(self):
         prob = om.Problem()
         model = prob.model
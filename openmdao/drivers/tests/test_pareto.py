@@ -0,0 +1,112 @@
+""" Unit tests for the non-dominated front utilities."""
+
+import unittest
+
+import numpy as np
+
+from openmdao.drivers.pareto import dominated_mask, nondominated_mask, crowding_distance, \
+    truncate_front, update_front
+from openmdao.utils.assert_utils import assert_near_equal
+
+
+def _brute_force_nondominated(obj):
+    keep = []
+    for j, pt in enumerate(obj):
+        dominated = False
+        for i, other in enumerate(obj):
+            if np.all(other <= pt) and (np.any(other < pt) or i < j):
+                if i != j:
+                    dominated = True
+                    break
+        keep.append(not dominated)
+    return np.array(keep)
+
+
+class TestPareto(unittest.TestCase):
+
+    def test_dominated_mask(self):
+        obj = np.array([[1., 2.], [2., 1.], [2., 2.], [1., 2.]])
+
+        mask = dominated_mask(obj, obj)
+
+        # equal points don't dominate each other.
+        self.assertEqual(list(mask), [False, False, True, False])
+
+        self.assertEqual(list(dominated_mask(obj, np.array([[0., 5.]]))), [False] * 4)
+        self.assertEqual(list(dominated_mask(obj, np.empty((0, 2)))), [False] * 4)
+
+    def test_nondominated_mask(self):
+        rng = np.random.default_rng(11)
+
+        for nobj in (2, 3, 4):
+            # integer objectives give many ties and duplicates.
+            obj = rng.integers(0, 6, size=(200, nobj)).astype(float)
+            self.assertEqual(list(nondominated_mask(obj)), list(_brute_force_nondominated(obj)))
+
+    def test_update_front(self):
+        rng = np.random.default_rng(7)
+
+        x_nd = np.empty((0, 3))
+        obj_nd = np.empty((0, 3))
+        x_all = np.empty((0, 3))
+        obj_all = np.empty((0, 3))
+
+        for gen in range(10):
+            x = rng.random((30, 3))
+            obj = np.round(np.column_stack([x[:, 0], x[:, 1], 2. - x[:, 0] - x[:, 1] + x[:, 2]]),
+                           1)
+
+            x_nd, obj_nd = update_front(x_nd, obj_nd, x, obj)
+
+            # same points, in the same order, as filtering everything seen so far.
+            x_all = np.concatenate((x_all, x))
+            obj_all = np.concatenate((obj_all, obj))
+            mask = nondominated_mask(obj_all)
+
+            assert_near_equal(obj_nd, obj_all[mask], 0.)
+            assert_near_equal(x_nd, x_all[mask], 0.)
+
+    def test_crowding_distance(self):
+        obj = np.array([[0., 4.], [1., 2.], [3., 1.], [4., 0.]])
+
+        dist = crowding_distance(obj)
+
+        assert_near_equal(dist, [np.inf, 3. / 4. + 3. / 4., 3. / 4. + 2. / 4., np.inf])
+
+        assert_near_equal(crowding_distance(obj[:2]), [np.inf, np.inf])
+
+    def test_truncate_front(self):
+        t = np.array([0., .1, .2, .21, .22, .5, .8, 1.])
+        obj = np.column_stack([t, 1. - t])
+        x = t[:, np.newaxis]
+
+        x_kept, obj_kept = truncate_front(x, obj, 5)
+
+        # the ends are kept and the crowded points are dropped first.
+        self.assertEqual(list(x_kept[:, 0]), [0., .22, .5, .8, 1.])
+        assert_near_equal(obj_kept, obj[[0, 4, 5, 6, 7]])
+
+    def test_update_front_max_size(self):
+        rng = np.random.default_rng(3)
+
+        x_nd = np.empty((0, 2))
+        obj_nd = np.empty((0, 2))
+
+        for gen in range(5):
+            x = rng.random((50, 2))
+            obj = np.column_stack([x[:, 0], 1. - x[:, 0] + 0.1 * x[:, 1]])
+
+            x_nd, obj_nd = update_front(x_nd, obj_nd, x, obj, max_size=10)
+
+            self.assertLessEqual(len(obj_nd), 10)
+            self.assertTrue(np.all(nondominated_mask(obj_nd)))
+
+        self.assertEqual(len(obj_nd), 10)
+
+        # the extremes of the front survive truncation.
+        self.assertLess(np.min(obj_nd[:, 0]), 0.05)
+        self.assertLess(np.min(obj_nd[:, 1]), 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,6 +12,7 @@ from scipy import __version__ as scipy_version
 ScipyVersion = Version(scipy_version)
 
 import openmdao.api as om
+from openmdao.core.constants import INF_BOUND
 from openmdao.test_suite.components.expl_comp_array import TestExplCompArrayDense, TestExplCompArraySparse, TestExplCompArrayJacVec
 from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.test_suite.components.paraboloid_distributed import DistParab
@@ -2371,5 +2372,144 @@ class TestScipyOptimizeDriver(unittest.TestCase):
         assert_near_equal(y_out, 1.0, tolerance=1.0E-3)
 
 
+@use_tempdirs
+class TestScipyOptimizeDriverEvalCache(unittest.TestCase):
+
+    def _check_unique_points(self, filename):
+        cr = om.CaseReader(filename)
+        cases = cr.get_cases('driver', recurse=False)
+
+        # the first case is the initial run, before the optimizer starts.
+        points = [np.concatenate([np.atleast_1d(val) for val in
+                                  case.get_design_vars(scaled=False).values()])
+                  for case in cases[1:]]
+
+        for prev, point in zip(points[:-1], points[1:]):
+            self.assertFalse(np.array_equal(prev, point),
+                             f"The model was run twice in a row at {point}.")
+
+        return len(cases)
+
+    def test_differential_evolution_one_run_per_point(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('parab', Paraboloid(), promotes=['*'])
+        model.add_subsystem('const', om.ExecComp('c = x + y'), promotes=['*'])
+        model.set_input_defaults('x', 0.)
+        model.set_input_defaults('y', 0.)
+
+        model.add_design_var('x', lower=-50, upper=50)
+        model.add_design_var('y', lower=-50, upper=50)
+        model.add_objective('f_xy')
+        model.add_constraint('c', upper=-15.0)
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='differential_evolution', disp=False)
+        prob.driver.opt_settings['seed'] = 11
+        prob.driver.opt_settings['maxiter'] = 20
+        prob.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        num_cases = self._check_unique_points('cases.sql')
+
+        # the constraint and the objective are evaluated with a single model run, so they
+        # always see the values of the same design point.
+        self.assertEqual(num_cases, prob.driver.iter_count)
+        self.assertGreater(prob.driver.opt_result['cache_hits'], 0)
+
+        assert_near_equal(prob.get_val('x'), -0.5, 1e-4)
+        assert_near_equal(prob.get_val('y'), -14.5, 1e-4)
+        assert_near_equal(prob.get_val('f_xy'), 126.75, 1e-6)
+
+    def test_final_state_matches_result(self):
+        for optimizer in ('shgo', 'differential_evolution', 'dual_annealing', 'SLSQP', 'COBYLA'):
+            with self.subTest(optimizer=optimizer):
+                prob = om.Problem()
+                model = prob.model
+
+                model.add_subsystem('parab', Paraboloid(), promotes=['*'])
+                model.add_subsystem('const', om.ExecComp('c = - x + y'), promotes=['*'])
+                model.set_input_defaults('x', 0.)
+                model.set_input_defaults('y', 0.)
+
+                model.add_design_var('x', lower=-50, upper=50)
+                model.add_design_var('y', lower=-50, upper=50)
+                model.add_objective('f_xy')
+                model.add_constraint('c', upper=-15.0)
+
+                prob.driver = om.ScipyOptimizeDriver(optimizer=optimizer, disp=False)
+                if optimizer in ('differential_evolution', 'dual_annealing'):
+                    prob.driver.opt_settings['seed'] = 11
+                    prob.driver.opt_settings['maxiter'] = 20
+
+                prob.setup()
+                prob.run_driver()
+
+                # the model is left at the optimum found by the optimizer, even if the last
+                # point it evaluated was elsewhere or was taken from the cache.
+                result = prob.driver.result
+                assert_near_equal(prob.get_val('x'), result.x[:1], 1e-15)
+                assert_near_equal(prob.get_val('y'), result.x[1:], 1e-15)
+                assert_near_equal(prob.get_val('f_xy'), result.fun, 1e-12)
+
+    def test_slsqp_vector_constraints(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', om.ExecComp('f = sum((x - 3.)**2)', x=np.zeros(4)),
+                            promotes=['*'])
+        model.add_subsystem('con', om.ExecComp('c = x', x=np.zeros(4), c=np.zeros(4)),
+                            promotes=['*'])
+        model.add_subsystem('lin', om.ExecComp('d = 2. * x', x=np.zeros(4), d=np.zeros(4)),
+                            promotes=['*'])
+
+        model.add_design_var('x', lower=-10., upper=10.)
+        model.add_objective('f')
+        model.add_constraint('c', lower=np.array([-1., 0., -INF_BOUND, 4.]),
+                             upper=np.array([1., INF_BOUND, 2., 5.]))
+        model.add_constraint('d', indices=[1], equals=1., linear=True)
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        prob.driver.add_recorder(om.SqliteRecorder('cases.sql'))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        assert_near_equal(prob.get_val('x'), [1., .5, 2., 4.], 1e-6)
+
+        self._check_unique_points('cases.sql')
+
+    @unittest.skipUnless(ScipyVersion >= Version("1.1"), "scipy >= 1.1 is required.")
+    def test_trust_constr_vector_constraint(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', om.ExecComp('f = sum((x - 3.)**2)', x=np.zeros(3)),
+                            promotes=['*'])
+        model.add_subsystem('con', om.ExecComp('c = x**2', x=np.zeros(3), c=np.zeros(3)),
+                            promotes=['*'])
+        model.add_subsystem('lin', om.ExecComp('d = x', x=np.zeros(3), d=np.zeros(3)),
+                            promotes=['*'])
+
+        model.add_design_var('x', lower=-10., upper=10.)
+        model.add_objective('f')
+
+        # every index of the constraints is enforced, not just the last one.
+        model.add_constraint('c', upper=np.array([1., 4., 16.]))
+        model.add_constraint('d', upper=np.array([2., 10., 2.5]), linear=True)
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='trust-constr', tol=1e-8, disp=False)
+
+        prob.setup()
+        prob.set_val('x', [.5, .5, .5])
+        prob.run_driver()
+
+        assert_near_equal(prob.get_val('x'), [1., 2., 2.5], 1e-4)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -44,7 +44,7 @@ _allowed_declare_partials_args = {
 
 _allowed_declare_coloring_args = {
     'wrt', 'method', 'form', 'step', 'per_instance', 'num_full_jacs', 'tol', 'orders',
-    'perturb_size', 'min_improve_pct', 'show_summary', 'show_sparsity'
+    'perturb_size', 'min_improve_pct', 'show_summary', 'show_sparsity', 'color_order'
 }
 
 
@@ -160,6 +160,22 @@ def _get_all_requesters(problem):
                 yield nl.linesearch
 
 
+def _clear_all_recorders(problem):
+    """
+    Remove all recorders from a problem without shutting them down.
+
+    This is used in worker processes forked from the process that owns the recorders, so that
+    the workers don't write to the same files.
+
+    Parameters
+    ----------
+    problem : Problem
+        The problem.
+    """
+    for req in _get_all_requesters(problem):
+        req._rec_mgr = RecordingManager()
+
+
 def _get_all_viewer_data_recorders(problem):
     for req in _get_all_requesters(problem):
         for r in req._rec_mgr._recorders:
@@ -442,8 +442,12 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 0",
             "    Subsystem : root",
             "        assembled_jac_type: csc",
+            "        num_fd_procs: 1",
             "        auto_order: False",
+            "        fuse_exec_comps: False",
+            "        jax_compile: False",
             "    Subsystem : p1",
+            "        num_fd_procs: 1",
             "        distributed: False",
             "        run_root_only: False",
             "        always_opt: False",
@@ -460,6 +464,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "        res_ref: None",
             "        tags: None",
             "    Subsystem : p2",
+            "        num_fd_procs: 1",
             "        distributed: False",
             "        run_root_only: False",
             "        always_opt: False",
@@ -476,10 +481,12 @@ class TestSqliteRecorder(unittest.TestCase):
             "        res_ref: None",
             "        tags: None",
             "    Subsystem : comp",
+            "        num_fd_procs: 1",
             "        distributed: False",
             "        run_root_only: False",
             "        always_opt: False",
             "    Subsystem : con",
+            "        num_fd_procs: 1",
             "        distributed: False",
             "        run_root_only: False",
             "        always_opt: False",
@@ -488,6 +495,8 @@ class TestSqliteRecorder(unittest.TestCase):
             "        shape: None",
             "        shape_by_conn: False",
             "        do_coloring: False",
+            "        vectorized_approx: False",
+            "        use_jax: False",
             ""
         ]
 
@@ -504,7 +513,10 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 1",
             "    Subsystem : root",
             "        assembled_jac_type: dense",
+            "        num_fd_procs: 1",
             "        auto_order: False",
+            "        fuse_exec_comps: False",
+            "        jax_compile: False",
             ""
         ]
 
@@ -544,8 +556,12 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 0",
             "    Subsystem : root",
             "        assembled_jac_type: csc",
+            "        num_fd_procs: 1",
             "        auto_order: False",
+            "        fuse_exec_comps: False",
+            "        jax_compile: False",
             "    Subsystem : p1",
+            "        num_fd_procs: 1",
             "        distributed: False",
             "        run_root_only: False",
             "        always_opt: False",
@@ -562,6 +578,7 @@ class TestSqliteRecorder(unittest.TestCase):
             "        res_ref: None",
             "        tags: None",
             "    Subsystem : p2",
+            "        num_fd_procs: 1",
             "        distributed: False",
             "        run_root_only: False",
             "        always_opt: False",
@@ -578,10 +595,12 @@ class TestSqliteRecorder(unittest.TestCase):
             "        res_ref: None",
             "        tags: None",
             "    Subsystem : comp",
+            "        num_fd_procs: 1",
             "        distributed: False",
             "        run_root_only: False",
             "        always_opt: False",
             "    Subsystem : con",
+            "        num_fd_procs: 1",
             "        distributed: False",
             "        run_root_only: False",
             "        always_opt: False",
@@ -590,6 +609,8 @@ class TestSqliteRecorder(unittest.TestCase):
             "        shape: None",
             "        shape_by_conn: False",
             "        do_coloring: False",
+            "        vectorized_approx: False",
+            "        use_jax: False",
             ""
         ]
 
@@ -606,7 +627,10 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 1",
             "    Subsystem : root",
             "        assembled_jac_type: dense",
+            "        num_fd_procs: 1",
             "        auto_order: False",
+            "        fuse_exec_comps: False",
+            "        jax_compile: False",
             ""
         ]
 
@@ -2944,7 +2968,10 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['type'], 'doe')
         self.assertEqual(metadata['options'], {'debug_print': [], 'generator': 'UniformGenerator',
                                                'invalid_desvar_behavior': 'warn',
-                                               'run_parallel': False, 'procs_per_model': 1})
+                                               'cache_linear_solutions': False,
+                                               'run_parallel': False, 'procs_per_model': 1,
+                                               'load_balance': False, 'num_procs': 1,
+                                               'resume_from': None})
 
         # Optimization
         driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-3)
@@ -2964,6 +2991,7 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['options'], {"debug_print": [], "optimizer": "SLSQP",
                                                "tol": 1e-03, "maxiter": 200, "disp": True,
                                                "invalid_desvar_behavior": "warn",
+                                               "cache_linear_solutions": False,
                                                 'singular_jac_behavior': 'warn', 'singular_jac_tol': 1e-16})
         self.assertEqual(metadata['opt_settings'], {"maxiter": 1000})
 
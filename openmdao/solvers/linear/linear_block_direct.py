@@ -0,0 +1,195 @@
+"""Define the LinearBlockDirect class."""
+
+import numpy as np
+import scipy.sparse.linalg
+from scipy.sparse import coo_matrix, csc_matrix
+
+from openmdao.core.component import Component
+from openmdao.solvers.solver import LinearSolver
+from openmdao.solvers.linear.direct import format_singular_error
+
+
+class LinearBlockDirect(LinearSolver):
+    """
+    Block Jacobi solver that uses cached LU factorizations of the diagonal blocks.
+
+    The diagonal blocks of the owning system's assembled jacobian, one per subsystem or one per
+    local component, are factored once in _linearize. Each solve is then a single sparse
+    triangular solve with no recursive calls to the _solve_linear methods of the subsystems.
+    This is intended primarily to be used as a preconditioner for ScipyKrylov or PETScKrylov.
+
+    Parameters
+    ----------
+    **kwargs : dict
+        Options dictionary.
+
+    Attributes
+    ----------
+    _lu : SuperLU or None
+        LU factorization of the block diagonal portion of the jacobian.
+    _block_ranges : list of tuple or None
+        (start, end) ranges of the diagonal blocks in the system's output vector.
+    """
+
+    SOLVER = 'LN: LNBD'
+
+    def __init__(self, **kwargs):
+        """
+        Declare the solver options.
+        """
+        super().__init__(**kwargs)
+        self._lu = None
+        self._block_ranges = None
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('block_level', default='subsystem',
+                             values=('subsystem', 'component'),
+                             desc="If 'subsystem', each direct subsystem of the owning system "
+                                  "forms a diagonal block. If 'component', each local component "
+                                  "below the owning system forms a diagonal block.")
+
+        # this solver does not iterate
+        self.options.undeclare("maxiter")
+        self.options.undeclare("err_on_non_converge")
+
+        self.options.undeclare("atol")
+        self.options.undeclare("rtol")
+
+        # The diagonal blocks are taken from an assembled jacobian.
+        self.options['assemble_jac'] = True
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+
+        if not self.options['assemble_jac']:
+            raise RuntimeError(f"{self.msginfo}: 'assemble_jac' must be True because the "
+                               "diagonal blocks are taken from an assembled jacobian.")
+
+        if self._system().comm.size > 1:
+            raise RuntimeError(f"{self.msginfo}: {type(self).__name__} is not supported when "
+                               "running under MPI if comm.size > 1.")
+
+        self._lu = None
+        self._block_ranges = None
+
+    def _linearize_children(self):
+        """
+        Return a flag that is True when we need to call linearize on our subsystems' solvers.
+
+        Returns
+        -------
+        boolean
+            Flag for indicating child linearization.
+        """
+        return False
+
+    def use_relevance(self):
+        """
+        Return True if relevance should be active.
+
+        Returns
+        -------
+        bool
+            True if relevance should be active.
+        """
+        return False
+
+    def _get_block_ranges(self):
+        """
+        Return the (start, end) ranges of the diagonal blocks in the system's output vector.
+
+        Returns
+        -------
+        list of tuple
+            Ranges of the diagonal blocks.
+        """
+        system = self._system()
+        out_ranges = self._assembled_jac._out_ranges
+
+        if self.options['block_level'] == 'component':
+            subs = system.system_iter(recurse=True, include_self=True, typ=Component)
+        else:
+            subs = system._subsystems_myproc if system._subsystems_myproc else [system]
+
+        ranges = []
+        for subsys in subs:
+            names = list(subsys._var_abs2meta['output'])
+            if names:
+                start = out_ranges[names[0]][0]
+                end = out_ranges[names[-1]][1]
+                if end > start:
+                    ranges.append((start, end))
+
+        return ranges
+
+    def _linearize(self):
+        """
+        Perform factorization of the diagonal blocks.
+        """
+        system = self._system()
+        matrix = self._assembled_jac._int_mtx._matrix
+
+        if self._block_ranges is None:
+            self._block_ranges = self._get_block_ranges()
+
+        # Keep only the entries that fall inside of a diagonal block.  Since the blocks are
+        # decoupled, a single sparse LU of the result is equivalent to factoring each block
+        # separately, and no fill-in can occur between blocks.
+        block_ids = np.full(matrix.shape[0], -1, dtype=int)
+        for i, (start, end) in enumerate(self._block_ranges):
+            block_ids[start:end] = i
+
+        coo = coo_matrix(matrix)
+        mask = block_ids[coo.row] == block_ids[coo.col]
+        block_diag = csc_matrix((coo.data[mask], (coo.row[mask], coo.col[mask])),
+                                shape=coo.shape)
+
+        try:
+            self._lu = scipy.sparse.linalg.splu(block_diag)
+        except RuntimeError:
+            raise RuntimeError(format_singular_error(system, block_diag))
+
+    def solve(self, mode, rel_systems=None):
+        """
+        Run the solver.
+
+        Parameters
+        ----------
+        mode : str
+            'fwd' or 'rev'.
+        rel_systems : set of str
+            Names of systems relevant to the current solve.  Deprecated.
+        """
+        system = self._system()
+
+        d_residuals = system._dresiduals
+        d_outputs = system._doutputs
+
+        # assign x and b vectors based on mode
+        if mode == 'fwd':
+            x_vec = d_outputs.asarray()
+            b_vec = d_residuals.asarray()
+            trans_splu = 'N'
+        else:  # rev
+            x_vec = d_residuals.asarray()
+            b_vec = d_outputs.asarray()
+            trans_splu = 'T'
+
+        # AssembledJacobians are unscaled.
+        with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+            x_vec[:] = self._lu.solve(b_vec, trans_splu)
@@ -3,7 +3,7 @@
 from packaging.version import Version
 import numpy as np
 import scipy
-from scipy.sparse.linalg import LinearOperator, gmres
+from scipy.sparse.linalg import LinearOperator, gmres, lgmres
 from openmdao.solvers.linear.linear_rhs_checker import LinearRHSChecker
 
 from openmdao.solvers.solver import LinearSolver
@@ -14,6 +14,7 @@ _SOLVER_TYPES = {
     # 'cg': cg,
     # 'cgs': cgs,
     'gmres': gmres,
+    'lgmres': lgmres,
 }
 
 
@@ -32,6 +33,11 @@ class ScipyKrylov(LinearSolver):
         Preconditioner for linear solve. Default is None for no preconditioner.
     _lin_rhs_checker : LinearRHSChecker or None
         Object for checking the right-hand side of the linear solve.
+    _outer_v : dict
+        LGMRES augmentation vectors, keyed by mode, that are kept between solves when the
+        'recycle_subspace' option is True.
+    _x_prev : ndarray or None
+        Solution from the previous lgmres iteration.  Used by the lgmres monitor.
     """
 
     SOLVER = 'LN: SCIPY'
@@ -44,6 +50,8 @@ class ScipyKrylov(LinearSolver):
 
         self.precon = None
         self._lin_rhs_checker = None
+        self._outer_v = {'fwd': [], 'rev': []}
+        self._x_prev = None
 
     def _assembled_jac_solver_iter(self):
         """
@@ -67,7 +75,19 @@ class ScipyKrylov(LinearSolver):
         self.options.declare('restart', default=20, types=int,
                              desc='Number of iterations between restarts. Larger values increase '
                                   'iteration cost, but may be necessary for convergence. This '
-                                  'option applies only to gmres.')
+                                  'option applies only to gmres and lgmres.')
+
+        self.options.declare('outer_k', default=3, types=int, lower=1,
+                             desc='Number of augmentation vectors carried between restarts of '
+                                  'the inner GMRES iteration. This option applies only to '
+                                  'lgmres.')
+
+        self.options.declare('recycle_subspace', default=False, types=bool,
+                             desc='If True, keep the lgmres augmentation vectors between solves, '
+                                  'including solves with different right-hand sides and solves '
+                                  'after the system has been relinearized, so that each solve '
+                                  'starts from a subspace enriched by the previous ones. This '
+                                  'option applies only to lgmres.')
 
         self.options.declare('rhs_checking', types=(bool, dict),
                              default=False,
@@ -99,6 +119,8 @@ class ScipyKrylov(LinearSolver):
         self._lin_rhs_checker = LinearRHSChecker.create(self._system(),
                                                         self.options['rhs_checking'])
 
+        self._outer_v = {'fwd': [], 'rev': []}
+
     def _set_solver_print(self, level=2, type_='all'):
         """
         Control printing for solvers and subsolvers in the model.
@@ -139,6 +161,11 @@ class ScipyKrylov(LinearSolver):
         if self._lin_rhs_checker is not None:
             self._lin_rhs_checker.clear()
 
+        # The operator has changed, so any stored products A*v of the recycled vectors are stale.
+        # Keep the vectors themselves and let lgmres recompute the products as needed.
+        for mode, outer_v in self._outer_v.items():
+            self._outer_v[mode] = [(v, None) for v, _ in outer_v]
+
     def _mat_vec(self, in_arr):
         """
         Compute matrix-vector product.
@@ -170,7 +197,7 @@ class ScipyKrylov(LinearSolver):
         # print('in', in_arr)
         # print('out', b_vec.asarray())
 
-        return b_vec.asarray()
+        return b_vec.asarray(copy=True)
 
     def _monitor(self, res):
         """
@@ -191,6 +218,25 @@ class ScipyKrylov(LinearSolver):
         self._mpi_print(self._iter_count, norm, norm / self._norm0)
         self._iter_count += 1
 
+    def _monitor_lgmres(self, x):
+        """
+        Print the norm of the solution update and iteration number (callback from SciPy lgmres).
+
+        lgmres only passes the current solution.  Computing the residual from it would take an
+        extra operator application that overwrites the linear vectors mid-solve, so the change
+        in the solution since the previous iteration is reported instead.
+
+        Parameters
+        ----------
+        x : ndarray
+            the current solution vector.
+        """
+        if self.options['iprint'] == 2:
+            self._monitor(x - self._x_prev)
+            self._x_prev = x.copy()
+        else:
+            self._iter_count += 1
+
     def solve(self, mode, rel_systems=None):
         """
         Run the solver.
@@ -206,7 +252,7 @@ class ScipyKrylov(LinearSolver):
 
         system = self._system()
         solver = _SOLVER_TYPES[self.options['solver']]
-        if solver is gmres:
+        if solver is gmres or solver is lgmres:
             restart = self.options['restart']
 
         maxiter = self.options['maxiter']
@@ -249,6 +295,26 @@ class ScipyKrylov(LinearSolver):
                 x, info = solver(linop, b_vec.asarray(True), M=M, restart=restart,
                                  x0=x_vec_combined, maxiter=maxiter, atol=atol, rtol=rtol,
                                  callback=self._monitor, callback_type='legacy')
+        elif solver is lgmres:
+            b = b_vec.asarray(True)
+            if self.options['iprint'] == 2:
+                self._x_prev = x_vec_combined.copy()
+            if self.options['recycle_subspace'] and not system.under_complex_step:
+                outer_v = self._outer_v[mode]
+            else:
+                outer_v = None
+
+            if Version(Version(scipy.__version__).base_version) < Version("1.12"):
+                x, info = solver(linop, b, M=M, x0=x_vec_combined, maxiter=maxiter,
+                                 tol=rtol, atol=atol, callback=self._monitor_lgmres,
+                                 inner_m=restart, outer_k=self.options['outer_k'],
+                                 outer_v=outer_v)
+            else:
+                x, info = solver(linop, b, M=M, x0=x_vec_combined, maxiter=maxiter,
+                                 rtol=rtol, atol=atol, callback=self._monitor_lgmres,
+                                 inner_m=restart, outer_k=self.options['outer_k'],
+                                 outer_v=outer_v)
+            self._x_prev = None
         else:
             x, info = solver(linop, b_vec.asarray(True), M=M,
                              x0=x_vec_combined, maxiter=maxiter, tol=atol, atol='legacy',
@@ -0,0 +1,123 @@
+"""Test the LinearBlockDirect class."""
+
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.test_suite.components.quad_implicit import QuadraticComp
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.utils.assert_utils import assert_near_equal
+
+
+def _build_quad_model(precon):
+    prob = om.Problem()
+    model = prob.model
+
+    sub1 = model.add_subsystem('sub1', om.Group())
+    sub1.add_subsystem('q1', QuadraticComp())
+    sub1.add_subsystem('z1', om.ExecComp('y = -6.0 + .01 * x'))
+    sub2 = model.add_subsystem('sub2', om.Group())
+    sub2.add_subsystem('q2', QuadraticComp())
+    sub2.add_subsystem('z2', om.ExecComp('y = -6.0 + .01 * x'))
+
+    model.connect('sub1.q1.x', 'sub1.z1.x')
+    model.connect('sub1.z1.y', 'sub2.q2.c')
+    model.connect('sub2.q2.x', 'sub2.z2.x')
+    model.connect('sub2.z2.y', 'sub1.q1.c')
+
+    model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+    model.linear_solver = om.ScipyKrylov()
+    model.linear_solver.precon = precon
+
+    return prob
+
+
+class TestLinearBlockDirect(unittest.TestCase):
+
+    def test_as_precon(self):
+        for block_level in ('subsystem', 'component'):
+            with self.subTest(block_level=block_level):
+                prob = _build_quad_model(om.LinearBlockDirect(block_level=block_level))
+                prob.setup()
+                prob.set_solver_print(level=0)
+                prob.run_model()
+
+                assert_near_equal(prob.get_val('sub1.q1.x'), 1.996, .0001)
+                assert_near_equal(prob.get_val('sub2.q2.x'), 1.996, .0001)
+
+    def test_as_precon_totals(self):
+        for mode in ('fwd', 'rev'):
+            for block_level in ('subsystem', 'component'):
+                with self.subTest(mode=mode, block_level=block_level):
+                    prob = om.Problem(model=SellarDerivatives())
+                    model = prob.model
+                    model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+                    model.linear_solver = om.ScipyKrylov()
+                    model.linear_solver.precon = om.LinearBlockDirect(block_level=block_level)
+
+                    model.add_design_var('x')
+                    model.add_design_var('z')
+                    model.add_objective('obj')
+                    model.add_constraint('con1', upper=0.0)
+                    model.add_constraint('con2', upper=0.0)
+
+                    prob.setup(mode=mode)
+                    prob.set_solver_print(level=0)
+                    prob.run_model()
+
+                    assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+                    assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+                    J = prob.compute_totals(of=['obj'], wrt=['x', 'z'],
+                                            return_format='flat_dict')
+                    assert_near_equal(J['obj', 'x'][0][0], 2.98061391, .00001)
+                    assert_near_equal(J['obj', 'z'][0][0], 9.61001055699, .00001)
+                    assert_near_equal(J['obj', 'z'][0][1], 1.78448533563, .00001)
+
+    def test_block_solve(self):
+        # when the coupling between subsystems vanishes, the block solve is exact.
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('q1', QuadraticComp())
+        model.add_subsystem('q2', QuadraticComp())
+
+        model.linear_solver = om.LinearBlockDirect()
+
+        prob.setup()
+        prob.set_val('q1.b', -4.0)
+        prob.set_val('q1.c', 3.0)
+        prob.set_val('q2.c', -2.0)
+        prob.run_model()
+        model.run_linearize()
+
+        d_inputs, d_outputs, d_residuals = model.get_linear_vectors()
+
+        # dR/dx = 2*a*x + b is 2 for q1 (x = 3) and 3 for q2 (x = 1)
+        expected = np.array([1.0 / 2.0, 1.0 / 3.0])
+
+        d_residuals.set_val(1.0)
+        d_outputs.set_val(0.0)
+        model.run_solve_linear('fwd')
+        assert_near_equal([d_outputs['q1.x'][0], d_outputs['q2.x'][0]], expected, 1e-15)
+
+        d_outputs.set_val(1.0)
+        d_residuals.set_val(0.0)
+        model.run_solve_linear('rev')
+        assert_near_equal([d_residuals['q1.x'][0], d_residuals['q2.x'][0]], expected, 1e-15)
+
+    def test_assemble_jac_err(self):
+        prob = _build_quad_model(om.LinearBlockDirect(assemble_jac=False))
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.setup()
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "LinearBlockDirect in <model> <class Group>: 'assemble_jac' must be True "
+                         "because the diagonal blocks are taken from an assembled jacobian.")
+
+
+if __name__ == "__main__":
+    unittest.main()
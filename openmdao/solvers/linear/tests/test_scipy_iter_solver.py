@@ -1,6 +1,9 @@
 """Test the ScipyKrylov linear solver class."""
 
 import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import mock
 
 import numpy as np
 import scipy
@@ -201,6 +204,74 @@ class TestScipyKrylov(LinearSolverTests.LinearSolverTestCase):
                         f"the first solve, which ran for {icount1} iterations.")
 
 
+class TestScipyKrylovLGMRES(TestScipyKrylov):
+
+    linear_solver_name = 'lgmres'
+    linear_solver_class = krylov_factory('lgmres')
+
+    def test_recycle_subspace(self):
+        n = 30
+        rng = np.random.default_rng(11)
+        A = np.eye(n) * 2. + rng.random((n, n)) * .1 - .05
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('lin', om.LinearSystemComp(size=n), promotes=['*'])
+        model.add_subsystem('obj', om.ExecComp('y = sum(x)', x=np.ones(n)), promotes=['*'])
+
+        model.linear_solver = om.ScipyKrylov(solver='lgmres', recycle_subspace=True, restart=5)
+
+        prob.setup(mode='rev')
+        prob.set_val('A', A)
+        prob.set_val('b', np.ones(n))
+        prob.run_model()
+
+        expected = np.linalg.solve(A.T, np.ones(n))
+
+        iters = []
+        for i in range(3):
+            J = prob.compute_totals('y', 'b')
+            assert_near_equal(J['y', 'b'][0], expected, 1e-9)
+            iters.append(model.linear_solver._iter_count)
+
+        # the vectors recycled from the first adjoint solve span most of the solution.
+        self.assertLess(iters[1], iters[0])
+        self.assertLess(iters[2], iters[0])
+
+    def test_iprint_no_extra_matvecs(self):
+        n = 30
+        rng = np.random.default_rng(11)
+        A = np.eye(n) * 2. + rng.random((n, n)) * .1 - .05
+        expected = np.linalg.solve(A.T, np.ones(n))
+
+        nmatvecs = {}
+        for iprint in (0, 2):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('lin', om.LinearSystemComp(size=n), promotes=['*'])
+            model.add_subsystem('obj', om.ExecComp('y = sum(x)', x=np.ones(n)), promotes=['*'])
+
+            model.linear_solver = om.ScipyKrylov(solver='lgmres', restart=5, iprint=iprint)
+
+            prob.setup(mode='rev')
+            prob.set_val('A', A)
+            prob.set_val('b', np.ones(n))
+            prob.run_model()
+
+            with mock.patch.object(model.linear_solver, '_mat_vec',
+                                   wraps=model.linear_solver._mat_vec) as spy:
+                with redirect_stdout(StringIO()):
+                    J = prob.compute_totals('y', 'b')
+
+            assert_near_equal(J['y', 'b'][0], expected, 1e-9)
+            nmatvecs[iprint] = spy.call_count
+
+        # printing the iterations doesn't apply the operator again.
+        self.assertEqual(nmatvecs[2], nmatvecs[0])
+
+
 class TestScipyKrylovFeature(unittest.TestCase):
 
     def test_feature_simple(self):
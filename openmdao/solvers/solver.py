@@ -857,12 +857,33 @@ class NonlinearSolver(Solver):
         Perform a Gauss-Seidel iteration over this Solver's subsystems.
         """
         system = self._system()
-        for subsys in system._relevance.filter(system._all_subsystem_iter()):
-            system._transfer('nonlinear', 'fwd', subsys.name)
+        subsystems = system._relevance.filter(system._all_subsystem_iter())
+
+        chains = system._get_fused_exec_chains()
+        if chains:
+            subsystems = list(subsystems)
+            relevant = {s.name for s in subsystems}
+        fused = ()
+
+        for subsys in subsystems:
+            if subsys.name in fused:
+                continue  # already run as part of a fused ExecComp chain
+
+            chain = chains.get(subsys.name)
+            if chain is not None and relevant.issuperset(c.name for c in chain.comps):
+                fused = {c.name for c in chain.comps}
+                for name in chain.xfer_names:
+                    system._transfer('nonlinear', 'fwd', name)
+            else:
+                chain = None
+                system._transfer('nonlinear', 'fwd', subsys.name)
 
             if subsys._is_local:
                 try:
-                    subsys._solve_nonlinear()
+                    if chain is None:
+                        subsys._solve_nonlinear()
+                    else:
+                        chain._solve_nonlinear(system)
                 except AnalysisError as err:
                     if 'reraise_child_analysiserror' not in self.options or \
                             self.options['reraise_child_analysiserror']:
@@ -1,4 +1,7 @@
 """Surrogate model based on Kriging."""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import scipy.linalg as linalg
 import os.path
@@ -10,6 +13,9 @@ from openmdao.utils.om_warnings import issue_warning, CacheWarning
 
 MACHINE_EPSILON = np.finfo(np.double).eps
 
+# data shared with the worker processes that run the hyperparameter restarts
+_restart_data = None
+
 
 class KrigingSurrogate(SurrogateModel):
     """
@@ -28,15 +34,25 @@ class KrigingSurrogate(SurrogateModel):
     alpha : ndarray
         Reduced likelihood parameter: alpha
     L : ndarray
-        Reduced likelihood parameter: L
+        Reduced likelihood parameter: L, the lower Cholesky factor of the correlation matrix
+        when training_method is 'cholesky'.
     n_dims : int
         Number of independents in the surrogate
     n_samples : int
         Number of training points.
+    nugget : float or ndarray
+        Nugget used in the Cholesky factorization of the trained model.  This can be larger than
+        the nugget option if the correlation matrix wasn't positive definite.
+    S_inv : ndarray
+        Reduced likelihood parameter: inverse singular values of the correlation matrix.
     sigma2 : ndarray
         Reduced likelihood parameter: sigma squared
     thetas : ndarray
         Kriging hyperparameters.
+    U : ndarray
+        Reduced likelihood parameter: left singular vectors of the correlation matrix.
+    Vh : ndarray
+        Reduced likelihood parameter: right singular vectors of the correlation matrix.
     X : ndarray
         Training input values, normalized.
     X_mean : ndarray
@@ -49,6 +65,8 @@ class KrigingSurrogate(SurrogateModel):
         Mean of training model response values, normalized.
     Y_std : ndarray
         Standard deviation of training model response values, normalized.
+    _sq_distances : tuple of ndarray or None
+        Pair indices and squared distances of the training points, kept during training.
     """
 
     def __init__(self, **kwargs):
@@ -69,6 +87,11 @@ class KrigingSurrogate(SurrogateModel):
         self.alpha = np.zeros(0)
         self.L = np.zeros(0)
         self.sigma2 = np.zeros(0)
+        self.U = np.zeros(0)
+        self.S_inv = np.zeros(0)
+        self.Vh = np.zeros(0)
+        self.nugget = None
+        self._sq_distances = None
 
         # Normalized Training Values
         self.X = np.zeros(0)
@@ -99,6 +122,30 @@ class KrigingSurrogate(SurrogateModel):
                                   "or 'gesvd' which is slower but more reliable."
                                   "'gesvd' is the default.")
 
+        self.options.declare('training_method', values=['svd', 'cholesky'], default='svd',
+                             desc="Factorization of the correlation matrix used in training. "
+                                  "'cholesky' never forms the (n_samples, n_dims, n_samples) "
+                                  "distance tensor, uses the analytic gradient of the likelihood "
+                                  "and increases the nugget if the matrix isn't positive "
+                                  "definite. It is much faster and leaner for large training "
+                                  "sets.")
+
+        self.options.declare('num_restarts', types=int, default=1, lower=1,
+                             desc="Number of starting points for the hyperparameter "
+                                  "optimization when training_method is 'cholesky'. The first "
+                                  "start is the default initial guess and the others are "
+                                  "randomly placed within the bounds.")
+
+        self.options.declare('num_procs', types=int, default=1, lower=1,
+                             desc="Number of processes used to run the hyperparameter restarts "
+                                  "concurrently when training_method is 'cholesky'. Requires the "
+                                  "'fork' start method.")
+
+        self.options.declare('block_size', types=int, default=1000, lower=1,
+                             desc="Maximum number of points whose correlations with the training "
+                                  "points are computed at once when predicting or linearizing "
+                                  "many points.")
+
         self.options.declare('training_cache', types=str, default=None,
                              desc="Cache the trained model to avoid repeating training and write "
                                   "it to the given file. If the specified file exists, it will be "
@@ -120,10 +167,14 @@ class KrigingSurrogate(SurrogateModel):
 
         cache = self.options['training_cache']
 
+        use_cholesky = self.options['training_method'] == 'cholesky'
+
         if cache:
             data_hash = md5()  # nosec: hashed content not sensitive
             data_hash.update(x.flatten())
             data_hash.update(y.flatten())
+            if use_cholesky:
+                data_hash.update(b'cholesky')
             training_data_hash = data_hash.hexdigest()
             cache_hash = ''
 
@@ -141,9 +192,13 @@ class KrigingSurrogate(SurrogateModel):
                     self.Y_std = np.array(data['Y_std'])
                     self.thetas = np.array(data['thetas'])
                     self.alpha = np.array(data['alpha'])
-                    self.U = np.array(data['U'])
-                    self.S_inv = np.array(data['S_inv'])
-                    self.Vh = np.array(data['Vh'])
+                    if use_cholesky:
+                        self.L = np.array(data['L'])
+                        self.nugget = np.array(data['nugget'])
+                    else:
+                        self.U = np.array(data['U'])
+                        self.S_inv = np.array(data['S_inv'])
+                        self.Vh = np.array(data['Vh'])
                     self.sigma2 = np.array(data['sigma2'])
                     cache_hash = str(data['hash'])
                 except KeyError as e:
@@ -178,11 +233,6 @@ class KrigingSurrogate(SurrogateModel):
         self.X_mean, self.X_std = X_mean, X_std
         self.Y_mean, self.Y_std = Y_mean, Y_std
 
-        def _calcll(thetas):
-            """Calculate loglike (callback function)."""
-            loglike = self._calculate_reduced_likelihood_params(np.exp(thetas))[0]
-            return -loglike
-
         bounds = [(np.log(1e-5), np.log(1e5)) for _ in range(self.n_dims)]
 
         options = {'eps': 1e-3}
@@ -192,9 +242,21 @@ class KrigingSurrogate(SurrogateModel):
             options['disp'] = True
             options['iprint'] = 2
 
-        optResult = minimize(_calcll, 1e-1 * np.ones(self.n_dims), method='slsqp',
-                             options=options,
-                             bounds=bounds)
+        if use_cholesky:
+            self._sq_distances = _pair_sq_distances(X)
+            try:
+                optResult = self._optimize_thetas_cholesky(bounds, options)
+            finally:
+                self._sq_distances = None
+        else:
+            def _calcll(thetas):
+                """Calculate loglike (callback function)."""
+                loglike = self._calculate_reduced_likelihood_params(np.exp(thetas))[0]
+                return -loglike
+
+            optResult = minimize(_calcll, 1e-1 * np.ones(self.n_dims), method='slsqp',
+                                 options=options,
+                                 bounds=bounds)
 
         if not optResult.success:
             raise ValueError(f'Kriging Hyper-parameter optimization failed: {optResult.message}')
@@ -202,10 +264,14 @@ class KrigingSurrogate(SurrogateModel):
         self.thetas = np.exp(optResult.x)
         _, params = self._calculate_reduced_likelihood_params()
         self.alpha = params['alpha']
-        self.U = params['U']
-        self.S_inv = params['S_inv']
-        self.Vh = params['Vh']
         self.sigma2 = params['sigma2']
+        if use_cholesky:
+            self.L = params['L']
+            self.nugget = params['nugget']
+        else:
+            self.U = params['U']
+            self.S_inv = params['S_inv']
+            self.Vh = params['Vh']
 
         # Save data to cache if specified
         if cache:
@@ -220,17 +286,131 @@ class KrigingSurrogate(SurrogateModel):
                 'Y_std': self.Y_std,
                 'thetas': self.thetas,
                 'alpha': self.alpha,
-                'U': self.U,
-                'S_inv': self.S_inv,
-                'Vh': self.Vh,
                 'sigma2': self.sigma2,
                 'hash': training_data_hash
             }
+            if use_cholesky:
+                data['L'] = self.L
+                data['nugget'] = self.nugget
+            else:
+                data['U'] = self.U
+                data['S_inv'] = self.S_inv
+                data['Vh'] = self.Vh
 
             if not os.path.exists(cache) or cache_hash != training_data_hash:
                 with open(cache, 'wb') as f:
                     np.savez_compressed(f, **data)
 
+    def update(self, x, y):
+        """
+        Add training points to the trained model, keeping the hyperparameters fixed.
+
+        When training_method is 'cholesky', the Cholesky factor of the correlation matrix is
+        extended with rows for the new points, which costs O(n_samples**2 * n_new) rather than
+        O(n_samples**3).  Otherwise the correlation matrix is factored again.  The
+        normalization of the training data isn't changed.
+
+        Parameters
+        ----------
+        x : array-like
+            Additional training input locations.
+        y : array-like
+            Model responses at the additional inputs.
+        """
+        if not self.trained:
+            self.train(x, y)
+            return
+
+        x, y = np.atleast_2d(x, y)
+        n_old = self.n_samples
+
+        self.X = np.vstack([self.X, (x - self.X_mean) / self.X_std])
+        self.Y = np.vstack([self.Y, (y - self.Y_mean) / self.Y_std])
+        self.n_samples = self.X.shape[0]
+
+        L = None
+        if self.options['training_method'] == 'cholesky' and np.ndim(self.nugget) == 0:
+            # correlations of the new points with all of the points
+            r = self._correlations(x)
+            r[:, n_old:][np.diag_indices(x.shape[0])] = 1. + self.nugget
+
+            B = linalg.solve_triangular(self.L, r[:, :n_old].T, lower=True, check_finite=False)
+            try:
+                L22 = linalg.cholesky(r[:, n_old:] - np.dot(B.T, B), lower=True,
+                                      check_finite=False)
+            except linalg.LinAlgError:
+                pass  # the nugget needs to be increased, so factor the whole matrix
+            else:
+                L = np.zeros((self.n_samples, self.n_samples))
+                L[:n_old, :n_old] = self.L
+                L[n_old:, :n_old] = B.T
+                L[n_old:, n_old:] = L22
+
+        if L is None:
+            _, params = self._calculate_reduced_likelihood_params()
+            self.alpha = params['alpha']
+            self.sigma2 = params['sigma2']
+            if self.options['training_method'] == 'cholesky':
+                self.L = params['L']
+                self.nugget = params['nugget']
+            else:
+                self.U = params['U']
+                self.S_inv = params['S_inv']
+                self.Vh = params['Vh']
+        else:
+            self.L = L
+            self.alpha = linalg.cho_solve((L, True), self.Y, check_finite=False)
+            sigma2 = np.dot(self.Y.T, self.alpha).sum(axis=0) / self.n_samples
+            self.sigma2 = sigma2 * np.square(self.Y_std)
+
+    def _optimize_thetas_cholesky(self, bounds, options):
+        """
+        Find the hyperparameters that maximize the likelihood, starting from several points.
+
+        Parameters
+        ----------
+        bounds : list of tuple
+            Lower and upper bounds of the log of each hyperparameter.
+        options : dict
+            Options for the optimizer.
+
+        Returns
+        -------
+        OptimizeResult
+            Result of the best successful restart, or of the first one if none succeeded.
+        """
+        num_restarts = self.options['num_restarts']
+        num_procs = min(self.options['num_procs'], num_restarts)
+
+        starts = [np.full(self.n_dims, np.log(1e-1))]
+        if num_restarts > 1:
+            lower, upper = np.array(bounds).T
+            rng = np.random.default_rng(0)
+            starts.extend(rng.uniform(lower, upper, (num_restarts - 1, self.n_dims)))
+
+        data = (self._sq_distances, self.Y, self.options['nugget'], bounds, options)
+
+        if num_procs > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            issue_warning("Option 'num_procs' is ignored because a process pool requires the "
+                          "'fork' start method.", prefix='KrigingSurrogate')
+            num_procs = 1
+
+        if num_procs > 1:
+            # the training data is inherited by the forked workers rather than pickled
+            with ProcessPoolExecutor(max_workers=num_procs,
+                                     mp_context=multiprocessing.get_context('fork'),
+                                     initializer=_init_restart_worker,
+                                     initargs=(data,)) as pool:
+                results = list(pool.map(_run_restart, starts))
+        else:
+            results = [_optimize_log_thetas(start, *data) for start in starts]
+
+        successful = [res for res in results if res.success]
+        if not successful:
+            return results[0]
+
+        return min(successful, key=lambda res: res.fun)
+
     def _calculate_reduced_likelihood_params(self, thetas=None):
         """
         Calculate quantity with same maximum location as the log-likelihood for a given theta.
@@ -255,6 +435,16 @@ class KrigingSurrogate(SurrogateModel):
         X, Y = self.X, self.Y
         params = {}
 
+        if self.options['training_method'] == 'cholesky':
+            sq_distances = self._sq_distances
+            if sq_distances is None:
+                sq_distances = _pair_sq_distances(X)
+
+            reduced_likelihood, _, params = _cholesky_likelihood(np.log(thetas), sq_distances, Y,
+                                                                 self.options['nugget'])
+            params['sigma2'] = params['sigma2'] * np.square(self.Y_std)
+            return reduced_likelihood, params
+
         # Correlation Matrix
         distances = np.zeros((self.n_samples, self.n_dims, self.n_samples))
         for i in range(self.n_samples):
@@ -295,7 +485,7 @@ class KrigingSurrogate(SurrogateModel):
         Parameters
         ----------
         x : array-like
-            Point at which the surrogate is evaluated.
+            Point(s) at which the surrogate is evaluated.
 
         Returns
         -------
@@ -306,29 +496,57 @@ class KrigingSurrogate(SurrogateModel):
         """
         super().predict(x)
 
-        thetas = self.thetas
-        if isinstance(x, list):
-            x = np.array(x)
-        x = np.atleast_2d(x)
-        n_eval = x.shape[0]
+        return self.vectorized_predict(x)
 
-        # Normalize input
-        x_n = (x - self.X_mean) / self.X_std
+    def vectorized_predict(self, x):
+        """
+        Calculate predicted values of the response at many points at once.
+
+        The correlations between the query points and the training points are computed in
+        blocks of at most 'block_size' query points to bound the memory used.
 
-        r = np.zeros((n_eval, self.n_samples), dtype=x.dtype)
-        for r_i, x_i in zip(r, x_n):
-            r_i[:] = np.exp(-thetas.dot(np.square((x_i - self.X).T)))
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate is evaluated, with shape (n_eval, n_dims).
 
-        # Scaled Predictor
-        y_t = np.dot(r, self.alpha)
+        Returns
+        -------
+        ndarray
+            Kriging predictions with shape (n_eval, n_outputs).
+        ndarray, optional (if eval_rmse is True)
+            Root mean square of the prediction errors with shape (n_eval, n_outputs).
+        """
+        x = np.atleast_2d(np.asarray(x))
+        n_eval = x.shape[0]
+        eval_rmse = self.options['eval_rmse']
+        block_size = self.options['block_size']
+
+        y_t = np.empty((n_eval, self.alpha.shape[1]), dtype=np.result_type(x, float))
+        if eval_rmse:
+            mse = np.empty(y_t.shape)
+
+        for start in range(0, n_eval, block_size):
+            block = slice(start, start + block_size)
+            r = self._correlations(x[block])
+
+            # Scaled Predictor
+            y_t[block] = np.dot(r, self.alpha)
+
+            if eval_rmse:
+                # diagonal of r R^-1 r^T
+                if self.options['training_method'] == 'cholesky':
+                    v = linalg.solve_triangular(self.L, r.real.T, lower=True)
+                    rRr = np.einsum('ij,ij->j', v, v)
+                else:
+                    v = self.S_inv[:, np.newaxis] * np.dot(self.U.T, r.real.T)
+                    rRr = np.einsum('ij,ij->j', np.dot(self.Vh.T, v), r.real.T)
+                mse[block] = (1. - rRr)[:, np.newaxis] * self.sigma2
 
         # Predictor
         y = self.Y_mean + self.Y_std * y_t
 
-        if self.options['eval_rmse']:
-            mse = (1. - np.dot(np.dot(r, self.Vh.T),
-                               np.einsum('j,kj,lk->jl', self.S_inv, self.U, r))) * self.sigma2
-
+        if eval_rmse:
             # Forcing negative RMSE to zero if negative due to machine precision
             mse[mse < 0.] = 0.
             return y, np.sqrt(mse)
@@ -349,17 +567,241 @@ class KrigingSurrogate(SurrogateModel):
         ndarray
             Jacobian of surrogate output wrt inputs.
         """
+        return self.vectorized_linearize(x)[0]
+
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobians of the Kriging surface at many points at once.
+
+        Parameters
+        ----------
+        x : array-like
+            Points at which the surrogate Jacobian is evaluated, with shape (n_eval, n_dims).
+
+        Returns
+        -------
+        ndarray
+            Jacobians of surrogate outputs wrt inputs with shape (n_eval, n_outputs, n_dims).
+        """
+        x = np.atleast_2d(np.asarray(x))
+        n_eval = x.shape[0]
+        block_size = self.options['block_size']
         thetas = self.thetas
 
-        # Normalize Input
-        x_n = (x - self.X_mean) / self.X_std
+        jac = np.empty((n_eval, self.alpha.shape[1], self.n_dims), dtype=np.result_type(x, float))
+        scale = np.outer(self.Y_std, 1. / self.X_std)
+
+        for start in range(0, n_eval, block_size):
+            block = slice(start, start + block_size)
+            x_n = (x[block] - self.X_mean) / self.X_std
+            r = self._correlations(x[block])
 
-        r = np.exp(-thetas.dot(np.square((x_n - self.X).T)))
+            # dr/dx_k = -2 theta_k (x_k - X_k) r
+            for k in range(self.n_dims):
+                gradr = r * (x_n[:, k, np.newaxis] - self.X[:, k])
+                jac[block, :, k] = -2. * thetas[k] * np.dot(gradr, self.alpha)
 
-        # Z = einsum('i,ij->ij', X, Y) is equivalent to, but much faster and
-        # memory efficient than, diag(X).dot(Y) for vector X and 2D array Y.
-        # i.e., Z[i,j] = X[i]*Y[i,j]
-        gradr = r * -2 * np.einsum('i,ij->ij', thetas, (x_n - self.X).T)
-        jac = np.einsum('i,j,ij->ij', self.Y_std, 1. /
-                        self.X_std, gradr.dot(self.alpha).T)
+        jac *= scale
         return jac
+
+    def _correlations(self, x):
+        """
+        Return the correlations between the given points and the training points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points with shape (n_eval, n_dims).
+
+        Returns
+        -------
+        ndarray
+            Correlations with shape (n_eval, n_samples).
+        """
+        # Normalize input
+        x_n = (x - self.X_mean) / self.X_std
+
+        dist = np.zeros((x.shape[0], self.n_samples), dtype=x_n.dtype)
+        for k, theta in enumerate(self.thetas):
+            dist += theta * np.square(x_n[:, k, np.newaxis] - self.X[:, k])
+
+        return np.exp(-dist)
+
+
+def _pair_sq_distances(X):
+    """
+    Return the squared distances between each pair of training points in each dimension.
+
+    Parameters
+    ----------
+    X : ndarray
+        Normalized training inputs with shape (n_samples, n_dims).
+
+    Returns
+    -------
+    tuple of ndarray
+        Row and column indices of the pairs in the upper triangle of the correlation matrix,
+        and the squared distances with shape (n_dims, n_pairs).
+    """
+    n_samples, n_dims = X.shape
+    rows, cols = np.triu_indices(n_samples, 1)
+
+    dist = np.empty((n_dims, rows.size))
+    for k in range(n_dims):
+        np.square(X[rows, k] - X[cols, k], out=dist[k])
+
+    return rows, cols, dist
+
+
+def _cholesky_factor(R, nugget):
+    """
+    Add the nugget to the diagonal of R and factor it, increasing the nugget if necessary.
+
+    Parameters
+    ----------
+    R : ndarray
+        Correlation matrix with its lower triangle filled in.  Its diagonal is overwritten.
+    nugget : float or ndarray
+        Requested nugget.
+
+    Returns
+    -------
+    ndarray
+        Lower Cholesky factor.
+    float or ndarray
+        The nugget that was used.
+    """
+    diag = np.diag_indices_from(R)
+    extra = 0.
+
+    for _ in range(12):
+        R[diag] = 1. + nugget + extra
+        try:
+            return linalg.cholesky(R, lower=True, check_finite=False), nugget + extra
+        except linalg.LinAlgError:
+            extra = 10. * MACHINE_EPSILON if extra == 0. else extra * 10.
+
+    raise linalg.LinAlgError("Kriging correlation matrix is not positive definite.")
+
+
+def _cholesky_likelihood(log_thetas, sq_distances, Y, nugget, gradient=False):
+    """
+    Calculate the reduced likelihood and its gradient using a Cholesky factorization.
+
+    Parameters
+    ----------
+    log_thetas : ndarray
+        Log of the correlation hyperparameters.
+    sq_distances : tuple of ndarray
+        Pair indices and squared distances of the training points from _pair_sq_distances.
+    Y : ndarray
+        Normalized training outputs with shape (n_samples, n_outputs).
+    nugget : float or ndarray
+        Nugget smoothing parameter.
+    gradient : bool
+        If True, calculate the gradient of the reduced likelihood wrt log_thetas.
+
+    Returns
+    -------
+    float
+        Reduced likelihood.
+    ndarray or None
+        Gradient of the reduced likelihood wrt log_thetas.
+    dict
+        Dictionary containing the parameters.
+    """
+    rows, cols, dist = sq_distances
+    n_samples = Y.shape[0]
+    thetas = np.exp(log_thetas)
+
+    r = np.exp(-thetas.dot(dist))
+    R = np.empty((n_samples, n_samples))
+    R[cols, rows] = r
+
+    L, nugget = _cholesky_factor(R, nugget)
+
+    alpha = linalg.cho_solve((L, True), Y, check_finite=False)
+    logdet = 2. * np.sum(np.log(np.diag(L)))
+    sigma2 = np.dot(Y.T, alpha).sum(axis=0) / n_samples
+    ssum = np.sum(sigma2)
+    reduced_likelihood = -(np.log(ssum) + logdet / n_samples)
+
+    grad = None
+    if gradient:
+        # dR/dtheta_k = -dist_k * R, so only the off diagonal pairs contribute.
+        R_inv = linalg.cho_solve((L, True), np.eye(n_samples), check_finite=False)
+        a = alpha.sum(axis=1)
+        weights = r * (R_inv[rows, cols] - a[rows] * a[cols] / ssum)
+        grad = (2. / n_samples) * thetas * dist.dot(weights)
+
+    params = {
+        'alpha': alpha,
+        'sigma2': sigma2,
+        'L': L,
+        'nugget': nugget,
+    }
+
+    return reduced_likelihood, grad, params
+
+
+def _optimize_log_thetas(start, sq_distances, Y, nugget, bounds, options):
+    """
+    Maximize the reduced likelihood wrt the log of the hyperparameters from one starting point.
+
+    Parameters
+    ----------
+    start : ndarray
+        Initial log of the hyperparameters.
+    sq_distances : tuple of ndarray
+        Pair indices and squared distances of the training points from _pair_sq_distances.
+    Y : ndarray
+        Normalized training outputs.
+    nugget : float or ndarray
+        Nugget smoothing parameter.
+    bounds : list of tuple
+        Lower and upper bounds of the log of each hyperparameter.
+    options : dict
+        Options for the optimizer.
+
+    Returns
+    -------
+    OptimizeResult
+        The optimization result.
+    """
+    def _calcll(log_thetas):
+        """Calculate negative loglike and its gradient (callback function)."""
+        loglike, grad, _ = _cholesky_likelihood(log_thetas, sq_distances, Y, nugget,
+                                                gradient=True)
+        return -loglike, -grad
+
+    return minimize(_calcll, start, jac=True, method='slsqp', options=options, bounds=bounds)
+
+
+def _init_restart_worker(data):
+    """
+    Store the training data in a worker process.
+
+    Parameters
+    ----------
+    data : tuple
+        Arguments of _optimize_log_thetas after the starting point.
+    """
+    global _restart_data
+    _restart_data = data
+
+
+def _run_restart(start):
+    """
+    Run one hyperparameter restart in a worker process.
+
+    Parameters
+    ----------
+    start : ndarray
+        Initial log of the hyperparameters.
+
+    Returns
+    -------
+    OptimizeResult
+        The optimization result.
+    """
+    return _optimize_log_thetas(start, *_restart_data)
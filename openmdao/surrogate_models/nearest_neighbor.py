@@ -76,6 +76,22 @@ class NearestNeighbor(SurrogateModel):
         self.interpolant = _interpolators[self.options['interpolant_type']](
             x, y, **self.interpolant_init_args)
 
+    def update(self, x, y):
+        """
+        Add training points to the interpolant without building it from scratch.
+
+        Parameters
+        ----------
+        x : array-like
+            Additional training input locations.
+        y : array-like
+            Model responses at the additional inputs.
+        """
+        if self.interpolant is None:
+            self.train(x, y)
+        else:
+            self.interpolant.add_points(x, y)
+
     def predict(self, x, **kwargs):
         """
         Calculate a predicted value of the response based on the current trained model.
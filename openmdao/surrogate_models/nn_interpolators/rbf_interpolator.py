@@ -53,15 +53,39 @@ class RBFInterpolator(NNBase):
         # rbf_family is an arbitrary value that picks a function to use
         self.rbf_family = rbf_family
 
+        self.N = num_neighbors
+        self.weights = self._compute_weights()
+
+    def _compute_weights(self):
+        """
+        Compute the weight of each training point.
+
+        Returns
+        -------
+        ndarray
+            Weights for each interpolation point.
+        """
         # For weights, first find the training points radial neighbors
-        tdist, tloc = self._KData.query(self._tp, num_neighbors)
+        tdist, tloc = self._KData.query(self._tp, self.N)
         Tt = tdist[:, :-1] / tdist[:, -1:]
         # Next determine weight matrix
         Rt = self._find_R(self._ntpts, Tt, tloc)
-        weights = (spsolve(csc_matrix(Rt), self._tv))[..., np.newaxis]
+        return (spsolve(csc_matrix(Rt), self._tv))[..., np.newaxis]
 
-        self.N = num_neighbors
-        self.weights = weights
+    def add_points(self, training_points, training_values):
+        """
+        Add training points to the interpolant and recompute the weights.
+
+        Parameters
+        ----------
+        training_points : ndarray
+            Ndarray of shape (num_new_points x independent dims) containing training input
+            locations.
+        training_values : ndarray
+            Ndarray of shape (num_new_points x dependent dims) containing training output values.
+        """
+        super().add_points(training_points, training_values)
+        self.weights = self._compute_weights()
 
     def _find_R(self, npp, T, neighbor_idx):
         """
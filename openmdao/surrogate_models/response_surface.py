@@ -25,6 +25,10 @@ class ResponseSurface(SurrogateModel):
         Number of training points.
     n : int
         Number of independent variables.
+    _xtx : ndarray
+        Product of the transposed regression matrix with itself.
+    _xty : ndarray
+        Product of the transposed regression matrix with the training responses.
     """
 
     def __init__(self):
@@ -37,6 +41,8 @@ class ResponseSurface(SurrogateModel):
         self.n = 0  # number of independents
         # vector of response surface equation coefficients
         self.betas = zeros(0)
+        self._xtx = None
+        self._xty = None
 
     def train(self, x, y):
         """
@@ -54,6 +60,57 @@ class ResponseSurface(SurrogateModel):
         m = self.m = x.shape[0]
         n = self.n = x.shape[1]
 
+        X = self._design_matrix(x)
+
+        # Determine response surface equation coefficients (betas) using least
+        # squares
+        self.betas, rs, r, s = lstsq(X, y)
+
+        # normal equations, kept for recursive updates
+        self._xtx = X.T.dot(X)
+        self._xty = X.T.dot(y)
+
+    def update(self, x, y):
+        """
+        Add training points to the response surface using recursive least squares.
+
+        The normal equations are accumulated, so the cost doesn't depend on the number of
+        training points.
+
+        Parameters
+        ----------
+        x : array-like
+            Additional training input locations.
+        y : array-like
+            Model responses at the additional inputs.
+        """
+        if not self.trained:
+            self.train(x, y)
+            return
+
+        X = self._design_matrix(x)
+
+        self.m += x.shape[0]
+        self._xtx += X.T.dot(X)
+        self._xty += X.T.dot(y)
+        self.betas, rs, r, s = lstsq(self._xtx, self._xty)
+
+    def _design_matrix(self, x):
+        """
+        Return the constant, linear, squared and cross terms of each training point.
+
+        Parameters
+        ----------
+        x : ndarray
+            Training input locations.
+
+        Returns
+        -------
+        ndarray
+            Regression matrix with one row per training point.
+        """
+        m, n = x.shape
+
         X = zeros((m, ((n + 1) * (n + 2)) // 2))
 
         # Modify X to include constant, squared terms and cross terms
@@ -73,9 +130,7 @@ class ResponseSurface(SurrogateModel):
             X_offset[:, :n - i] = einsum('i,ij->ij', x[:, i], x[:, i:])
             X_offset = X_offset[:, n - i:]
 
-        # Determine response surface equation coefficients (betas) using least
-        # squares
-        self.betas, rs, r, s = lstsq(X, y)
+        return X
 
     def predict(self, x):
         """
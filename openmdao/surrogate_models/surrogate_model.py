@@ -44,6 +44,19 @@ class SurrogateModel(object):
         """
         self.trained = True
 
+    def update(self, x, y):
+        """
+        Add training points to the trained surrogate model without training it from scratch.
+
+        Parameters
+        ----------
+        x : array-like
+            Additional training input locations.
+        y : array-like
+            Model responses at the additional inputs.
+        """
+        pass
+
     def predict(self, x):
         """
         Calculate a predicted value of the response based on the current trained model.
@@ -65,7 +78,7 @@ class SurrogateModel(object):
         Parameters
         ----------
         x : array-like
-            Vectorized point(s) at which the surrogate is evaluated.
+            Vectorized point(s) at which the surrogate is evaluated, one point per row.
         """
         pass
 
@@ -80,6 +93,17 @@ class SurrogateModel(object):
         """
         pass
 
+    def vectorized_linearize(self, x):
+        """
+        Calculate the jacobians of the interpolant at many points at once.
+
+        Parameters
+        ----------
+        x : array-like
+            Vectorized points at which the surrogate Jacobian is evaluated, one point per row.
+        """
+        pass
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -173,6 +173,169 @@ class TestKrigingSurrogate(unittest.TestCase):
 
         os.unlink('test_cache.npz')
 
+    def test_vectorized(self):
+        rng = np.random.default_rng(3)
+        x = rng.uniform(-1, 1, (40, 3))
+        y = np.column_stack([np.sin(x.sum(axis=1)), x[:, 0] * x[:, 1] - x[:, 2]])
+        x_eval = rng.uniform(-1, 1, (11, 3))
+
+        for method in ('svd', 'cholesky'):
+            with self.subTest(method=method):
+                surrogate = KrigingSurrogate(eval_rmse=True, training_method=method, block_size=4)
+                surrogate.train(x, y)
+
+                mu, sigma = surrogate.vectorized_predict(x_eval)
+                jac = surrogate.vectorized_linearize(x_eval)
+                self.assertEqual(mu.shape, (11, 2))
+                self.assertEqual(sigma.shape, (11, 2))
+                self.assertEqual(jac.shape, (11, 2, 3))
+
+                for i, x0 in enumerate(x_eval):
+                    mu0, sigma0 = surrogate.predict(x0)
+                    assert_near_equal(mu[i], mu0[0], 1e-10)
+                    assert_near_equal(sigma[i], sigma0[0], 1e-6)
+
+                    # finite difference check of the jacobian
+                    h = 1e-6
+                    fd = np.column_stack([(surrogate.predict(x0 + dx)[0][0] -
+                                           surrogate.predict(x0 - dx)[0][0]) / (2 * h)
+                                          for dx in np.eye(3) * h])
+                    assert_near_equal(jac[i], fd, 1e-5)
+                    assert_near_equal(surrogate.linearize(x0), jac[i], 1e-10)
+
+    def test_update(self):
+        rng = np.random.default_rng(5)
+        x = rng.uniform(-1, 1, (60, 2))
+        y = np.column_stack([np.sin(3 * x[:, 0]) * x[:, 1], np.cos(x.sum(axis=1))])
+        x_eval = rng.uniform(-1, 1, (7, 2))
+
+        for method in ('svd', 'cholesky'):
+            with self.subTest(method=method):
+                # a small nugget keeps the correlation matrix well conditioned
+                surrogate = KrigingSurrogate(eval_rmse=True, training_method=method, nugget=1e-8)
+                surrogate.train(x[:40], y[:40])
+                thetas = surrogate.thetas.copy()
+
+                surrogate.update(x[40:50], y[40:50])
+                surrogate.update(x[50:], y[50:])
+
+                self.assertEqual(surrogate.n_samples, 60)
+                assert_near_equal(surrogate.thetas, thetas, 1e-15)
+
+                # same as factoring the correlation matrix of all of the points
+                _, params = surrogate._calculate_reduced_likelihood_params()
+                assert_near_equal(surrogate.alpha, params['alpha'], 1e-6)
+                assert_near_equal(surrogate.sigma2, params['sigma2'], 1e-6)
+                if method == 'cholesky':
+                    assert_near_equal(surrogate.L, params['L'], 1e-10)
+
+                # the new points are interpolated
+                mu = surrogate.predict(x[55])[0]
+                assert_near_equal(mu, y[55:56], 1e-3)
+
+                mu, sigma = surrogate.vectorized_predict(x_eval)
+                self.assertTrue(np.all(np.isfinite(sigma)))
+
+
+class TestKrigingSurrogateCholesky(unittest.TestCase):
+
+    def setUp(self):
+        self.x = np.array([[-2., 0.], [-0.5, 1.5], [1., 3.], [8.5, 4.5],
+                           [-3.5, 6.], [4., 7.5], [-5., 9.], [5.5, 10.5],
+                           [10., 12.], [7., 13.5], [2.5, 15.]])
+        self.y = np.array([[branin(case)] for case in self.x])
+
+    def test_2d(self):
+        surrogate = KrigingSurrogate(nugget=0., eval_rmse=True, training_method='cholesky')
+        surrogate.train(self.x, self.y)
+
+        for x0, y0 in zip(self.x, self.y):
+            mu, sigma = surrogate.predict(x0)
+            assert_near_equal(mu, [y0], 1e-9)
+            assert_near_equal(sigma, [[0]], 1e-4)
+
+        mu, sigma = surrogate.predict([5., 5.])
+
+        assert_near_equal(mu, [[16.72]], 1e-1)
+        assert_near_equal(sigma, [[15.27]], 1e-2)
+
+    def test_likelihood_matches_svd(self):
+        svd = KrigingSurrogate(nugget=0.)
+        svd.train(self.x, self.y)
+
+        chol = KrigingSurrogate(nugget=0., training_method='cholesky')
+        chol.train(self.x, self.y)
+
+        assert_near_equal(chol.thetas, svd.thetas, 1e-3)
+
+        thetas = np.array([1.0, 0.5])
+        ll_svd, params_svd = svd._calculate_reduced_likelihood_params(thetas)
+        ll_chol, params_chol = chol._calculate_reduced_likelihood_params(thetas)
+        assert_near_equal(ll_chol, ll_svd, 1e-10)
+        assert_near_equal(params_chol['sigma2'], params_svd['sigma2'], 1e-10)
+
+    def test_likelihood_gradient(self):
+        from openmdao.surrogate_models.kriging import _pair_sq_distances, _cholesky_likelihood
+
+        rng = np.random.default_rng(1)
+        X = rng.normal(size=(30, 3))
+        Y = rng.normal(size=(30, 2))
+        sq_distances = _pair_sq_distances(X)
+        log_thetas = np.array([-1., .3, .5])
+
+        _, grad, _ = _cholesky_likelihood(log_thetas, sq_distances, Y, 1e-10, gradient=True)
+
+        h = 1e-6
+        fd = [(_cholesky_likelihood(log_thetas + dx, sq_distances, Y, 1e-10)[0] -
+               _cholesky_likelihood(log_thetas - dx, sq_distances, Y, 1e-10)[0]) / (2 * h)
+              for dx in np.eye(3) * h]
+
+        assert_near_equal(grad, fd, 1e-6)
+
+    def test_nugget_fallback(self):
+        # repeated training points make the correlation matrix singular
+        x = np.vstack([self.x, self.x[:3]])
+        y = np.vstack([self.y, self.y[:3]])
+
+        surrogate = KrigingSurrogate(nugget=0., training_method='cholesky')
+        surrogate.train(x, y)
+
+        self.assertTrue(surrogate.nugget > 0.)
+        assert_near_equal(surrogate.predict(self.x[5]), [self.y[5]], 1e-6)
+
+    def test_restarts(self):
+        surrogate = KrigingSurrogate(training_method='cholesky', num_restarts=4)
+        surrogate.train(self.x, self.y)
+
+        pooled = KrigingSurrogate(training_method='cholesky', num_restarts=4, num_procs=2)
+        pooled.train(self.x, self.y)
+
+        assert_near_equal(pooled.thetas, surrogate.thetas, 1e-12)
+
+        single = KrigingSurrogate(training_method='cholesky')
+        single.train(self.x, self.y)
+
+        ll = surrogate._calculate_reduced_likelihood_params()[0]
+        ll_single = single._calculate_reduced_likelihood_params()[0]
+        self.assertTrue(ll >= ll_single - 1e-10)
+
+    def test_cache(self):
+        surrogate_before = KrigingSurrogate(nugget=0., eval_rmse=True, training_method='cholesky',
+                                            training_cache='test_cache_chol.npz')
+        surrogate_before.train(self.x, self.y)
+
+        surrogate = KrigingSurrogate(nugget=0., eval_rmse=True, training_method='cholesky',
+                                     training_cache='test_cache_chol.npz')
+        surrogate.train(self.x, self.y)
+
+        assert_near_equal(surrogate.L, surrogate_before.L, 1e-15)
+        mu, sigma = surrogate.predict([5., 5.])
+
+        assert_near_equal(mu, [[16.72]], 1e-1)
+        assert_near_equal(sigma, [[15.27]], 1e-2)
+
+        os.unlink('test_cache_chol.npz')
+
 
 if __name__ == "__main__":
     unittest.main()
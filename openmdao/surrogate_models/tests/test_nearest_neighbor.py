@@ -16,6 +16,29 @@ class TestNearestNeighbor(unittest.TestCase):
         self.assertEqual(expected_msg, str(cm.exception))
 
 
+    def test_update(self):
+        rng = np.random.default_rng(0)
+        x = rng.uniform(0, 1, (40, 2))
+        # the first points span the full range of the training data, so the scaling of the
+        # updated interpolant matches one trained on all of the points.
+        x[:2] = [[0., 0.], [1., 1.]]
+        y = (x[:, 0] + x[:, 1])[:, np.newaxis]
+        test_x = rng.uniform(0.2, 0.8, (5, 2))
+
+        for interp in ('linear', 'weighted', 'rbf'):
+            with self.subTest(interp=interp):
+                surrogate = NearestNeighbor(interpolant_type=interp)
+                surrogate.train(x[:20], y[:20])
+                surrogate.update(x[20:], y[20:])
+
+                full = NearestNeighbor(interpolant_type=interp)
+                full.train(x, y)
+
+                assert_near_equal(surrogate.predict(test_x), full.predict(test_x), 1e-12)
+                assert_near_equal(surrogate.linearize(test_x[:1]), full.linearize(test_x[:1]),
+                                  1e-12)
+
+
 class TestLinearInterpolator1D(unittest.TestCase):
     def setUp(self):
         self.surrogate = NearestNeighbor(interpolant_type='linear')
@@ -136,6 +136,22 @@ class TestResponseSurfaceSurrogate(unittest.TestCase):
         jac = surrogate.linearize(array([[0.5, 0.5]]))
         assert_near_equal(jac, array([[1, 1], [1, -1]]), 1e-5)
 
+    def test_update(self):
+        x = array([[a, b] for a, b in
+                   itertools.product(linspace(0, 1, 10), repeat=2)])
+        y = array([[sin(a) + b, a * b - cos(b)] for a, b in x])
+
+        surrogate = ResponseSurface()
+        surrogate.train(x[:30], y[:30])
+        surrogate.update(x[30:60], y[30:60])
+        surrogate.update(x[60:], y[60:])
+
+        full = ResponseSurface()
+        full.train(x, y)
+
+        self.assertEqual(surrogate.m, 100)
+        assert_near_equal(surrogate.betas, full.betas, 1e-10)
+
 
 if __name__ == "__main__":
     unittest.main()
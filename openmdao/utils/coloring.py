@@ -11,14 +11,15 @@ import tempfile
 import traceback
 import pathlib
 import webbrowser
-from itertools import combinations, groupby
+from itertools import groupby
+from heapq import heapify, heappop, heappush
 from contextlib import contextmanager
 from pprint import pprint
 from packaging.version import Version
 
 
 import numpy as np
-from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
+from scipy.sparse import coo_matrix, csc_matrix, csr_matrix, issparse
 
 from openmdao.core.constants import INT_DTYPE, _DEFAULT_OUT_STREAM
 from openmdao.utils.general_utils import _src_name_iter, _src_or_alias_item_iter, \
@@ -140,6 +141,10 @@ class ColoringMeta(object):
         Size of input/output perturbation during generation of sparsity.
     use_scaling : bool
         If True, use driver scaling when computing sparsity.
+    sparsity_method : str
+        Method used to compute total jacobian sparsity, either 'numeric' or 'structural'.
+    color_order : str
+        Column ordering used by the greedy coloring, either 'ID', 'smallest_last' or 'DSATUR'.
     msginfo : str
         Prefix for warning/error messages.
 
@@ -167,6 +172,10 @@ class ColoringMeta(object):
         Size of input/output perturbation during generation of sparsity.
     use_scaling : bool
         If True, use driver scaling when computing sparsity.
+    sparsity_method : str
+        Method used to compute total jacobian sparsity, either 'numeric' or 'structural'.
+    color_order : str
+        Column ordering used by the greedy coloring, either 'ID', 'smallest_last' or 'DSATUR'.
     msginfo : str
         Prefix for warning/error messages.
     _coloring : Coloring or None
@@ -178,11 +187,13 @@ class ColoringMeta(object):
     """
 
     _meta_names = {'num_full_jacs', 'tol', 'orders', 'min_improve_pct', 'show_summary',
-                   'show_sparsity', 'dynamic', 'perturb_size', 'use_scaling', 'msginfo'}
+                   'show_sparsity', 'dynamic', 'perturb_size', 'use_scaling', 'sparsity_method',
+                   'color_order', 'msginfo'}
 
     def __init__(self, num_full_jacs=3, tol=1e-25, orders=None, min_improve_pct=5.,
                  show_summary=True, show_sparsity=False, dynamic=False, static=None,
-                 perturb_size=1e-9, use_scaling=False, msginfo=''):
+                 perturb_size=1e-9, use_scaling=False, sparsity_method='numeric', color_order='ID',
+                 msginfo=''):
         """
         Initialize data structures.
         """
@@ -196,6 +207,8 @@ class ColoringMeta(object):
         self.static = static
         self.perturb_size = perturb_size
         self.use_scaling = use_scaling
+        self.sparsity_method = sparsity_method
+        self.color_order = color_order
         self.msginfo = msginfo
         self._coloring = None
         self._failed = False
@@ -436,6 +449,8 @@ class Partial_ColoringMeta(ColoringMeta):
     static : Coloring, str, or None
         If a Coloring object, just use that.  If a filename, load the coloring from that file.
         If None, do not attempt to use a static coloring.
+    color_order : str
+        Column ordering used by the greedy coloring, either 'ID', 'smallest_last' or 'DSATUR'.
     msginfo : str
         Prefix for warning/error messages.
 
@@ -463,14 +478,15 @@ class Partial_ColoringMeta(ColoringMeta):
 
     def __init__(self, wrt_patterns=('*',), method='fd', form=None, step=None, per_instance=True,
                  perturb_size=1e-9, num_full_jacs=3, tol=1e-25, orders=None, min_improve_pct=5.,
-                 show_summary=True, show_sparsity=False, dynamic=False, static=None, msginfo=''):
+                 show_summary=True, show_sparsity=False, dynamic=False, static=None,
+                 color_order='ID', msginfo=''):
         """
         Initialize data structures.
         """
         super().__init__(num_full_jacs=num_full_jacs, tol=tol, orders=orders,
                          min_improve_pct=min_improve_pct, show_summary=show_summary,
                          show_sparsity=show_sparsity, dynamic=dynamic, static=static,
-                         perturb_size=perturb_size, msginfo=msginfo)
+                         perturb_size=perturb_size, color_order=color_order, msginfo=msginfo)
         if wrt_patterns is None:
             wrt_patterns = ()
         elif isinstance(wrt_patterns, str):
@@ -1130,7 +1146,10 @@ class Coloring(object):
         meta = self._meta
         print('', file=out_stream)
         good_tol = meta.get('good_tol')
-        if good_tol is not None:
+        if meta.get('sparsity_method') == 'structural':
+            print("Sparsity computed structurally from declared partial sparsity.",
+                  file=out_stream)
+        elif good_tol is not None:
             print("Sparsity computed using tolerance: %g" % meta['good_tol'], file=out_stream)
             if meta['n_tested'] > 1:
                 print("Most common number of nonzero entries (%d of %d) repeated %d times out "
@@ -1997,11 +2016,78 @@ class Coloring(object):
             return abs_name
 
 
-def _order_by_ID(col_adj_matrix):
+def _bucket_push(buckets, bucket_ids, entries):
+    """
+    Push entries onto the heaps of a bucket queue, adding buckets as needed.
+
+    Parameters
+    ----------
+    buckets : list of list
+        The buckets, each of which is a heap.
+    bucket_ids : ndarray
+        Index of the bucket for each entry.
+    entries : ndarray
+        Integer entries to be pushed.
+    """
+    while len(buckets) <= bucket_ids.max():
+        buckets.append([])
+
+    if entries.size < 64:
+        for bid, entry in zip(bucket_ids.tolist(), entries.tolist()):
+            heappush(buckets[bid], entry)
+        return
+
+    for bid in np.unique(bucket_ids).tolist():
+        new = entries[bucket_ids == bid].tolist()
+        bucket = buckets[bid]
+        if len(new) > len(bucket) >> 3:
+            # cheaper to rebuild the heap than to push the entries one at a time
+            bucket.extend(new)
+            heapify(bucket)
+        else:
+            for entry in new:
+                heappush(bucket, entry)
+
+
+def _bucket_pop(buckets, idx, step, is_current):
+    """
+    Pop the smallest current entry from the first nonempty bucket, starting at the given index.
+
+    Entries that are no longer current are discarded lazily as they reach the top of their heap.
+
+    Parameters
+    ----------
+    buckets : list of list
+        The buckets, each of which is a heap.
+    idx : int
+        Index of the first bucket that may contain a current entry.
+    step : int
+        Direction to search for a nonempty bucket, either 1 or -1.
+    is_current : function
+        Function taking an entry and its bucket index and returning True if the entry is current.
+
+    Returns
+    -------
+    int
+        The popped entry.
+    int
+        Index of the bucket that contained the entry.
+    """
+    while True:
+        bucket = buckets[idx]
+        while bucket:
+            if is_current(bucket[0], idx):
+                return heappop(bucket), idx
+            heappop(bucket)
+        idx += step
+
+
+def _order_by_ID(col_adj_matrix, colors):
     """
     Return columns in order of incidence degree (ID).
 
-    ID is the number of already colored neighbors (neighbors are dependent columns).
+    ID is the number of already colored neighbors (neighbors are dependent columns).  Ties are
+    broken in favor of the lowest column index.
 
     The parameters given are assumed to correspond to a those of a column dependency matrix,
     i.e., (i, j) nonzero entries in the matrix indicate that column i is dependent on column j.
@@ -2010,65 +2096,246 @@ def _order_by_ID(col_adj_matrix):
     ----------
     col_adj_matrix : csc matrix
         CSC column adjacency matrix.
+    colors : ndarray
+        Color of each column, updated by the caller after each column is yielded.  Not used by
+        this ordering.
 
     Yields
     ------
     int
         Column index.
     ndarray
-        Boolean array that's True where the column matches nzcols.
+        Indices of the columns adjacent to the yielded column.
     """
+    indptr = col_adj_matrix.indptr
+    indices = col_adj_matrix.indices
     ncols = col_adj_matrix.shape[1]
-    colored_degrees = np.zeros(ncols, dtype=INT_DTYPE)
-    colored_degrees[col_adj_matrix.indices] = 1  # make sure zero cols aren't considered
-
-    for i in range(np.nonzero(colored_degrees)[0].size):
-        col = colored_degrees.argmax()
-        colnzrows = col_adj_matrix.getcol(col).indices
-        colored_degrees[colnzrows] += 1
-        colored_degrees[col] = -ncols  # ensure that this col will never have max degree again
+
+    done = np.ones(ncols, dtype=bool)
+    done[indices] = False  # make sure zero cols aren't considered
+
+    # degrees[i] is the number of colored neighbors of uncolored column i, and buckets[d] is a
+    # heap of the columns with degree d.
+    degrees = np.zeros(ncols, dtype=INT_DTYPE)
+    buckets = [np.flatnonzero(~done).tolist()]
+    top = 0
+
+    def is_current(col, degree):
+        return not done[col] and degrees[col] == degree
+
+    for i in range(len(buckets[0])):
+        col, top = _bucket_pop(buckets, top, -1, is_current)
+        done[col] = True
+
+        colnzrows = indices[indptr[col]:indptr[col + 1]]
+        neighbors = colnzrows[~done[colnzrows]]
+        if neighbors.size > 0:
+            degrees[neighbors] += 1
+            new_degrees = degrees[neighbors]
+            _bucket_push(buckets, new_degrees, neighbors)
+            top = max(top, new_degrees.max())
+
         yield col, colnzrows
 
 
-def _2col_adj_rows_cols(J):
+def _order_smallest_last(col_adj_matrix, colors):
     """
-    Convert nonzero rows/cols of sparsity matrix to those of a column adjacency matrix.
+    Return columns in smallest-last (SL) order.
+
+    The SL order is the reverse of the order in which columns are removed from the column
+    adjacency graph when a column of minimum degree in the remaining graph is always removed
+    next.
 
     Parameters
     ----------
-    J : coo_matrix
-        Sparse matrix to be colored.
+    col_adj_matrix : csc matrix
+        CSC column adjacency matrix.
+    colors : ndarray
+        Color of each column, updated by the caller after each column is yielded.  Not used by
+        this ordering.
+
+    Yields
+    ------
+    int
+        Column index.
+    ndarray
+        Indices of the columns adjacent to the yielded column.
+    """
+    indptr = col_adj_matrix.indptr
+    indices = col_adj_matrix.indices
+    ncols = col_adj_matrix.shape[1]
+
+    removed = np.ones(ncols, dtype=bool)
+    removed[indices] = False
+
+    # degree within the remaining graph, not counting the column itself
+    degrees = np.diff(indptr).astype(INT_DTYPE)
+    degrees[col_adj_matrix.diagonal() != 0] -= 1
+
+    live = np.flatnonzero(~removed)
+    buckets = [[]]
+    if live.size > 0:
+        _bucket_push(buckets, degrees[live], live)
+
+    def is_current(col, degree):
+        return not removed[col] and degrees[col] == degree
+
+    bottom = 0
+    removal_order = []
+    for i in range(live.size):
+        col, bottom = _bucket_pop(buckets, bottom, 1, is_current)
+        removed[col] = True
+        removal_order.append(col)
+
+        colnzrows = indices[indptr[col]:indptr[col + 1]]
+        neighbors = colnzrows[~removed[colnzrows]]
+        if neighbors.size > 0:
+            degrees[neighbors] -= 1
+            _bucket_push(buckets, degrees[neighbors], neighbors)
+            # removing a column lowers the degree of its neighbors by at most 1
+            bottom = max(bottom - 1, 0)
+
+    for col in reversed(removal_order):
+        yield col, indices[indptr[col]:indptr[col + 1]]
+
+
+def _order_by_DSATUR(col_adj_matrix, colors):
+    """
+    Return columns in degree of saturation (DSATUR) order.
+
+    The saturation of a column is the number of distinct colors used by its neighbors.  The
+    uncolored column with the highest saturation is returned next, with ties broken in favor of
+    the column with the highest degree and then the lowest column index.
+
+    Parameters
+    ----------
+    col_adj_matrix : csc matrix
+        CSC column adjacency matrix.
+    colors : ndarray
+        Color of each column.  The caller must set the color of each yielded column before
+        requesting the next one.
+
+    Yields
+    ------
+    int
+        Column index.
+    ndarray
+        Indices of the columns adjacent to the yielded column.
+    """
+    indptr = col_adj_matrix.indptr
+    indices = col_adj_matrix.indices
+    ncols = col_adj_matrix.shape[1]
+
+    done = np.ones(ncols, dtype=bool)
+    done[indices] = False
+
+    # heap keys sort by decreasing degree and then by increasing column index
+    degrees = np.diff(indptr).astype(INT_DTYPE)
+    keys = (degrees.max() - degrees) * ncols + np.arange(ncols, dtype=INT_DTYPE)
+
+    saturation = np.zeros(ncols, dtype=INT_DTYPE)
+
+    # has_color_nbr[c][i] is True if column i has a neighbor with color c
+    has_color_nbr = []
+
+    live = np.flatnonzero(~done)
+    buckets = [keys[live].tolist()]
+    heapify(buckets[0])
+    top = 0
+
+    def is_current(key, sat):
+        col = key % ncols
+        return not done[col] and saturation[col] == sat
+
+    for i in range(live.size):
+        key, top = _bucket_pop(buckets, top, -1, is_current)
+        col = key % ncols
+        done[col] = True
+
+        colnzrows = indices[indptr[col]:indptr[col + 1]]
+        yield col, colnzrows
+
+        color = colors[col]
+        while len(has_color_nbr) <= color:
+            has_color_nbr.append(np.zeros(ncols, dtype=bool))
+        has_nbr = has_color_nbr[color]
+
+        neighbors = colnzrows[~done[colnzrows]]
+        neighbors = neighbors[~has_nbr[neighbors]]
+        if neighbors.size > 0:
+            has_nbr[neighbors] = True
+            saturation[neighbors] += 1
+            new_sats = saturation[neighbors]
+            _bucket_push(buckets, new_sats, keys[neighbors])
+            top = max(top, new_sats.max())
+
+
+_coloring_order_funcs = {
+    'ID': _order_by_ID,
+    'smallest_last': _order_smallest_last,
+    'DSATUR': _order_by_DSATUR,
+}
+
+
+def _check_coloring_order(color_order, msginfo=''):
+    """
+    Raise an exception if the given column ordering isn't a valid coloring order.
+
+    Parameters
+    ----------
+    color_order : str
+        Name of the column ordering.
+    msginfo : str
+        Prefix for the error message.
+    """
+    if color_order not in _coloring_order_funcs:
+        prefix = f"{msginfo}: " if msginfo else ''
+        raise ValueError(f"{prefix}color_order must be one of {list(_coloring_order_funcs)}, "
+                         f"but got '{color_order}'.")
+
+
+def _col_adj_matrix(nzrows, nzcols, shape):
+    """
+    Return the column adjacency matrix for the given sparsity.
+
+    Columns are adjacent if they have a nonzero in the same row.  Every nonzero column is
+    adjacent to itself.
+
+    Parameters
+    ----------
+    nzrows : ndarray
+        Nonzero rows of the matrix being colored.
+    nzcols : ndarray
+        Nonzero columns of the matrix being colored.
+    shape : tuple
+        Shape of the matrix being colored.
 
     Returns
     -------
     csc_matrix
         Sparse column adjacency matrix.
     """
-    nrows, ncols = J.shape
-    nzrows, nzcols = J.row, J.col
+    csc = csc_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=shape)
+    adj = (csc.T @ csc).tocsc()
+    adj.sort_indices()
+    return adj
 
-    adjrows = []
-    adjcols = []
 
-    csr = csr_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=J.shape)
-
-    # mark col_matrix entries as True when nonzero row entries make them dependent
-    for row in np.unique(nzrows):
-        row_nzcols = csr.getrow(row).indices
-
-        if row_nzcols.size > 0:
-            for c in row_nzcols:
-                adjrows.append(row_nzcols)
-                adjcols.append(np.full(row_nzcols.size, c))
+def _2col_adj_rows_cols(J):
+    """
+    Convert nonzero rows/cols of sparsity matrix to those of a column adjacency matrix.
 
-    if adjrows:
-        adjrows = np.hstack(adjrows)
-        adjcols = np.hstack(adjcols)
-    else:
-        adjrows = np.zeros(0, dtype=INT_DTYPE)
-        adjcols = np.zeros(0, dtype=INT_DTYPE)
+    Parameters
+    ----------
+    J : coo_matrix
+        Sparse matrix to be colored.
 
-    return csc_matrix((np.ones(adjrows.size, dtype=bool), (adjrows, adjcols)), shape=(ncols, ncols))
+    Returns
+    -------
+    csc_matrix
+        Sparse column adjacency matrix.
+    """
+    return _col_adj_matrix(J.row, J.col, J.shape)
 
 
 def _Jc2col_matrix_direct(Jrows, Jcols, shape):
@@ -2091,54 +2358,13 @@ def _Jc2col_matrix_direct(Jrows, Jcols, shape):
 
     Returns
     -------
-    tuple
-        (nzrows, nzcols, shape) of column adjacency matrix.
+    csc_matrix
+        Sparse column adjacency matrix.
     """
-    nrows, ncols = shape
-
-    allnzr = []
-    allnzc = []
+    return _col_adj_matrix(Jrows, Jcols, shape)
 
-    Jrow = np.zeros(ncols, dtype=bool)
-    csr = csr_matrix((np.ones(Jrows.size, dtype=bool), (Jrows, Jcols)), shape=shape)
 
-    # mark col_matrix[col1, col2] as True when Jpart[row, col1] is True OR Jpart[row, col2] is True
-    for row in np.unique(Jrows):
-        nzr = []
-        nzc = []
-        row_nzcols = csr.getrow(row).indices
-
-        if row_nzcols.size == 1:
-            # if there's only 1 nonzero column in a row, include it
-            nzr.append(row_nzcols[0])
-            nzc.append(row_nzcols[0])
-        else:
-            Jrow[:] = False
-            Jrow[row_nzcols] = True
-            for col1, col2 in combinations(row_nzcols, 2):
-                if Jrow[col1] or Jrow[col2]:
-                    nzr.append(col1)
-                    nzc.append(col2)
-        if nzr:
-            allnzr.append(nzr)
-            allnzc.append(nzc)
-
-    csr = Jrow = None  # free up memory
-
-    if allnzr:
-        # matrix is symmetric, so duplicate
-        rows = np.hstack(allnzr + allnzc)
-        cols = np.hstack(allnzc + allnzr)
-    else:
-        rows = np.zeros(0, dtype=INT_DTYPE)
-        cols = np.zeros(0, dtype=INT_DTYPE)
-
-    allnzr = allnzc = None
-
-    return csc_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=(ncols, ncols))
-
-
-def _get_full_disjoint_cols(J):
+def _get_full_disjoint_cols(J, color_order='ID'):
     """
     Find sets of disjoint columns in J and their corresponding rows using a col adjacency matrix.
 
@@ -2146,16 +2372,18 @@ def _get_full_disjoint_cols(J):
     ----------
     J : coo_matrix
         Sparse matrix to be colored.
+    color_order : str
+        Column ordering used for the greedy coloring.  One of 'ID', 'smallest_last' or 'DSATUR'.
 
     Returns
     -------
     list
         List of lists of disjoint columns
     """
-    return _get_full_disjoint_col_matrix_cols(_2col_adj_rows_cols(J))
+    return _get_full_disjoint_col_matrix_cols(_2col_adj_rows_cols(J), color_order)
 
 
-def _get_full_disjoint_col_matrix_cols(col_adj_matrix):
+def _get_full_disjoint_col_matrix_cols(col_adj_matrix, color_order='ID'):
     """
     Find sets of disjoint columns in a column intersection matrix.
 
@@ -2163,6 +2391,8 @@ def _get_full_disjoint_col_matrix_cols(col_adj_matrix):
     ----------
     col_adj_matrix : csc_matrix
         Sparse column adjacency matrix.
+    color_order : str
+        Column ordering used for the greedy coloring.  One of 'ID', 'smallest_last' or 'DSATUR'.
 
     Returns
     -------
@@ -2175,21 +2405,25 @@ def _get_full_disjoint_col_matrix_cols(col_adj_matrix):
     # -1 indicates that a column has not been colored
     colors = np.full(ncols, -1, dtype=INT_DTYPE)
 
-    for icol, colnzrows in _order_by_ID(col_adj_matrix):
+    # forbidden[color] == icol if color is used by a neighbor of column icol
+    forbidden = np.full(ncols, -1, dtype=INT_DTYPE)
+
+    for icol, colnzrows in _coloring_order_funcs[color_order](col_adj_matrix, colors):
         neighbor_colors = colors[colnzrows]
-        for color, grp in enumerate(color_groups):
-            if color not in neighbor_colors:
-                grp.append(icol)
-                colors[icol] = color
-                break
+        forbidden[neighbor_colors[neighbor_colors >= 0]] = icol
+        free = np.flatnonzero(forbidden[:len(color_groups)] != icol)
+        if free.size > 0:
+            color = free[0]
+            color_groups[color].append(icol)
         else:
-            colors[icol] = len(color_groups)
+            color = len(color_groups)
             color_groups.append([icol])
+        colors[icol] = color
 
     return color_groups
 
 
-def _color_partition(Jprows, Jpcols, shape):
+def _color_partition(Jprows, Jpcols, shape, color_order='ID'):
     """
     Compute a single directional fwd coloring using partition Jpart.
 
@@ -2203,6 +2437,8 @@ def _color_partition(Jprows, Jpcols, shape):
         Nonzero columns of a partition of the matrix being colored.
     shape : tuple
         Shape of a partition of the matrix being colored.
+    color_order : str
+        Column ordering used for the greedy coloring.  One of 'ID', 'smallest_last' or 'DSATUR'.
 
     Returns
     -------
@@ -2214,7 +2450,7 @@ def _color_partition(Jprows, Jpcols, shape):
     _, ncols = shape
 
     col_adj_matrix = _Jc2col_matrix_direct(Jprows, Jpcols, shape)
-    col_groups = _get_full_disjoint_col_matrix_cols(col_adj_matrix)
+    col_groups = _get_full_disjoint_col_matrix_cols(col_adj_matrix, color_order)
 
     col_adj_matrix = None
 
@@ -2222,14 +2458,62 @@ def _color_partition(Jprows, Jpcols, shape):
         col_groups[i] = sorted(group)
 
     csc = csc_matrix((np.ones(Jprows.size), (Jprows, Jpcols)), shape=shape)
+    indptr, indices = csc.indptr, csc.indices
     col2row = [None] * ncols
-    for col in np.unique(Jpcols):
-        col2row[col] = csc.getcol(col).indices
+    for col in np.flatnonzero(np.diff(indptr)):
+        col2row[col] = indices[indptr[col]:indptr[col + 1]]
 
     return [col_groups, col2row]
 
 
-def MNCO_bidir(J):
+def _min_heap_top(heap, counts):
+    """
+    Return the index at the top of a lazily updated min heap of (count, index) entries.
+
+    Entries whose count doesn't match the current count for their index are discarded.
+
+    Parameters
+    ----------
+    heap : list
+        Heap of (count, index) tuples.
+    counts : ndarray
+        Current count for each index.
+
+    Returns
+    -------
+    int
+        Index with the smallest current count, or the lowest such index in the event of a tie.
+    """
+    while heap[0][0] != counts[heap[0][1]]:
+        heappop(heap)
+    return heap[0][1]
+
+
+def _index_groups(inds, size):
+    """
+    Return a stable ordering of entries grouped by index, along with the group boundaries.
+
+    Parameters
+    ----------
+    inds : ndarray
+        Index of each entry.
+    size : int
+        Number of groups.
+
+    Returns
+    -------
+    ndarray
+        Entry positions, grouped by index.
+    ndarray
+        Array of size+1 offsets such that the entries of group i are in
+        order[ptr[i]:ptr[i + 1]].
+    """
+    ptr = np.zeros(size + 1, dtype=INT_DTYPE)
+    np.cumsum(np.bincount(inds, minlength=size), out=ptr[1:])
+    return np.argsort(inds, kind='stable'), ptr
+
+
+def MNCO_bidir(J, color_order='ID'):
     """
     Compute bidirectional coloring using Minimum Nonzero Count Order (MNCO).
 
@@ -2241,6 +2525,9 @@ def MNCO_bidir(J):
     ----------
     J : coo_matrix
         Jacobian sparsity matrix (boolean).
+    color_order : str
+        Column ordering used for the greedy coloring of each partition.  One of 'ID',
+        'smallest_last' or 'DSATUR'.
 
     Returns
     -------
@@ -2252,20 +2539,23 @@ def MNCO_bidir(J):
 
     coloring = Coloring(sparsity=J)
 
-    M_col_nonzeros = np.zeros(ncols, dtype=INT_DTYPE)
-    M_row_nonzeros = np.zeros(nrows, dtype=INT_DTYPE)
-
     sparse = csc_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=J.shape)
-
-    for c in range(ncols):
-        M_col_nonzeros[c] = sparse.getcol(c).indices.size
-    sparse = sparse.tocsr()
-    for r in range(nrows):
-        M_row_nonzeros[r] = sparse.getrow(r).indices.size
-
+    M_col_nonzeros = np.diff(sparse.indptr).astype(INT_DTYPE)
+    M_row_nonzeros = np.diff(sparse.tocsr().indptr).astype(INT_DTYPE)
     sparse = None
 
-    M_rows, M_cols = nzrows, nzcols
+    # nonzeros of J that haven't been assigned to Jf or Jr yet, accessible by row and by column
+    M_alive = np.ones(nzrows.size, dtype=bool)
+    M_remaining = nzrows.size
+    row_entries, row_ptr = _index_groups(nzrows, nrows)
+    col_entries, col_ptr = _index_groups(nzcols, ncols)
+
+    # min heaps of (count, index) used to find the row and col with the fewest nonzeros.
+    # Outdated entries are discarded when they reach the top.
+    row_heap = list(zip(M_row_nonzeros.tolist(), range(nrows)))
+    col_heap = list(zip(M_col_nonzeros.tolist(), range(ncols)))
+    heapify(row_heap)
+    heapify(col_heap)
 
     Jf_rows = [None] * nrows
     Jr_cols = [None] * ncols
@@ -2277,18 +2567,19 @@ def MNCO_bidir(J):
     # Jr is colored by row and those rows will be solved in reverse mode
     # We build Jf from bottom up (by row) and Jr from right to left (by column).
 
-    # get index of row with fewest nonzeros and col with fewest nonzeros
-    r = M_row_nonzeros.argmin()
-    c = M_col_nonzeros.argmin()
+    if M_remaining > 0:
+        # get index of row with fewest nonzeros and col with fewest nonzeros
+        r = _min_heap_top(row_heap, M_row_nonzeros)
+        c = _min_heap_top(col_heap, M_col_nonzeros)
 
-    # get number of nonzeros in the selected row and column
-    nnz_r = M_row_nonzeros[r]
-    nnz_c = M_col_nonzeros[c]
+        # get number of nonzeros in the selected row and column
+        nnz_r = M_row_nonzeros[r]
+        nnz_c = M_col_nonzeros[c]
 
     Jf_nz_max = 0   # max row nonzeros in Jf
     Jr_nz_max = 0   # max col nonzeros in Jr
 
-    while M_rows.size > 0:
+    while M_remaining > 0:
         # what the algorithm is doing is basically minimizing the total of the max number of nonzero
         # columns in Jf + the max number of nonzero rows in Jr, so it's basically minimizing
         # the upper bound of the number of colors that will be needed.
@@ -2297,38 +2588,46 @@ def MNCO_bidir(J):
         # different sides of the inequality in order to prevent bad colorings when we have
         # matrices that have many more rows than columns or many more columns than rows.
         if ncols + Jr_nz_max + max(Jf_nz_max, nnz_r) < (nrows + Jf_nz_max + max(Jr_nz_max, nnz_c)):
-            Jf_rows[r] = M_cols[M_rows == r]
+            entries = row_entries[row_ptr[r]:row_ptr[r + 1]]
+            entries = entries[M_alive[entries]]
+            Jf_rows[r] = cols = nzcols[entries]
             Jf_nz_max = max(nnz_r, Jf_nz_max)
 
             M_row_nonzeros[r] = ncols + 1  # make sure we don't pick this one again
-            M_col_nonzeros[Jf_rows[r]] -= 1
+            heappush(row_heap, (ncols + 1, r))
+            M_col_nonzeros[cols] -= 1
+            for col, count in zip(cols.tolist(), M_col_nonzeros[cols].tolist()):
+                heappush(col_heap, (count, col))
 
-            # remove row r
-            keep = M_rows != r
-            r = M_row_nonzeros.argmin()
-            c = M_col_nonzeros.argmin()
+            r = _min_heap_top(row_heap, M_row_nonzeros)
+            c = _min_heap_top(col_heap, M_col_nonzeros)
             nnz_r = M_row_nonzeros[r]
 
             row_i += 1
         else:
-            Jr_cols[c] = M_rows[M_cols == c]
+            entries = col_entries[col_ptr[c]:col_ptr[c + 1]]
+            entries = entries[M_alive[entries]]
+            Jr_cols[c] = rows = nzrows[entries]
             Jr_nz_max = max(nnz_c, Jr_nz_max)
 
             M_col_nonzeros[c] = nrows + 1  # make sure we don't pick this one again
-            M_row_nonzeros[Jr_cols[c]] -= 1
+            heappush(col_heap, (nrows + 1, c))
+            M_row_nonzeros[rows] -= 1
+            for row, count in zip(rows.tolist(), M_row_nonzeros[rows].tolist()):
+                heappush(row_heap, (count, row))
 
-            # remove column c
-            keep = M_cols != c
-            r = M_row_nonzeros.argmin()
-            c = M_col_nonzeros.argmin()
+            r = _min_heap_top(row_heap, M_row_nonzeros)
+            c = _min_heap_top(col_heap, M_col_nonzeros)
             nnz_c = M_col_nonzeros[c]
 
             col_i += 1
 
-        M_rows = M_rows[keep]
-        M_cols = M_cols[keep]
+        # remove row r or column c
+        M_alive[entries] = False
+        M_remaining -= entries.size
 
-    M_row_nonzeros = M_col_nonzeros = None
+    M_row_nonzeros = M_col_nonzeros = row_heap = col_heap = None
+    M_alive = row_entries = col_entries = None
 
     nnz_Jf = nnz_Jr = 0
 
@@ -2345,7 +2644,7 @@ def MNCO_bidir(J):
         Jf_rows = None
         Jfr = np.hstack(Jfr)
         Jfc = np.hstack(Jfc)
-        coloring._fwd = _color_partition(Jfr, Jfc, J.shape)
+        coloring._fwd = _color_partition(Jfr, Jfc, J.shape, color_order)
         Jfr = Jfc = None
 
     if col_i > 0:
@@ -2361,7 +2660,7 @@ def MNCO_bidir(J):
         Jr_cols = None
         Jrr = np.hstack(Jrr)
         Jrc = np.hstack(Jrc)
-        coloring._rev = _color_partition(Jrc, Jrr, J.T.shape)
+        coloring._rev = _color_partition(Jrc, Jrr, J.T.shape, color_order)
 
     if nzrows.size != nnz_Jf + nnz_Jr:
         raise RuntimeError("Nonzero mismatch for J vs. Jf and Jr")
@@ -2569,7 +2868,299 @@ def _get_total_jac_sparsity(prob, num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_ful
     return coo_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=shape), spmeta
 
 
-def _compute_coloring(J, mode):
+def _get_voi_src_inds(meta, slices):
+    """
+    Return the indices into the full output vector for the given design var or response.
+
+    Parameters
+    ----------
+    meta : dict
+        Metadata for the design var or response.
+    slices : dict
+        Slices into the full output vector keyed by absolute output name.
+
+    Returns
+    -------
+    ndarray
+        Indices into the full output vector.
+    """
+    slc = slices[meta['source']]
+    if meta['indices'] is None:
+        return np.arange(slc.start, slc.stop, dtype=INT_DTYPE)
+    return meta['indices'].shaped_array() + slc.start
+
+
+def _get_structural_partials_matrix(model):
+    """
+    Return the boolean sparsity of the model's partial jacobian, dR/do.
+
+    Subjacs with respect to inputs are mapped through the connections (and any src_indices)
+    onto the connected source outputs.  The sparsity of each subjac is taken from its declared
+    rows and cols, or from its computed partial coloring sparsity if it has one. Otherwise the
+    subjac is treated as dense, as is every subjac of a matrix free component.
+
+    Parameters
+    ----------
+    model : <Group>
+        The top level System.
+
+    Returns
+    -------
+    csr_matrix
+        Boolean sparsity of dR/do with a row per residual and a column per output.
+    """
+    from openmdao.core.component import Component
+
+    slices = model._doutputs.get_slice_dict()
+    conns = model._conn_global_abs_in2out
+    abs2meta_in = model._var_abs2meta['input']
+    size = len(model._doutputs)
+
+    def wrt_cols(wrt):
+        if wrt in slices:
+            slc = slices[wrt]
+            return np.arange(slc.start, slc.stop, dtype=INT_DTYPE)
+        slc = slices[conns[wrt]]
+        src_indices = abs2meta_in[wrt]['src_indices']
+        if src_indices is None:
+            return np.arange(slc.start, slc.stop, dtype=INT_DTYPE)
+        return src_indices.shaped_array() + slc.start
+
+    rows = []
+    cols = []
+    for comp in model.system_iter(recurse=True, typ=Component):
+        if comp.matrix_free:
+            # we don't know anything about the sparsity of a matrix free component
+            wrts = list(comp._var_abs2meta['output']) + list(comp._var_abs2meta['input'])
+            wrt_inds = np.concatenate([wrt_cols(wrt) for wrt in wrts])
+            for of in comp._var_abs2meta['output']:
+                slc = slices[of]
+                of_inds = np.arange(slc.start, slc.stop, dtype=INT_DTYPE)
+                rows.append(np.repeat(of_inds, wrt_inds.size))
+                cols.append(np.tile(wrt_inds, of_inds.size))
+            continue
+
+        for (of, wrt), meta in comp._subjacs_info.items():
+            if 'sparsity' in meta:
+                sjrows, sjcols, _ = meta['sparsity']
+            elif meta['rows'] is not None:
+                sjrows, sjcols = meta['rows'], meta['cols']
+            elif issparse(meta['val']):
+                coo = meta['val'].tocoo()
+                sjrows, sjcols = coo.row, coo.col
+            else:
+                nrows, ncols = meta['shape']
+                sjrows = np.repeat(np.arange(nrows, dtype=INT_DTYPE), ncols)
+                sjcols = np.tile(np.arange(ncols, dtype=INT_DTYPE), nrows)
+
+            rows.append(np.asarray(sjrows, dtype=INT_DTYPE) + slices[of].start)
+            cols.append(wrt_cols(wrt)[sjcols])
+
+    if rows:
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+    else:
+        rows = cols = np.zeros(0, dtype=INT_DTYPE)
+
+    return csr_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=(size, size))
+
+
+def _propagate_sparsity(A, seed_inds):
+    """
+    Return the boolean sparsity of A^-1 for the columns given by seed_inds.
+
+    The sparsity of A^-1 is contained in the union of the sparsity of A^k for k >= 0, so each
+    column of the result is the set of rows reachable from the corresponding seed index in the
+    directed graph of A.
+
+    Parameters
+    ----------
+    A : csr_matrix
+        Boolean sparsity of a square matrix.
+    seed_inds : ndarray
+        Indices of the seeded columns.
+
+    Returns
+    -------
+    csc_matrix
+        Boolean matrix of shape (A.shape[0], seed_inds.size).
+    """
+    A = A.astype(float)
+    nseeds = seed_inds.size
+    reached = csc_matrix((np.ones(nseeds), (seed_inds, np.arange(nseeds))),
+                         shape=(A.shape[0], nseeds))
+    frontier = reached
+
+    while frontier.nnz > 0:
+        new = (A @ frontier).tocsc()
+        new.data[:] = 1.0
+        frontier = new - new.multiply(reached)
+        frontier.eliminate_zeros()
+        reached = reached + frontier
+
+    return reached.astype(bool)
+
+
+def _structural_sparsity_ok(J, Jdir, fwd, ofs, wrts):
+    """
+    Check the structural total sparsity against a set of directional derivatives.
+
+    Parameters
+    ----------
+    J : coo_matrix
+        Boolean structural sparsity of the total jacobian.
+    Jdir : ndarray
+        Total jacobian containing a directional derivative in the first column (fwd) or row
+        (rev) of each design variable or response.
+    fwd : bool
+        True if the directional derivatives were computed in fwd mode.
+    ofs : dict
+        Metadata for the responses.
+    wrts : dict
+        Metadata for the design variables.
+
+    Returns
+    -------
+    bool
+        True if no nonzero directional derivative falls outside of the structural sparsity.
+    """
+    if fwd:
+        J = J.tocsc()
+    else:
+        J = J.tocsr()
+    Jdir = np.abs(Jdir)
+
+    start = end = 0
+    for meta in (wrts if fwd else ofs).values():
+        end += meta['size']
+        vals = Jdir[:, start] if fwd else Jdir[start, :]
+        maxval = np.max(vals) if vals.size > 0 else 0.0
+        if maxval > 0.0:
+            struct_nz = np.zeros(vals.size, dtype=bool)
+            struct_nz[J.indices[J.indptr[start]:J.indptr[end]]] = True
+            if np.any(vals[~struct_nz] > maxval * 1e-10):
+                return False
+        start = end
+
+    return True
+
+
+def _get_structural_total_jac_sparsity(prob, setup=False, run_model=False, of=None, wrt=None,
+                                       driver=None):
+    """
+    Return a boolean version of the total jacobian computed from the structure of the model.
+
+    Boolean sparsity is propagated through the declared partial sparsity of each component and
+    the connections of the model, so no full total jacobians are computed.  The result is then
+    verified against a single random directional derivative per design variable (fwd) or
+    response (rev).
+
+    Parameters
+    ----------
+    prob : Problem
+        The Problem being analyzed.
+    setup : bool
+        If True, run setup before computing sparsity.
+    run_model : bool
+        If True, run run_model before computing sparsity.
+    of : iter of str or None
+        Names of response variables.
+    wrt : iter of str or None
+        Names of design variables.
+    driver : Driver, None, or False
+        The driver that will be used to compute the total jacobian.  If None, the driver
+        from the problem will be used.  If False, compute_totals will be called directly
+        on the problem.
+
+    Returns
+    -------
+    coo_matrix or None
+        Boolean sparsity of the total jacobian, or None if the structural sparsity could not be
+        determined.
+    dict or None
+        Metadata about the sparsity computation.
+    """
+    from openmdao.core.group import Group
+    from openmdao.core.total_jac import _TotalJacInfo
+
+    if driver is None:
+        driver = prob.driver
+        driver._con_subjacs = {}
+
+    model = prob.model
+
+    if not prob._computing_coloring:
+        if setup:
+            prob.setup(mode=prob._orig_mode)
+
+        if run_model:
+            prob.run_model(reset_iter_counts=False)
+
+    if model.comm.size > 1:
+        reason = "it is not supported under MPI"
+    elif any(s._approx_schemes for s in model.system_iter(recurse=True, typ=Group)):
+        reason = "the model contains groups with approximated partials"
+    else:
+        reason = None
+
+    if reason is not None:
+        issue_warning(f"Structural total sparsity could not be computed because {reason}. "
+                      "Numeric total sparsity will be used instead.",
+                      prefix=model.msginfo, category=DerivativesWarning)
+        return None, None
+
+    ofs, wrts, _ = model._get_totals_metadata(driver, of, wrt)
+
+    with _compute_total_coloring_context(prob):
+        start_time = time.perf_counter()
+
+        # the directional derivatives must be computed first because the first linearization
+        # will compute any dynamic partial colorings, which give us the sparsity of
+        # approximated partials.
+        total_info = _TotalJacInfo(prob, list(ofs), list(wrts), 'array', driver_scaling=False,
+                                   directional=True, coloring_info=False, driver=driver)
+        Jdir = total_info.compute_totals()
+        fwd = total_info.mode == 'fwd'
+        total_info = None
+
+        A = _get_structural_partials_matrix(model)
+        slices = model._doutputs.get_slice_dict()
+        of_inds = np.concatenate([_get_voi_src_inds(m, slices) for m in ofs.values()])
+        wrt_inds = np.concatenate([_get_voi_src_inds(m, slices) for m in wrts.values()])
+
+        # propagate from whichever side has fewer seeds
+        if wrt_inds.size <= of_inds.size:
+            J = _propagate_sparsity(A, wrt_inds).tocsr()[of_inds, :]
+        else:
+            J = _propagate_sparsity(A.T.tocsr(), of_inds).tocsr()[wrt_inds, :].T
+
+        elapsed = time.perf_counter() - start_time
+
+    J = coo_matrix(J)
+
+    if not _structural_sparsity_ok(J, Jdir, fwd, ofs, wrts):
+        issue_warning("Structural total sparsity does not contain all nonzeros found in a random "
+                      "check of the total jacobian, so numeric total sparsity will be used "
+                      "instead.  Check that the declared partials of all components are "
+                      "correct.", prefix=model.msginfo, category=DerivativesWarning)
+        return None, None
+
+    spmeta = {
+        'type': 'total',
+        'sparsity_method': 'structural',
+        'sparsity_time': elapsed,
+        'J_size': J.shape[0] * J.shape[1],
+        'zero_entries': J.shape[0] * J.shape[1] - J.nnz,
+    }
+
+    print(f"Structural total jacobian sparsity for problem '{prob._metadata['pathname']}' was "
+          f"computed in {elapsed} seconds.")
+    print("Total jacobian shape:", J.shape, "\n")
+
+    return coo_matrix((np.ones(J.nnz, dtype=bool), (J.row, J.col)), shape=J.shape), spmeta
+
+
+def _compute_coloring(J, mode, color_order='ID'):
     """
     Compute a good coloring in a specified dominant direction.
 
@@ -2580,12 +3171,17 @@ def _compute_coloring(J, mode):
     mode : str
         The direction for solving for total derivatives.  Must be 'fwd', 'rev' or 'auto'.
         If 'auto', use bidirectional coloring.
+    color_order : str
+        Column ordering used for the greedy coloring.  One of 'ID' (incidence degree),
+        'smallest_last' or 'DSATUR'.
 
     Returns
     -------
     Coloring
         See Coloring class docstring.
     """
+    _check_coloring_order(color_order)
+
     start_time = time.perf_counter()
     try:
         start_mem = mem_usage()
@@ -2597,12 +3193,12 @@ def _compute_coloring(J, mode):
             nzrows, nzcols = np.nonzero(J)
             J = coo_matrix((np.ones(nzrows.size, dtype=bool), (nzrows, nzcols)), shape=J.shape)
 
-        coloring = MNCO_bidir(J)
-        fallback = _compute_coloring(J, 'fwd')
+        coloring = MNCO_bidir(J, color_order)
+        fallback = _compute_coloring(J, 'fwd', color_order)
         if coloring.total_solves() >= fallback.total_solves():
             coloring = fallback
             coloring._meta['fallback'] = True
-        fallback = _compute_coloring(J, 'rev')
+        fallback = _compute_coloring(J, 'rev', color_order)
         if coloring.total_solves() > fallback.total_solves():
             coloring = fallback
             coloring._meta['fallback'] = True
@@ -2629,19 +3225,15 @@ def _compute_coloring(J, mode):
         J = coo_matrix((np.ones(nzrows.size), (nzrows, nzcols)), shape=J.shape)
 
     nzrows, nzcols = J.row, J.col
-    col_groups = _get_full_disjoint_cols(J)
+    col_groups = _get_full_disjoint_cols(J, color_order)
 
     col2rows = [None] * ncols  # will contain list of nonzero rows for each column
 
-    for r, c in zip(nzrows, nzcols):
-        if col2rows[c] is None:
-            col2rows[c] = [r]
-        else:
-            col2rows[c].append(r)
-
-    for c, rows in enumerate(col2rows):
-        if rows is not None:
-            col2rows[c] = sorted(rows)
+    if nzrows.size > 0:
+        srt = np.lexsort((nzrows, nzcols))
+        cols, starts = np.unique(nzcols[srt], return_index=True)
+        for c, rows in zip(cols.tolist(), np.split(nzrows[srt], starts[1:])):
+            col2rows[c] = rows.tolist()
 
     if rev:
         coloring._rev = (col_groups, col2rows)
@@ -2660,7 +3252,7 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
                            tol=_DEF_COMP_SPARSITY_ARGS['tol'],
                            orders=_DEF_COMP_SPARSITY_ARGS['orders'],
                            setup=False, run_model=False, fname=None,
-                           driver=None):
+                           driver=None, sparsity_method='numeric', color_order='ID'):
     """
     Compute simultaneous derivative colorings for the total jacobian of the given problem.
 
@@ -2689,12 +3281,25 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
     driver : <Driver>, None, or False
         The driver associated with the coloring.  If None, use problem.driver.  If False, no
         driver will be used.
+    sparsity_method : str
+        Method used to compute the total jacobian sparsity.  If 'numeric', compute
+        'num_full_jacs' total jacobians with randomized partials.  If 'structural', propagate
+        the declared partial sparsity through the model and verify it with a single random
+        directional derivative, falling back to 'numeric' if that fails.
+    color_order : str
+        Column ordering used by the greedy coloring.  One of 'ID' (incidence degree),
+        'smallest_last' or 'DSATUR'.
 
     Returns
     -------
     Coloring
         See docstring for Coloring class.
     """
+    if sparsity_method not in ('numeric', 'structural'):
+        raise ValueError(f"sparsity_method must be 'numeric' or 'structural', but got "
+                         f"'{sparsity_method}'.")
+    _check_coloring_order(color_order)
+
     if driver is None:
         driver = problem.driver
 
@@ -2725,13 +3330,23 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
         if run_model:
             problem.run_model()
         coloring = model._compute_coloring(method=list(model._approx_schemes)[0],
-                                           num_full_jacs=num_full_jacs, tol=tol, orders=orders)[0]
+                                           num_full_jacs=num_full_jacs, tol=tol, orders=orders,
+                                           color_order=color_order)[0]
     else:
-        J, sparsity_info = _get_total_jac_sparsity(problem, num_full_jacs=num_full_jacs, tol=tol,
-                                                   orders=orders, setup=setup,
-                                                   run_model=run_model, of=ofs, wrt=wrts,
-                                                   driver=driver)
-        coloring = _compute_coloring(J, mode)
+        J = None
+        if sparsity_method == 'structural':
+            J, sparsity_info = _get_structural_total_jac_sparsity(problem, setup=setup,
+                                                                  run_model=run_model, of=ofs,
+                                                                  wrt=wrts, driver=driver)
+            # setup and run_model have already been done if requested
+            setup = run_model = False
+
+        if J is None:
+            J, sparsity_info = _get_total_jac_sparsity(problem, num_full_jacs=num_full_jacs,
+                                                       tol=tol, orders=orders, setup=setup,
+                                                       run_model=run_model, of=ofs, wrt=wrts,
+                                                       driver=driver)
+        coloring = _compute_coloring(J, mode, color_order)
         if coloring is not None:
             coloring._row_vars = list(ofs)
             coloring._row_var_sizes = [m['size'] for m in ofs.values()]
@@ -2775,6 +3390,48 @@ def compute_total_coloring(problem, mode=None, of=None, wrt=None,
     return coloring
 
 
+def _get_cached_total_coloring(cache, driver, of, wrt):
+    """
+    Look up the total coloring for the current driver and model in the coloring cache.
+
+    Parameters
+    ----------
+    cache : ColoringCache
+        The coloring cache.
+    driver : <Driver>
+        The driver performing the optimization.
+    of : iter of str or None
+        Names of the 'response' variables.
+    wrt : iter of str or None
+        Names of the 'design' variables.
+
+    Returns
+    -------
+    Coloring or None
+        The cached coloring, or None if there isn't a valid one.
+    str or None
+        The cache key, or None if the coloring can't be cached.
+    """
+    from openmdao.utils.coloring_cache import total_coloring_key
+
+    problem = driver._problem()
+    model = problem.model
+    ofs, wrts, _ = model._get_totals_metadata(driver, of, wrt)
+
+    def check(coloring):
+        if of is None and wrt is None:
+            coloring._check_config_total(driver, model)
+        else:
+            coloring._config_check_msgs(ofs, [m['size'] for m in ofs.values()],
+                                        wrts, [m['size'] for m in wrts.values()], driver)
+
+    key = total_coloring_key(model, driver, ofs, wrts, problem._orig_mode)
+    if key is None:
+        return None, None
+
+    return cache.get(key, check), key
+
+
 def dynamic_total_coloring(driver, run_model=True, fname=None, of=None, wrt=None):
     """
     Compute simultaneous deriv coloring during runtime.
@@ -2811,10 +3468,27 @@ def dynamic_total_coloring(driver, run_model=True, fname=None, of=None, wrt=None
                                               _DEF_COMP_SPARSITY_ARGS['num_full_jacs'])
     tol = driver._coloring_info.get('tol', _DEF_COMP_SPARSITY_ARGS['tol'])
     orders = driver._coloring_info.get('orders', _DEF_COMP_SPARSITY_ARGS['orders'])
+    sparsity_method = driver._coloring_info.get('sparsity_method', 'numeric')
+    color_order = driver._coloring_info.get('color_order', 'ID')
 
-    coloring = compute_total_coloring(problem, of=of, wrt=wrt, num_full_jacs=num_full_jacs, tol=tol,
-                                      orders=orders, setup=False, run_model=run_model, fname=fname,
-                                      driver=driver)
+    coloring = cache_key = None
+    cache = problem._metadata['coloring_cache']
+    if cache is not None and not problem.model._approx_schemes:
+        coloring, cache_key = _get_cached_total_coloring(cache, driver, of, wrt)
+        if coloring is not None:
+            print(f"loading total coloring from cache file {cache._entry_path(cache_key)}")
+            if fname is not None:
+                coloring.save(fname)
+            if run_model:
+                problem.run_model(reset_iter_counts=False)
+
+    if coloring is None:
+        coloring = compute_total_coloring(problem, of=of, wrt=wrt, num_full_jacs=num_full_jacs,
+                                          tol=tol, orders=orders, setup=False,
+                                          run_model=run_model, fname=fname, driver=driver,
+                                          sparsity_method=sparsity_method, color_order=color_order)
+        if cache_key is not None and coloring is not None:
+            cache.put(cache_key, coloring)
 
     driver._coloring_info.coloring = coloring
 
@@ -0,0 +1,462 @@
+"""
+A persistent on-disk cache of total and partial colorings.
+
+Cache entries are keyed by a hash of everything that determines the sparsity of the jacobian
+being colored, i.e., the variable names and sizes, connections, declared partials, the options of
+each system, the of/wrt variables and the coloring settings.  A coloring found in the cache is
+validated against the current model before it is used.
+
+The cache can't see state that isn't part of the model structure or options, e.g., an attribute
+set on a component after it is created, that changes the sparsity of a jacobian.  Colorings
+that depend on such state must not use the cache.  If a system has an option value that can't
+be hashed reliably, e.g., an arbitrary object or a function, the colorings of that system are
+not cached.
+"""
+import os
+import sys
+import hashlib
+import inspect
+import tempfile
+from functools import lru_cache
+
+import numpy as np
+from scipy.sparse import issparse
+
+from openmdao import __version__
+from openmdao.core.constants import _DEFAULT_OUT_STREAM, _ReprClass
+from openmdao.utils.indexer import Indexer
+
+# coloring metadata that affects the computed coloring
+_KEY_META_NAMES = ('num_full_jacs', 'tol', 'orders', 'perturb_size', 'use_scaling',
+                   'sparsity_method', 'color_order', 'wrt_patterns', 'method', 'form', 'step')
+
+
+class ColoringCache(object):
+    """
+    A directory of colorings with least recently used (LRU) eviction.
+
+    Parameters
+    ----------
+    directory : str
+        Directory where cached colorings are stored.
+    max_entries : int
+        Maximum number of colorings kept in the cache directory.
+
+    Attributes
+    ----------
+    directory : str
+        Directory where cached colorings are stored.
+    max_entries : int
+        Maximum number of colorings kept in the cache directory.
+    hits : int
+        Number of colorings found in the cache.
+    misses : int
+        Number of colorings that were not found in the cache or failed validation.
+    evictions : int
+        Number of cache entries removed to stay within max_entries.
+    """
+
+    def __init__(self, directory, max_entries=100):
+        """
+        Initialize attributes.
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _entry_path(self, key):
+        """
+        Return the path of the cache file for the given key.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+
+        Returns
+        -------
+        str
+            Path of the cache file.
+        """
+        return os.path.join(self.directory, f'coloring_{key}.pkl')
+
+    def _entries(self):
+        """
+        Return the paths of all cache files, oldest first.
+
+        Returns
+        -------
+        list of str
+            Paths of the cache files sorted by last use.
+        """
+        try:
+            fnames = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+
+        paths = [os.path.join(self.directory, f) for f in fnames
+                 if f.startswith('coloring_') and f.endswith('.pkl')]
+
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.path.getmtime(path)
+            except FileNotFoundError:  # removed by another process
+                pass
+
+        return sorted(mtimes, key=mtimes.get)
+
+    def get(self, key, check=None):
+        """
+        Return the cached coloring for the given key, or None if there isn't a valid one.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+        check : function or None
+            Function that takes the cached coloring and raises a RuntimeError if it doesn't
+            match the current model.  Entries that fail the check are removed.
+
+        Returns
+        -------
+        Coloring or None
+            The cached coloring.
+        """
+        from openmdao.utils.coloring import Coloring
+
+        path = self._entry_path(key)
+
+        try:
+            coloring = Coloring.load(path)
+            if check is not None:
+                check(coloring)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # the entry is unreadable or doesn't match the model, so get rid of it
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        # mark as most recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return coloring
+
+    def put(self, key, coloring):
+        """
+        Store a coloring in the cache, evicting the least recently used entries if necessary.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+        coloring : Coloring
+            The coloring to store.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        # write to a temporary file and rename it so that other processes sharing the cache
+        # never see a partially written entry.
+        fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        os.close(fd)
+        try:
+            coloring.save(tmp)
+            os.replace(tmp, self._entry_path(key))
+        except Exception:
+            self._remove(tmp)
+            raise
+
+        entries = self._entries()
+        for path in entries[:max(len(entries) - self.max_entries, 0)]:
+            self._remove(path)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        for path in self._entries():
+            self._remove(path)
+
+    def _remove(self, path):
+        """
+        Remove a file, ignoring it if it no longer exists.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file.
+        """
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def report(self, out_stream=_DEFAULT_OUT_STREAM):
+        """
+        Print the cache directory and the number of hits, misses and evictions.
+
+        Parameters
+        ----------
+        out_stream : file-like object
+            Where to send human readable output. Default is sys.stdout.
+            Set to None to suppress.
+        """
+        if out_stream is None:
+            return
+        if out_stream is _DEFAULT_OUT_STREAM:
+            out_stream = sys.stdout
+
+        print(f"Coloring cache: {self.directory}", file=out_stream)
+        print(f"   hits: {self.hits}   misses: {self.misses}   evictions: {self.evictions}   "
+              f"entries: {len(self._entries())}", file=out_stream)
+
+
+def _hash_update(h, obj):
+    """
+    Update a hash object with the contents of a (possibly nested) object.
+
+    Parameters
+    ----------
+    h : hash object
+        The hash being updated.
+    obj : object
+        The object to hash.  Containers and arrays are hashed by content and anything else
+        by its repr.
+    """
+    if isinstance(obj, np.ndarray):
+        h.update(f'array{obj.dtype.str}{obj.shape}'.encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, Indexer):
+        try:
+            _hash_update(h, obj.shaped_array())
+        except Exception:
+            h.update(str(obj).encode())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f'seq{len(obj)}'.encode())
+        for item in obj:
+            _hash_update(h, item)
+    elif isinstance(obj, dict):
+        h.update(f'dict{len(obj)}'.encode())
+        for key, val in obj.items():
+            _hash_update(h, key)
+            _hash_update(h, val)
+    else:
+        h.update(f'{type(obj).__name__}:{obj!r};'.encode())
+
+
+@lru_cache(maxsize=None)
+def _source_hash(obj):
+    """
+    Return a hash of the source code of a class or function.
+
+    Changing the code of a component can change its sparsity, so the source is part of the key.
+
+    Parameters
+    ----------
+    obj : class or function
+        The class or function.
+
+    Returns
+    -------
+    str
+        The hash of the source, or the qualified name if the source isn't available.
+    """
+    try:
+        src = inspect.getsource(obj)
+    except (OSError, TypeError):
+        src = f'{obj.__module__}.{obj.__qualname__}'
+    return hashlib.sha256(src.encode()).hexdigest()
+
+
+def _option_key_data(val):
+    """
+    Return data that identifies the value of an option in a cache key.
+
+    Parameters
+    ----------
+    val : object
+        The option value.
+
+    Returns
+    -------
+    object
+        The data to hash.
+
+    Raises
+    ------
+    TypeError
+        If the value can't be hashed reliably, e.g., if it's an arbitrary object whose repr
+        doesn't reflect its state.
+    """
+    if val is None or isinstance(val, (bool, int, float, complex, str, bytes, np.number,
+                                       np.bool_, _ReprClass)):
+        return val
+    if isinstance(val, np.ndarray) and val.dtype != object:
+        return val
+    if isinstance(val, (list, tuple)):
+        return [_option_key_data(v) for v in val]
+    if isinstance(val, (set, frozenset)):
+        return sorted([_option_key_data(v) for v in val], key=repr)
+    if isinstance(val, dict):
+        return [(_option_key_data(k), _option_key_data(v)) for k, v in val.items()]
+    if isinstance(val, type):
+        return (val.__module__, val.__qualname__, _source_hash(val))
+    raise TypeError(f"Can't hash option value of type '{type(val).__name__}'.")
+
+
+def _hash_system_structure(h, system):
+    """
+    Update a hash with the structure of a system and everything below it.
+
+    This includes the class, class source and options of each subsystem, the names and sizes of
+    all variables, the connections and the declared partials of each component.
+
+    Parameters
+    ----------
+    h : hash object
+        The hash being updated.
+    system : System
+        The system.
+
+    Returns
+    -------
+    bool
+        False if an option of some subsystem can't be hashed, so the key isn't reliable.
+    """
+    from openmdao.core.component import Component
+
+    plen = len(system.pathname) + 1 if system.pathname else 0
+
+    for s in system.system_iter(include_self=True, recurse=True):
+        _hash_update(h, (s.pathname[plen:], type(s).__module__, type(s).__qualname__,
+                         _source_hash(type(s))))
+        # options can change the sparsity, e.g., by changing which partials are declared
+        for name, val in s.options.items():
+            try:
+                _hash_update(h, (name, _option_key_data(val)))
+            except TypeError:
+                return False
+        if isinstance(s, Component):
+            _hash_update(h, s.matrix_free)
+            for (of, wrt), meta in s._subjacs_info.items():
+                val = meta.get('val')
+                _hash_update(h, (of[plen:], wrt[plen:], meta.get('rows'), meta.get('cols'),
+                                 meta.get('shape'), meta.get('method'),
+                                 val.tocoo().coords if issparse(val) else None))
+
+    for io in ('input', 'output'):
+        for name, meta in system._var_allprocs_abs2meta[io].items():
+            _hash_update(h, (name[plen:], meta['size'], meta['distributed']))
+
+    abs2meta_in = system._var_abs2meta['input']
+    for tgt, src in sorted(getattr(system, '_conn_global_abs_in2out', {}).items()):
+        src_indices = abs2meta_in[tgt]['src_indices'] if tgt in abs2meta_in else None
+        _hash_update(h, (tgt[plen:], src[plen:], src_indices))
+
+    return True
+
+
+def _new_hash(kind, coloring_info):
+    """
+    Return a new hash object initialized with the coloring type, versions and settings.
+
+    Parameters
+    ----------
+    kind : str
+        Type of coloring, e.g., 'total' or 'partial'.
+    coloring_info : ColoringMeta
+        Coloring settings.
+
+    Returns
+    -------
+    hash object
+        The new hash.
+    """
+    from openmdao.utils.coloring import _COLORING_VERSION
+
+    h = hashlib.sha256()
+    _hash_update(h, (kind, __version__, _COLORING_VERSION))
+    _hash_update(h, [(n, coloring_info.get(n)) for n in _KEY_META_NAMES])
+    return h
+
+
+def _voi_key_data(vois):
+    """
+    Return the parts of design variable or response metadata that affect the coloring.
+
+    Parameters
+    ----------
+    vois : dict
+        Metadata of the variables of interest keyed by name.
+
+    Returns
+    -------
+    list
+        The hashable data.
+    """
+    return [(name, meta['size'], meta.get('source'), meta.get('indices'))
+            for name, meta in vois.items()]
+
+
+def total_coloring_key(model, driver, of, wrt, mode):
+    """
+    Return the cache key of a total coloring.
+
+    Parameters
+    ----------
+    model : Group
+        The top level system.
+    driver : Driver
+        Driver that provides the total coloring settings.
+    of : dict
+        Metadata of the response variables keyed by name.
+    wrt : dict
+        Metadata of the design variables keyed by name.
+    mode : str
+        Derivative direction, 'fwd', 'rev' or 'auto'.
+
+    Returns
+    -------
+    str or None
+        The cache key, or None if the coloring can't be cached.
+    """
+    h = _new_hash('total', driver._coloring_info)
+    _hash_update(h, (mode, _voi_key_data(of), _voi_key_data(wrt)))
+    if _hash_system_structure(h, model):
+        return h.hexdigest()
+
+
+def partial_coloring_key(system, extra=None):
+    """
+    Return the cache key of a partial coloring.
+
+    Parameters
+    ----------
+    system : System
+        The system being colored.
+    extra : object or None
+        Any additional data that affects the sparsity of the system, e.g., the expressions
+        of an ExecComp.
+
+    Returns
+    -------
+    str or None
+        The cache key, or None if the coloring can't be cached.
+    """
+    info = system._coloring_info
+    h = _new_hash('partial', info)
+    if info.per_instance:
+        _hash_update(h, system.pathname)
+    _hash_update(h, extra)
+    if _hash_system_structure(h, system):
+        return h.hexdigest()
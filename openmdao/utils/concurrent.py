@@ -3,12 +3,17 @@ Utilities for submitting function evaluations under MPI.
 """
 import os
 import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from itertools import chain, islice
 
 from openmdao.utils.mpi import debug
 
 trace = os.environ.get('OPENMDAO_TRACE')
 
+# function evaluated by each worker of a pool created with fork_pool
+_pool_func = None
+
 
 def concurrent_eval_lb(func, cases, comm, broadcast=False):
     """
@@ -252,3 +257,203 @@ def concurrent_eval(func, cases, comm, allgather=False, model_mpi=None):
                 results = None
 
     return results
+
+
+def _init_pool_worker(func, initializer, initargs):
+    """
+    Store the function to evaluate in a pool worker and run the user initializer.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute in the worker.
+    initializer : function or None
+        Function called once in the worker before any cases are run.
+    initargs : tuple
+        Arguments of the initializer.
+    """
+    global _pool_func
+    _pool_func = func
+
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _run_pool_case(args, kwargs):
+    """
+    Evaluate one case in a pool worker.
+
+    Parameters
+    ----------
+    args : list or tuple
+        Positional arguments of the function.
+    kwargs : dict or None
+        Keyword arguments of the function.
+
+    Returns
+    -------
+    tuple
+        The return value of the function, or None if it failed, and the traceback of the
+        failure, or None if it succeeded.
+    """
+    try:
+        if kwargs:
+            retval = _pool_func(*args, **kwargs)
+        else:
+            retval = _pool_func(*args)
+    except Exception:
+        return None, traceback.format_exc()
+
+    return retval, None
+
+
+def fork_pool(func, num_procs, initializer=None, initargs=()):
+    """
+    Create a pool of worker processes, forked from this one, that evaluate the given function.
+
+    Because the workers are forked, func may be a bound method of an object that can't be
+    pickled, like a Problem or a Driver.  Each worker works on a copy of that object as it was
+    when the pool was created.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute in workers.
+    num_procs : int
+        Number of worker processes.
+    initializer : function or None
+        Function called once in each worker before any cases are run.
+    initargs : tuple
+        Arguments of the initializer.
+
+    Returns
+    -------
+    ProcessPoolExecutor or None
+        The process pool, or None if the 'fork' start method isn't available on this platform.
+    """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+
+    return ProcessPoolExecutor(max_workers=num_procs,
+                               mp_context=multiprocessing.get_context('fork'),
+                               initializer=_init_pool_worker,
+                               initargs=(func, initializer, initargs))
+
+
+def concurrent_eval_pool(cases, pool):
+    """
+    Evaluate cases on the workers of a pool created with fork_pool.
+
+    Cases are handed out one at a time, so a worker that finishes a case starts on the next
+    one right away.
+
+    Parameters
+    ----------
+    cases : collection of function args
+        Entries are assumed to be of the form (args, kwargs) where
+        kwargs are allowed to be None and args should be a list or tuple.
+    pool : ProcessPoolExecutor
+        The process pool.
+
+    Returns
+    -------
+    list
+        (return value, traceback) of each case, in the same order as the cases.
+    """
+    cases = list(cases)
+    return list(pool.map(_run_pool_case, [args for args, _ in cases],
+                         [kwargs for _, kwargs in cases]))
+
+
+def concurrent_eval_async(func, next_case, case_done, comm=None, pool=None, num_workers=1):
+    """
+    Evaluate cases as they are generated, starting a new case as soon as any case finishes.
+
+    Unlike the other functions in this module, the cases are not known ahead of time.  next_case
+    is called whenever a worker is free, so each new case can depend on the results of all of
+    the cases that have finished so far.
+
+    Under MPI, rank 0 generates the cases and hands them out to the other ranks, so next_case
+    and case_done are only called on rank 0.
+
+    Parameters
+    ----------
+    func : function
+        The function to execute in workers.  It isn't used with a pool, whose workers execute
+        the function the pool was created with.
+    next_case : function
+        Called with no arguments to get the next case as an (args, kwargs) tuple, or None if
+        there are no more cases.
+    case_done : function
+        Called with the case, the return value of the function or None if it failed, and the
+        traceback of the failure or None if it succeeded.
+    comm : MPI communicator or None
+        The MPI communicator that is shared between the master and workers.
+    pool : ProcessPoolExecutor or None
+        Pool created with fork_pool that evaluates the cases.  If neither comm nor pool is
+        given, the cases are evaluated serially.
+    num_workers : int
+        Number of workers in the pool.
+    """
+    if pool is not None:
+        pending = {}
+
+        def submit():
+            case = next_case()
+            if case is not None:
+                pending[pool.submit(_run_pool_case, *case)] = case
+            return case is not None
+
+        for i in range(num_workers):
+            if not submit():
+                break
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                case_done(pending.pop(future), *future.result())
+                submit()
+
+    elif comm is not None and comm.size > 1:
+        if comm.rank > 0:
+            _concurrent_eval_lb_worker(func, comm)
+            return
+
+        pending = {}
+
+        # seed the workers
+        for rank in range(1, comm.size):
+            case = next_case()
+            if case is None:
+                break
+            comm.send(case, rank, tag=1)
+            pending[rank] = case
+
+        while pending:
+            # wait for any worker to finish, then give it a new case
+            worker, retval, err = comm.recv(tag=2)
+            case_done(pending.pop(worker), retval, err)
+
+            case = next_case()
+            if case is not None:
+                comm.send(case, worker, tag=1)
+                pending[worker] = case
+
+        # tell all workers to stop
+        for rank in range(1, comm.size):
+            comm.send((None, None), rank, tag=1)
+
+    else:  # serial execution
+        case = next_case()
+        while case is not None:
+            args, kwargs = case
+            try:
+                if kwargs:
+                    retval = func(*args, **kwargs)
+                else:
+                    retval = func(*args)
+            except Exception:
+                case_done(case, None, traceback.format_exc())
+            else:
+                case_done(case, retval, None)
+            case = next_case()
@@ -0,0 +1,239 @@
+"""Tests of the persistent coloring cache."""
+
+import os
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.coloring import Coloring
+from openmdao.utils.coloring_cache import ColoringCache
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+class SparseComp(om.ExplicitComponent):
+    """A component with a banded jacobian that uses partial coloring."""
+
+    def initialize(self):
+        self.options.declare('n', default=10)
+
+    def setup(self):
+        n = self.options['n']
+        self.add_input('x', np.ones(n))
+        self.add_output('y', np.ones(n))
+        self.declare_partials('y', 'x', method='cs')
+        self.declare_coloring(wrt='x', method='cs')
+
+    def compute(self, inputs, outputs):
+        x = inputs['x']
+        outputs['y'] = 3.0 * x ** 2
+        outputs['y'][1:] += x[:-1]
+
+
+class CoupledComp(om.ExplicitComponent):
+    """A component whose sparsity depends on an option."""
+
+    def initialize(self):
+        self.options.declare('couple', types=bool, default=False)
+        self.options.declare('func', default=None, allow_none=True)
+
+    def setup(self):
+        self.add_input('x', np.ones(5))
+        self.add_output('y', np.ones(5))
+        self.declare_partials('y', 'x', method='cs')
+        self.declare_coloring(wrt='x', method='cs')
+
+    def compute(self, inputs, outputs):
+        x = inputs['x']
+        outputs['y'] = x ** 2
+        if self.options['couple']:
+            outputs['y'] += x[0]
+
+
+def _build_problem(n=10, coloring_dir='coloring_files', cache=True, driver_coloring=True):
+    prob = om.Problem(coloring_dir=coloring_dir, coloring_cache=cache,
+                      coloring_cache_dir='color_cache', reports=False)
+    model = prob.model
+    model.add_subsystem('comp', SparseComp(n=n), promotes=['*'])
+    model.add_design_var('x', lower=-10., upper=10.)
+    model.add_constraint('y', upper=100., indices=np.arange(1, n))
+    model.add_objective('y', index=0, alias='obj')
+
+    prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP')
+    if driver_coloring:
+        prob.driver.declare_coloring()
+
+    prob.setup(mode='fwd')
+    return prob
+
+
+@use_tempdirs
+class TestColoringCache(unittest.TestCase):
+
+    def test_total_and_partial_hits(self):
+        prob = _build_problem(coloring_dir='run1')
+        prob.run_model()
+        c1 = prob.driver._get_coloring(run_model=False)
+        cache = prob.get_coloring_cache()
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        J1 = prob.compute_totals(return_format='array')
+
+        # a new problem with the same structure loads both colorings from the cache
+        prob = _build_problem(coloring_dir='run2')
+        prob.run_model()
+        c2 = prob.driver._get_coloring(run_model=False)
+        self.assertEqual(c1._fwd[0], c2._fwd[0])
+        self.assertEqual(c1._rev, c2._rev)
+
+        # the partial coloring isn't needed until derivatives are computed
+        assert_near_equal(prob.compute_totals(return_format='array'), J1, 1e-12)
+        cache = prob.get_coloring_cache()
+        self.assertEqual((cache.hits, cache.misses), (2, 0))
+
+        # the usual coloring files are still written
+        self.assertTrue(os.path.isfile(os.path.join('run2', 'total_coloring.pkl')))
+
+        # and the partial coloring is used
+        comp = prob.model.comp
+        self.assertIsNotNone(comp._coloring_info.coloring)
+        self.assertEqual(comp._coloring_info.coloring.total_solves(), 2)
+
+    def test_structure_change_misses(self):
+        prob = _build_problem(coloring_dir='run1')
+        prob.run_model()
+        prob.driver._get_coloring(run_model=False)
+
+        prob = _build_problem(n=12, coloring_dir='run2')
+        prob.run_model()
+        coloring = prob.driver._get_coloring(run_model=False)
+        cache = prob.get_coloring_cache()
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertEqual(coloring._shape, (12, 12))
+        self.assertEqual(coloring.total_solves(), 2)
+        self.assertEqual(len(os.listdir('color_cache')), 4)
+
+    def test_exec_comp_exprs_in_key(self):
+        def run(expr):
+            prob = om.Problem(coloring_cache=True, coloring_cache_dir='color_cache',
+                              reports=False)
+            comp = prob.model.add_subsystem('comp', om.ExecComp(expr, x=np.ones(5),
+                                                                y=np.ones(5)))
+            comp.declare_coloring(wrt='*', method='cs', per_instance=True)
+            prob.setup(mode='fwd')
+            prob.run_model()
+            prob.compute_totals('comp.y', 'comp.x')
+            return prob.get_coloring_cache()
+
+        cache = run('y = 2.0 * x')
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        cache = run('y = 2.0 * x')
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+        cache = run('y = 2.0 * x * sum(x)')
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def _run_coupled(self, **options):
+        prob = om.Problem(coloring_cache=True, coloring_cache_dir='color_cache', reports=False)
+        prob.model.add_subsystem('comp', CoupledComp(**options))
+        prob.setup(mode='fwd')
+        prob.run_model()
+        J = prob.compute_totals('comp.y', 'comp.x', return_format='array')
+        return J, prob.get_coloring_cache()
+
+    def test_options_in_key(self):
+        J, cache = self._run_coupled(couple=False)
+        assert_near_equal(J, 2. * np.eye(5), 1e-12)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        # the option changes the sparsity, so the cached coloring isn't used
+        J, cache = self._run_coupled(couple=True)
+        expected = 2. * np.eye(5)
+        expected[:, 0] += 1.
+        assert_near_equal(J, expected, 1e-12)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        J, cache = self._run_coupled(couple=True)
+        assert_near_equal(J, expected, 1e-12)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_uncacheable_option(self):
+        # a function in the options can't be hashed reliably, so the cache isn't used
+        J, cache = self._run_coupled(func=np.sin)
+        assert_near_equal(J, 2. * np.eye(5), 1e-12)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+        self.assertFalse(os.path.exists('color_cache'))
+
+    def test_cache_inactive(self):
+        prob = _build_problem(cache=False)
+        prob.run_model()
+        prob.driver._get_coloring(run_model=False)
+        self.assertIsNone(prob.get_coloring_cache())
+        self.assertFalse(os.path.exists('color_cache'))
+
+    def test_default_cache_dir(self):
+        prob = om.Problem(coloring_dir='colors', coloring_cache=True, reports=False)
+        prob.setup()
+        self.assertEqual(prob.get_coloring_cache().directory, os.path.join('colors', 'cache'))
+
+
+@use_tempdirs
+class TestColoringCacheEntries(unittest.TestCase):
+
+    def _coloring(self, n):
+        return Coloring(sparsity=np.eye(n, dtype=bool), row_vars=['y'], row_var_sizes=[n],
+                        col_vars=['x'], col_var_sizes=[n])
+
+    def test_lru_eviction(self):
+        cache = ColoringCache('cache', max_entries=2)
+        cache.put('a', self._coloring(2))
+        cache.put('b', self._coloring(3))
+
+        # make 'a' the oldest entry, then use it so 'b' becomes the least recently used
+        os.utime(cache._entry_path('a'), (0, 0))
+        os.utime(cache._entry_path('b'), (1, 1))
+        self.assertIsNotNone(cache.get('a'))
+
+        cache.put('c', self._coloring(4))
+        self.assertEqual(cache.evictions, 1)
+        self.assertFalse(os.path.exists(cache._entry_path('b')))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c')._shape, (4, 4))
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_invalid_entries_removed(self):
+        cache = ColoringCache('cache')
+        cache.put('a', self._coloring(2))
+
+        def check(coloring):
+            raise RuntimeError("bad coloring")
+
+        self.assertIsNone(cache.get('a', check))
+        self.assertFalse(os.path.exists(cache._entry_path('a')))
+
+        with open(cache._entry_path('b'), 'w') as f:
+            f.write('junk')
+
+        self.assertIsNone(cache.get('b'))
+        self.assertFalse(os.path.exists(cache._entry_path('b')))
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_report(self):
+        from io import StringIO
+
+        cache = ColoringCache('cache')
+        cache.put('a', self._coloring(2))
+        cache.get('a')
+        cache.get('b')
+
+        stream = StringIO()
+        cache.report(out_stream=stream)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(lines[0], "Coloring cache: cache")
+        self.assertEqual(lines[1].split(), ['hits:', '1', 'misses:', '1', 'evictions:', '0',
+                                            'entries:', '1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -220,6 +220,8 @@ def _make_header_table(prob):
     rows.append(['Number of driver iterations:', prob.driver.opt_result['iter_count']])
     rows.append(['Number of objective calls:', prob.driver.opt_result['obj_calls']])
     rows.append(['Number of derivative calls:', prob.driver.opt_result['deriv_calls']])
+    if 'cache_hits' in prob.driver.opt_result:
+        rows.append(['Number of cache hits:', prob.driver.opt_result['cache_hits']])
     rows.append(['Execution start time:', time_stamp])
     rows.append(['Wall clock run time:', runtime_formatted])
     rows.append(['Exit status:', prob.driver.opt_result['exit_status']])